@@ -126,7 +126,8 @@ from tvcgui.features.frame_data.binding import (
     live_binding,
 )
 from tvcgui.features.training.flags import read_training_flags
-from tvcgui.ui.debug_panel import read_debug_flags, draw_debug_overlay
+from tvcgui.ui.debug_panel import read_debug_flags, read_move_memory_rows, draw_debug_overlay
+from tvcgui.platform.move_memory import shared_move_memory
 
 from tvcgui.platform.dolphin import hook, rd8, rd32, wd8, wd32, wbytes, addr_in_ram, rbytes, prime_mem2_latch, set_emulated_write_quarantine
 from tvcgui.runtime.punish_training import (
@@ -229,6 +230,8 @@ from tvcgui.features.combat.timing_engine import TIMING_ENGINE
 from tvcgui.features.combat.projectile_level_detector import PROJECTILE_LEVEL_DETECTOR
 from tvcgui.features.frame_data.timing_observations import (
     apply_observations_to_scan_data,
+    close_timing_observations,
+    get_observation_store_stats,
     record_timing_result,
 )
 from tvcgui.features.combat.moves import (
@@ -347,6 +350,16 @@ try:
 except Exception as e:
     runtime_pm = None
     print(f"WARNING: runtime patch manager not available ({e!r})")
+try:
+    import tvcgui.platform.memory_watch as memory_watch
+except Exception as e:
+    memory_watch = None
+    print(f"WARNING: memory watch registry not available ({e!r})")
+try:
+    from tvcgui.runtime.tick_budget import TICKS as tick_budget
+except Exception as e:
+    tick_budget = None
+    print(f"WARNING: tick budget scheduler not available ({e!r})")
 try:
     from tvcgui.features.assists import (
         open_assist_scanner_window,
@@ -473,6 +486,35 @@ from tvcgui.ui.components import (
     draw_top_command_dock,
 )
 
+# Main-loop ticks under the per-frame budget.  Critical ticks always run and
+# only spend budget; the rest yield to them and slip at most a few frames.
+if tick_budget is not None:
+    tick_budget.register("mission_fast_tick", priority=100, budget_ms=4.0, critical=True)
+    tick_budget.register("assist_tick", priority=90, budget_ms=2.0, critical=True)
+    tick_budget.register("megacrash_tick", priority=90, budget_ms=2.0, critical=True)
+    tick_budget.register("assist_persist", priority=50, budget_ms=2.0, max_defer_frames=4)
+    tick_budget.register("hud_editor_tick", priority=30, budget_ms=2.0, max_defer_frames=6)
+    tick_budget.register("char_test_tick", priority=20, budget_ms=3.0, max_defer_frames=10)
+
+
+def _tick_budget_allows(name: str) -> bool:
+    if tick_budget is None:
+        return True
+    try:
+        return tick_budget.should_run(name)
+    except Exception:
+        return True
+
+
+def _tick_budget_record(name: str, start_perf: float) -> None:
+    if tick_budget is None:
+        return
+    try:
+        tick_budget.record(name, (time.perf_counter() - start_perf) * 1000.0)
+    except Exception:
+        pass
+
+
 def _char_test_active_for_dock() -> bool:
     """Return whether Char test is currently running."""
     if get_char_test_state is None:
@@ -530,7 +572,7 @@ def merged_debug_values():
         else:
             core_flags = [trpause_row]
 
-    return core_flags + remaining_training
+    return core_flags + remaining_training + read_move_memory_rows()
 
 
 def safe_read_fighter(base: int, yoff: int) -> dict | None:
@@ -1200,6 +1242,10 @@ def legacy_main():
     # profiler resolves after release, so this lets its shorter result such as
     # 'Blaster 2' be merged back into 'Hyper Zero Blaster 2'.
     move_label_by_slot_action = {slot: {} for (slot, _team, _index) in SLOTS}
+    # (csv char id, true char id, action) -> best label.  Both move maps are
+    # fixed after startup, so the per-frame label is one dict hit.
+    move_label_memo = {}
+    move_label_miss = object()
 
     baroque_latch_by_base        = {}
     last_baroque_pct_by_base     = {}
@@ -1268,12 +1314,6 @@ def legacy_main():
         if not active_quick_assist_by_slot or not isinstance(_snaps, dict):
             return
 
-        # Validate/clean selection state only a few times per second.  The actual
-        # assist write path runs in tick_assist_profiles_from_main(), which sees
-        # every frame and patches only when an assist-ish state is active.
-        if (_frame_idx % 15) != 0:
-            return
-
         for _slot_label, _row in list(active_quick_assist_by_slot.items()):
             if not isinstance(_row, dict):
                 active_quick_assist_by_slot.pop(_slot_label, None)
@@ -1938,6 +1978,7 @@ def legacy_main():
     special_restore_orig = 0
 
     megacrash_trainer_state = _load_megacrash_trainer_config()
+    quick_assist_upkeep_due = False
     megacrash_trainer_state.setdefault("pulses", {})
     megacrash_trainer_state.setdefault("last_combo_keys", {})
     megacrash_trainer_state.setdefault("scheduled_triggers", {})
@@ -2019,6 +2060,26 @@ def legacy_main():
             patch_state = runtime_pm.get_runtime_patch_state() if runtime_pm is not None else {}
         except Exception as e:
             patch_state = {"error": repr(e)}
+        try:
+            watch_state = memory_watch.get_watch_stats() if memory_watch is not None else {}
+        except Exception as e:
+            watch_state = {"error": repr(e)}
+        try:
+            timing_store_state = get_observation_store_stats()
+        except Exception as e:
+            timing_store_state = {"error": repr(e)}
+        try:
+            tick_budget_state = tick_budget.stats() if tick_budget is not None else {}
+        except Exception as e:
+            tick_budget_state = {"error": repr(e)}
+        try:
+            scan_cache_state = (
+                scan_normals_all.get_normal_scan_cache_stats()
+                if HAVE_SCAN_NORMALS and scan_normals_all is not None
+                else {}
+            )
+        except Exception as e:
+            scan_cache_state = {"error": repr(e)}
         return {
             "hooked": True,
             "slots": slot_state,
@@ -2026,6 +2087,10 @@ def legacy_main():
             "hud_editor": hud_state,
             "assist": assist_state,
             "runtime_patch_manager": patch_state,
+            "memory_watch": watch_state,
+            "tick_budget": tick_budget_state,
+            "timing_observations": timing_store_state,
+            "normal_scan_cache": scan_cache_state,
             "perf": perf_state,
             "active_quick_assist_by_slot": active_quick_state,
         }
@@ -2115,6 +2180,8 @@ def legacy_main():
     # ------------------------------------------------------------------
     while running:
         _frame_perf_start = time.perf_counter()
+        if tick_budget is not None:
+            tick_budget.begin_frame(frame_idx)
         now  = time.time()
         t_ms = pygame.time.get_ticks()
         mouse_clicked_pos = None
@@ -2318,6 +2385,9 @@ def legacy_main():
                                 pass
                 else:
                     last_scan_normals = res
+                    # A different roster means different move scripts at the
+                    # same addresses; drop the shared move-memory reads.
+                    shared_move_memory().note_roster(_fd_export_roster_signature(last_scan_normals))
                     # Once a current compact preview confirms the clicked
                     # fighter/table, request the matching rich workbench row.
                     # This is the second half of the stale-slot guard.
@@ -2388,6 +2458,12 @@ def legacy_main():
         resolved_slots = resolve_bases(last_base_by_ptr, y_off_by_base)
         p1c1_base = next((b for n, t, b in resolved_slots if n == "P1-C1" and b), None)
         p2c1_base = next((b for n, t, b in resolved_slots if n == "P2-C1" and b), None)
+        if memory_watch is not None:
+            try:
+                memory_watch.poll_watches()
+            except Exception as _watch_poll_error:
+                if frame_idx % 300 == 0:
+                    print(f"[memory watch] poll failed: {_watch_poll_error!r}", flush=True)
         meter_p1 = read_meter(p1c1_base, teamtag="P1")
         meter_p2 = read_meter(p2c1_base, teamtag="P2")
 
@@ -2442,40 +2518,46 @@ def legacy_main():
             csv_char_id = snap.get("csv_char_id")
             cur_anim    = snap.get("attA") or snap.get("attB")
 
-            # Resolve against both the corrected CSV ID and the game's true ID.
-            # Character-specific rows carry strength names such as Charge C and
-            # Hyper Zero Blaster L2/L3/L4, while the generic map can collapse
-            # all of those states to one family label.
-            _label_candidates = []
-            for _cid in (csv_char_id, snap.get("id")):
-                if _cid is None:
-                    continue
-                try:
-                    _candidate = lookup_move_name(cur_anim, int(_cid))
-                except Exception:
-                    _candidate = None
-                if _candidate and _candidate not in _label_candidates:
-                    _label_candidates.append(_candidate)
-                try:
-                    _candidate = move_label_for(cur_anim, int(_cid), move_map, global_map)
-                except Exception:
-                    _candidate = None
-                if _candidate and _candidate not in _label_candidates:
-                    _label_candidates.append(_candidate)
-
-            def _move_label_specificity(_value):
-                _text = str(_value or "").strip()
-                _low = _text.lower()
-                _score = len(_text)
-                if any(token in _low for token in ("charge", "charged", "level", " lv", " l2", " l3", " l4")):
-                    _score += 120
-                if _text.endswith((" A", " B", " C", " L", " M", " H")):
-                    _score += 80
-                if _low in {"idle", "unknown", "action", "--"}:
-                    _score -= 200
-                return _score
-
-            mv_label = max(_label_candidates, key=_move_label_specificity) if _label_candidates else None
+            _label_key = (csv_char_id, snap.get("id"), cur_anim)
+            mv_label = move_label_memo.get(_label_key, move_label_miss)
+            if mv_label is move_label_miss:
+                # Resolve against both the corrected CSV ID and the game's true ID.
+                # Character-specific rows carry strength names such as Charge C and
+                # Hyper Zero Blaster L2/L3/L4, while the generic map can collapse
+                # all of those states to one family label.
+                _label_candidates = []
+                for _cid in (csv_char_id, snap.get("id")):
+                    if _cid is None:
+                        continue
+                    try:
+                        _candidate = lookup_move_name(cur_anim, int(_cid))
+                    except Exception:
+                        _candidate = None
+                    if _candidate and _candidate not in _label_candidates:
+                        _label_candidates.append(_candidate)
+                    try:
+                        _candidate = move_label_for(cur_anim, int(_cid), move_map, global_map)
+                    except Exception:
+                        _candidate = None
+                    if _candidate and _candidate not in _label_candidates:
+                        _label_candidates.append(_candidate)
+
+                def _move_label_specificity(_value):
+                    _text = str(_value or "").strip()
+                    _low = _text.lower()
+                    _score = len(_text)
+                    if any(token in _low for token in ("charge", "charged", "level", " lv", " l2", " l3", " l4")):
+                        _score += 120
+                    if _text.endswith((" A", " B", " C", " L", " M", " H")):
+                        _score += 80
+                    if _low in {"idle", "unknown", "action", "--"}:
+                        _score -= 200
+                    return _score
+
+                mv_label = max(_label_candidates, key=_move_label_specificity) if _label_candidates else None
+                if len(move_label_memo) >= 4096:
+                    move_label_memo.clear()
+                move_label_memo[_label_key] = mv_label
             snap["mv_label"]       = mv_label
             snap["mv_label_base"]  = mv_label
             snap["mv_id_display"]  = cur_anim
@@ -2702,6 +2784,7 @@ def legacy_main():
         except Exception as _mission_tick_error:
             if frame_idx % 60 == 0:
                 print(f"[mission] fast tick failed: {_mission_tick_error!r}", flush=True)
+        _tick_budget_record("mission_fast_tick", _perf_section_start)
         _perf_warn("mission_fast_tick", _perf_section_start)
 
         # Mission-owned burst timing is part of the realtime lane. Run it
@@ -2855,19 +2938,31 @@ def legacy_main():
         except Exception as e:
             if frame_idx % 60 == 0:
                 print(f"[assist scanner] main trigger failed: {e!r}")
+        _tick_budget_record("assist_tick", _perf_section_start)
         _perf_warn("assist_tick", _perf_section_start)
 
-        _perf_section_start = time.perf_counter()
-        try:
-            _tick_persistent_quick_assists(snaps, frame_idx)
-        except Exception as e:
-            if frame_idx % 60 == 0:
-                print(f"[assist quick] persistent state failed: {e!r}")
-        _perf_warn("assist_persist", _perf_section_start)
+        # Validate/clean quick-assist selection state only a few times per
+        # second.  The actual assist write path runs in
+        # tick_assist_profiles_from_main(), which sees every frame and patches
+        # only when an assist-ish state is active.  A pass the tick budget
+        # defers stays due and runs on the next frame with room.
+        if frame_idx % 15 == 0:
+            quick_assist_upkeep_due = True
+        if quick_assist_upkeep_due and _tick_budget_allows("assist_persist"):
+            quick_assist_upkeep_due = False
+            _perf_section_start = time.perf_counter()
+            try:
+                _tick_persistent_quick_assists(snaps, frame_idx)
+            except Exception as e:
+                if frame_idx % 60 == 0:
+                    print(f"[assist quick] persistent state failed: {e!r}")
+            _tick_budget_record("assist_persist", _perf_section_start)
+            _perf_warn("assist_persist", _perf_section_start)
 
         # Operator-controlled Megacrash Trainer remains independent.
         _perf_section_start = time.perf_counter()
         megacrash_trainer_state = _tick_megacrash_trainer(megacrash_trainer_state, snaps, now, frame_idx)
+        _tick_budget_record("megacrash_tick", _perf_section_start)
         _perf_warn("megacrash_tick", _perf_section_start)
 
         # KO lab v4: learn a rolling last-good pre-KO frame for each live slot.
@@ -2966,13 +3061,14 @@ def legacy_main():
                 pass
 
         # HUD Editor persistent state owns only live match HUD values.
-        if tick_hud_editor_state is not None:
+        if tick_hud_editor_state is not None and _tick_budget_allows("hud_editor_tick"):
             _perf_section_start = time.perf_counter()
             try:
                 tick_hud_editor_state(now=now)
             except Exception as e:
                 if frame_idx % 60 == 0:
                     print(f"[hud editor] persistent tick failed: {e!r}")
+            _tick_budget_record("hud_editor_tick", _perf_section_start)
             _perf_warn("hud_editor_tick", _perf_section_start)
 
         # Stage Select capture service is independent from Extra Characters.
@@ -2992,6 +3088,7 @@ def legacy_main():
             and char_test_needs_service is not None
             and char_test_needs_service()
             and now >= char_test_next_tick
+            and _tick_budget_allows("char_test_tick")
         ):
             _perf_section_start = time.perf_counter()
             try:
@@ -3001,6 +3098,7 @@ def legacy_main():
                     print(f"[char test] tick failed: {e!r}")
             finally:
                 char_test_next_tick = now + CHAR_TEST_TICK_INTERVAL
+            _tick_budget_record("char_test_tick", _perf_section_start)
             _perf_warn("char_test_tick", _perf_section_start)
 
         # Damage / hit logging
@@ -4678,6 +4776,10 @@ def legacy_main():
             runtime_meter_generation_profiler.flush()
     except Exception:
         pass
+    try:
+        close_timing_observations()
+    except Exception:
+        pass
     try:
         if runtime_red_health_profiler is not None:
             runtime_red_health_profiler.flush()
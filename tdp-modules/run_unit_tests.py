@@ -13,7 +13,9 @@ from __future__ import annotations
 
 import argparse
 import os
+import shutil
 import sys
+import tempfile
 import unittest
 
 
@@ -48,10 +50,17 @@ def main(argv: list[str] | None = None) -> int:
     print(f"[unit tests] tests_dir={tests_dir}")
     print(f"[unit tests] pattern={args.pattern}")
 
-    loader = unittest.defaultTestLoader
-    suite = loader.discover(start_dir=tests_dir, pattern=args.pattern, top_level_dir=app_dir)
-    verbosity = 1 if args.quiet else 2
-    result = unittest.TextTestRunner(stream=sys.stdout, verbosity=verbosity).run(suite)
+    # Mission progress, overlay payloads and other runtime state go to a
+    # scratch directory instead of the project data tree.
+    user_data = tempfile.mkdtemp(prefix="tvc-user-data-")
+    os.environ.setdefault("TVC_USER_DATA_DIR", user_data)
+    try:
+        loader = unittest.defaultTestLoader
+        suite = loader.discover(start_dir=tests_dir, pattern=args.pattern, top_level_dir=app_dir)
+        verbosity = 1 if args.quiet else 2
+        result = unittest.TextTestRunner(stream=sys.stdout, verbosity=verbosity).run(suite)
+    finally:
+        shutil.rmtree(user_data, ignore_errors=True)
     return 0 if result.wasSuccessful() else 1
 
 
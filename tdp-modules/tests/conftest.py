@@ -0,0 +1,13 @@
+"""Keep runtime state the app writes during tests out of the source tree."""
+from __future__ import annotations
+
+import os
+import shutil
+import tempfile
+
+_USER_DATA = tempfile.mkdtemp(prefix="tvc-user-data-")
+os.environ.setdefault("TVC_USER_DATA_DIR", _USER_DATA)
+
+
+def pytest_unconfigure(config) -> None:
+    shutil.rmtree(_USER_DATA, ignore_errors=True)
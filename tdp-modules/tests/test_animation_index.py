@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from tvcgui.features.animation import database, runtime
+
+
+def _doc(total: int = 40) -> dict:
+    def char(base: int) -> dict:
+        actions = {
+            f"0x{aid:04X}": {"action_id": aid, "total_frames": total + base + aid, "duration_seconds": 0.5,
+                             "clip_offset": 0x1000 + aid * 0x10}
+            for aid in range(0x100, 0x110)
+        }
+        motion = {"actions": actions, "fps": 60, "motion_table_count": 0x200, "uncompressed_size": 0x8000 + base}
+        return {"motions": {"0000.mot": motion}}
+
+    return {
+        "schema_version": "2.1",
+        "fps": 60,
+        "character_aliases": {"ryu": "ryu", "alex": "alx"},
+        "characters": {"ryu": char(0), "alx": char(5), "kar": char(9)},
+    }
+
+
+@pytest.fixture
+def source(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    path = tmp_path / "animation_frames.json"
+    path.write_text(json.dumps(_doc()), encoding="utf-8")
+    monkeypatch.setenv("TVC_ANIMATION_FRAMES_JSON", str(path))
+    monkeypatch.setenv("TVC_ANIMATION_INDEX_DIR", str(tmp_path / "index"))
+    monkeypatch.setattr(database, "ANIMATION_CHARACTER_CACHE", 2)
+    return path
+
+
+def _moves() -> list[dict]:
+    return [{"id": 0x100 + index, "active_end": 8, "hitstun": 20, "blockstun": 15} for index in range(4)]
+
+
+def test_index_answers_like_the_whole_file_loader(source: Path, tmp_path: Path) -> None:
+    indexed = _moves()
+    database.apply_animation_metadata(indexed, "id_07_alex", 7)
+    status = database.animation_database_status()
+    assert status["mode"] == "index" and status["loaded_characters"] == ["alx"]
+    assert sorted(path.name for path in (tmp_path / "index").iterdir()) == ["alx.json", "kar.json", "manifest.json", "ryu.json"]
+
+    record = _doc()["characters"]["alx"]["motions"]["0000.mot"]["actions"]["0x0101"]
+    assert indexed[1]["animation_total_frames"] == record["total_frames"]
+    assert indexed[1]["recovery"] == record["total_frames"] - 8
+
+
+def test_lru_keeps_only_hot_characters_and_rebuilds_on_change(source: Path) -> None:
+    for name in ("Ryu", "Alex", "Kar", "Ryu"):
+        database.apply_animation_metadata(_moves(), name)
+    status = database.animation_database_status()
+    assert status["loaded_characters"] == ["kar", "ryu"]
+
+    source.write_text(json.dumps(_doc(total=1000)), encoding="utf-8")
+    moves = _moves()
+    database.apply_animation_metadata(moves, "Ryu")
+    assert moves[0]["animation_total_frames"] == 1000 + 0x100
+    assert database.animation_database_status()["loaded_characters"] == ["ryu"]
+
+
+def test_runtime_motion_lookups_read_one_partition(source: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    database.animation_database_status()
+
+    def whole_file():
+        raise AssertionError("runtime lookups must not parse the whole motion JSON")
+
+    monkeypatch.setattr(database, "_load_database", whole_file)
+    assert runtime.resolve_char_key("Alex") == "alx"
+    assert runtime.resolve_char_key("kar") == "kar"
+    desc = runtime.motion_descriptor("alx", 0x102)
+    assert desc == runtime.MotionDescriptor("alx", 0x102, 0x2020, 0x200, 0x8005)
+    loaded = runtime.LoadedMot("alx", 0x91000000, 0x91000010, 0x200, 0x8005)
+    assert runtime.animation_id_from_pointer(loaded, "alx", 0x91000000 + 0x2030) == 0x103
+    assert runtime.motion_descriptor("alx", 0x1FF) is None
+    assert database.animation_database_status()["loaded_characters"] == ["alx"]
+
+
+def test_rebuild_removes_only_partitions_it_wrote(source: Path, tmp_path: Path) -> None:
+    # Building next to the source must not touch it or other JSON files.
+    (tmp_path / "notes.json").write_text("{}", encoding="utf-8")
+    database.build_animation_index(source, tmp_path)
+    doc = _doc()
+    del doc["characters"]["kar"]
+    source.write_text(json.dumps(doc), encoding="utf-8")
+    database.build_animation_index(source, tmp_path)
+
+    names = sorted(path.name for path in tmp_path.glob("*.json"))
+    assert names == ["alx.json", "animation_frames.json", "manifest.json", "notes.json", "ryu.json"]
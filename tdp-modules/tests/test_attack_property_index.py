@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import struct
+import time
+
+import pytest
+
+from tvcgui.features.frame_data import attack_property_runtime as runtime
+from tvcgui.features.frame_data.attack_property_runtime import (
+    build_attack_property_index,
+    clear_attack_property_runtime_cache,
+    install_attack_property_index,
+    request_attack_property_index,
+    resolve_live_attack_definition,
+)
+from tvcgui.platform.move_memory import shared_move_memory
+
+FIGHTER = 0x9246B9C0
+TABLE = 0x90896640
+ACTIONS = {0x0100: 0x10000, 0x0101: 0x10400, 0x013B: 0x21A94, 0x013C: 0x22010}
+CLASSES = (0x09, 0x0A, 0x0C, 0x11)
+
+
+class _Memory:
+    def __init__(self) -> None:
+        self.data: dict[int, int] = {}
+        self.reads = 0
+
+    def read(self, address: int, size: int) -> bytes:
+        self.reads += 1
+        return bytes(self.data.get(int(address) + index, 0) for index in range(int(size)))
+
+    def write(self, address: int, payload: bytes) -> None:
+        for index, value in enumerate(bytes(payload)):
+            self.data[int(address) + index] = value
+
+    def read_u32(self, address: int) -> int:
+        return struct.unpack(">I", self.read(address, 4))[0]
+
+
+def _script_set(field_id: int, value: int) -> bytes:
+    return bytes((0x04, 0x01, 0x60, 0x00)) + struct.pack(">III", field_id, 0x3F000000, value)
+
+
+def _memory() -> _Memory:
+    memory = _Memory()
+    memory.write(FIGHTER + 0x01E0, struct.pack(">I", TABLE))
+    for n, (action, rel) in enumerate(ACTIONS.items()):
+        memory.write(TABLE + action * 4, struct.pack(">I", rel))
+        memory.write(TABLE + rel + 0x20, _script_set(0x240, CLASSES[n]))
+        memory.write(TABLE + rel + 0x30, _script_set(0x244, 0x40))
+    return memory
+
+
+@pytest.fixture(autouse=True)
+def _fresh_caches():
+    clear_attack_property_runtime_cache()
+    yield
+    clear_attack_property_runtime_cache()
+
+
+def _resolve(memory: _Memory, action: int) -> dict:
+    return resolve_live_attack_definition(FIGHTER, action, read_u32=memory.read_u32, read_block=memory.read)
+
+
+def test_indexed_lookups_match_the_script_walk_without_reading(monkeypatch) -> None:
+    memory = _memory()
+    monkeypatch.setattr(runtime, "request_attack_property_index", lambda *_args, **_kwargs: False)
+    walked = {action: _resolve(memory, action) for action in (*ACTIONS, 0x0150)}
+    assert walked[0x013B]["status"] == "OK" and walked[0x0150]["status"] == "NO_ACTION_ENTRY"
+
+    clear_attack_property_runtime_cache()
+    assert install_attack_property_index(build_attack_property_index(TABLE, memory.read))
+    memory.reads = 0
+    indexed = {action: _resolve(memory, action) for action in (*ACTIONS, 0x0150)}
+    assert memory.reads == len(indexed)  # just the fighter's table pointer
+    assert indexed == walked
+    assert runtime.attack_property_index_stats()["hits"] == len(indexed)
+
+
+def test_sampled_fingerprint_rejects_a_reused_table(monkeypatch) -> None:
+    memory = _memory()
+    monkeypatch.setattr(runtime, "request_attack_property_index", lambda *_args, **_kwargs: False)
+    assert install_attack_property_index(build_attack_property_index(TABLE, memory.read))
+    assert _resolve(memory, 0x0100)["property_a"] == 0x09
+
+    # Another character loads into the same table address.
+    memory.write(TABLE + 0x12000 + 0x20, _script_set(0x240, 0x22))
+    memory.write(TABLE + 0x0100 * 4, struct.pack(">I", 0x12000))
+    monkeypatch.setattr(runtime, "INDEX_VALIDATE_INTERVAL", 0.0)
+    assert _resolve(memory, 0x0100)["property_a"] == 0x22
+    assert runtime.attack_property_index_stats()["rejected"] == 1
+
+
+def test_writes_into_the_script_region_drop_the_index(monkeypatch) -> None:
+    memory = _memory()
+    monkeypatch.setattr(runtime, "request_attack_property_index", lambda *_args, **_kwargs: False)
+    assert install_attack_property_index(build_attack_property_index(TABLE, memory.read))
+    assert not shared_move_memory().note_write(TABLE - 0x100, 4)
+    assert _resolve(memory, 0x013C)["property_a"] == 0x11
+
+    memory.write(TABLE + 0x22010 + 0x2F, b"\x12")
+    assert shared_move_memory().note_write(TABLE + 0x22010 + 0x2F, 1)
+    assert _resolve(memory, 0x013C)["property_a"] == 0x12
+
+
+def test_first_lookup_queues_a_background_build() -> None:
+    memory = _memory()
+    assert _resolve(memory, 0x0101)["status"] == "OK"
+    deadline = time.monotonic() + 5.0
+    while runtime.attack_property_index_stats()["indexes"] == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert runtime.attack_property_index_stats()["indexes"] == 1
+    assert not request_attack_property_index(TABLE, memory.read)
+    assert _resolve(memory, 0x0101)["property_a"] == 0x0A
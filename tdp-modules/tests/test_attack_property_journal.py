@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from tvcgui.features.training import attack_property_profiler as module
+
+
+def _profiler(tmp_path: Path, **kwargs) -> module.RuntimeAttackPropertyProfiler:
+    return module.RuntimeAttackPropertyProfiler(
+        path=tmp_path / "profiles.json",
+        event_path=tmp_path / "events.csv",
+        read_u32=lambda _address: None,
+        read_block=lambda _address, _size: b"",
+        write_block=lambda _address, _payload: False,
+        is_valid_addr=lambda address: bool(address),
+        start_worker=False,
+        emit_console=False,
+        **kwargs,
+    )
+
+
+def _observe(profiler: module.RuntimeAttackPropertyProfiler, actor: int, damage: int) -> None:
+    record = {
+        "actor": actor,
+        "owner_slot": "P1-C1",
+        "victim_slot": "P2-C1",
+        "owner_action_id": 0x100,
+        "property_a": 0x24,
+        "property_b": 0x40,
+        "base_damage": damage,
+    }
+    with profiler._lock:
+        profiler._record_transition_locked(record, gui_frame=1)
+
+
+def test_routine_flush_appends_without_rewriting_the_snapshot(tmp_path: Path) -> None:
+    profiler = _profiler(tmp_path, journal=True)
+    _observe(profiler, 0x90001000, 1800)
+    assert profiler._write_pending(force=False)
+    assert not (tmp_path / "profiles.json").exists()
+    assert len(profiler.journal_path.read_text(encoding="utf-8").splitlines()) == 1
+
+    _observe(profiler, 0x90002000, 1800)
+    profiler._last_write = 0.0
+    assert profiler._write_pending(force=False)
+    assert profiler.persistence_stats()["journal_records"] == 2
+    profiler.flush()
+
+
+def test_journal_is_replayed_on_load(tmp_path: Path) -> None:
+    profiler = _profiler(tmp_path, journal=True)
+    _observe(profiler, 0x90001000, 1800)
+    _observe(profiler, 0x90002000, 1800)
+    _observe(profiler, 0x90003000, 900)
+    assert profiler._write_pending(force=False)
+    expected = json.loads(json.dumps(profiler.doc["signatures"]))
+
+    reloaded = _profiler(tmp_path, journal=True)
+    assert reloaded.persistence_stats()["replayed"] == 3
+    assert reloaded.doc["signatures"] == expected
+    assert len(reloaded.doc["events"]) == 3
+    reloaded.flush()
+
+
+def test_compaction_folds_the_journal_into_the_snapshot(tmp_path: Path) -> None:
+    profiler = _profiler(tmp_path, journal=True)
+    _observe(profiler, 0x90001000, 1800)
+    assert profiler.flush()
+    assert profiler.journal_path.read_text(encoding="utf-8") == ""
+    snapshot = json.loads((tmp_path / "profiles.json").read_text(encoding="utf-8"))
+    assert snapshot["journal_seq"] == 1
+
+    # A journal left over from before the compaction must not be applied twice.
+    profiler.journal_path.write_text(
+        json.dumps({"seq": 1, "key": "stale", "event": {"actor": 1}}) + "\n",
+        encoding="utf-8",
+    )
+    reloaded = _profiler(tmp_path, journal=True)
+    assert reloaded.persistence_stats()["replayed"] == 0
+    assert "stale" not in reloaded.doc["signatures"]
+    reloaded.flush()
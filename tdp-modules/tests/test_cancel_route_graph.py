@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import struct
+import time
+
+import pytest
+
+from tvcgui.features.frame_data import cancel_mapper as mapper
+from tvcgui.features.frame_data import cancel_routes as routes
+
+
+def _moves() -> list[dict]:
+    moves = [
+        {"id": 0x0100, "abs": 0x90954424, "move_name": "5A", "kind": "normal",
+         "cancel_windows": [{"kind": "normal", "target_id": 0x0109, "addr": 0x90954480, "branch_addr": 0x909544A0}]},
+        {"id": 0x0101, "abs": 0x90954600, "move_name": "5B", "kind": "normal"},
+        {"id": 0x0103, "abs": 0x909553A0, "move_name": "2A", "kind": "normal"},
+        {"id": 0x0105, "abs": 0x90955C7C, "move_name": "2C", "kind": "normal"},
+        {"id": 0x0109, "abs": 0x90956000, "move_name": "6B", "kind": "normal"},
+        {"id": 0x0140, "abs": 0x90946F8E, "move_name": "Shooting Star Kick A", "kind": "special"},
+        {"id": 0x0170, "abs": 0x90960F44, "move_name": "Super Destruction Beam", "kind": "super"},
+        {"id": 0x0040, "abs": 0x90940000, "move_name": "anim_0040", "kind": "other"},
+    ]
+    # A duplicate helper row for 5A that canonical_moves drops.
+    moves.append({"id": 0x0100, "abs": 0x90954500, "move_name": "5A", "kind": "normal", "move_name_source": "scan"})
+    return moves
+
+
+@pytest.fixture(autouse=True)
+def _fresh_graphs():
+    routes.clear_cancel_route_graphs()
+    yield
+    routes.clear_cancel_route_graphs()
+
+
+def test_graph_rows_match_the_per_pair_classifier() -> None:
+    moves = _moves()
+    graph = routes.build_cancel_route_graph(moves, key="ryu")
+    assert graph.sources == mapper.canonical_moves(moves)
+    for source in graph.sources:
+        assert graph.rows_for(source) == mapper.build_cancel_rows(source, moves)
+    assert graph.rows_for(moves[-2]) is None  # not a mapper source
+    allowed = [row["target_id"] for row in graph.rows_for(moves[0]) if row["status"] == "ALLOWED"]
+    assert 0x0109 in allowed
+
+
+def test_saved_graph_reloads_only_for_the_same_moves(tmp_path) -> None:
+    moves = _moves()
+    graph = routes.build_cancel_route_graph(moves, key="ryu")
+    assert routes.save_cancel_route_graph(graph, directory=str(tmp_path))
+
+    reloaded_moves = _moves()
+    loaded = routes.load_cancel_route_graph("ryu", reloaded_moves, directory=str(tmp_path))
+    assert loaded is not None
+    source = loaded.sources[0]
+    assert source is reloaded_moves[0]
+    assert loaded.rows_for(source) == mapper.build_cancel_rows(source, reloaded_moves)
+
+    edited = _moves()
+    edited[0]["cancel_windows"][0]["target_id"] = 0x0101
+    assert routes.load_cancel_route_graph("ryu", edited, directory=str(tmp_path)) is None
+
+
+def test_background_request_builds_saves_and_rebinds(tmp_path) -> None:
+    moves = _moves()
+    assert routes.request_cancel_route_graph("ryu", moves, directory=str(tmp_path)) is None
+    deadline = time.monotonic() + 5.0
+    while routes.cached_cancel_route_graph("ryu", moves) is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    graph = routes.cached_cancel_route_graph("ryu", moves)
+    assert graph is not None
+    assert routes.cancel_route_graph_stats()["builds"] >= 1
+    assert (tmp_path / routes.ROUTE_DIRECTORY_NAME / "ryu.json").is_file()
+
+    # An equal profile reloaded as new dicts reuses the graph.
+    again = _moves()
+    graph = routes.request_cancel_route_graph("ryu", again, directory=str(tmp_path))
+    assert graph is not None and graph.sources[0] is again[0]
+
+
+def test_command_rows_index_matches_the_row_walk() -> None:
+    table = 0x909719C4
+    rows = [
+        (0x00060001, 0, 0x80, 0, 0, 0x0100),
+        (0x00020000, 6, 0x40, 1, 2, 0x0109),
+        (0x00060001, 0, 0x100, 0, 0, 0x0100),
+        (0xFFFF0000, 0, 0, 0, 0, 0x0101),
+        (0x00060001, 0, 0x200, 0, 0, 0x0101),
+    ]
+    data = b"".join(struct.pack(">6I", *row) for row in rows)
+    index = routes.command_rows_by_target(table, data)
+    assert [row["index"] for row in index[0x0100]] == [0, 2]
+    assert index[0x0109][0]["addr"] == table + 24 and index[0x0109][0]["direction"] == 6
+    assert 0x0101 not in index  # past the terminator
+    assert routes.command_rows_by_target(table, data) is index
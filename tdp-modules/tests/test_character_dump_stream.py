@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import json
+import os
+import random
+import struct
+
+from tvcgui.features.frame_data import dumper
+
+BASE = 0x90800000
+CHUNK = 0x1000
+
+
+def _memory(size: int = 0x10000) -> bytearray:
+    rng = random.Random(7)
+    mem = bytearray(size)
+    for n in range(1, size // CHUNK):
+        # Alternate cards straddling every chunk seam.
+        seam = n * CHUNK
+        if n % 2:
+            sig = seam + rng.choice((-8, -4, 0, 4))
+            mem[sig:sig + 8] = dumper.SUPER_BEAM_SIG
+            struct.pack_into(">I", mem, sig - 8 + 0x10, 1000 + n)
+        else:
+            anchor = seam - rng.choice((1, 3, 5))
+            mem[anchor:anchor + 7] = dumper.PROJECTILE_ANCHOR
+            struct.pack_into(">H", mem, anchor + 7, 500 + n)
+            struct.pack_into(">f", mem, anchor + 7 + 0x2C, 32.0)
+        card = seam + 0x200
+        mem[card:card + 4] = b"\x01\x23\x00\x00"
+        struct.pack_into(">H", mem, card + 4, 40 + n)
+    return mem
+
+
+def _reader(mem: bytearray, reads: list[int]):
+    def rbytes(addr: int, size: int) -> bytes:
+        reads.append(size)
+        off = addr - BASE
+        chunk = bytes(mem[max(0, off):off + size])
+        return chunk + bytes(size - len(chunk))
+
+    return rbytes
+
+
+def test_chunked_scan_matches_the_whole_buffer_scanners() -> None:
+    mem = bytes(_memory())
+    expected = (
+        dumper._scan_super_beam_cards(BASE, mem),
+        dumper._scan_projectile_templates(BASE, mem),
+        dumper._scan_23_card_candidates(BASE, mem),
+    )
+    assert all(expected)
+    streamed = dumper._stream_region(BASE, BASE + len(mem), _reader(bytearray(mem), []), [], chunk_size=CHUNK)
+    assert streamed["chunks"] == len(mem) // CHUNK
+    assert (streamed["super_cards"], streamed["projectile_templates"], streamed["loose_23_cards"]) == expected
+
+
+def test_dump_streams_the_region_into_a_random_access_file(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(dumper, "DUMP_CHUNK_SIZE", CHUNK)
+    monkeypatch.setattr(dumper, "REGION_PAD_AFTER", 0x8000)
+    mem = _memory(0x20000)
+    reads: list[int] = []
+    moves = [{"abs": BASE + 0x4000 + n * 0x640, "id": 0x100 + n, "move_name": f"Move {n}"} for n in range(8)]
+    outdir = dumper.dump_character(
+        {"char_name": "Ryu", "slot_label": "P1-C1"}, moves, [], output_root=str(tmp_path), rbytes_func=_reader(mem, reads)
+    )
+    report = json.loads(open(os.path.join(outdir, "character_dump.json"), encoding="utf-8").read())
+    region = report["scan_region"]
+    assert region["bytes_read"] == region["size"]
+    # Bounded reads only: no read spans more than one chunk plus its overlap.
+    assert max(reads) <= CHUNK + dumper.DUMP_CHUNK_AHEAD
+    assert report["moves"][3]["raw_head_hex"] == dumper._hex(bytes(mem[0x4000 + 3 * 0x640:]), 96)
+
+    path = os.path.join(outdir, report["region_chunks"]["path"])
+    index = dumper.region_dump_index(path)
+    assert len(index) == report["region_chunks"]["chunks"] == region["size"] // CHUNK
+    start = region["start"] - BASE
+    for addr in (region["start"], region["start"] + CHUNK - 3, region["end"] - 0x20):
+        assert dumper.read_region_dump(path, addr, 0x20, index) == bytes(mem[addr - BASE:addr - BASE + 0x20])
+    assert dumper.read_region_dump(path, region["start"], region["size"]) == bytes(mem[start:start + region["size"]])
+    assert dumper.read_region_dump(path, region["end"], 4) == b""
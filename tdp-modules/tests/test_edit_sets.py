@@ -0,0 +1,301 @@
+from __future__ import annotations
+
+import struct
+import sys
+import types
+
+import pytest
+
+if "dolphin_memory_engine" not in sys.modules:
+    dme = types.ModuleType("dolphin_memory_engine")
+    dme.is_hooked = lambda: False
+    dme.hook = lambda: None
+    dme.un_hook = lambda: None
+    dme.read_byte = lambda *_args, **_kwargs: 0
+    dme.read_bytes = lambda *_args, **_kwargs: b""
+    dme.write_byte = lambda *_args, **_kwargs: None
+    dme.write_bytes = lambda *_args, **_kwargs: None
+    sys.modules["dolphin_memory_engine"] = dme
+
+import tvcgui.features.combat.move_writer as mw
+from tvcgui.features.frame_data import edit_sets as FES
+from tvcgui.features.frame_data import write_helpers as WH
+
+STUN = bytes((0x04, 0x01, 0x60, 0x00, 0x00, 0x00, 0x02, 0x54, 0x3F)) + bytes(6)
+
+
+class _Memory:
+    def __init__(self) -> None:
+        self.data = bytearray(0x4000)
+        self.base = 0x90900000
+        self.reads: list[tuple[int, int]] = []
+        self.writes: list[tuple[int, bytes]] = []
+
+    def read(self, addr: int, size: int) -> bytes:
+        self.reads.append((addr, size))
+        off = addr - self.base
+        return bytes(self.data[off:off + size])
+
+    def write(self, addr: int, data: bytes) -> bool:
+        self.writes.append((addr, bytes(data)))
+        off = addr - self.base
+        self.data[off:off + len(data)] = data
+        return True
+
+    def at(self, addr: int, size: int) -> bytes:
+        return bytes(self.data[addr - self.base:addr - self.base + size])
+
+
+def _rows(memory: _Memory) -> list[dict]:
+    rows = []
+    for n in range(4):
+        abs_addr = memory.base + n * 0x400
+        damage_addr = abs_addr + 0x40
+        stun_addr = abs_addr + 0x50
+        memory.data[damage_addr - memory.base:damage_addr - memory.base + 5] = bytes((0x35, 0x10, 0x20, 0x3F, 0x00))
+        memory.data[stun_addr - memory.base:stun_addr - memory.base + len(STUN)] = STUN
+        rows.append({
+            "id": 0x100 + n,
+            "abs": abs_addr,
+            "kind": "normal",
+            "damage_addr": damage_addr,
+            "stun_addr": stun_addr,
+            "knockback_addr": abs_addr + 0x200,
+        })
+    return rows
+
+
+def _stage_family(edit_set: FES.EditSet, rows: list[dict]) -> None:
+    for mv in rows:
+        edit_set.stage(mv, "damage", 1200, original=mv.get("damage"))
+        edit_set.stage(mv, "hitstun", 18, original=mv.get("hitstun"))
+        edit_set.stage(mv, "blockstun", 12, original=mv.get("blockstun"))
+        edit_set.stage(mv, "kb_x", 2.5, original=mv.get("kb_x"))
+
+
+def test_edit_set_coalesces_writes_and_checks_packets_once() -> None:
+    memory = _Memory()
+    rows = _rows(memory)
+    edit_set = FES.EditSet("Ryu")
+    _stage_family(edit_set, rows)
+    edit_set.stage(rows[0], "move", 0x0140)
+    edit_set.stage(rows[0], "damage", 1500)  # restaged: replaces the first damage edit
+    calls = []
+
+    def fallback(entry):
+        calls.append(entry["group"])
+        return True, "ok"
+
+    result = edit_set.apply(read_block=memory.read, write_block=memory.write, fallback=fallback)
+    assert not result["failed"]
+    assert len(result["applied"]) == len(edit_set) == 17
+    assert calls == ["move"]
+    # Damage and stun fields share one read and one write per row; knockback is its own.
+    assert result["reads"] == len(memory.reads) == 8
+    assert result["writes"] == len(memory.writes) == 8
+
+    for n, mv in enumerate(rows):
+        assert memory.at(mv["damage_addr"] + 5, 3) == (1500 if n == 0 else 1200).to_bytes(3, "big")
+        assert memory.at(mv["stun_addr"] + 15, 1) == bytes([18])
+        assert memory.at(mv["stun_addr"] + 31, 1) == bytes([12])
+        assert memory.at(mv["knockback_addr"] + 12, 4) == struct.pack(">f", 2.5)
+        assert memory.at(mv["stun_addr"], len(STUN)) == STUN
+        assert mv["hitstun"] == 18 and mv["kb_x"] == 2.5
+
+
+def test_stale_packets_and_bad_values_are_rejected_before_writing() -> None:
+    memory = _Memory()
+    rows = _rows(memory)
+    memory.data[rows[1]["damage_addr"] - memory.base] = 0x00
+    edit_set = FES.EditSet("Ryu")
+    edit_set.stage(rows[0], "damage", 900)
+    edit_set.stage(rows[1], "damage", 900)
+    edit_set.stage(rows[2], "kb_x", float("nan"))
+    edit_set.stage(rows[3], "attack_property", 0x0C)  # no direct route, no fallback
+
+    result = edit_set.apply(read_block=memory.read, write_block=memory.write)
+    assert [entry["mv"] for entry in result["applied"]] == [rows[0]]
+    reasons = {entry["mv"]["id"]: reason for entry, reason in result["failed"]}
+    assert reasons[0x101].startswith("stale damage packet")
+    assert reasons[0x102].startswith("invalid value")
+    assert reasons[0x103] == "no direct write route"
+    assert memory.writes == [(rows[0]["damage_addr"] + 5, (900).to_bytes(3, "big"))]
+    assert "damage" not in rows[1]
+
+
+def test_journal_undoes_redoes_and_reapplies_after_a_reload(tmp_path) -> None:
+    memory = _Memory()
+    rows = _rows(memory)
+    path = str(tmp_path / "ryu.jsonl")
+    journal = FES.EditJournal(path)
+    edit_set = FES.EditSet("Ryu")
+    _stage_family(edit_set, rows)
+    before = bytes(memory.data)
+    result = edit_set.apply(read_block=memory.read, write_block=memory.write)
+    seq = journal.record("Ryu", result)
+    after = bytes(memory.data)
+
+    memory.writes.clear()
+    record, reason = journal.undo(memory.read, memory.write, expect_seq=seq)
+    assert reason == "ok" and record["seq"] == seq
+    assert bytes(memory.data) == before
+    assert len(memory.writes) == result["writes"]
+
+    # History survives a restart.
+    journal = FES.EditJournal(path)
+    assert journal.can_redo and not journal.can_undo
+    record, reason = journal.redo(memory.read, memory.write)
+    assert reason == "ok" and bytes(memory.data) == after
+
+    memory.data[rows[2]["stun_addr"] + 15 - memory.base] = 0x05
+    record, reason = journal.undo(memory.read, memory.write)
+    assert record is None and reason == f"memory at 0x{rows[2]['damage_addr'] + 5:08X} changed since this edit"
+
+    # After a reload the rows are new dicts; the journal rebuilds the set.
+    reloaded = FES.EditSet("Ryu", FES.EditJournal(path).applied_changes())
+    fresh = _rows(_Memory())
+    by_abs = {f"0x{mv['abs']:08X}": mv for mv in fresh}
+    assert reloaded.bind(lambda entry: (None, by_abs.get(entry["selector"]["abs"]))) == []
+    assert len(reloaded) == 16
+    FES.save_edit_set(reloaded, str(tmp_path / "set.json"))
+    assert FES.load_edit_set(str(tmp_path / "set.json")).to_payload() == reloaded.to_payload()
+
+
+def test_failed_steps_roll_back_and_unpersisted_sets_get_no_seq(tmp_path, monkeypatch) -> None:
+    memory = _Memory()
+    rows = _rows(memory)
+    journal = FES.EditJournal(str(tmp_path / "ryu.jsonl"))
+    edit_set = FES.EditSet("Ryu")
+    _stage_family(edit_set, rows)
+    seq = journal.record("Ryu", edit_set.apply(read_block=memory.read, write_block=memory.write))
+    after = bytes(memory.data)
+
+    # The third run of the undo fails; the two before it must be put back.
+    calls = []
+
+    def flaky(addr: int, data: bytes) -> bool:
+        calls.append(addr)
+        return False if len(calls) == 3 else memory.write(addr, data)
+
+    record, reason = journal.undo(memory.read, flaky, expect_seq=seq)
+    assert record is None and reason == "write failed"
+    assert bytes(memory.data) == after and journal.can_undo
+    record, reason = journal.undo(memory.read, memory.write, expect_seq=seq)
+    assert reason == "ok"
+
+    # A set the journal could not persist is not offered for undo.
+    monkeypatch.setattr(journal, "_append", lambda _row: False)
+    assert journal.record("Ryu", edit_set.apply(read_block=memory.read, write_block=memory.write)) is None
+    assert not journal.can_undo and journal.can_redo
+    record, reason = journal.redo(memory.read, memory.write)
+    assert record is None and reason.startswith("memory at")
+
+
+_ROW = 0x90900000
+_LAYOUT = {
+    "abs": _ROW,
+    "damage_addr": _ROW + 0x40,
+    "active_addr": _ROW + 0x60,
+    "stun_addr": _ROW + 0x80,
+    "meter_addr": _ROW + 0x100,
+    "speed_mod_addr": _ROW + 0x101,
+    "combo_kb_mod_addr": _ROW + 0x102,
+    "hit_reaction_addr": _ROW + 0x110,
+    "proj_tpl": _ROW + 0x120,
+    "hit_spark_addr": _ROW + 0x130,
+    "stretch_len_addr": _ROW + 0x140,
+    "active2_addr": _ROW + 0x160,
+    "knockback_addr": _ROW + 0x200,
+}
+_WRITERS = [
+    ("damage", 0x012345, lambda mv, v: mw.write_damage(mv, v)),
+    ("active", {"start": 4, "end": 9}, lambda mv, v: mw.write_active_frames(mv, v["start"], v["end"])),
+    ("hitstun", 18, lambda mv, v: mw.write_hitstun(mv, v)),
+    ("blockstun", 12, lambda mv, v: mw.write_blockstun(mv, v)),
+    ("hitstop", 9, lambda mv, v: mw.write_hitstop(mv, v)),
+    ("meter", 40, lambda mv, v: mw.write_meter(mv, v)),
+    ("launch_profile", 0x0102_0304, lambda mv, v: mw.write_knockback(mv, launch_profile=v)),
+    ("kb_unknown", 0xA0B0_C0D0, lambda mv, v: mw.write_knockback(mv, kb_unknown=v)),
+    ("kb_x", 2.5, lambda mv, v: mw.write_knockback(mv, kb_x=v)),
+    ("air_kb", -1.25, lambda mv, v: mw.write_knockback(mv, air_kb=v)),
+    ("hb", 42.0, lambda mv, v: mw.write_hitbox_radius(mv, v)),
+    ("active2", {"start": 3, "end": 7}, lambda mv, v: WH.write_active2_frames_inline(mv, v["start"], v["end"], True)),
+    ("speed_mod", 0x1FE, lambda mv, v: WH.write_speed_mod_inline(mv, v, True)),
+    ("combo_kb_mod", 7, lambda mv, v: WH.write_combo_kb_mod_inline(mv, v, True)),
+    ("hit_reaction", 0x0A0B0C, lambda mv, v: WH.write_hit_reaction_inline(mv, v, True)),
+    ("proj_dmg", 70000, lambda mv, v: WH.write_proj_dmg_inline(mv, v, True)),
+    ("hit_spark", 0x1122_3344, lambda mv, v: WH.write_u32_field_inline(mv, "hit_spark_addr", "hit_spark", v)),
+    ("stretch_len", 0.75, lambda mv, v: WH.write_f32_field_inline(mv, "stretch_len_addr", "stretch_len", v)),
+]
+
+
+@pytest.fixture
+def game(monkeypatch):
+    memory = _Memory()
+    memory.data[:] = bytes((n * 7 + 3) & 0xFF for n in range(len(memory.data)))
+    for key, header in (("damage_addr", FES._DAMAGE_HEADER), ("active_addr", FES._ACTIVE_HEADER),
+                        ("stun_addr", FES._STUN_HEADER)):
+        off = _LAYOUT[key] - memory.base
+        memory.data[off:off + len(header)] = header
+
+    def wd8(addr, value):
+        return memory.write(addr, bytes([int(value) & 0xFF]))
+
+    monkeypatch.setattr(mw, "rbytes", memory.read)
+    monkeypatch.setattr(mw, "wd8", wd8)
+    monkeypatch.setattr(mw, "wdf32", lambda addr, value: memory.write(addr, struct.pack(">f", value)))
+    # write_helpers imports wd8 at call time; other tests may have swapped the module.
+    monkeypatch.setattr(sys.modules["tvcgui.platform.dolphin"], "wd8", wd8, raising=False)
+    return memory
+
+
+@pytest.mark.parametrize("group, value, writer", _WRITERS, ids=[case[0] for case in _WRITERS])
+def test_compiled_bytes_match_the_single_field_writers(game, group, value, writer) -> None:
+    initial = bytes(game.data)
+    edit = FES.compile_edit(dict(_LAYOUT), group, value)
+    compiled = bytearray(initial)
+    for addr, data in edit.writes:
+        compiled[addr - game.base:addr - game.base + len(data)] = data
+
+    assert writer(dict(_LAYOUT), value)
+    assert bytes(game.data) == bytes(compiled)
+
+    # Packet checks cover exactly the bytes the writer verifies.
+    for addr, header, _kind in edit.checks:
+        game.data[:] = initial
+        game.data[addr + len(header) - game.base] ^= 0xFF
+        assert writer(dict(_LAYOUT), value)
+        game.data[:] = initial
+        game.data[addr + len(header) - 1 - game.base] ^= 0xFF
+        assert not writer(dict(_LAYOUT), value)
+
+
+def test_journal_compacts_dead_rows_and_folds_old_sets_into_the_base(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(FES, "JOURNAL_HISTORY_LIMIT", 3)
+    monkeypatch.setattr(FES, "JOURNAL_COMPACT_SLACK", 4)
+    memory = _Memory()
+    rows = _rows(memory)
+    path = tmp_path / "ryu.jsonl"
+    journal = FES.EditJournal(str(path))
+    seqs = []
+    for n, value in enumerate((500, 600, 700, 800, 900)):
+        edit_set = FES.EditSet("Ryu")
+        edit_set.stage(rows[n % 2], "damage", value)
+        seqs.append(journal.record("Ryu", edit_set.apply(read_block=memory.read, write_block=memory.write)))
+    for _ in range(3):
+        assert journal.undo(memory.read, memory.write)[1] == "ok"
+        assert journal.redo(memory.read, memory.write)[1] == "ok"
+    assert journal.undo(memory.read, memory.write)[1] == "ok"
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) <= 1 + 2 * 3 + 4
+    reopened = FES.EditJournal(str(path))
+    assert reopened._applied == seqs[2:4] and reopened._redo == seqs[4:]
+    # The folded sets can't be undone any more, but their edits still reapply.
+    assert {(c["selector"]["abs"], c["value"]) for c in reopened.applied_changes()} == {
+        (f"0x{rows[0]['abs']:08X}", 700),
+        (f"0x{rows[1]['abs']:08X}", 800),
+    }
+    assert [reopened.undo(memory.read, memory.write)[0]["seq"] for _ in range(2)] == [seqs[3], seqs[2]]
+    assert reopened.undo(memory.read, memory.write)[1] == "nothing to undo"
+    assert reopened.redo(memory.read, memory.write)[0]["seq"] == seqs[2]
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import random
+import struct
+
+from tvcgui.core.constants import ATT_ID_OFF_PRIMARY, OFF_CUR_HP, POSX_OFF
+from tvcgui.features.frame_data import field_diff as FDD
+
+BLOCK = 0x90900000
+FIGHTER = 0x92000000
+
+
+class _Game:
+    """Advances one frame per block read."""
+
+    def __init__(self) -> None:
+        self.frame = 0
+        self.block = bytearray(0x100)
+        self.fighter = bytearray(0x200)
+
+    def step(self) -> None:
+        n = self.frame
+        hp = 10000 - 25 * n
+        action = 0x100 if (n // 10) % 2 else 0x40
+        x = 100.0 + 2.5 * n
+        struct.pack_into(">I", self.fighter, OFF_CUR_HP, hp)
+        struct.pack_into(">I", self.fighter, ATT_ID_OFF_PRIMARY, action)
+        struct.pack_into(">f", self.fighter, POSX_OFF, x)
+        # Unknown fields: a damage tally, a state byte keyed to the action and a mirrored X.
+        struct.pack_into(">I", self.block, 0x10, 25 * n)
+        self.block[0x21] = 3 if action == 0x100 else 0
+        struct.pack_into(">f", self.block, 0x40, -x)
+        self.frame += 1
+
+    def rbytes(self, addr: int, size: int) -> bytes:
+        if addr == BLOCK:
+            self.step()
+            return bytes(self.block[:size])
+        off = addr - FIGHTER
+        return bytes(self.fighter[off:off + size])
+
+
+def test_capture_ranks_fields_against_known_fighter_values() -> None:
+    game = _Game()
+    capture = FDD.capture_block(BLOCK, 0x100, 60, game.rbytes, fighter_base=FIGHTER, sleep=lambda _s: None)
+    assert capture.count == 60 and sorted(capture.known) == ["action_id", "hp", "pos_x"]
+
+    stats = {(row.offset, row.kind): row for row in FDD.analyze_capture(capture)}
+    tally = stats[(0x10, "u32")]
+    assert tally.changes == 59 and tally.low == 0 and tally.high == 25 * 59
+    assert tally.best_correlation[0] == "hp" and round(tally.correlations["hp"], 6) == -1.0
+
+    state = stats[(0x21, "u8")]
+    assert state.distinct == 2 and state.changes == 5
+    assert state.best_co_change == ("action_id", 1.0)
+
+    mirrored = stats[(0x40, "f32")]
+    assert mirrored.first == -100.0 and round(mirrored.correlations["pos_x"], 6) == -1.0
+    # Bytes that never changed produce no rows.
+    assert all(0x10 <= row.offset < 0x44 for row in stats.values())
+    assert FDD.sort_field_stats(list(stats.values()), "changes", descending=True)[0].changes == 59
+
+
+def test_column_pass_matches_a_per_frame_walk() -> None:
+    rng = random.Random(3)
+    capture = FDD.BlockCapture(BLOCK, 0x40)
+    data = bytearray(rng.randbytes(0x40))
+    for _ in range(50):
+        for off in rng.sample(range(0x40), 3):
+            data[off] = rng.randrange(256)
+        capture.add(bytes(data))
+
+    frames = [capture.frame(n) for n in range(capture.count)]
+    for row in FDD.analyze_capture(capture, kinds=("u8", "u16")):
+        fmt = ">B" if row.kind == "u8" else ">H"
+        values = [struct.unpack_from(fmt, frame, row.offset)[0] for frame in frames]
+        assert row.changes == sum(a != b for a, b in zip(values, values[1:]))
+        assert (row.distinct, row.low, row.high) == (len(set(values)), min(values), max(values))
+        assert row.correlations == {}
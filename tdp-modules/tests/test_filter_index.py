@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import random
+
+from tvcgui.features.frame_data.filter_index import FrameFilterIndex
+
+COLUMNS = ("move", "kind", "hits", "damage", "abs")
+
+
+def _naive(rows: dict, global_q: str, col_filters: dict) -> set:
+    out = set()
+    for iid, values in rows.items():
+        cells = dict(zip(COLUMNS, values))
+        hay = " ".join(cells[c] for c in ("move", "kind", "abs")).lower()
+        if global_q and global_q not in hay:
+            continue
+        if all(needle in cells.get(c, "").lower() for c, needle in col_filters.items()):
+            out.add(iid)
+    return out
+
+
+def _build(rng: random.Random, count: int = 300) -> tuple[FrameFilterIndex, dict]:
+    index = FrameFilterIndex(COLUMNS)
+    rows: dict = {}
+    names = ["5A", "2B", "j.C", "Shoryuken", "Hadouken", "Tatsu", "Shinkuu Hadouken", "İzuna"]
+    parent = ""
+    for n in range(count):
+        values = (
+            rng.choice(names),
+            rng.choice(["normal", "special", "super"]),
+            str(rng.randrange(1, 4)),
+            str(rng.randrange(0, 3000)),
+            f"0x{0x90800000 + n * 0x640:08X}",
+        )
+        iid = f"r{n}"
+        if n % 5 and parent:
+            index.insert(parent, "end", iid, values)
+        else:
+            index.insert("", "end", iid, values)
+            parent = iid
+        rows[iid] = values
+    return index, rows
+
+
+def test_blob_matching_equals_per_cell_substring_checks() -> None:
+    rng = random.Random(42)
+    index, rows = _build(rng)
+    queries = [
+        ("", {"move": "hado"}),
+        ("special", {}),
+        ("0x9080", {"damage": "1"}),
+        ("", {"kind": "su", "hits": "2"}),
+        ("i̇zu", {}),
+        ("ken 0x", {}),
+        ("", {"move": "zzz"}),
+        ("", {"nope": "a"}),
+    ]
+    for global_q, col_filters in queries:
+        assert index.match(global_q, col_filters) == _naive(rows, global_q, col_filters)
+
+
+def test_edits_moves_and_deletes_keep_the_mirror_current() -> None:
+    index, rows = _build(random.Random(7), 40)
+    assert index.match("", {"damage": "99999"}) == set()
+    index.set_value("r3", "damage", 99999)
+    assert index.match("", {"damage": "99999"}) == {"r3"}
+
+    assert index.parent("r3") == "r0"
+    assert index.with_ancestors({"r3"}) == {"r3", "r0"}
+    index.move("r5", "", 0)
+    assert index.children("")[0] == "r5"
+    assert index.order()[:2] == ["r5", "r6"]
+
+    index.delete("r0")
+    assert "r3" not in index and "r1" not in index
+    assert index.match("", {"damage": "99999"}) == set()
+
+
+def test_plan_keeps_mirror_order_and_drops_hidden_rows() -> None:
+    index = FrameFilterIndex(COLUMNS)
+    for iid, parent in (("a", ""), ("a1", "a"), ("a2", "a"), ("b", ""), ("c", ""), ("c1", "c")):
+        index.insert(parent, "end", iid, (iid, "normal", "1", "10", "0x0"))
+    assert index.plan() == {"": ("a", "b", "c"), "a": ("a1", "a2"), "c": ("c1",)}
+    hidden = {"b", "a2", "c", "c1"}
+    assert index.plan(hidden) == {"": ("a",), "a": ("a1",), "c": ()}
+    index.insert("", 1, "z", ("z",))
+    assert index.plan(hidden)[""] == ("a", "z")
+
+
+def test_reorder_sorts_hidden_rows_and_keeps_the_plan_filtered() -> None:
+    index = FrameFilterIndex(COLUMNS)
+    for iid, damage in (("a", "30"), ("b", "10"), ("c", "20"), ("d", "40")):
+        index.insert("", "end", iid, (iid, "normal", "1", damage, "0x0"))
+    index.insert("a", "end", "a1", ("a1",))
+    version = index.structure_version
+    ordered = sorted(index.children(""), key=lambda iid: int(index.value(iid, "damage")))
+    index.reorder("", ordered + ["a1", "zz"])
+    assert index.children("") == ("b", "c", "a", "d")
+    assert index.structure_version == version + 1
+    assert index.plan({"c"}) == {"": ("b", "a", "d"), "a": ("a1",)}
+    # Unlisted children keep their order after the listed ones.
+    index.reorder("", ["d"])
+    assert index.children("") == ("d", "b", "c", "a")
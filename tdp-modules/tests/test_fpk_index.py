@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import random
+from pathlib import Path
+
+import pytest
+
+from tvcgui.features.stage_select import fpk
+from tvcgui.features.stage_select.fpk import FpkArchiveIndex, PrsFormatError
+
+
+class _PrsWriter:
+    def __init__(self) -> None:
+        self.out = bytearray()
+        self._control = -1
+        self._used = 8
+
+    def bit(self, value: int) -> None:
+        if self._used == 8:
+            self._control = len(self.out)
+            self.out.append(0)
+            self._used = 0
+        if value:
+            self.out[self._control] |= 0x80 >> self._used
+        self._used += 1
+
+    def literal(self, value: int) -> None:
+        self.bit(1)
+        self.out.append(value)
+
+    def short_copy(self, distance: int, count: int) -> None:
+        self.bit(0)
+        self.bit(0)
+        self.bit((count - 2) >> 1)
+        self.bit((count - 2) & 1)
+        self.out.append(0x100 - distance)
+
+    def long_copy(self, distance: int, count: int) -> None:
+        self.bit(0)
+        self.bit(1)
+        word = (0x2000 - distance) << 3
+        if 3 <= count <= 9:
+            self.out += (word | (count - 2)).to_bytes(2, "big")
+        else:
+            self.out += word.to_bytes(2, "big")
+            self.out.append(count - 1)
+
+
+def _random_stream(rng: random.Random) -> tuple[bytes, int]:
+    writer = _PrsWriter()
+    produced = 0
+    for _ in range(rng.randrange(1, 120)):
+        choice = rng.random()
+        if produced == 0 or choice < 0.4:
+            writer.literal(rng.randrange(256))
+            produced += 1
+        elif choice < 0.7:
+            count = rng.randrange(2, 6)
+            writer.short_copy(rng.randrange(1, min(produced, 256) + 1), count)
+            produced += count
+        else:
+            count = rng.randrange(1, 257)
+            writer.long_copy(rng.randrange(1, min(produced, 0x2000) + 1), count)
+            produced += max(count, 1)
+    return bytes(writer.out), produced
+
+
+def _decode(decoder, data: bytes, size: int):
+    try:
+        return decoder(data, size)
+    except PrsFormatError as exc:
+        return ("error", str(exc))
+
+
+def test_fast_prs_decoder_matches_the_bitwise_reference() -> None:
+    rng = random.Random(0x37)
+    for _ in range(400):
+        stream, produced = _random_stream(rng)
+        for size in (produced, rng.randrange(0, produced + 1), produced + rng.randrange(1, 8)):
+            assert _decode(fpk._prs_decompress, stream, size) == _decode(fpk._prs_decompress_bitwise, stream, size)
+        corrupt = bytearray(stream)
+        corrupt[rng.randrange(len(corrupt))] ^= 1 << rng.randrange(8)
+        assert _decode(fpk._prs_decompress, corrupt, produced) == _decode(fpk._prs_decompress_bitwise, corrupt, produced)
+    payload = bytes(rng.randrange(256) for _ in range(203))
+    literal = fpk._literal_prs_compress(payload)
+    for size in (0, 8, 200, 203, 210):
+        assert _decode(fpk._prs_decompress, literal, size) == _decode(fpk._prs_decompress_bitwise, literal, size)
+    for _ in range(400):
+        noise = bytes(rng.randrange(256) for _ in range(rng.randrange(0, 48)))
+        size = rng.randrange(0, 160)
+        assert _decode(fpk._prs_decompress, noise, size) == _decode(fpk._prs_decompress_bitwise, noise, size)
+
+
+def _write_fpk(path: Path, files: dict[str, bytes]) -> None:
+    directory = 0x10
+    cursor = directory + len(files) * 0x30
+    table = bytearray()
+    blobs = bytearray()
+    for name, payload in files.items():
+        compressed = fpk._literal_prs_compress(payload)
+        table += name.encode("ascii").ljust(0x24, b"\0")
+        table += (cursor + len(blobs)).to_bytes(4, "big")
+        table += len(compressed).to_bytes(4, "big")
+        table += len(payload).to_bytes(4, "big")
+        blobs += compressed
+    header = bytearray(0x10)
+    header[0x04:0x08] = len(files).to_bytes(4, "big")
+    header[0x08:0x0C] = directory.to_bytes(4, "big")
+    header[0x0C:0x10] = (cursor + len(blobs)).to_bytes(4, "big")
+    path.write_bytes(bytes(header + table + blobs))
+
+
+@pytest.fixture
+def index(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> FpkArchiveIndex:
+    created = FpkArchiveIndex(tmp_path / "fpk_index.json")
+    monkeypatch.setattr(fpk, "_ARCHIVE_INDEX", created)
+    return created
+
+
+def test_second_scan_is_served_from_the_persistent_index(tmp_path: Path, index: FpkArchiveIndex, monkeypatch: pytest.MonkeyPatch) -> None:
+    root = tmp_path / "disc"
+    root.mkdir()
+    sequence = b"stg01\0\0\0stg01\0\0\0" + bytes(range(256)) * 4
+    _write_fpk(root / "stage.fpk", {fpk._STAGE_SEQUENCE: sequence, fpk._STAGE_LAYOUT: b"layout"})
+    _write_fpk(root / "other.fpk", {"chr/ryu.arc": b"ryu"})
+
+    first = fpk.scan_for_stage_archives(root)
+    assert index.stats()["misses"] == 2
+    assert first["candidates"][0]["stage_menu"]["sequence"]["decoded_sha1"]
+
+    reopened = FpkArchiveIndex(index.path)
+    monkeypatch.setattr(fpk, "_ARCHIVE_INDEX", reopened)
+    monkeypatch.setattr(fpk, "_inspect_fpk_uncached", lambda _archive: pytest.fail("archive was re-read"))
+    assert fpk.scan_for_stage_archives(root) == first
+    assert reopened.stats()["hits"] == 2
+    assert reopened.decoded_hashes(root / "stage.fpk") == {
+        fpk._STAGE_SEQUENCE: first["candidates"][0]["stage_menu"]["sequence"]["decoded_sha1"]
+    }
+
+
+def test_changed_or_removed_archives_are_reinspected(tmp_path: Path, index: FpkArchiveIndex) -> None:
+    root = tmp_path / "disc"
+    root.mkdir()
+    _write_fpk(root / "a.fpk", {"menu/main/title.seq": b"title"})
+    _write_fpk(root / "b.fpk", {"stage/stg01.arc": b"stage"})
+    fpk.scan_for_stage_archives(root)
+
+    _write_fpk(root / "a.fpk", {"stage/stg02.arc": b"stage two"})
+    (root / "b.fpk").unlink()
+    result = fpk.scan_for_stage_archives(root)
+    assert [Path(row["path"]).name for row in result["candidates"]] == ["a.fpk"]
+    assert index.stats()["archives"] == 1
+    assert fpk.inspect_fpk(root / "a.fpk", use_index=False) == fpk.inspect_fpk(root / "a.fpk")
+
+
+def test_inspect_saves_the_index_only_after_a_miss(tmp_path: Path, index: FpkArchiveIndex, monkeypatch: pytest.MonkeyPatch) -> None:
+    archive = tmp_path / "a.fpk"
+    _write_fpk(archive, {"stage/stg01.arc": b"stage"})
+    saves = []
+    real_save = index.save
+    monkeypatch.setattr(index, "save", lambda: saves.append(1) or real_save())
+
+    first = fpk.inspect_fpk(archive)
+    assert saves == [1] and index.path.exists()
+    assert fpk.inspect_fpk(archive) == first
+    assert saves == [1] and index.stats()["hits"] == 1
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from tvcgui.features.frame_data import spreadsheet_export
+from tvcgui.features.frame_data.export_history import KEYFRAME_INTERVAL, ExportHistory
+from tvcgui.features.frame_data.spreadsheet_export import FrameDataSpreadsheetExporter
+
+
+def _csv(version: int, rows: int = 200) -> bytes:
+    lines = ["row_key,damage,notes\r\n"]
+    lines.extend(f"k{index},{1000 + index + (version if index % 50 == 0 else 0)},x\r\n" for index in range(rows))
+    return "".join(lines).encode("utf-8")
+
+
+def test_versions_are_deltas_and_restore_exactly(tmp_path: Path) -> None:
+    history = ExportHistory(tmp_path / "history", keep_versions=64)
+    for version in range(KEYFRAME_INTERVAL + 3):
+        assert history.record("a.csv", _csv(version)) == version + 1
+    assert history.record("a.csv", _csv(KEYFRAME_INTERVAL + 2)) == KEYFRAME_INTERVAL + 3
+
+    stats = history.stats()
+    assert stats["versions"] == KEYFRAME_INTERVAL + 3
+    assert stats["stored_bytes"] < len(_csv(0)) * 2
+    for number in (1, 7, KEYFRAME_INTERVAL + 1, KEYFRAME_INTERVAL + 3):
+        assert ExportHistory(tmp_path / "history", keep_versions=64).read_version("a.csv", number) == _csv(number - 1)
+
+    diff = history.diff_versions("a.csv", 1, 2)
+    assert diff["added"] == [] and diff["removed"] == []
+    assert diff["changed"]["k50"] == {"damage": ("1050", "1051")}
+
+
+def test_retention_prunes_and_rebases_surviving_deltas(tmp_path: Path) -> None:
+    history = ExportHistory(tmp_path / "history", keep_versions=3)
+    for version in range(6):
+        history.record("a.csv", _csv(version))
+    assert [entry["n"] for entry in history.versions("a.csv")] == [4, 5, 6]
+    assert history.read_version("a.csv", 4) == _csv(3)
+    assert history.stats()["objects"] == 3
+    with pytest.raises(KeyError):
+        history.read_version("a.csv", 2)
+
+    capped = ExportHistory(tmp_path / "capped", max_bytes=1)
+    capped.record("a.csv", _csv(0))
+    capped.record("b.csv", _csv(1))
+    capped.record("a.csv", _csv(2))
+    assert [entry["n"] for entry in capped.versions("a.csv")] == [2]
+    assert capped.read_version("a.csv", 2) == _csv(2)
+
+
+def _slot(damage: int) -> dict:
+    return {
+        "char_id": 1,
+        "char_name": "Ryu",
+        "profile_key": "id_01_ryu",
+        "moves": [{"id": 0x100 + index, "kind": "normal", "move_label": f"{index}A", "damage": damage} for index in range(4)],
+    }
+
+
+def test_exporter_replaces_previous_copies_with_history(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(spreadsheet_export, "prior_root_export_path", lambda: tmp_path / "prior" / "master.csv")
+    monkeypatch.setattr(spreadsheet_export, "prior_root_character_directory", lambda: tmp_path / "prior" / "chars")
+    character_directory = tmp_path / spreadsheet_export.EXPORT_DIRECTORY_NAME
+    character_directory.mkdir()
+    (character_directory / "01_Ryu.previous.csv").write_bytes(b"legacy\r\n")
+
+    exporter = FrameDataSpreadsheetExporter(master_path=tmp_path / "master.csv", background=False, startup_rebuild=False)
+    assert not list(tmp_path.rglob("*.previous.csv"))
+    exporter.upsert_scan_rows([_slot(100)])
+    exporter.upsert_scan_rows([_slot(200)])
+    assert not list(tmp_path.rglob("*.previous.csv"))
+
+    character_csv = Path(spreadsheet_export.EXPORT_DIRECTORY_NAME) / "01_Ryu.csv"
+    versions = exporter.export_versions(character_csv)
+    assert [entry["source"] for entry in versions] == ["legacy-previous", "export", "export"]
+    assert exporter.history.read_version(character_csv.as_posix(), 1) == b"legacy\r\n"
+    assert len(exporter.diff_export_versions(2, 3, character_csv)["changed"]) == 4
+
+    assert exporter.restore_export_version(2, character_csv)
+    restored = (tmp_path / character_csv).read_text(encoding="utf-8-sig")
+    assert ",100," in restored and ",200," not in restored
+    assert exporter.export_versions(character_csv)[-1]["source"] == "restore:2"
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import csv
+from pathlib import Path
+
+import pytest
+
+from tvcgui.features.frame_data import spreadsheet_export
+from tvcgui.features.frame_data.spreadsheet_export import FrameDataSpreadsheetExporter
+
+
+@pytest.fixture(autouse=True)
+def _no_prior_layout(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(spreadsheet_export, "prior_root_export_path", lambda: tmp_path / "prior" / "master.csv")
+    monkeypatch.setattr(spreadsheet_export, "prior_root_character_directory", lambda: tmp_path / "prior" / "chars")
+
+
+def _slot(char_id: int, name: str, damage: int) -> dict:
+    return {
+        "char_id": char_id,
+        "char_name": name,
+        "profile_key": f"id_{char_id:02d}_{name.lower()}",
+        "slot_label": "P1-C1",
+        "moves": [
+            {"id": 0x100 + index, "kind": "normal", "move_label": f"{name} {index}A", "damage": damage + index}
+            for index in range(3)
+        ],
+    }
+
+
+def _exporter(tmp_path: Path) -> FrameDataSpreadsheetExporter:
+    return FrameDataSpreadsheetExporter(master_path=tmp_path / "master.csv", background=False, startup_rebuild=False)
+
+
+def _master_rows(path: Path) -> list[dict]:
+    with path.open("r", encoding="utf-8-sig", newline="") as handle:
+        return list(csv.DictReader(handle))
+
+
+def test_unchanged_character_is_skipped(tmp_path: Path) -> None:
+    exporter = _exporter(tmp_path)
+    assert exporter.upsert_scan_rows([_slot(1, "Ryu", 1000), _slot(2, "Ken", 900)])
+    assert exporter.last_character_write_count == 2
+    master_stamp = exporter.path.stat().st_mtime_ns
+
+    assert exporter.upsert_scan_rows([_slot(1, "Ryu", 1000), _slot(2, "Ken", 950)])
+    assert exporter.last_character_write_count == 1
+    assert exporter.last_character_skip_count == 1
+    assert exporter.last_master_changed_rows == 3
+    assert exporter.path.stat().st_mtime_ns >= master_stamp
+
+    assert exporter.upsert_scan_rows([_slot(1, "Ryu", 1000), _slot(2, "Ken", 950)])
+    assert exporter.last_character_skip_count == 2
+
+
+def test_incremental_master_matches_a_full_compile(tmp_path: Path) -> None:
+    exporter = _exporter(tmp_path)
+    exporter.upsert_scan_rows([_slot(1, "Ryu", 1000), _slot(2, "Ken", 900)])
+    exporter.upsert_scan_rows([_slot(2, "Ken", 800), _slot(3, "Chun", 700)])
+    incremental = exporter.path.read_text(encoding="utf-8-sig")
+
+    assert exporter.compile_master_from_character_exports()
+    assert exporter.path.read_text(encoding="utf-8-sig") == incremental
+    assert [row["damage"] for row in _master_rows(exporter.path) if row["character"] == "Ken"] == ["800", "801", "802"]
+
+
+def test_manual_columns_and_external_edits_survive(tmp_path: Path) -> None:
+    exporter = _exporter(tmp_path)
+    exporter.upsert_scan_rows([_slot(1, "Ryu", 1000)])
+    rows = _master_rows(exporter.path)
+    rows[0]["research_notes"] = "checked on stream"
+    with exporter.path.open("w", encoding="utf-8-sig", newline="") as handle:
+        writer = csv.DictWriter(handle, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+    # A second process drops a new character file next to the exporter's own.
+    other = _exporter(tmp_path)
+    other.upsert_scan_rows([_slot(4, "Roll", 300)])
+
+    exporter.upsert_scan_rows([_slot(1, "Ryu", 1100)])
+    merged = _master_rows(exporter.path)
+    assert {row["character"] for row in merged} == {"Ryu", "Roll"}
+    assert [row["research_notes"] for row in merged if row["row_key"] == rows[0]["row_key"]] == ["checked on stream"]
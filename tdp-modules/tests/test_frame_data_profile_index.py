@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from tvcgui.features.frame_data import profile_store
+from tvcgui.features.frame_data.profile_store import (
+    load_frame_data_moves,
+    load_frame_data_profile,
+    load_frame_data_profile_header,
+    profile_index,
+    save_frame_data_profile,
+    sync_frame_data_profile_index,
+)
+
+
+def _profile(key: str, char_id: int, damage: int) -> dict:
+    return {
+        "version": 9,
+        "key": key,
+        "char_id": char_id,
+        "char_name": key,
+        "table_signature": f"sig-{char_id}",
+        "specials": [{"abs": 0x9000_0400}],
+        "moves": [
+            {"id": 0x100, "abs": 0x9000_0000, "damage": damage},
+            {"id": 0x101, "abs": 0x9000_0100, "damage": damage + 1, "hb_x": float("nan")},
+            {"id": 0x101, "abs": 0x9000_0200, "damage": damage + 2},
+        ],
+    }
+
+
+@pytest.fixture
+def dirs(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> dict:
+    monkeypatch.setenv("TVC_FD_PROFILE_INDEX_FILE", str(tmp_path / "index.sqlite3"))
+    yield {
+        "bundled_directory": str(tmp_path / "bundled"),
+        "writable_directory": str(tmp_path / "writable"),
+        "bundled_legacy_file": "",
+        "writable_legacy_file": "",
+    }
+    profile_index().close()
+    profile_store._PROFILE_INDEXES.clear()
+
+
+def test_single_move_lookup_matches_the_json_profile(dirs: dict) -> None:
+    save_frame_data_profile("id_01_alpha", _profile("id_01_alpha", 1, 100), writable_directory=dirs["bundled_directory"])
+
+    moves = load_frame_data_moves("id_01_alpha", move_id=0x101, **dirs)
+    assert [move["abs"] for move in moves] == [0x9000_0100, 0x9000_0200]
+    assert load_frame_data_moves("id_01_alpha", abs_addr=0x9000_0200, **dirs)[0]["damage"] == 102
+    assert profile_index().load_header("id_01_alpha")["char_id"] == 1
+
+
+def test_saving_a_shard_invalidates_the_indexed_copy(dirs: dict) -> None:
+    save_frame_data_profile("id_01_alpha", _profile("id_01_alpha", 1, 100), writable_directory=dirs["bundled_directory"])
+    assert load_frame_data_moves("id_01_alpha", move_id=0x100, **dirs)[0]["damage"] == 100
+
+    save_frame_data_profile("id_01_alpha", _profile("id_01_alpha", 1, 5000), writable_directory=dirs["writable_directory"])
+    assert load_frame_data_moves("id_01_alpha", move_id=0x100, **dirs)[0]["damage"] == 5000
+    assert load_frame_data_moves("id_01_alpha", move_id=0x100, expected_version=8, **dirs) == []
+
+
+def test_index_backend_round_trips_and_exports_shards(dirs: dict, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    for char_id, key in ((1, "id_01_alpha"), (2, "id_02_beta")):
+        save_frame_data_profile(key, _profile(key, char_id, char_id * 100), writable_directory=dirs["bundled_directory"])
+    report = sync_frame_data_profile_index(**dirs)
+    assert report["synced"] == ["id_01_alpha", "id_02_beta"]
+
+    json_copy = load_frame_data_profile("id_02_beta", **dirs)
+    monkeypatch.setenv("TVC_FD_PROFILE_BACKEND", "index")
+    indexed_copy = load_frame_data_profile("id_02_beta", **dirs)
+    assert json.dumps(indexed_copy, sort_keys=True) == json.dumps(json_copy, sort_keys=True)
+
+    exported = profile_index().export_shards(str(tmp_path / "exported"))
+    assert len(exported["written"]) == 2
+    shard = json.loads((tmp_path / "exported" / "id_01_alpha.json").read_text(encoding="utf-8"))
+    assert shard["moves"][2]["damage"] == 102
+
+
+def test_header_loads_skip_the_move_rows(dirs: dict, monkeypatch: pytest.MonkeyPatch) -> None:
+    from tvcgui.features.frame_data.profile_index import ProfileIndex
+
+    save_frame_data_profile("id_01_alpha", _profile("id_01_alpha", 1, 100), writable_directory=dirs["bundled_directory"])
+    json_header = load_frame_data_profile_header("id_01_alpha", **dirs)
+    assert "moves" not in json_header and json_header["specials"] == [{"abs": 0x9000_0400}]
+
+    def no_rows(*_args, **_kwargs):
+        raise AssertionError("a header load must not decode move rows")
+
+    monkeypatch.setenv("TVC_FD_PROFILE_BACKEND", "index")
+    monkeypatch.setattr(ProfileIndex, "iter_moves", no_rows)
+    monkeypatch.setattr(ProfileIndex, "find_moves", no_rows)
+    assert load_frame_data_profile_header("id_01_alpha", **dirs) == json_header
+    assert load_frame_data_profile_header("id_01_alpha", expected_version=8, **dirs) is None
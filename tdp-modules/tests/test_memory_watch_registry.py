@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import queue
+import struct
+import unittest
+
+from tvcgui.platform.memory_watch import WatchRegistry
+
+
+class FakeRam:
+    def __init__(self, base: int = 0x92000000, size: int = 0x4000) -> None:
+        self.base = base
+        self.data = bytearray(size)
+        self.reads: list[tuple[int, int]] = []
+
+    def read(self, addr: int, size: int) -> bytes:
+        self.reads.append((addr, size))
+        off = addr - self.base
+        return bytes(self.data[off:off + size])
+
+    def put_u32(self, addr: int, value: int) -> None:
+        off = addr - self.base
+        self.data[off:off + 4] = struct.pack(">I", value)
+
+
+class MemoryWatchRegistryTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.ram = FakeRam()
+        self.registry = WatchRegistry(read_func=self.ram.read, max_polled_bytes=64)
+
+    def test_nearby_watches_share_one_read_per_poll(self) -> None:
+        base = self.ram.base + 0x100
+        self.registry.register(base, 4, label="a")
+        self.registry.register(base + 0x10, 4, label="b")
+        self.registry.register(base + 0x2000, 4, label="far")
+        self.registry.poll()
+        self.assertEqual(len(self.ram.reads), 2)
+
+    def test_only_changes_are_dispatched(self) -> None:
+        addr = self.ram.base + 0x200
+        seen = []
+        events: queue.Queue = queue.Queue()
+        self.registry.register(addr, 4, callback=lambda a, old, new: seen.append((old, new)))
+        watch_id = self.registry.register(addr, 4, queue=events, label="meter")
+
+        self.assertEqual(self.registry.poll(), 2)
+        self.assertEqual(self.registry.poll(), 0)
+        self.ram.put_u32(addr, 50000)
+        self.assertEqual(self.registry.poll(), 2)
+
+        self.assertEqual(seen[-1], (b"\x00\x00\x00\x00", struct.pack(">I", 50000)))
+        self.assertEqual(events.qsize(), 2)
+        self.assertEqual(self.registry.value_u32(watch_id), 50000)
+        stats = self.registry.stats()
+        self.assertEqual(stats["per_watch"]["meter"]["hits"], 2)
+        self.assertEqual(stats["per_watch"]["meter"]["polls"], 3)
+
+    def test_registrations_over_the_byte_cap_are_refused(self) -> None:
+        self.assertTrue(self.registry.register(self.ram.base, 60))
+        self.assertEqual(self.registry.register(self.ram.base + 0x100, 8), 0)
+        self.assertEqual(self.registry.stats()["rejected"], 1)
+
+    def test_stale_value_is_hidden_when_max_age_is_given(self) -> None:
+        watch_id = self.registry.register(self.ram.base, 4)
+        self.assertIsNone(self.registry.value(watch_id))
+        self.registry.poll()
+        self.assertIsNotNone(self.registry.value(watch_id, max_age_sec=10.0))
+        self.assertIsNone(self.registry.value(watch_id, max_age_sec=-1.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -97,4 +97,5 @@ def test_action_frame_samples_do_not_bloat_mission_edge_queue() -> None:
     source = (ROOT / "tvcgui" / "runtime" / "realtime_sampler.py").read_text(encoding="utf-8")
     assert "if meaningful_change:" in source
     assert "Action-frame-only" in source
-    assert "listener(slot, dict(sample))" in source
+    # Listeners share the frozen published sample instead of per-listener copies.
+    assert "listener(slot, sample)" in source
@@ -355,3 +355,78 @@ def test_recovery_idle_respects_step_grace_before_resetting():
     ])
     assert result.cleared
     assert result.attempt_id == 1
+
+
+def test_compiled_steps_precompute_expected_labels_and_event_kinds():
+    from tvcgui.features.training.mission_runtime_v2 import StepKind, compile_steps
+
+    steps = compile_steps([
+        {"labels": ["5C"], "input": "5C"},
+        {"labels": ["Jump Cancel"], "input": "7 / 8 / 9"},
+        {"labels": ["Legs C"], "input": "C C C"},
+    ])
+    assert steps[0].expected == ("5C", "5C")
+    assert steps[0].owner_event_kinds == frozenset({EVENT_ACTION})
+    assert steps[1].kind == StepKind.JUMP_CANCEL
+    assert steps[1].owner_event_kinds == frozenset({EVENT_INPUT, EVENT_JUMP})
+    assert EVENT_INPUT in steps[2].owner_event_kinds
+
+
+def test_action_labels_are_not_resolved_while_step_waits_for_input():
+    runtime = MissionRuntimeV2()
+    configure(runtime, [{"labels": ["Baroque cancel"]}, {"labels": ["5C"]}])
+    calls = []
+
+    def counting_resolver(event):
+        calls.append(event.sequence)
+        return resolver(event)
+
+    result = runtime.consume(
+        [
+            ev(1, EVENT_ACTION, action_id=0x102),
+            ev(2, EVENT_INPUT, pressed=0x90, held=0x90),
+            ev(3, EVENT_ACTION, action_id=0x102),
+        ],
+        owner_slot="P1-C1",
+        label_matcher=matcher,
+        action_label_resolver=counting_resolver,
+        newest_sequence=3,
+    )
+    assert result.progress_index == 1
+    assert calls == [3]
+
+
+def test_label_matcher_verdicts_are_memoised_per_step():
+    runtime = MissionRuntimeV2()
+    configure(runtime, [{"labels": ["Tatsu B"]}])
+    calls = []
+
+    def counting_matcher(candidate, expected):
+        calls.append(candidate)
+        return matcher(candidate, expected)
+
+    events = [ev(seq, EVENT_ACTION, action_id=0x130) for seq in range(1, 6)]
+    runtime.consume(
+        events,
+        owner_slot="P1-C1",
+        label_matcher=counting_matcher,
+        action_label_resolver=resolver,
+        newest_sequence=5,
+    )
+    assert calls == ["Tatsu A"]
+
+
+def test_every_shipped_mission_route_compiles_to_a_dispatchable_matcher():
+    import json
+    from pathlib import Path
+
+    from tvcgui.features.training.mission_runtime_v2 import compile_steps
+
+    mission_dir = Path(__file__).resolve().parents[1] / "missions"
+    files = sorted(mission_dir.glob("*.json"))
+    assert len(files) >= 27
+    for path in files:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        for mission in data.get("missions") or []:
+            for step in compile_steps(mission.get("steps") or []):
+                assert step.owner_event_kinds, (path.name, step.label)
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from tvcgui.features.frame_data import move_families as families
+
+
+def _helper(abs_addr: int, damage_addrs: tuple[int, ...]) -> dict:
+    return {
+        "id": 0x0150,
+        "abs": abs_addr,
+        "move_name": "anim_0150",
+        "move_name_source": "anim",
+        "kind": "special",
+        "hit_segments": [{"damage": 900, "damage_addr": addr} for addr in damage_addrs],
+    }
+
+
+def test_multihit_helpers_attach_to_the_nearest_named_owner() -> None:
+    moves = [
+        {"id": 0x0140, "abs": 0x90900000, "move_name": "Bird Run A", "move_name_source": "lookup", "kind": "special"},
+        {"id": 0x0141, "abs": 0x90905000, "move_name": "Bird Run B", "move_name_source": "lookup", "kind": "special"},
+        _helper(0x90900600, (0x90900640, 0x90900680)),
+        _helper(0x90904C00, (0x90904C40, 0x90904C80)),
+        # Far from every owner.
+        _helper(0x90990000, (0x90990040, 0x90990080)),
+    ]
+    out = families.annotate_move_families(moves, "Ken")
+    assert out[2]["linked_owner_abs"] == 0x90900000
+    assert out[3]["linked_owner_abs"] == 0x90905000
+    assert "linked_owner_abs" not in out[4]
+    assert out[2]["family_link_label"].endswith("Linked hits")
+
+
+def test_helpers_that_duplicate_an_owned_multihit_are_left_alone() -> None:
+    owner = {
+        "id": 0x0142,
+        "abs": 0x90900000,
+        "move_name": "Eagle Rush",
+        "move_name_source": "lookup",
+        "kind": "special",
+        "hit_segments": [{"damage": 900, "damage_addr": 0x90900640}, {"damage": 900, "damage_addr": 0x90900680}],
+    }
+    wrapper = {"id": 0x0143, "abs": 0x90900400, "move_name": "Tek Lancer", "move_name_source": "lookup", "kind": "special"}
+    moves = [owner, wrapper, _helper(0x90900600, (0x90900640, 0x90900680))]
+    out = families.annotate_move_families(moves, "Ken")
+    assert "linked_owner_abs" not in out[2]
+
+
+def test_regrouping_after_one_edit_parses_only_that_row() -> None:
+    moves = [
+        {"id": 0x0130 + n, "abs": 0x90900000 + n * 0x200, "move_name": f"Hado {s} {p}", "move_name_source": "lookup", "kind": "special"}
+        for n, (s, p) in enumerate((s, p) for s in "LMH" for p in ("Start", "Loop", "End"))
+    ]
+    families.annotate_move_families(moves, "Ken")
+    before = families._classify_name.cache_info()
+    moves[4]["move_name"] = "Hado M Spin"
+    out = families.annotate_move_families(moves, "Ken")
+    after = families._classify_name.cache_info()
+    assert after.misses - before.misses == 1
+    assert after.hits - before.hits == len(moves) - 1
+    assert out[4]["family_phase"] == "Spin" and out[4]["family_label"] == "Hado"
+    # Cached results are copied per row, never shared.
+    out[0]["family_label"] = "edited"
+    assert families.classify_move(moves[0], "Ken")["family_label"] == "Hado"
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from tvcgui.features.combat import move_id_map
+
+CSV = (
+    "# Ryu (ID: 1)\n"
+    "256,0x100,5A,,,,1\n"
+    "257,0x101,6B,,,,1\n"
+    "300,0x12c,Dash,,,,100\n"
+    "256,0x100,Generic 5A,,,,100\n"
+)
+
+
+@pytest.fixture
+def csv_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    path = tmp_path / "move_id_map_charagnostic.csv"
+    path.write_text(CSV, encoding="utf-8")
+    monkeypatch.setattr(move_id_map, "_find_csv_path", lambda: str(path))
+    monkeypatch.setattr(move_id_map, "_index_path", lambda: str(tmp_path / "move_id_map_charagnostic.idx"))
+    move_id_map.reload_move_id_map()
+    yield path
+    move_id_map.reload_move_id_map()
+
+
+def test_index_is_reused_until_the_csv_changes(csv_path: Path) -> None:
+    assert move_id_map.lookup_move_name(256, 1) == "5A"
+    assert move_id_map.get_move_id_map_stats()["source"] == "csv"
+    assert (csv_path.parent / "move_id_map_charagnostic.idx").is_file()
+
+    move_id_map.reload_move_id_map()
+    assert move_id_map.lookup_move_name(300, 1) == "Dash"
+    assert move_id_map.get_move_id_map_stats()["source"] == "index"
+
+    csv_path.write_text(CSV.replace("Dash", "Forward Dash"), encoding="utf-8")
+    move_id_map.reload_move_id_map()
+    assert move_id_map.lookup_move_name(300, 1) == "Forward Dash"
+    assert move_id_map.get_move_id_map_stats()["source"] == "csv"
+
+
+def test_memo_matches_direct_resolution(csv_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    keys = [(256, 1), (257, 1), (300, 1), (256, 7), (999, 1), (256, None)]
+    first = [move_id_map.lookup_move_name(anim_id, char_id) for anim_id, char_id in keys]
+    assert first == [move_id_map._resolve_move_name(anim_id, char_id) for anim_id, char_id in keys]
+    assert move_id_map.get_move_id_map_stats()["memo_entries"] == len(keys)
+
+    monkeypatch.setattr(move_id_map, "_resolve_move_name", lambda *_args: pytest.fail("memo missed"))
+    assert [move_id_map.lookup_move_name(anim_id, char_id) for anim_id, char_id in keys] == first
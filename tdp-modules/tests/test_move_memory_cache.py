@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import threading
+
+from tvcgui.platform.move_memory import MoveMemoryCache
+
+BASE = 0x90800000
+
+
+class _Memory:
+    def __init__(self, size: int = 0x4000) -> None:
+        self.image = bytearray(n & 0xFF for n in range(size))
+        self.reads = 0
+
+    def rbytes(self, addr: int, size: int) -> bytes:
+        self.reads += 1
+        off = addr - BASE
+        return bytes(self.image[off:off + size])
+
+
+def test_contained_reads_are_served_from_one_block() -> None:
+    memory = _Memory()
+    cache = MoveMemoryCache(memory.rbytes)
+    rbytes = cache.reader(7)
+    assert rbytes(BASE + 0x100, 0x800) == memory.image[0x100:0x900]
+    assert rbytes(BASE + 0x180, 0x10) == memory.image[0x180:0x190]
+    assert rbytes(BASE + 0x8F0, 0x10) == memory.image[0x8F0:0x900]
+    assert memory.reads == 1
+
+    # Past the block end, or under another character, is a fresh read.
+    rbytes(BASE + 0x8F0, 0x20)
+    cache.read(BASE + 0x180, 0x10, char=8)
+    assert memory.reads == 3
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"]) == (2, 3)
+
+
+def test_only_overlapping_writes_bump_the_generation() -> None:
+    memory = _Memory()
+    cache = MoveMemoryCache(memory.rbytes)
+    cache.read(BASE + 0x1000, 0x400, char=1)
+    assert not cache.note_write(BASE + 0x0FFC, 4)
+    assert not cache.note_write(BASE + 0x1400, 1)
+    assert cache.generation == 0
+
+    memory.image[0x1200] = 0xEE
+    assert cache.note_write(BASE + 0x1200, 1)
+    assert cache.generation == 1
+    assert cache.read(BASE + 0x1200, 1, char=1) == b"\xEE"
+    assert cache.stats()["invalidations"] == {"write": 1}
+
+
+def test_roster_changes_and_reloads_invalidate() -> None:
+    memory = _Memory()
+    cache = MoveMemoryCache(memory.rbytes)
+    assert not cache.note_roster((("P1-C1", 12),))
+    cache.read(BASE, 0x100, char=12)
+    assert not cache.note_roster((("P1-C1", 12),))
+    assert cache.note_roster((("P1-C1", 14),))
+    cache.read(BASE, 0x100, char=14)
+    cache.bump("reload")
+    cache.read(BASE, 0x100, char=14)
+    assert memory.reads == 3
+    assert cache.stats()["invalidations"] == {"roster": 1, "reload": 1}
+
+
+def test_reads_in_flight_across_a_bump_are_not_stored() -> None:
+    memory = _Memory()
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow(addr: int, size: int) -> bytes:
+        started.set()
+        release.wait(5.0)
+        return memory.rbytes(addr, size)
+
+    cache = MoveMemoryCache(slow)
+    worker = threading.Thread(target=cache.read, args=(BASE, 0x100), kwargs={"char": 3})
+    worker.start()
+    started.wait(5.0)
+    cache.bump("write")
+    release.set()
+    worker.join(5.0)
+    assert cache.stats()["stale_drops"] == 1 and cache.stats()["blocks"] == 0
+
+
+def test_writes_landing_on_an_in_flight_read_keep_it_out_of_the_cache() -> None:
+    memory = _Memory()
+    cache = MoveMemoryCache()
+
+    def racing(addr: int, size: int) -> bytes:
+        data = memory.rbytes(addr, size)
+        # Nothing is cached yet, so only the in-flight range can see this write.
+        memory.image[0x10] = 0xAB
+        assert not cache.note_write(BASE + 0x10, 1)
+        assert not cache.note_write(BASE + 0x3000, 4)
+        return data
+
+    cache._rbytes = racing
+    assert cache.read(BASE, 0x100, char=1)[0x10] == 0x10
+    assert cache.stats()["stale_drops"] == 1 and cache.stats()["blocks"] == 0
+
+    # The next read goes back to memory and is cached as usual.
+    cache._rbytes = memory.rbytes
+    assert cache.read(BASE, 0x100, char=1)[0x10] == 0xAB
+    assert cache.stats()["blocks"] == 1
+
+    # A write elsewhere during a read leaves it cacheable.
+    def elsewhere(addr: int, size: int) -> bytes:
+        cache.note_write(BASE + 0x3000, 4)
+        return memory.rbytes(addr, size)
+
+    cache._rbytes = elsewhere
+    cache.read(BASE + 0x1000, 0x100, char=1)
+    assert cache.stats()["blocks"] == 2 and cache.stats()["stale_drops"] == 1
+
+
+def test_budget_evicts_least_recently_used_blocks() -> None:
+    memory = _Memory()
+    cache = MoveMemoryCache(memory.rbytes, max_bytes=0x300)
+    cache.read(BASE, 0x100, char=1)
+    cache.read(BASE + 0x100, 0x100, char=1)
+    cache.read(BASE, 0x10, char=1)
+    cache.read(BASE + 0x200, 0x180, char=1)
+    stats = cache.stats()
+    assert stats["bytes"] <= 0x300 and stats["evictions"] == 1
+    reads = memory.reads
+    cache.read(BASE + 0x8, 0x8, char=1)
+    assert memory.reads == reads
+    cache.read(BASE + 0x108, 0x8, char=1)
+    assert memory.reads == reads + 1
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+if "dolphin_memory_engine" not in sys.modules:
+    dme = types.ModuleType("dolphin_memory_engine")
+    dme.is_hooked = lambda: False
+    dme.hook = lambda: None
+    dme.un_hook = lambda: None
+    dme.read_byte = lambda *_args, **_kwargs: 0
+    dme.read_bytes = lambda *_args, **_kwargs: b""
+    dme.write_byte = lambda *_args, **_kwargs: None
+    dme.write_bytes = lambda *_args, **_kwargs: None
+    sys.modules["dolphin_memory_engine"] = dme
+
+from tvcgui.tools.scanners import normal_scanner
+from tvcgui.tools.scanners.normal_scan_cache import NormalScanCache, scan_fingerprint
+
+CHR_TBL = 0x9100_0000
+
+
+@pytest.fixture
+def scanner(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    memory = {"window": bytearray(b"\x11" * 0x400)}
+    calls = []
+
+    def slow_path(char_id, char_name, chr_tbl_abs, tbl_move_addrs, *, tbl_move_entries=None, window_info=None):
+        calls.append(char_name)
+        if window_info is not None:
+            window_info["size"] = len(memory["window"])
+            window_info["digest"] = scan_fingerprint(bytes(memory["window"]))
+        return [{"id": 0x100, "abs": chr_tbl_abs + 0x3600, "damage": memory["window"][0]}]
+
+    monkeypatch.setattr(normal_scanner, "_SCAN_CACHE", NormalScanCache(str(tmp_path / "scan_cache")))
+    monkeypatch.setattr(normal_scanner, "_load_profile_moves", slow_path)
+    monkeypatch.setattr(normal_scanner, "safe_rbytes", lambda _addr, size: bytes(memory["window"][:size]))
+    monkeypatch.setattr(normal_scanner, "frame_data_profile_stamp", lambda *_args, **_kwargs: "stamp-1")
+    return memory, calls
+
+
+def _load(table: bytes = b"\x00\x00\x36\x00" * 4):
+    return normal_scanner._load_profile_moves_cached(1, "Ryu", CHR_TBL, table, [CHR_TBL + 0x3600])
+
+
+def test_repeat_load_is_served_from_the_fingerprint_cache(scanner) -> None:
+    _memory, calls = scanner
+    first, hit = _load()
+    assert not hit
+    second, hit = _load()
+    assert hit and second == first
+    second[0]["damage"] = 0
+    assert _load()[0][0]["damage"] == first[0]["damage"]
+    assert calls == ["Ryu"]
+    stats = normal_scanner.get_normal_scan_cache_stats()
+    assert (stats["hits"], stats["stores"]) == (2, 1)
+
+
+def test_table_or_move_window_changes_miss(scanner) -> None:
+    memory, calls = scanner
+    _load()
+    _load(table=b"\x00\x00\x36\x10" * 4)
+    memory["window"][0] = 0x22
+    moves, hit = _load()
+    assert not hit and moves[0]["damage"] == 0x22
+    assert len(calls) == 3
+
+
+def test_entries_survive_a_new_process_and_can_be_invalidated(scanner, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    _memory, calls = scanner
+    _load()
+    monkeypatch.setattr(normal_scanner, "_SCAN_CACHE", NormalScanCache(str(tmp_path / "scan_cache")))
+    assert _load()[1]
+    assert normal_scanner.clear_normal_scan_cache(1, "Ryu") == 1
+    assert not _load()[1]
+    assert len(calls) == 2
+
+
+@pytest.mark.parametrize("backend", ["json", "index"])
+def test_profile_fast_path_returns_rows_for_a_matching_table(monkeypatch: pytest.MonkeyPatch, backend: str) -> None:
+    addrs = [CHR_TBL + 0x3600, CHR_TBL + 0x3800]
+    profile = {
+        "version": normal_scanner.PROFILE_CACHE_VERSION,
+        "stun_resolver_revision": normal_scanner.STUN_RESOLVER_REVISION,
+        "active_resolver_revision": normal_scanner.ACTIVE_RESOLVER_REVISION,
+        "table_signature": normal_scanner._profile_table_signature(addrs, CHR_TBL),
+        "moves": [{"id": 0x100 + n, "abs": addr - CHR_TBL, "source": "table"} for n, addr in enumerate(addrs)],
+    }
+    loads = []
+
+    def full(key, **_kwargs):
+        loads.append("full")
+        return profile
+
+    def header(key, **_kwargs):
+        loads.append("header")
+        return {name: value for name, value in profile.items() if name != "moves"}
+
+    monkeypatch.setenv("TVC_FD_PROFILE_BACKEND", backend)
+    monkeypatch.setattr(normal_scanner, "_PROFILE_CACHE_BY_KEY", {})
+    monkeypatch.setattr(normal_scanner, "load_frame_data_profile", full)
+    monkeypatch.setattr(normal_scanner, "load_frame_data_profile_header", header)
+    monkeypatch.setattr(normal_scanner, "_read_profile_window", lambda chr_tbl, _moves: (bytes(0x4000), chr_tbl))
+    monkeypatch.setattr(normal_scanner, "_profile_refresh_move", lambda *_args: None)
+
+    moves = normal_scanner._load_profile_moves(1, "Ryu", CHR_TBL, addrs, tbl_move_entries=[(0x100, addrs[0]), (0x101, addrs[1])])
+    assert [mv["abs"] for mv in moves] == addrs and all(mv["_profile_fast_path"] for mv in moves)
+    assert loads == (["header", "full"] if backend == "index" else ["full"])
+
+    # A different table is rejected on the header alone.
+    loads.clear()
+    monkeypatch.setattr(normal_scanner, "_PROFILE_CACHE_BY_KEY", {})
+    assert normal_scanner._load_profile_moves(1, "Ryu", CHR_TBL, addrs[:1]) is None
+    assert loads == (["header"] if backend == "index" else ["full"])
+
+
+def test_counters_reach_the_stats_file_only_on_flush(scanner, tmp_path: Path) -> None:
+    stats_path = tmp_path / "scan_cache" / "stats.json"
+    for _ in range(3):
+        _load()
+    assert not stats_path.exists()
+    assert normal_scanner.get_normal_scan_cache_stats()["all_processes"]["hits"] == 2
+
+    assert normal_scanner._SCAN_CACHE.flush_stats()
+    other = NormalScanCache(str(tmp_path / "scan_cache"))
+    totals = other.stats()["all_processes"]
+    assert (totals["hits"], totals["stores"], totals["last_result"]) == (2, 1, "hits")
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import struct
+import unittest
+from unittest import mock
+
+import tvcgui.platform.patch_manager as pm
+
+
+class FakeMemory:
+    def __init__(self, base: int = 0x90000000, size: int = 0x2000) -> None:
+        self.base = base
+        self.data = bytearray(size)
+        self.reads: list[tuple[int, int]] = []
+        self.writes: list[tuple[int, bytes]] = []
+
+    def rbytes(self, addr: int, size: int) -> bytes:
+        self.reads.append((addr, size))
+        off = addr - self.base
+        return bytes(self.data[off:off + size])
+
+    def wbytes(self, addr: int, data: bytes, **_kwargs) -> bool:
+        self.writes.append((addr, bytes(data)))
+        off = addr - self.base
+        self.data[off:off + len(data)] = data
+        return True
+
+
+class PatchManagerTransactionTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.mem = FakeMemory()
+        patches = (
+            mock.patch.object(pm, "rbytes", self.mem.rbytes),
+            mock.patch.object(pm, "wbytes", self.mem.wbytes),
+        )
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        pm.clear_runtime_patch_state()
+
+    def test_adjacent_dirty_words_commit_as_one_write(self) -> None:
+        base = self.mem.base + 0x100
+        txn = pm.WriteTransaction(key="test:packet")
+        for index in range(6):
+            txn.u32(base + index * 4, index + 1)
+        result = txn.commit()
+
+        self.assertTrue(result["ok"])
+        self.assertEqual(result["reads"], 1)
+        self.assertEqual(result["writes"], 1)
+        self.assertEqual(self.mem.writes[0][0], base)
+        self.assertEqual(self.mem.writes[0][1], struct.pack(">6I", 1, 2, 3, 4, 5, 6))
+
+    def test_clean_edits_are_skipped_and_split_runs_stay_separate(self) -> None:
+        base = self.mem.base + 0x200
+        self.mem.data[0x200:0x204] = struct.pack(">I", 7)
+        result = pm.commit_writes(
+            [
+                (base, struct.pack(">I", 7)),
+                (base + 0x04, struct.pack(">I", 8)),
+                (base + 0x20, struct.pack(">I", 9)),
+            ],
+            key="test:split",
+        )
+        self.assertEqual(result["dirty"], 2)
+        self.assertEqual(result["reads"], 1)
+        self.assertEqual([addr for addr, _ in self.mem.writes], [base + 0x04, base + 0x20])
+
+    def test_later_overlapping_edit_wins(self) -> None:
+        base = self.mem.base + 0x300
+        pm.commit_writes(
+            [(base, b"\x01\x02\x03\x04"), (base + 2, b"\xAA")],
+            key="test:overlap",
+            force=True,
+        )
+        self.assertEqual(bytes(self.mem.data[0x300:0x304]), b"\x01\x02\xAA\x04")
+
+    def test_malformed_edits_are_skipped_and_reported_by_index(self) -> None:
+        base = self.mem.base + 0x500
+        result = pm.commit_writes(
+            [(base, b"\x01"), (0, b"\x02"), (base + 1, 4), (base + 2, b""), ("x",), (base + 3, b"\x05")],
+            key="test:invalid",
+        )
+        self.assertFalse(result["ok"])
+        self.assertEqual([index for index, _reason in result["invalid"]], [1, 2, 3, 4])
+        self.assertEqual(result["edits"], 2)
+        self.assertEqual(bytes(self.mem.data[0x500:0x504]), b"\x01\x00\x00\x05")
+        self.assertIn("first at index 1", pm.get_runtime_patch_state()["last_error"])
+
+    def test_transaction_counts_are_reported_in_runtime_stats(self) -> None:
+        before = pm.get_runtime_patch_state()
+        pm.write_many(
+            {self.mem.base + 0x400: b"\x01", self.mem.base + 0x401: b"\x02"},
+            key="test:many",
+        )
+        stats = pm.get_runtime_patch_state()
+        self.assertEqual(stats["txn_count"], before["txn_count"] + 1)
+        self.assertEqual(stats["last_txn_key"], "test:many")
+        self.assertEqual(stats["last_txn_edits"], 2)
+        self.assertEqual(stats["last_txn_writes"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import struct
+import sys
+import types
+
+import pytest
+
+if "dolphin_memory_engine" not in sys.modules:
+    dme = types.ModuleType("dolphin_memory_engine")
+    dme.is_hooked = lambda: False
+    dme.hook = lambda: None
+    dme.un_hook = lambda: None
+    dme.read_byte = lambda *_args, **_kwargs: 0
+    dme.read_bytes = lambda *_args, **_kwargs: b""
+    dme.write_byte = lambda *_args, **_kwargs: None
+    dme.write_bytes = lambda *_args, **_kwargs: None
+    sys.modules["dolphin_memory_engine"] = dme
+
+from tvcgui.features.frame_data import patch_runtime as P
+
+DAMAGE = bytes((0x35, 0x10, 0x20, 0x3F, 0x00))
+STUN = bytes((0x04, 0x01, 0x60, 0x00, 0x00, 0x00, 0x02, 0x54, 0x3F)) + bytes(6)
+SAVED_BASE = 0x90900000
+
+
+class _Memory:
+    def __init__(self, base: int) -> None:
+        self.base = base
+        self.data = bytearray(0x2000)
+        self.reads: list[tuple[int, int]] = []
+        self.writes: list[tuple[int, bytes]] = []
+
+    def read(self, addr: int, size: int) -> bytes:
+        self.reads.append((addr, size))
+        return bytes(self.data[addr - self.base:addr - self.base + size])
+
+    def write(self, addr: int, data: bytes) -> bool:
+        self.writes.append((addr, bytes(data)))
+        self.data[addr - self.base:addr - self.base + len(data)] = data
+        return True
+
+    def at(self, addr: int, size: int) -> bytes:
+        return bytes(self.data[addr - self.base:addr - self.base + size])
+
+
+def _slot(memory: _Memory) -> dict:
+    moves = []
+    for n in range(4):
+        abs_addr = memory.base + n * 0x400
+        memory.data[n * 0x400 + 0x40:n * 0x400 + 0x45] = DAMAGE
+        memory.data[n * 0x400 + 0x50:n * 0x400 + 0x50 + len(STUN)] = STUN
+        moves.append({"id": 0x100 + n, "abs": abs_addr, "kind": "normal", "move_name": f"Move {n}"})
+    return {"char_name": "Ryu", "slot_label": "P1-C1", "moves": moves}
+
+
+def _change(n: int, group: str, value) -> dict:
+    abs_addr = SAVED_BASE + n * 0x400
+    return {
+        "group": group,
+        "value": value,
+        "selector": {"abs": f"0x{abs_addr:08X}", "move_id": 0x100 + n, "kind": "normal"},
+        "addresses": {
+            "abs": f"0x{abs_addr:08X}",
+            "damage_addr": f"0x{abs_addr + 0x40:08X}", "damage_addr_rel": 0x40,
+            "stun_addr": f"0x{abs_addr + 0x50:08X}", "stun_addr_rel": 0x50,
+            "knockback_addr": f"0x{abs_addr + 0x200:08X}", "knockback_addr_rel": 0x200,
+        },
+    }
+
+
+def _document() -> dict:
+    changes = []
+    for n in range(4):
+        changes += [_change(n, "damage", 1200), _change(n, "hitstun", 18), _change(n, "kb_x", 2.5)]
+    changes.append(_change(0, "move", 0x0140))
+    changes.append(_change(1, "kb_x", float("nan")))
+    return {"schema": P.SCHEMA, "characters": {"Ryu": {"changes": changes}}, "_path": "a.json"}
+
+
+@pytest.fixture(autouse=True)
+def _fresh():
+    P.clear_compiled_patches()
+    P._LIVE_ENTRIES_BY_CHAR.clear()
+    yield
+    P.clear_compiled_patches()
+    P._LIVE_ENTRIES_BY_CHAR.clear()
+
+
+def test_documents_compile_once_per_content() -> None:
+    doc = _document()
+    compiled = P.compile_patch_document(doc)
+    section = compiled.sections["Ryu"]
+    assert len(section.ops) == 12
+    assert [e["group"] for e in section.deferred] == ["move"]
+    assert section.errors[0][1].startswith("invalid value")
+    assert section.ops[0].writes == ((0x45, (1200).to_bytes(3, "big")),)
+
+    moved = dict(_document(), _path="b.json")
+    assert P.compile_patch_document(moved) is compiled
+    assert P.patch_compile_stats() == {"compiles": 1, "hits": 1, "cached": 1}
+    moved["characters"]["Ryu"]["changes"][0]["value"] = 1300
+    assert P.compile_patch_document(moved) is not compiled
+
+
+@pytest.mark.parametrize("base", [SAVED_BASE, SAVED_BASE + 0x8000])
+def test_character_load_applies_the_section_as_one_batch(monkeypatch, base) -> None:
+    memory = _Memory(base)
+    slot = _slot(memory)
+    deferred = []
+
+    def per_entry(mv, entry, *, write_to_dolphin=True):
+        deferred.append((mv["id"], entry["group"]))
+        return True, "ok"
+
+    monkeypatch.setattr(P, "apply_patch_change_to_move", per_entry)
+    controller = P.PatchAutoloadController(mode="all", patches=[P.LoadedPatch("a.json", _document())])
+    result = controller.apply_to_scan_data([slot], read_block=memory.read, write_block=memory.write)
+
+    assert result["applied"] == 13 and result["skipped"] == 1
+    assert deferred == [(0x100, "move")]
+    # One read and one write for each row's damage+stun span, one for each knockback block.
+    assert result["reads"] == len(memory.reads) == 8
+    assert result["writes"] == len(memory.writes) == 8
+    for n, mv in enumerate(slot["moves"]):
+        row = n * 0x400 + base
+        assert memory.at(row + 0x45, 3) == (1200).to_bytes(3, "big")
+        assert memory.at(row + 0x50 + 15, 1) == bytes([18])
+        assert memory.at(row + 0x50, len(STUN)) == STUN
+        assert mv["damage"] == 1200 and mv["hitstun"] == 18 and mv["_fd_patched"]
+    assert memory.at(base + 0x200 + 12, 4) == struct.pack(">f", 2.5)
+
+    # The same slot is not written twice.
+    memory.writes.clear()
+    controller.apply_to_scan_data([slot], read_block=memory.read, write_block=memory.write)
+    assert memory.writes == []
+
+
+def test_rows_that_disagree_with_the_saved_layout_are_recompiled(monkeypatch) -> None:
+    memory = _Memory(SAVED_BASE)
+    slot = _slot(memory)
+    moved = slot["moves"][2]
+    memory.data[0x800 + 0x60:0x800 + 0x60 + len(STUN)] = STUN
+    moved["stun_addr"] = moved["abs"] + 0x60
+    slot["moves"][3]["stun_write_verified"] = False
+    monkeypatch.setattr(P, "apply_patch_change_to_move", lambda mv, entry, **_kw: (False, "write failed"))
+    doc = {"schema": P.SCHEMA, "characters": {"Ryu": {"changes": [_change(n, "hitstun", 20) for n in (1, 2, 3)]}}}
+    controller = P.PatchAutoloadController(mode="all", patches=[P.LoadedPatch("a.json", doc)])
+    result = controller.apply_to_scan_data([slot], read_block=memory.read, write_block=memory.write)
+
+    assert result["recompiled"] == 1 and result["applied"] == 2
+    assert memory.at(moved["abs"] + 0x60 + 15, 1) == bytes([20])
+    assert memory.at(moved["abs"] + 0x50 + 15, 1) == b"\x00"
+    # Unverified stun packets keep the per-entry writer.
+    assert result["failures"] == ["Ryu: 0x90900C00: write failed"]
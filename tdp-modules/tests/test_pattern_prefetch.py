@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from tvcgui.features.frame_data import patterns
+from tvcgui.features.frame_data.patterns import MoveRegionPrefetch
+
+BASE = 0x90800000
+STRIDE = 0x640
+
+FINDERS = (
+    patterns.find_hit_spark_addr,
+    patterns.find_limb_stretch_packet,
+    patterns.find_post_animation_link_addr,
+    patterns.find_speed_mod_addr,
+    patterns.find_attack_property_addr,
+    patterns.find_hit_result_flags_addr,
+    patterns.find_combo_kb_mod_addr,
+)
+
+
+class _Memory:
+    def __init__(self, moves: int) -> None:
+        rng = random.Random(0x41)
+        image = bytearray(rng.randrange(256) for _ in range(moves * STRIDE + 0x900))
+        for index in range(moves):
+            off = index * STRIDE
+            image[off + 0x10:off + 0x1A] = b"\x04\x01\x02\x3F\x00\x00\x02\x02\x01\x3C"
+            image[off + 0x20:off + 0x23] = bytes([0x04, index & 0xFF, 0x60])
+            image[off + 0x30:off + 0x37] = patterns.COMBO_KB_SIG_A + bytes([index & 0x7F])
+            image[off + 0x40:off + 0x4C] = bytes([0x20, 0x3F, 0, 0, 0, index & 0x3F, 0x04, 0x17, 0x60, 0, 0, 0])
+            image[off + 0x80:off + 0x84] = patterns.HIT_SPARK_SIG
+            image[off + 0xC0:off + 0xCC] = patterns.HIT_RESULT_OR_SIG
+        self.image = image
+        self.reads = 0
+
+    def rbytes(self, addr: int, size: int) -> bytes:
+        self.reads += 1
+        off = addr - BASE
+        return bytes(self.image[max(0, off):max(0, off + size)])
+
+    def rd8(self, addr: int) -> int | None:
+        data = self.rbytes(addr, 1)
+        return data[0] if data else None
+
+
+@pytest.fixture(autouse=True)
+def _fresh_memo():
+    patterns.clear_finder_memo()
+    yield
+    patterns.clear_finder_memo()
+
+
+def _addrs(moves: int) -> list[int]:
+    return [BASE + index * STRIDE for index in range(moves)]
+
+
+def test_prefetched_finders_match_direct_reads_with_one_region_read() -> None:
+    memory = _Memory(48)
+    addrs = _addrs(48)
+    direct = [finder(addr, memory.rbytes) for addr in addrs for finder in FINDERS]
+    direct += [patterns.find_superbg_addr(addr, memory.rbytes, memory.rd8) for addr in addrs]
+    assert memory.reads == len(addrs) * (len(FINDERS) + 2)
+
+    memory.reads = 0
+    region = MoveRegionPrefetch(memory.rbytes, addrs + [None, 0, addrs[3]])
+    prefetched = [region.run(finder, addr) for addr in addrs for finder in FINDERS]
+    prefetched += [region.run(patterns.find_superbg_addr, addr, region.rd8) for addr in addrs]
+    assert prefetched == direct
+    assert memory.reads == 1
+    assert region.stats["memo_misses"] == len(direct)
+
+
+def test_memo_is_keyed_on_region_bytes() -> None:
+    memory = _Memory(8)
+    addrs = _addrs(8)
+    first = MoveRegionPrefetch(memory.rbytes, addrs)
+    value = first.run(patterns.find_speed_mod_addr, addrs[2])
+
+    again = MoveRegionPrefetch(memory.rbytes, addrs)
+    assert again.run(patterns.find_speed_mod_addr, addrs[2]) == value
+    assert again.stats["memo_hits"] == 1
+
+    memory.image[2 * STRIDE + 0x45] = 0x33
+    edited = MoveRegionPrefetch(memory.rbytes, addrs)
+    addr, speed, _sig = edited.run(patterns.find_speed_mod_addr, addrs[2])
+    assert (addr, speed) == (addrs[2] + 0x45, 0x33)
+    assert edited.stats["memo_hits"] == 0
+
+
+def test_reads_outside_the_region_fall_through_and_are_not_memoised() -> None:
+    memory = _Memory(4)
+    addrs = _addrs(4)
+    region = MoveRegionPrefetch(memory.rbytes, addrs[:1], gap=0)
+    assert region(addrs[0], 0x100) == memory.rbytes(addrs[0], 0x100)
+    memory.reads = 0
+    assert region(addrs[2], 0x10) == bytes(memory.image[2 * STRIDE:2 * STRIDE + 0x10])
+    assert memory.reads == 1 and region.stats["direct_reads"] == 1
+
+    region.run(patterns.find_legacy_anim_u16_addr, addrs[0], lookahead=0x2000)
+    region.run(patterns.find_legacy_anim_u16_addr, addrs[0], lookahead=0x2000)
+    assert region.stats["memo_hits"] == 0
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from pathlib import Path
+
+from tvcgui.features.hitboxes.range_profile_store import RangeProfileStore
+
+
+def _write_json(path: str, payload: dict) -> None:
+    Path(path).write_text(json.dumps(payload, sort_keys=True), encoding="utf-8")
+
+
+def _store(tmp_path: Path, profiles: dict | None = None, **kwargs) -> RangeProfileStore:
+    kwargs.setdefault("interval", 0.0)
+    kwargs.setdefault("background", False)
+    return RangeProfileStore(
+        str(tmp_path / "ranges.json"),
+        profiles if profiles is not None else {"attacks": {}, "bodies": {}},
+        write_payload=kwargs.pop("write_payload", _write_json),
+        schema=5,
+        **kwargs,
+    )
+
+
+def test_marked_entries_are_batched_and_written_once(tmp_path: Path) -> None:
+    attack = {"char_id": 1, "move_id": 256, "reach_from_start": 1.0}
+    store = _store(tmp_path, {"attacks": {"1:256": attack}, "bodies": {}}, interval=60.0)
+    attack["reach_from_start"] = 1.5
+    assert store.mark(attack)
+    assert store.mark(attack)
+    assert store.commit()
+    attack["reach_from_start"] = 2.0
+    store.mark(attack)
+    assert not store.commit()
+    assert store.pending == 1
+
+    written = json.loads((tmp_path / "ranges.json").read_text(encoding="utf-8"))
+    assert written["attacks"]["1:256"]["reach_from_start"] == 1.5
+    assert store.stats()["flushes"] == 1
+    assert store.commit(force=True)
+    written = json.loads((tmp_path / "ranges.json").read_text(encoding="utf-8"))
+    assert written["attacks"]["1:256"]["reach_from_start"] == 2.0
+    assert not store.mark({"char_id": 1, "move_id": 256})
+
+
+def test_draw_thread_never_waits_for_the_writer(tmp_path: Path) -> None:
+    release = threading.Event()
+    calls = []
+
+    def slow_write(path: str, payload: dict) -> None:
+        calls.append(json.dumps(payload))
+        release.wait(5.0)
+        _write_json(path, payload)
+
+    store = _store(tmp_path, write_payload=slow_write, background=True, interval=0.05)
+    body = {"char_id": 3, "samples": 1}
+    store.view["bodies"]["3"] = body
+    store.mark(body)
+    assert store.commit(force=True)
+    deadline = time.monotonic() + 2.0
+    while not calls and time.monotonic() < deadline:
+        time.sleep(0.01)
+    started = time.perf_counter()
+    for samples in range(2, 50):
+        body["samples"] = samples
+        store.mark(body)
+        store.commit(force=True)
+    assert time.perf_counter() - started < 1.0
+    release.set()
+    store.close()
+    written = json.loads((tmp_path / "ranges.json").read_text(encoding="utf-8"))
+    assert written["bodies"]["3"]["samples"] == 49
+    assert store.stats()["last_flush_ms"] > 0
+
+
+def test_failed_write_is_retried(tmp_path: Path) -> None:
+    attempts = []
+
+    def flaky(path: str, payload: dict) -> None:
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise OSError("disk full")
+        _write_json(path, payload)
+
+    store = _store(tmp_path, write_payload=flaky)
+    store.view["bodies"]["4"] = body = {"char_id": 4}
+    store.mark(body)
+    assert store.commit()
+    assert store.stats()["failures"] == 1 and not (tmp_path / "ranges.json").exists()
+    assert store._write_batch()
+    assert json.loads((tmp_path / "ranges.json").read_text(encoding="utf-8"))["bodies"]["4"] == {"char_id": 4}
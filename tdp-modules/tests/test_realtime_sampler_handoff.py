@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import sys
+import threading
+import types
+
+
+if "dolphin_memory_engine" not in sys.modules:
+    dme = types.ModuleType("dolphin_memory_engine")
+    dme.is_hooked = lambda: False
+    dme.hook = lambda: None
+    dme.un_hook = lambda: None
+    dme.read_byte = lambda *_args, **_kwargs: 0
+    dme.read_bytes = lambda *_args, **_kwargs: b""
+    dme.write_byte = lambda *_args, **_kwargs: None
+    dme.write_bytes = lambda *_args, **_kwargs: None
+    sys.modules["dolphin_memory_engine"] = dme
+
+from tvcgui.runtime.realtime_sampler import RealtimeCombatSampler
+
+
+def _sampler() -> RealtimeCombatSampler:
+    return RealtimeCombatSampler(autostart=False, read_packet_fn=lambda *_a, **_k: None)
+
+
+def test_published_frame_is_swapped_not_mutated() -> None:
+    sampler = _sampler()
+    sampler.publish_packet("P1-C1", {"action_id": 0x100, "sample_ns": 10})
+    first = sampler.current_frame()
+    sampler.publish_packet("P2-C1", {"action_id": 0x101, "sample_ns": 20})
+    second = sampler.current_frame()
+
+    assert first is not second
+    assert set(first.latest_by_slot) == {"P1-C1"}
+    assert set(second.latest_by_slot) == {"P1-C1", "P2-C1"}
+    assert second.latest_by_slot["P1-C1"] is first.latest_by_slot["P1-C1"]
+    sampler.close()
+
+
+def test_snapshot_reads_do_not_wait_for_the_publish_lock() -> None:
+    sampler = _sampler()
+    sampler.publish_packet("P1-C1", {"action_id": 0x100, "held": 0x80, "sample_ns": 10})
+    held = threading.Event()
+    release = threading.Event()
+
+    def hold_lock() -> None:
+        with sampler._lock:
+            held.set()
+            release.wait(2.0)
+
+    thread = threading.Thread(target=hold_lock, daemon=True)
+    thread.start()
+    held.wait(1.0)
+    try:
+        latest, samples = sampler.snapshot_for_slot("P1-C1")
+    finally:
+        release.set()
+        thread.join(1.0)
+    assert latest["action_id"] == 0x100
+    assert len(samples) == 1
+    sampler.close()
+
+
+def test_queue_stays_bounded_and_listeners_share_the_published_sample() -> None:
+    sampler = RealtimeCombatSampler(autostart=False, queue_limit=16, read_packet_fn=lambda *_a, **_k: None)
+    seen = []
+    sampler.add_listener(lambda slot, sample: seen.append(sample))
+    for tick in range(40):
+        sampler.publish_packet("P1-C1", {"action_id": 0x100 + tick, "sample_ns": tick + 1})
+
+    _latest, samples = sampler.snapshot_for_slot("P1-C1")
+    assert len(samples) == 16
+    assert samples[-1]["action_id"] == 0x100 + 39
+    assert seen[-1] is sampler.current_frame().latest_by_slot["P1-C1"]
+    assert sampler.lock_stats()["publishes"] == 40
+    sampler.close()
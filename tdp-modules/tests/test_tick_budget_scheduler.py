@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import unittest
+
+from tvcgui.runtime.tick_budget import FrameTickScheduler
+
+
+class FrameTickSchedulerTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.ticks = FrameTickScheduler(frame_budget_ms=10.0)
+        self.ticks.register("mission", priority=100, budget_ms=4.0, critical=True)
+        self.ticks.register("hud", priority=30, budget_ms=2.0, max_defer_frames=2)
+
+    def test_critical_tick_runs_even_when_the_frame_is_spent(self) -> None:
+        self.ticks.begin_frame(0)
+        self.ticks.record("mission", 25.0)
+        self.assertTrue(self.ticks.should_run("mission"))
+
+    def test_non_critical_tick_defers_then_is_forced(self) -> None:
+        decisions = []
+        for frame in range(4):
+            self.ticks.begin_frame(frame)
+            self.ticks.record("mission", 9.5)
+            decisions.append(self.ticks.should_run("hud"))
+            if decisions[-1]:
+                self.ticks.record("hud", 0.5)
+        self.assertEqual(decisions, [False, False, True, False])
+        row = self.ticks.stats()["ticks"]["hud"]
+        self.assertEqual(row["deferrals"], 3)
+        self.assertEqual(row["forced_runs"], 1)
+
+    def test_pending_higher_priority_work_is_reserved(self) -> None:
+        self.ticks.register("megacrash", priority=90, budget_ms=7.0, critical=True)
+        self.ticks.begin_frame(0)
+        self.assertFalse(self.ticks.should_run("hud"))
+        self.ticks.begin_frame(1)
+        self.ticks.record("megacrash", 1.0)
+        self.assertTrue(self.ticks.should_run("hud"))
+
+    def test_overruns_land_in_budget_multiple_buckets(self) -> None:
+        self.ticks.begin_frame(0)
+        self.ticks.record("mission", 5.0)
+        self.ticks.record("mission", 40.0)
+        self.ticks.record("mission", 3.0)
+        row = self.ticks.stats()["ticks"]["mission"]
+        self.assertEqual(row["overruns"], 2)
+        self.assertEqual(row["overrun_histogram"], {"x1.5": 1, ">x8": 1})
+
+    def test_run_records_elapsed_and_reraises(self) -> None:
+        self.ticks.begin_frame(0)
+        ran, result = self.ticks.run("mission", lambda: 7)
+        self.assertEqual((ran, result), (True, 7))
+
+        def boom() -> None:
+            raise RuntimeError("tick failed")
+
+        with self.assertRaises(RuntimeError):
+            self.ticks.run("mission", boom)
+        row = self.ticks.stats()["ticks"]["mission"]
+        self.assertEqual(row["runs"], 2)
+        self.assertEqual(row["errors"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
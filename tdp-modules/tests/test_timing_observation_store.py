@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import json
+
+from tvcgui.features.combat.timing_engine import TimingResult
+import tvcgui.features.frame_data.timing_observations as observations
+
+
+def _result(sequence, *, char_id=12, action_id=0x102, blockstun=15):
+    return TimingResult(
+        sequence=sequence,
+        timestamp="12:00:00",
+        frame_idx=sequence,
+        kind="block",
+        attacker_slot="P1-C1",
+        defender_slot="P2-C1",
+        attacker_name="Ryu",
+        defender_name="Polimar",
+        char_id=char_id,
+        action_id=action_id,
+        action_name="5C",
+        blockstun=blockstun,
+        hitstop=12,
+        clean=True,
+    )
+
+
+def _isolate(tmp_path, monkeypatch):
+    path = tmp_path / "timing_observations.json"
+    monkeypatch.setattr(observations, "OBSERVATION_FILE", str(path))
+    monkeypatch.setattr(observations, "_DOC", None)
+    monkeypatch.setattr(observations, "_DIRTY", {})
+    monkeypatch.setattr(observations, "_request_flush", lambda: None)
+    return path
+
+
+def test_recording_defers_the_write_but_reads_see_the_sample(tmp_path, monkeypatch):
+    path = _isolate(tmp_path, monkeypatch)
+    observations.record_timing_result(_result(1))
+    assert not path.exists()
+    assert observations.get_move_observations(12, 0x102)["fields"]["blockstun"]["samples"] == [15]
+    assert observations.get_observation_store_stats()["queue_depth"] >= 1
+
+
+def test_flush_writes_only_dirty_character_partitions(tmp_path, monkeypatch):
+    _isolate(tmp_path, monkeypatch)
+    observations.record_timing_result(_result(1, char_id=12))
+    observations.record_timing_result(_result(2, char_id=12))
+    observations.record_timing_result(_result(3, char_id=7, action_id=0x110))
+    assert observations.flush_timing_observations() == 2
+
+    partitions = tmp_path / "timing_observations_by_character"
+    assert sorted(p.name for p in partitions.iterdir()) == ["char_12.json", "char_7.json"]
+    before = (partitions / "char_7.json").stat().st_mtime_ns
+
+    observations.record_timing_result(_result(4, char_id=12))
+    assert observations.flush_timing_observations() == 1
+    assert (partitions / "char_7.json").stat().st_mtime_ns == before
+    saved = json.loads((partitions / "char_12.json").read_text(encoding="utf-8"))
+    assert saved["moves"]["258"]["fields"]["blockstun"]["sample_count"] == 3
+    stats = observations.get_observation_store_stats()
+    assert stats["queue_depth"] == 0
+    assert stats["last_flush_ms"] >= 0.0
+
+
+def test_partitions_override_the_seed_document_on_load(tmp_path, monkeypatch):
+    path = _isolate(tmp_path, monkeypatch)
+    path.write_text(json.dumps({
+        "version": observations.OBSERVATION_VERSION,
+        "characters": {
+            "12": {"moves": {"258": {"fields": {"blockstun": {"samples": [9], "value": 9}}}}},
+            "7": {"moves": {"272": {"fields": {"hitstop": {"samples": [11], "value": 11}}}}},
+        },
+    }))
+    observations.record_timing_result(_result(1, char_id=12))
+    observations.flush_timing_observations()
+
+    monkeypatch.setattr(observations, "_DOC", None)
+    assert observations.get_move_observations(12, 0x102)["fields"]["blockstun"]["samples"] == [9, 15]
+    assert observations.get_move_observations(7, 0x110)["fields"]["hitstop"]["value"] == 11
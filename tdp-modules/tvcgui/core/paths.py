@@ -36,8 +36,11 @@ def user_data_path(*parts: str) -> str:
 
     Source runs write into the project data tree. Frozen builds write beside the
     executable instead of into the transient one-file extraction directory.
+    ``TVC_USER_DATA_DIR`` replaces the ``data/`` root; the test runners point it
+    at a temporary directory so runtime state never lands in the source tree.
     """
-    return os.path.join(_runtime_root(), "data", *parts)
+    override = str(os.environ.get("TVC_USER_DATA_DIR", "") or "").strip()
+    return os.path.join(override or os.path.join(_runtime_root(), "data"), *parts)
 
 
 def resolve_data_path(*parts: str) -> str:
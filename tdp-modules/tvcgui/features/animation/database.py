@@ -9,13 +9,21 @@ For a single active window that is equivalent to:
     total - ((first_active - 1) + active_count)
 
 It does not claim to replace any future runtime-cancel/landing/exit exception.
+
+Lookups are served from a per-character partitioned index built from the
+JSON: a small manifest (aliases, character list, source stamp) plus one file
+per character, loaded on demand into a small LRU.  The index is rebuilt
+automatically whenever the source JSON's size or mtime changes, or explicitly
+with ``python -m tvcgui.tools.animation_frame_index``.
 """
 from __future__ import annotations
 
 import json
 import os
 import re
+import tempfile
 import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Dict, Iterable, Optional
 
@@ -26,6 +34,16 @@ _DB_CACHE: Optional[Dict[str, Any]] = None
 _DB_PATH: Optional[Path] = None
 _DB_MTIME_NS: Optional[int] = None
 
+ANIMATION_INDEX_VERSION = 1
+ANIMATION_INDEX_MANIFEST = "manifest.json"
+ANIMATION_CHARACTER_CACHE = max(1, int(os.environ.get("TVC_ANIMATION_CHARACTER_CACHE", "6") or 6))
+
+_INDEX_MANIFEST: Optional[Dict[str, Any]] = None
+_INDEX_DIRECTORY: Optional[Path] = None
+_INDEX_SOURCE_STAMP: Optional[tuple] = None
+_CHARACTER_LRU: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_INDEX_STATS: Dict[str, Any] = {"partition_loads": 0, "partition_hits": 0, "builds": 0, "mode": ""}
+
 
 def _normalize(value: Any) -> str:
     return re.sub(r"[^a-z0-9]+", "", str(value or "").lower())
@@ -72,8 +90,183 @@ def _load_database() -> Dict[str, Any]:
         return _DB_CACHE
 
 
+def default_animation_index_directory() -> Path:
+    override = str(os.environ.get("TVC_ANIMATION_INDEX_DIR") or "").strip()
+    if override:
+        return Path(override)
+    return Path(user_data_path("animation", "animation_frames_index"))
+
+
+def _source_path() -> Optional[Path]:
+    for path in _candidate_paths():
+        if path.is_file():
+            return path
+    return None
+
+
+def _source_stamp(path: Path) -> Optional[tuple]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (os.path.abspath(str(path)), stat.st_size, stat.st_mtime_ns)
+
+
+def _partition_name(char_key: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", str(char_key)) + ".json"
+
+
+def _write_json(path: Path, payload: Any) -> None:
+    fd, tmp_name = tempfile.mkstemp(prefix=path.name + ".", suffix=".tmp", dir=str(path.parent))
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle, separators=(",", ":"))
+        os.replace(tmp_name, path)
+    finally:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+
+
+def _manifest_files(directory: Path) -> set:
+    """Character files listed by the manifest already in ``directory``, any version."""
+    try:
+        manifest = json.loads((directory / ANIMATION_INDEX_MANIFEST).read_text(encoding="utf-8"))
+        entries = manifest["characters"].values()
+    except Exception:
+        return set()
+    files = set()
+    for entry in entries:
+        name = entry.get("file") if isinstance(entry, dict) else None
+        # Ignore anything that is not a bare partition name in this directory.
+        if isinstance(name, str) and name.endswith(".json") and name == Path(name).name:
+            files.add(name)
+    return files
+
+
+def build_animation_index(source: Optional[str | Path] = None, output: Optional[str | Path] = None) -> Dict[str, Any]:
+    """Split ``animation_frames.json`` into a manifest plus per-character files."""
+    source_path = Path(source) if source else _source_path()
+    if source_path is None:
+        raise FileNotFoundError("animation_frames.json was not found.")
+    stamp = _source_stamp(source_path)
+    doc = json.loads(source_path.read_text(encoding="utf-8"))
+    if not isinstance(doc, dict) or not isinstance(doc.get("characters"), dict):
+        raise ValueError(f"{source_path} is not an animation frame database.")
+
+    directory = Path(output) if output else default_animation_index_directory()
+    directory.mkdir(parents=True, exist_ok=True)
+    previous = _manifest_files(directory)
+    characters: Dict[str, Dict[str, Any]] = {}
+    for char_key, char in doc["characters"].items():
+        if not isinstance(char, dict):
+            continue
+        name = _partition_name(char_key)
+        _write_json(directory / name, char)
+        motion = (char.get("motions") or {}).get("0000.mot") or {}
+        characters[str(char_key)] = {"file": name, "actions": len(motion.get("actions") or {})}
+
+    manifest = {key: value for key, value in doc.items() if key != "characters"}
+    manifest.update(
+        {
+            "index_version": ANIMATION_INDEX_VERSION,
+            "source": list(stamp) if stamp else None,
+            "characters": characters,
+        }
+    )
+    # The manifest is written last so a partial build never looks current.
+    _write_json(directory / ANIMATION_INDEX_MANIFEST, manifest)
+    # Only files an earlier build wrote are ours to remove; the output
+    # directory may hold anything else (even the source database).
+    for stale in previous - {entry["file"] for entry in characters.values()}:
+        try:
+            (directory / stale).unlink()
+        except OSError:
+            pass
+    with _DB_LOCK:
+        _INDEX_STATS["builds"] += 1
+    return {"source": str(source_path), "output_directory": str(directory), "characters": len(characters)}
+
+
+def _read_manifest(directory: Path, stamp: tuple) -> Optional[Dict[str, Any]]:
+    try:
+        manifest = json.loads((directory / ANIMATION_INDEX_MANIFEST).read_text(encoding="utf-8"))
+    except Exception:
+        return None
+    if not isinstance(manifest, dict) or manifest.get("index_version") != ANIMATION_INDEX_VERSION:
+        return None
+    if tuple(manifest.get("source") or ()) != stamp or not isinstance(manifest.get("characters"), dict):
+        return None
+    return manifest
+
+
+def _load_index() -> Dict[str, Any]:
+    """Return the index manifest, rebuilding it when the source JSON changed.
+
+    Falls back to the whole-file loader when the index cannot be written.
+    """
+    global _INDEX_MANIFEST, _INDEX_DIRECTORY, _INDEX_SOURCE_STAMP
+    with _DB_LOCK:
+        source = _source_path()
+        stamp = _source_stamp(source) if source is not None else None
+        if _INDEX_MANIFEST is not None and stamp == _INDEX_SOURCE_STAMP:
+            return _INDEX_MANIFEST
+        _CHARACTER_LRU.clear()
+        _INDEX_SOURCE_STAMP = stamp
+        if stamp is None:
+            _INDEX_MANIFEST = {"characters": {}, "character_aliases": {}}
+            _INDEX_DIRECTORY = None
+            _INDEX_STATS["mode"] = "empty"
+            return _INDEX_MANIFEST
+        directory = default_animation_index_directory()
+        manifest = _read_manifest(directory, stamp)
+        if manifest is None:
+            try:
+                build_animation_index(source, directory)
+                manifest = _read_manifest(directory, stamp)
+            except Exception:
+                manifest = None
+        if manifest is None:
+            doc = _load_database()
+            manifest = {key: value for key, value in doc.items() if key != "characters"}
+            manifest["characters"] = {key: {} for key in doc.get("characters") or {}}
+            _INDEX_DIRECTORY = None
+            _INDEX_STATS["mode"] = "json"
+        else:
+            _INDEX_DIRECTORY = directory
+            _INDEX_STATS["mode"] = "index"
+        _INDEX_MANIFEST = manifest
+        return manifest
+
+
+def _character(char_key: str) -> Optional[Dict[str, Any]]:
+    with _DB_LOCK:
+        manifest = _load_index()
+        cached = _CHARACTER_LRU.get(char_key)
+        if cached is not None:
+            _CHARACTER_LRU.move_to_end(char_key)
+            _INDEX_STATS["partition_hits"] += 1
+            return cached
+        entry = (manifest.get("characters") or {}).get(char_key)
+        if entry is None:
+            return None
+        if _INDEX_DIRECTORY is None:
+            char = (_load_database().get("characters") or {}).get(char_key)
+        else:
+            try:
+                char = json.loads((_INDEX_DIRECTORY / str(entry.get("file") or "")).read_text(encoding="utf-8"))
+            except Exception:
+                char = None
+        if not isinstance(char, dict):
+            return None
+        _INDEX_STATS["partition_loads"] += 1
+        _CHARACTER_LRU[char_key] = char
+        while len(_CHARACTER_LRU) > ANIMATION_CHARACTER_CACHE:
+            _CHARACTER_LRU.popitem(last=False)
+        return char
+
+
 def _resolve_character_key(char_name: Any, char_id: Any = None) -> Optional[str]:
-    doc = _load_database()
+    doc = _load_index()
     characters = doc.get("characters") or {}
     aliases = doc.get("character_aliases") or {}
     if not isinstance(characters, dict):
@@ -111,8 +304,7 @@ def _action_record(char_key: str, action_id: Any) -> Optional[Dict[str, Any]]:
         aid = int(action_id)
     except Exception:
         return None
-    doc = _load_database()
-    char = (doc.get("characters") or {}).get(char_key)
+    char = _character(char_key)
     if not isinstance(char, dict):
         return None
     motions = char.get("motions") or {}
@@ -196,9 +388,13 @@ def apply_animation_metadata(moves: Iterable[Dict[str, Any]], char_name: Any, ch
 
 def animation_database_status() -> Dict[str, Any]:
     """Small diagnostic payload for UI/logging without exposing raw JSON."""
-    doc = _load_database()
-    return {
-        "path": str(_DB_PATH) if _DB_PATH else "",
-        "characters": len(doc.get("characters") or {}),
-        "schema_version": doc.get("schema_version"),
-    }
+    doc = _load_index()
+    with _DB_LOCK:
+        return {
+            "path": str(_INDEX_SOURCE_STAMP[0]) if _INDEX_SOURCE_STAMP else "",
+            "characters": len(doc.get("characters") or {}),
+            "schema_version": doc.get("schema_version"),
+            "index_directory": str(_INDEX_DIRECTORY) if _INDEX_DIRECTORY else "",
+            "loaded_characters": list(_CHARACTER_LRU),
+            **_INDEX_STATS,
+        }
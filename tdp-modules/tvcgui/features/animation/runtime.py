@@ -56,16 +56,28 @@ def _coerce_int(value: Any) -> Optional[int]:
         return None
 
 
-def _motion_database() -> dict[str, Any]:
+def _motion_index() -> dict[str, Any]:
+    """Character keys and aliases, without any character's motion tables."""
     try:
         from . import database as frames
-        loader = getattr(frames, "_load_database", None)
-        if callable(loader):
-            doc = loader()
-            return doc if isinstance(doc, dict) else {}
+        doc = frames._load_index()
+        return doc if isinstance(doc, dict) else {}
     except Exception:
-        pass
-    return {}
+        return {}
+
+
+def _motion_actions(char_key: str) -> tuple[dict[str, Any], dict[str, Any]]:
+    """One character's ``0000.mot`` record and its action table, from the index."""
+    try:
+        from . import database as frames
+        char = frames._character(str(char_key))
+    except Exception:
+        char = None
+    motion = ((char or {}).get("motions") or {}).get("0000.mot") if isinstance(char, dict) else None
+    if not isinstance(motion, dict):
+        return {}, {}
+    actions = motion.get("actions")
+    return motion, actions if isinstance(actions, dict) else {}
 
 
 def resolve_char_key(char_name: Any = None, char_id: Any = None, move: Optional[dict] = None) -> Optional[str]:
@@ -83,7 +95,7 @@ def resolve_char_key(char_name: Any = None, char_id: Any = None, move: Optional[
     except Exception:
         pass
 
-    doc = _motion_database()
+    doc = _motion_index()
     chars = doc.get("characters") or {}
     aliases = doc.get("character_aliases") or {}
     candidates = [str(char_name or "").strip().lower()]
@@ -104,14 +116,8 @@ def motion_descriptor(char_key: str, action_id: Any) -> Optional[MotionDescripto
     aid = _coerce_int(action_id)
     if aid is None:
         return None
-    doc = _motion_database()
-    char = (doc.get("characters") or {}).get(str(char_key))
-    if not isinstance(char, dict):
-        return None
-    motion = (char.get("motions") or {}).get("0000.mot")
-    if not isinstance(motion, dict):
-        return None
-    rec = (motion.get("actions") or {}).get(f"0x{aid & 0xFFFF:04X}")
+    motion, actions = _motion_actions(char_key)
+    rec = actions.get(f"0x{aid & 0xFFFF:04X}")
     if not isinstance(rec, dict):
         return None
     clip_offset = _coerce_int(rec.get("clip_offset"))
@@ -186,18 +192,14 @@ def _valid_loaded_mot(candidate: int, char_key: str, source: MotionDescriptor, r
 
 
 def _anchor_descriptors(char_key: str, source_action_id: int) -> list[MotionDescriptor]:
-    doc = _motion_database()
-    char = (doc.get("characters") or {}).get(str(char_key))
-    motion = ((char or {}).get("motions") or {}).get("0000.mot") if isinstance(char, dict) else None
-    actions = (motion or {}).get("actions") if isinstance(motion, dict) else {}
+    _motion, actions = _motion_actions(char_key)
     ordered_ids: list[int] = []
     for candidate in (0x0100, 0x0101, 0x0102, source_action_id, 0x0000, 0x0001, 0x0002):
         if candidate not in ordered_ids:
             ordered_ids.append(candidate)
     out: list[MotionDescriptor] = []
     for aid in ordered_ids:
-        rec = actions.get(f"0x{aid & 0xFFFF:04X}") if isinstance(actions, dict) else None
-        if not isinstance(rec, dict):
+        if not isinstance(actions.get(f"0x{aid & 0xFFFF:04X}"), dict):
             continue
         desc = motion_descriptor(char_key, aid)
         if desc is not None:
@@ -285,12 +287,7 @@ def locate_loaded_mot(
 
 
 def animation_id_from_pointer(loaded: LoadedMot, char_key: str, pointer: int) -> Optional[int]:
-    doc = _motion_database()
-    char = (doc.get("characters") or {}).get(char_key)
-    motion = ((char or {}).get("motions") or {}).get("0000.mot") if isinstance(char, dict) else None
-    actions = (motion or {}).get("actions") if isinstance(motion, dict) else {}
-    if not isinstance(actions, dict):
-        return None
+    _motion, actions = _motion_actions(char_key)
     relative = int(pointer) - int(loaded.base)
     for key, rec in actions.items():
         if not isinstance(rec, dict):
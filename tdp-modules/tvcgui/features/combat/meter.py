@@ -12,6 +12,11 @@
 
 from tvcgui.platform.dolphin import rd32
 
+try:
+    from tvcgui.platform import memory_watch
+except Exception:
+    memory_watch = None
+
 METER_ADDR_P1 = 0x9246BA0C  
 METER_ADDR_P2 = 0x927EBA2C   
  
@@ -35,13 +40,33 @@ METER_CACHE = MeterAddrCache()
 
 
 _debug_printed = set()
+_METER_WATCH_IDS: dict[int, int] = {}
+# A watched value older than this was not refreshed by the current main-loop
+# tick (for example a tool window calling read_meter on its own), so read live.
+_METER_WATCH_MAX_AGE_SEC = 0.05
+
+
+def _watched_meter(addr: int) -> int | None:
+    if memory_watch is None:
+        return None
+    watch_id = _METER_WATCH_IDS.get(addr)
+    if watch_id is None:
+        watch_id = memory_watch.register_watch(addr, 4, label=f"meter:0x{addr:08X}")
+        _METER_WATCH_IDS[addr] = watch_id
+        return None
+    if not watch_id:
+        return None
+    return memory_watch.WATCHES.value_u32(watch_id, max_age_sec=_METER_WATCH_MAX_AGE_SEC)
+
 
 def read_meter(base, *, teamtag: str | None = None) -> int | None:
     if not base:
         return None
 
     addr = _METER_ADDR_BY_TEAM.get(teamtag, METER_ADDR_P1)
-    v = rd32(addr)
+    v = _watched_meter(addr)
+    if v is None:
+        v = rd32(addr)
 
     if teamtag not in _debug_printed:
         _debug_printed.add(teamtag)
@@ -9,11 +9,21 @@
 #   2: move name
 #   3–5: legacy columns (ignored)
 #   6: character ID (100 = global/generic)
+#
+# The parsed tables are pickled to move_id_map_charagnostic.idx under the
+# writable data tree together with the CSV's SHA-1; later starts load the
+# pickle when the hash still matches.  Resolved names are memoised per
+# (char_id, anim_id), so the per-frame HUD lookup is a single dict hit.
 
 import os
 import csv
+import hashlib
+import io
+import pickle
+import tempfile
+import time
 
-from tvcgui.core.paths import data_path
+from tvcgui.core.paths import data_path, user_data_path
 from tvcgui.features.combat.move_filters import is_purged_move_label
  
 # (char_id -> {anim_id -> name})
@@ -23,6 +33,16 @@ _MOVE_NAMES_GENERIC = {}
 
 _LOADED = False
 
+_INDEX_VERSION = 1
+_INDEX_NAME = "move_id_map_charagnostic.idx"
+
+# (char_id, anim_id) -> resolved name or None
+_NAME_MEMO = {}
+_NAME_MEMO_LIMIT = 8192
+_MISSING = object()
+
+_LOAD_STATS = {"source": "", "load_ms": 0.0, "path": ""}
+
 
 def _find_csv_path():
     '\n    Try a couple of sane default locations.\n    Adjust this if the target behavior requires it somewhere else.\n    '
@@ -38,11 +58,97 @@ def _find_csv_path():
     return None
 
 
+def _parse_csv_text(text):
+    by_char = {}
+    generic = {}
+    reader = csv.reader(io.StringIO(text, newline=""))
+    for row in reader:
+        # allow comment lines starting with '#'
+        if not row:
+            continue
+        first = row[0].strip()
+        if not first or first.startswith("#"):
+            continue
+
+        # need at least: id_dec, (hex), name, ... , char_id
+        if len(row) < 7:
+            continue
+
+        try:
+            anim_id_dec = int(first)
+        except ValueError:
+            continue
+
+        name = row[2].strip()
+        if not name:
+            continue
+
+        try:
+            # char id column can be "100" or "100.0" depending on how it was saved
+            char_id = int(float(row[6]))
+        except ValueError:
+            char_id = 100
+
+        if char_id == 100:
+            # global / generic
+            if anim_id_dec not in generic:
+                generic[anim_id_dec] = name
+        else:
+            m = by_char.setdefault(char_id, {})
+            if anim_id_dec not in m:
+                m[anim_id_dec] = name
+    return by_char, generic
+
+
+def _index_path():
+    return user_data_path("combat", _INDEX_NAME)
+
+
+def _read_index(source_hash):
+    try:
+        with open(_index_path(), "rb") as f:
+            payload = pickle.load(f)
+    except Exception:
+        return None
+    if not isinstance(payload, dict):
+        return None
+    if payload.get("version") != _INDEX_VERSION or payload.get("source_sha1") != source_hash:
+        return None
+    by_char = payload.get("by_char")
+    generic = payload.get("generic")
+    if not isinstance(by_char, dict) or not isinstance(generic, dict):
+        return None
+    return by_char, generic
+
+
+def _write_index(source_hash, by_char, generic):
+    path = _index_path()
+    payload = {
+        "version": _INDEX_VERSION,
+        "source_sha1": source_hash,
+        "by_char": by_char,
+        "generic": generic,
+    }
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(prefix=_INDEX_NAME + ".", suffix=".tmp", dir=os.path.dirname(path))
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_name, path)
+        finally:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+    except Exception as e:
+        print(f"move_id_map: could not write index: {e}")
+
+
 def _load_if_needed():
     global _LOADED
     if _LOADED:
         return
 
+    started = time.perf_counter()
     csv_path = _find_csv_path()
     if not csv_path:
         print("move_id_map: CSV not found; move labels will fall back.")
@@ -51,45 +157,19 @@ def _load_if_needed():
 
     by_char = {}
     generic = {}
+    source = "csv"
 
     try:
-        with open(csv_path, newline="", encoding="utf-8") as f:
-            reader = csv.reader(f)
-            for row in reader:
-                # allow comment lines starting with '#'
-                if not row:
-                    continue
-                first = row[0].strip()
-                if not first or first.startswith("#"):
-                    continue
-
-                # need at least: id_dec, (hex), name, ... , char_id
-                if len(row) < 7:
-                    continue
-
-                try:
-                    anim_id_dec = int(first)
-                except ValueError:
-                    continue
-
-                name = row[2].strip()
-                if not name:
-                    continue
-
-                try:
-                    # char id column can be "100" or "100.0" depending on how it was saved
-                    char_id = int(float(row[6]))
-                except ValueError:
-                    char_id = 100
-
-                if char_id == 100:
-                    # global / generic
-                    if anim_id_dec not in generic:
-                        generic[anim_id_dec] = name
-                else:
-                    m = by_char.setdefault(char_id, {})
-                    if anim_id_dec not in m:
-                        m[anim_id_dec] = name
+        with open(csv_path, "rb") as f:
+            raw = f.read()
+        source_hash = hashlib.sha1(raw).hexdigest()
+        cached = _read_index(source_hash)
+        if cached is not None:
+            by_char, generic = cached
+            source = "index"
+        else:
+            by_char, generic = _parse_csv_text(raw.decode("utf-8"))
+            _write_index(source_hash, by_char, generic)
     except Exception as e:
         print(f"move_id_map: failed to load CSV: {e}")
 
@@ -97,15 +177,36 @@ def _load_if_needed():
     _MOVE_NAMES_BY_CHAR.update(by_char)
     _MOVE_NAMES_GENERIC.clear()
     _MOVE_NAMES_GENERIC.update(generic)
+    _NAME_MEMO.clear()
     _LOADED = True
+    _LOAD_STATS.update(
+        source=source,
+        load_ms=round((time.perf_counter() - started) * 1000.0, 3),
+        path=csv_path,
+    )
 
     print(
         "move_id_map: loaded "
         f"{sum(len(v) for v in _MOVE_NAMES_BY_CHAR.values())} char-specific and "
-        f"{len(_MOVE_NAMES_GENERIC)} generic move IDs from {csv_path}"
+        f"{len(_MOVE_NAMES_GENERIC)} generic move IDs from {csv_path} ({source})"
     )
 
 
+def reload_move_id_map():
+    """Drop the loaded tables and memo; the next lookup reloads them."""
+    global _LOADED
+    _LOADED = False
+    _NAME_MEMO.clear()
+
+
+def get_move_id_map_stats():
+    return {
+        **_LOAD_STATS,
+        "loaded": _LOADED,
+        "memo_entries": len(_NAME_MEMO),
+    }
+
+
 def lookup_move_name(anim_id, char_id=None):
     """
     Look up a human-readable move name from the ID map.
@@ -118,8 +219,20 @@ def lookup_move_name(anim_id, char_id=None):
     if anim_id is None:
         return None
 
+    key = (char_id, anim_id)
+    name = _NAME_MEMO.get(key, _MISSING)
+    if name is not _MISSING:
+        return name
+
     _load_if_needed()
+    name = _resolve_move_name(anim_id, char_id)
+    if len(_NAME_MEMO) >= _NAME_MEMO_LIMIT:
+        _NAME_MEMO.clear()
+    _NAME_MEMO[key] = name
+    return name
+
 
+def _resolve_move_name(anim_id, char_id):
     if char_id is not None:
         per_char = _MOVE_NAMES_BY_CHAR.get(char_id)
         if per_char:
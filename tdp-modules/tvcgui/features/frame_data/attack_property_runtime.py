@@ -13,13 +13,23 @@ The script does more than SET those fields. It later applies OR and CLEAR
 operations to build result behavior. This parser replays those operations in
 script order, preserves every mutation, and separates the initial guard/tier
 byte from the later hit-result word instead of collapsing them into one value.
+
+The first lookup against a character table queues a background build of an
+:class:`AttackPropertyIndex` holding every action's resolved phases; once it
+is published, HUD and profiler lookups are a dictionary hit instead of a walk
+over table anchors and script bytes.
 """
 
+import hashlib
 import struct
 import threading
 import time
+from bisect import bisect_right
 from typing import Callable, Optional
 
+from tvcgui.platform.move_memory import shared_move_memory
+from tvcgui.runtime.deferred_work import DeferredWorkLoop
+
 try:
     from tvcgui.platform.dolphin import rd32 as _live_rd32, rbytes as _live_rbytes
 except Exception:
@@ -76,11 +86,26 @@ SCRIPT_OPERATION_NAMES = {
 HIT_RESULT_CLEAR_MASK = 0x80042F00
 PROPERTY_A_CLASS_MASK = 0x0000003F
 
+# Per-character index: every action of a table resolved up front, checked by
+# re-reading a few sampled windows at most once per interval.
+INDEX_VALIDATE_INTERVAL = 0.5
+INDEX_SAMPLE_ROOTS = 6
+INDEX_SAMPLE_BYTES = 0x20
+INDEX_RETRY_DELAY = 1.0
+
 _LOCK = threading.RLock()
 _TABLE_CACHE: dict[int, tuple[dict[int, int], tuple[int, ...], int]] = {}
 _TABLE_GENERATION: dict[int, int] = {}
 _DEFINITION_CACHE: dict[tuple[int, int, int], dict] = {}
 _FAILED_UNTIL: dict[tuple[int, int, int], float] = {}
+_INDEXES: dict[int, "AttackPropertyIndex"] = {}
+_INDEX_PENDING: dict[int, Callable[[int, int], bytes]] = {}
+_INDEX_RETRY_AT: dict[int, float] = {}
+_INDEX_BUILDER: Optional[DeferredWorkLoop] = None
+# Bumped by clear_attack_property_runtime_cache() so a build that was already
+# running cannot publish an index from before the clear.
+_INDEX_EPOCH = 0
+_INDEX_STATS = {"hits": 0, "fallbacks": 0, "builds": 0, "build_ms": 0.0, "validations": 0, "rejected": 0}
 
 
 def _is_mem2(value: int) -> bool:
@@ -316,7 +341,8 @@ def _table_entries(
 
 
 def _action_span(move_root: int, sorted_roots: tuple[int, ...]) -> int:
-    next_root = next((candidate for candidate in sorted_roots if candidate > move_root), 0)
+    pos = bisect_right(sorted_roots, move_root)
+    next_root = sorted_roots[pos] if pos < len(sorted_roots) else 0
     if next_root:
         return max(MIN_ACTION_SCAN, min(MAX_ACTION_SCAN, next_root - move_root))
     return MAX_ACTION_SCAN
@@ -504,6 +530,241 @@ def _build_property_phases(commands: list[dict]) -> list[dict]:
     return phases
 
 
+def _definition_from_script(
+    action: int,
+    root: int,
+    table_generation: int,
+    move_root: int,
+    scan_size: int,
+    blob: bytes,
+) -> dict:
+    """Definition for one action from its script bytes (no fighter fields)."""
+    commands = _script_property_commands(blob, move_root)
+    phases = _build_property_phases(commands)
+    if not phases:
+        return {
+            "status": "NO_PROPERTY_COMMAND",
+            "action_id": action,
+            "chr_tbl": root,
+            "table_generation": table_generation,
+            "move_root": move_root,
+            "scan_size": scan_size,
+            "command_count": len(commands),
+        }
+    first = phases[0]
+    return {
+        "status": "OK",
+        "action_id": action,
+        "chr_tbl": root,
+        "table_generation": table_generation,
+        "move_root": move_root,
+        "scan_size": scan_size,
+        "command_count": len(commands),
+        "property_a": int(first["property_a"]) & 0xFF,
+        "property_b": int(first["property_b"]) & 0xFFFFFFFF,
+        "property_a_addr": int(first["property_a_addr"]),
+        "property_b_addr": int(first["property_b_addr"]),
+        "phase_count": len(phases),
+        "phases": phases,
+        "operations": commands,
+    }
+
+
+class AttackPropertyIndex:
+    """Every action of one character table, resolved to its phase list.
+
+    Built off the HUD thread by :func:`build_attack_property_index`.  Lookups
+    are a dictionary hit.  The index is trusted while the shared move-memory
+    generation is unchanged (roster swaps, reloads and writes into the
+    character's script region all bump it) and while a handful of sampled
+    windows - the table head and a few move roots - still hash the same.
+    """
+
+    __slots__ = (
+        "root", "table_generation", "definitions", "samples", "fingerprint",
+        "memory_generation", "validated_at", "span", "epoch",
+    )
+
+    def __init__(self, root, table_generation, definitions, samples, fingerprint, memory_generation, span):
+        self.root = int(root)
+        self.table_generation = int(table_generation)
+        self.definitions: dict[int, dict] = definitions
+        self.samples: tuple[tuple[int, int], ...] = samples
+        self.fingerprint = fingerprint
+        self.memory_generation = int(memory_generation)
+        self.validated_at = time.monotonic()
+        self.span: tuple[int, int] = span
+        self.epoch = _INDEX_EPOCH
+
+    def definition(self, action: int) -> dict:
+        found = self.definitions.get(int(action))
+        if found is not None:
+            return found
+        return {
+            "status": "NO_ACTION_ENTRY",
+            "action_id": int(action),
+            "chr_tbl": self.root,
+            "table_generation": self.table_generation,
+        }
+
+
+def _index_samples(root: int, sorted_roots: tuple[int, ...]) -> tuple[tuple[int, int], ...]:
+    samples = [(int(root), 0x10), (int(root) + 0x0100 * 4, 0x10)]
+    if sorted_roots:
+        count = min(INDEX_SAMPLE_ROOTS, len(sorted_roots))
+        step = len(sorted_roots) / count
+        samples.extend((sorted_roots[int(i * step)], INDEX_SAMPLE_BYTES) for i in range(count))
+    return tuple(samples)
+
+
+def _index_fingerprint(samples, block_reader: Callable[[int, int], bytes]) -> Optional[bytes]:
+    digest = hashlib.blake2b(digest_size=16)
+    for address, size in samples:
+        data = _read_bytes(block_reader, address, size)
+        if len(data) != size:
+            return None
+        digest.update(data)
+    return digest.digest()
+
+
+def build_attack_property_index(
+    root: int,
+    read_block: Callable[[int, int], bytes] | None = None,
+) -> Optional[AttackPropertyIndex]:
+    """Resolve every action of the table at ``root`` (slow; run off-thread)."""
+    block_reader = read_block or _live_rbytes
+    root = int(root or 0)
+    if not _is_mem2(root):
+        return None
+    memory_generation = shared_move_memory().generation
+    epoch = _INDEX_EPOCH
+    started = time.perf_counter()
+    entries, sorted_roots, table_generation = _table_entries(root, block_reader)
+    if not entries:
+        return None
+    lo = sorted_roots[0]
+    hi = sorted_roots[-1] + MAX_ACTION_SCAN
+    # One read for the whole script region; per-action reads if it fails.
+    region = _read_bytes(block_reader, lo, hi - lo)
+    if len(region) != hi - lo:
+        region = b""
+    definitions: dict[int, dict] = {}
+    by_root: dict[int, tuple[int, bytes]] = {}
+    for action, move_root in sorted(entries.items()):
+        scanned = by_root.get(move_root)
+        if scanned is None:
+            scan_size = _action_span(move_root, sorted_roots)
+            if region:
+                blob = region[move_root - lo:move_root - lo + scan_size]
+            else:
+                blob = _read_bytes(block_reader, move_root, scan_size)
+            scanned = by_root[move_root] = (scan_size, blob)
+        scan_size, blob = scanned
+        definitions[action] = _definition_from_script(action, root, table_generation, move_root, scan_size, blob)
+    samples = _index_samples(root, sorted_roots)
+    fingerprint = _index_fingerprint(samples, block_reader)
+    if fingerprint is None:
+        return None
+    index = AttackPropertyIndex(
+        root, table_generation, definitions, samples, fingerprint, memory_generation, (root, hi - root)
+    )
+    index.epoch = epoch
+    with _LOCK:
+        _INDEX_STATS["builds"] += 1
+        _INDEX_STATS["build_ms"] = round((time.perf_counter() - started) * 1000.0, 3)
+    return index
+
+
+def install_attack_property_index(index: AttackPropertyIndex) -> bool:
+    """Publish a built index unless memory moved on while it was built."""
+    memory = shared_move_memory()
+    with _LOCK:
+        if index.memory_generation != memory.generation or index.epoch != _INDEX_EPOCH:
+            return False
+        _INDEXES[index.root] = index
+        _INDEX_RETRY_AT.pop(index.root, None)
+    memory.watch_span(("attack_property_index", index.root), *index.span)
+    return True
+
+
+def _build_pending_indexes() -> None:
+    while True:
+        with _LOCK:
+            if not _INDEX_PENDING:
+                return
+            root, block_reader = _INDEX_PENDING.popitem()
+        index = None
+        try:
+            index = build_attack_property_index(root, block_reader)
+        except Exception:
+            index = None
+        if index is None or not install_attack_property_index(index):
+            with _LOCK:
+                _INDEX_RETRY_AT[root] = time.monotonic() + INDEX_RETRY_DELAY
+
+
+def request_attack_property_index(root: int, read_block: Callable[[int, int], bytes] | None = None) -> bool:
+    """Queue a background index build for the table at ``root``."""
+    global _INDEX_BUILDER
+    root = int(root or 0)
+    if not _is_mem2(root):
+        return False
+    with _LOCK:
+        if root in _INDEXES or root in _INDEX_PENDING:
+            return False
+        if time.monotonic() < _INDEX_RETRY_AT.get(root, 0.0):
+            return False
+        _INDEX_PENDING[root] = read_block or _live_rbytes
+        if _INDEX_BUILDER is None:
+            _INDEX_BUILDER = DeferredWorkLoop(_build_pending_indexes, interval=0.05, name="TvCAttackPropertyIndex")
+        builder = _INDEX_BUILDER
+    builder.request()
+    return True
+
+
+def _drop_index_locked(root: int) -> None:
+    _INDEXES.pop(root, None)
+    # Anything the slow path cached for this table predates the same change.
+    _invalidate_table_root_locked(root)
+    shared_move_memory().unwatch_span(("attack_property_index", root))
+
+
+def _indexed_definition(root: int, action: int, block_reader: Callable[[int, int], bytes]) -> Optional[dict]:
+    with _LOCK:
+        index = _INDEXES.get(root)
+        if index is None:
+            _INDEX_STATS["fallbacks"] += 1
+            return None
+        if index.memory_generation != shared_move_memory().generation:
+            _drop_index_locked(root)
+            _INDEX_STATS["rejected"] += 1
+            _INDEX_STATS["fallbacks"] += 1
+            return None
+        due = time.monotonic() - index.validated_at >= INDEX_VALIDATE_INTERVAL
+    if due:
+        fingerprint = _index_fingerprint(index.samples, block_reader)
+        with _LOCK:
+            _INDEX_STATS["validations"] += 1
+            if fingerprint != index.fingerprint:
+                if _INDEXES.get(root) is index:
+                    _drop_index_locked(root)
+                _INDEX_STATS["rejected"] += 1
+                _INDEX_STATS["fallbacks"] += 1
+                return None
+            index.validated_at = time.monotonic()
+    with _LOCK:
+        _INDEX_STATS["hits"] += 1
+    return index.definition(action)
+
+
+def attack_property_index_stats() -> dict:
+    with _LOCK:
+        out = dict(_INDEX_STATS)
+        out["indexes"] = len(_INDEXES)
+        out["pending"] = len(_INDEX_PENDING)
+    return out
+
+
 def resolve_live_attack_definition(
     fighter_base_abs: int,
     action_id: int,
@@ -536,6 +797,11 @@ def resolve_live_attack_definition(
             "chr_tbl": root,
         }
 
+    indexed = _indexed_definition(root, action, block_reader)
+    if indexed is not None:
+        return {"status": indexed["status"], "fighter_base": base, **indexed}
+    request_attack_property_index(root, block_reader)
+
     entries, sorted_roots, table_generation = _table_entries(
         root,
         block_reader,
@@ -576,38 +842,8 @@ def resolve_live_attack_definition(
         else:
             scan_size = _action_span(move_root, sorted_roots)
             blob = _read_bytes(block_reader, move_root, scan_size)
-            commands = _script_property_commands(blob, move_root)
-            phases = _build_property_phases(commands)
-            if not phases:
-                result = {
-                    "status": "NO_PROPERTY_COMMAND",
-                    "fighter_base": base,
-                    "action_id": action,
-                    "chr_tbl": root,
-                    "table_generation": table_generation,
-                    "move_root": move_root,
-                    "scan_size": scan_size,
-                    "command_count": len(commands),
-                }
-            else:
-                first = phases[0]
-                result = {
-                    "status": "OK",
-                    "fighter_base": base,
-                    "action_id": action,
-                    "chr_tbl": root,
-                    "table_generation": table_generation,
-                    "move_root": move_root,
-                    "scan_size": scan_size,
-                    "command_count": len(commands),
-                    "property_a": int(first["property_a"]) & 0xFF,
-                    "property_b": int(first["property_b"]) & 0xFFFFFFFF,
-                    "property_a_addr": int(first["property_a_addr"]),
-                    "property_b_addr": int(first["property_b_addr"]),
-                    "phase_count": len(phases),
-                    "phases": phases,
-                    "operations": commands,
-                }
+            definition = _definition_from_script(action, root, table_generation, move_root, scan_size, blob)
+            result = {"status": definition["status"], "fighter_base": base, **definition}
 
     with _LOCK:
         if result.get("status") == "OK":
@@ -638,7 +874,13 @@ def resolve_live_attack_property(
 
 
 def clear_attack_property_runtime_cache() -> None:
+    global _INDEX_EPOCH
     with _LOCK:
+        _INDEX_EPOCH += 1
+        for root in list(_INDEXES):
+            _drop_index_locked(root)
+        _INDEX_PENDING.clear()
+        _INDEX_RETRY_AT.clear()
         _TABLE_CACHE.clear()
         _TABLE_GENERATION.clear()
         _DEFINITION_CACHE.clear()
@@ -646,13 +888,18 @@ def clear_attack_property_runtime_cache() -> None:
 
 
 __all__ = [
+    "AttackPropertyIndex",
     "HIT_RESULT_CLEAR_MASK",
     "SCRIPT_FIELD_PROPERTY_A",
     "SCRIPT_FIELD_PROPERTY_B",
     "SCRIPT_OP_SET",
     "SCRIPT_OP_OR",
     "SCRIPT_OP_CLEAR",
+    "attack_property_index_stats",
+    "build_attack_property_index",
     "collect_live_projectile_properties",
+    "install_attack_property_index",
+    "request_attack_property_index",
     "resolve_live_attack_definition",
     "resolve_live_attack_property",
     "clear_attack_property_runtime_cache",
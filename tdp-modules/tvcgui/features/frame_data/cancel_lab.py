@@ -9,6 +9,7 @@ from typing import Any, Callable, Sequence
 from tvcgui.core.action_event_bus import publish_action_event
 
 from . import cancel_mapper as FCM
+from . import cancel_routes as FCR
 from . import cancel_windows as FCW
 from .widgets import apply_titlebar_icon
 try:
@@ -17,6 +18,11 @@ except Exception:
     rd32 = None
     wd32 = None
 
+try:
+    from tvcgui.platform.move_memory import move_memory_reader
+except Exception:
+    move_memory_reader = None
+
 
 SLOT_POINTERS = {
     "P1-C1": 0x803C9FCC,
@@ -178,14 +184,18 @@ def command_rows_for_target(base: int, target_id: int) -> list[dict[str, int]]:
     if not _valid_fighter_base(table):
         return []
     target = int(target_id) & 0xFFFF
+    data = _command_table_block(table)
+    if data is not None:
+        return [dict(row) for row in FCR.command_rows_by_target(table, data).get(target, ())]
     rows: list[dict[str, int]] = []
     for index in range(COMMAND_ROW_LIMIT):
         row_addr = table + index * COMMAND_ROW_SIZE
-        word0 = _read_u32(row_addr, 0xFFFFFFFF)
+        row = (_read_u32(row_addr, 0xFFFFFFFF),) + tuple(_read_u32(row_addr + 4 * k, 0) for k in range(1, 6))
+        word0 = row[0]
         row_type = _signed_u16(word0 >> 16)
         if row_type == -1:
             break
-        action = _read_u32(row_addr + 20, 0) & 0xFFFF
+        action = row[5] & 0xFFFF
         if action != target:
             continue
         rows.append(
@@ -194,16 +204,36 @@ def command_rows_for_target(base: int, target_id: int) -> list[dict[str, int]]:
                 "index": index,
                 "type": row_type,
                 "mode": word0 & 0xFFFF,
-                "direction": _read_u32(row_addr + 4, 0),
-                "buttons": _read_u32(row_addr + 8, 0),
-                "state_a": _read_u32(row_addr + 12, 0),
-                "state_b": _read_u32(row_addr + 16, 0),
+                "direction": row[1],
+                "buttons": row[2],
+                "state_a": row[3],
+                "state_b": row[4],
                 "target": action,
             }
         )
     return rows
 
 
+def _command_table_block(table: int) -> bytes | None:
+    """The whole command table, read once through the shared cache.
+
+    The table is static character data, so the lab's per-frame input checks
+    reuse one block read (and its by-target index) instead of re-reading and
+    re-walking every row.  Returns None when the block can't be read and rows
+    fall back to rd32.
+    """
+    if rd32 is None or move_memory_reader is None:
+        return None
+    size = COMMAND_ROW_LIMIT * COMMAND_ROW_SIZE
+    try:
+        data = move_memory_reader(("command_table", int(table)))(int(table), size)
+    except Exception:
+        return None
+    if not data or len(data) != size:
+        return None
+    return bytes(data)
+
+
 def recognized_special_actions(base: int) -> tuple[set[int], dict[str, int]]:
     """Return special/super actions recognized by TvC's command parser.
 
@@ -282,6 +312,13 @@ def manual_target_trigger(base: int, target_id: int, target_kind: str) -> dict[s
     return None
 
 
+def _canonical_sources(slot_row: dict[str, Any], moves: Sequence[dict[str, Any]] | None) -> list[dict[str, Any]]:
+    """Canonical moves for a profile, from its cancel-route graph when built."""
+    moves = list(moves or [])
+    graph = FCR.request_cancel_route_graph(FCR.graph_key(slot_row), moves) if moves else None
+    return graph.sources if graph is not None else FCM.canonical_moves(moves)
+
+
 def _move_label(move: dict[str, Any], char_name: str = "") -> str:
     name = FCM.display_name(move, char_name)
     action_id = _as_int(move.get("id"), -1)
@@ -389,7 +426,7 @@ class CancelLabWindow:
         self._source_special_baseline: set[int] = set()
         self._source_pressed_baseline = 0
 
-        canonical = FCM.canonical_moves(list(moves or []))
+        canonical = _canonical_sources(self.target_slot, moves)
         for extra in (source_move, target_move):
             if not isinstance(extra, dict) or extra.get("id") is None:
                 continue
@@ -509,7 +546,7 @@ class CancelLabWindow:
         self.target_slot = row
         self.char_name = str(row.get("char_name") or row.get("name") or "")
 
-        canonical = FCM.canonical_moves(list(row.get("moves") or []))
+        canonical = _canonical_sources(row, row.get("moves"))
         canonical.sort(
             key=lambda move: (
                 {"normal": 0, "special": 1, "super": 2}.get(FCM.move_kind(move), 9),
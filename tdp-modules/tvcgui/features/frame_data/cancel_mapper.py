@@ -209,14 +209,21 @@ def direct_route_targets(source: Dict[str, Any]) -> Dict[int, Dict[str, Any]]:
     return targets
 
 
+def _move_facts(move: Dict[str, Any]) -> Tuple[Optional[int], str, str]:
+    return _as_int(move.get("id")), notation_for_move(move), move_kind(move)
+
+
 def classify_cancel(source: Dict[str, Any], target: Dict[str, Any]) -> Dict[str, Any]:
-    source_id = _as_int(source.get("id"))
-    target_id = _as_int(target.get("id"))
-    source_notation = notation_for_move(source)
-    target_notation = notation_for_move(target)
-    source_kind = move_kind(source)
-    target_kind = move_kind(target)
-    routes = direct_route_targets(source)
+    return _classify(_move_facts(source), _move_facts(target), direct_route_targets(source))
+
+
+def _classify(
+    source_facts: Tuple[Optional[int], str, str],
+    target_facts: Tuple[Optional[int], str, str],
+    routes: Dict[int, Dict[str, Any]],
+) -> Dict[str, Any]:
+    source_id, source_notation, source_kind = source_facts
+    target_id, target_notation, target_kind = target_facts
     route = routes.get(target_id) if target_id is not None else None
 
     base = {
@@ -305,10 +312,27 @@ def classify_cancel(source: Dict[str, Any], target: Dict[str, Any]) -> Dict[str,
 def build_cancel_rows(
     source: Dict[str, Any],
     moves: Sequence[Dict[str, Any]],
+    *,
+    canonical: Optional[Sequence[Dict[str, Any]]] = None,
+    facts: Optional[Dict[int, Tuple[Optional[int], str, str]]] = None,
 ) -> List[Dict[str, Any]]:
+    """Classify ``source`` against every canonical target.
+
+    ``canonical`` and ``facts`` (``id(move)`` -> :func:`_move_facts`) let a
+    caller that classifies many sources compute them once.
+    """
+    if canonical is None:
+        canonical = canonical_moves(moves)
+    if facts is None:
+        facts = {}
+    source_facts = facts.get(id(source)) or _move_facts(source)
+    routes = direct_route_targets(source)
     rows: List[Dict[str, Any]] = []
-    for target in canonical_moves(moves):
-        result = classify_cancel(source, target)
+    for target in canonical:
+        target_facts = facts.get(id(target))
+        if target_facts is None:
+            target_facts = facts[id(target)] = _move_facts(target)
+        result = _classify(source_facts, target_facts, routes)
         result.update(
             target=target,
             target_id=_as_int(target.get("id")),
@@ -362,6 +386,7 @@ def open_standalone_cancel_mapper(
 
     from .widgets import apply_titlebar_icon
     from . import tree as fd_tree
+    from .cancel_routes import cached_cancel_route_graph, graph_key, request_cancel_route_graph
 
     rows: list[Dict[str, Any]] = []
     seen_slots: set[str] = set()
@@ -369,12 +394,14 @@ def open_standalone_cancel_mapper(
         if not isinstance(raw, dict):
             continue
         slot = _slot_label(raw)
-        moves = canonical_moves(list(raw.get("moves") or []))
-        if not moves or slot in seen_slots:
+        raw_moves = list(raw.get("moves") or [])
+        graph = request_cancel_route_graph(graph_key(raw), raw_moves) if raw_moves else None
+        sources = graph.sources if graph is not None else canonical_moves(raw_moves)
+        if not sources or slot in seen_slots:
             continue
         row = dict(raw)
         row["slot_label"] = slot
-        row["moves"] = list(raw.get("moves") or [])
+        row["moves"] = raw_moves
         rows.append(row)
         seen_slots.add(slot)
 
@@ -542,7 +569,8 @@ def open_standalone_cancel_mapper(
         nonlocal current_moves
         row = current_slot_row()
         current_moves = list(row.get("moves") or [])
-        candidates = canonical_moves(current_moves)
+        graph = cached_cancel_route_graph(graph_key(row), current_moves)
+        candidates = graph.sources if graph is not None else canonical_moves(current_moves)
         source_by_label.clear()
         labels: list[str] = []
         for move in candidates:
@@ -617,7 +645,13 @@ def open_standalone_cancel_mapper(
         wanted = filter_var.get().strip().upper()
         needle = search_var.get().strip().lower()
         totals = {"ALLOWED": 0, "ELIGIBLE": 0, "BLOCKED": 0, "UNKNOWN": 0}
-        for result in build_cancel_rows(source, current_moves):
+        # The route graph is built in the background when the mapper opens;
+        # until it is ready (or for a source it doesn't know) classify here.
+        graph = cached_cancel_route_graph(graph_key(row), current_moves)
+        results = graph.rows_for(source) if graph is not None else None
+        if results is None:
+            results = build_cancel_rows(source, current_moves)
+        for result in results:
             status = str(result.get("status") or "UNKNOWN").upper()
             totals[status] = totals.get(status, 0) + 1
             searchable = " ".join(
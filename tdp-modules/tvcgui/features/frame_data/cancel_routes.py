@@ -0,0 +1,400 @@
+"""Per-character cancel-route graph for Cancel Mapper and Cancel Lab.
+
+Opening the mapper used to re-run :func:`cancel_mapper.canonical_moves` and
+classify every source/target pair on the Tk thread, and the lab parsed the
+whole command table for every normal it checked.  A
+:class:`CancelRouteGraph` holds that work for one character: the canonical
+source list and, for every source, its classified target rows.  Graphs are
+built on a background thread, kept in memory for the session, and saved
+next to the frame-data profiles (``_cancel_routes/<key>.json``), so later
+sessions load them instead of rebuilding.  A graph is tied to the move rows
+it was built from by a signature over the fields the mapper reads.
+
+:func:`command_rows_by_target` indexes the lab's command-table block (one
+read through the shared move-memory cache) by destination action.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import struct
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from . import cancel_mapper as FCM
+from .profile_store import _atomic_write_json, _safe_key, default_writable_directory
+from tvcgui.runtime.deferred_work import DeferredWorkLoop
+
+CANCEL_ROUTE_GRAPH_VERSION = 1
+ROUTE_DIRECTORY_NAME = "_cancel_routes"
+ROUTE_GRAPH_LIMIT = 16
+
+_SIGNATURE_FIELDS = (
+    "id",
+    "abs",
+    "kind",
+    "move_name",
+    "pretty_name",
+    "name",
+    "label",
+    "family_group_label",
+    "family_label",
+    "family_link_label",
+    "move_name_source",
+    "_scan_index",
+)
+_WINDOW_FIELDS = ("kind", "target_id", "addr", "branch_addr")
+
+_LOCK = threading.RLock()
+_GRAPHS: Dict[str, "CancelRouteGraph"] = {}
+_PENDING: Dict[str, Tuple[List[Dict[str, Any]], Optional[str]]] = {}
+_BUILDER: Optional[DeferredWorkLoop] = None
+_STATS: Dict[str, Any] = {"builds": 0, "loads": 0, "last_build_ms": 0.0, "last_error": ""}
+
+
+def moves_signature(moves: Sequence[Dict[str, Any]]) -> str:
+    """Hash of every move field the mapper classification reads."""
+    digest = hashlib.blake2b(digest_size=16)
+    for move in moves or ():
+        if not isinstance(move, dict):
+            digest.update(b"-\n")
+            continue
+        windows = [
+            [probe.get(field) for field in _WINDOW_FIELDS]
+            for probe in (move.get("cancel_windows") or ())
+            if isinstance(probe, dict)
+        ]
+        row = [move.get(field) for field in _SIGNATURE_FIELDS]
+        row.append(windows)
+        digest.update(json.dumps(row, default=str, separators=(",", ":")).encode("utf-8"))
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+def graph_key(slot_row: Dict[str, Any]) -> str:
+    """Storage key for a slot row: its profile key, else character id/name."""
+    for field in ("profile_key", "char_id", "csv_char_id", "char_name", "name"):
+        value = slot_row.get(field) if isinstance(slot_row, dict) else None
+        if value not in (None, "", 0):
+            return _safe_key(value)
+    return "unknown"
+
+
+class CancelRouteGraph:
+    """Canonical sources and their classified target rows for one character.
+
+    Rows refer to moves by position in the move list the graph was built
+    from; :meth:`bind` re-targets a graph at an equal list (same signature)
+    whose dicts are different objects, such as a reloaded profile.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        signature: str,
+        moves: Sequence[Dict[str, Any]],
+        source_indexes: Sequence[int],
+        rows: Dict[int, List[Tuple[int, Dict[str, Any]]]],
+    ) -> None:
+        self.key = str(key)
+        self.signature = str(signature)
+        self.source_indexes = list(source_indexes)
+        self._rows = rows
+        self.bind(moves)
+
+    def bind(self, moves: Sequence[Dict[str, Any]]) -> "CancelRouteGraph":
+        self.moves = list(moves)
+        self._identity = tuple(id(move) for move in self.moves)
+        self._position = {ident: index for index, ident in enumerate(self._identity)}
+        return self
+
+    def built_from(self, moves: Sequence[Dict[str, Any]]) -> bool:
+        return len(moves) == len(self._identity) and all(
+            id(move) == ident for move, ident in zip(moves, self._identity)
+        )
+
+    @property
+    def sources(self) -> List[Dict[str, Any]]:
+        return [self.moves[index] for index in self.source_indexes]
+
+    def source_for_action(self, action_id: Any) -> Optional[Dict[str, Any]]:
+        wanted = FCM._as_int(action_id)
+        for move in self.sources:
+            if FCM._as_int(move.get("id")) == wanted:
+                return move
+        return None
+
+    def rows_for(self, source: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+        """Mapper rows for ``source``, or None when it is not a graph source."""
+        position = self._position.get(id(source))
+        if position is None:
+            match = self.source_for_action((source or {}).get("id"))
+            position = self._position.get(id(match)) if match is not None else None
+            if match is None or FCM._as_int(match.get("abs")) != FCM._as_int(source.get("abs")):
+                return None
+        rows = self._rows.get(position)
+        if rows is None:
+            return None
+        return [dict(row, target=self.moves[target]) for target, row in rows]
+
+    def to_payload(self) -> Dict[str, Any]:
+        return {
+            "version": CANCEL_ROUTE_GRAPH_VERSION,
+            "key": self.key,
+            "signature": self.signature,
+            "sources": list(self.source_indexes),
+            "rows": {
+                str(source): [[target, row] for target, row in rows]
+                for source, rows in self._rows.items()
+            },
+        }
+
+    @classmethod
+    def from_payload(
+        cls,
+        payload: Any,
+        moves: Sequence[Dict[str, Any]],
+        *,
+        signature: Optional[str] = None,
+    ) -> Optional["CancelRouteGraph"]:
+        if not isinstance(payload, dict) or payload.get("version") != CANCEL_ROUTE_GRAPH_VERSION:
+            return None
+        signature = signature or moves_signature(moves)
+        if payload.get("signature") != signature:
+            return None
+        try:
+            count = len(moves)
+            sources = [int(index) for index in payload.get("sources") or ()]
+            rows = {
+                int(source): [(int(target), dict(row)) for target, row in items]
+                for source, items in (payload.get("rows") or {}).items()
+            }
+            if any(not 0 <= index < count for index in sources):
+                return None
+            if any(not 0 <= target < count for items in rows.values() for target, _row in items):
+                return None
+        except Exception:
+            return None
+        return cls(str(payload.get("key") or ""), signature, moves, sources, rows)
+
+
+def build_cancel_route_graph(
+    moves: Sequence[Dict[str, Any]],
+    *,
+    key: str = "",
+    signature: Optional[str] = None,
+) -> CancelRouteGraph:
+    """Classify every canonical source against every canonical target."""
+    moves = list(moves or [])
+    position = {id(move): index for index, move in enumerate(moves)}
+    canonical = FCM.canonical_moves(moves)
+    facts: Dict[int, Tuple[Optional[int], str, str]] = {}
+    rows: Dict[int, List[Tuple[int, Dict[str, Any]]]] = {}
+    for source in canonical:
+        built = FCM.build_cancel_rows(source, moves, canonical=canonical, facts=facts)
+        rows[position[id(source)]] = [
+            (position[id(row.pop("target"))], row) for row in built
+        ]
+    return CancelRouteGraph(
+        key,
+        signature or moves_signature(moves),
+        moves,
+        [position[id(move)] for move in canonical],
+        rows,
+    )
+
+
+def route_graph_path(key: str, directory: Optional[str] = None) -> str:
+    return os.path.join(directory or default_writable_directory(), ROUTE_DIRECTORY_NAME, _safe_key(key) + ".json")
+
+
+def load_cancel_route_graph(
+    key: str,
+    moves: Sequence[Dict[str, Any]],
+    *,
+    directory: Optional[str] = None,
+    signature: Optional[str] = None,
+) -> Optional[CancelRouteGraph]:
+    try:
+        with open(route_graph_path(key, directory), "r", encoding="utf-8") as handle:
+            payload = json.load(handle)
+    except Exception:
+        return None
+    return CancelRouteGraph.from_payload(payload, moves, signature=signature)
+
+
+def save_cancel_route_graph(graph: CancelRouteGraph, *, directory: Optional[str] = None) -> bool:
+    return _atomic_write_json(route_graph_path(graph.key, directory), graph.to_payload())
+
+
+def cached_cancel_route_graph(key: str, moves: Sequence[Dict[str, Any]]) -> Optional[CancelRouteGraph]:
+    """The in-memory graph for ``key`` if it matches ``moves``; never builds."""
+    with _LOCK:
+        graph = _GRAPHS.get(_safe_key(key))
+    if graph is None:
+        return None
+    if graph.built_from(moves):
+        return graph
+    if moves_signature(moves) == graph.signature:
+        return graph.bind(moves)
+    return None
+
+
+def _remember(graph: CancelRouteGraph) -> None:
+    with _LOCK:
+        _GRAPHS.pop(graph.key, None)
+        _GRAPHS[graph.key] = graph
+        while len(_GRAPHS) > ROUTE_GRAPH_LIMIT:
+            _GRAPHS.pop(next(iter(_GRAPHS)))
+
+
+def ensure_cancel_route_graph(
+    key: str,
+    moves: Sequence[Dict[str, Any]],
+    *,
+    directory: Optional[str] = None,
+) -> CancelRouteGraph:
+    """Memory, then disk, then a fresh build (saved for next time).  Blocking."""
+    key = _safe_key(key)
+    moves = list(moves or [])
+    graph = cached_cancel_route_graph(key, moves)
+    if graph is not None:
+        return graph
+    signature = moves_signature(moves)
+    graph = load_cancel_route_graph(key, moves, directory=directory, signature=signature)
+    if graph is not None:
+        with _LOCK:
+            _STATS["loads"] += 1
+    else:
+        started = time.perf_counter()
+        graph = build_cancel_route_graph(moves, key=key, signature=signature)
+        with _LOCK:
+            _STATS["builds"] += 1
+            _STATS["last_build_ms"] = round((time.perf_counter() - started) * 1000.0, 3)
+        if not save_cancel_route_graph(graph, directory=directory):
+            with _LOCK:
+                _STATS["last_error"] = f"could not save {route_graph_path(key, directory)}"
+    _remember(graph)
+    return graph
+
+
+def _build_pending() -> None:
+    while True:
+        with _LOCK:
+            if not _PENDING:
+                return
+            key, (moves, directory) = _PENDING.popitem()
+        try:
+            ensure_cancel_route_graph(key, moves, directory=directory)
+        except Exception as exc:
+            with _LOCK:
+                _STATS["last_error"] = repr(exc)
+
+
+def request_cancel_route_graph(
+    key: str,
+    moves: Sequence[Dict[str, Any]],
+    *,
+    directory: Optional[str] = None,
+) -> Optional[CancelRouteGraph]:
+    """Return the ready graph, or queue a background load/build and return None."""
+    global _BUILDER
+    key = _safe_key(key)
+    moves = list(moves or [])
+    graph = cached_cancel_route_graph(key, moves)
+    if graph is not None or not moves:
+        return graph
+    with _LOCK:
+        _PENDING[key] = (moves, directory)
+        if _BUILDER is None:
+            _BUILDER = DeferredWorkLoop(_build_pending, interval=0.05, name="TvCCancelRouteGraph")
+        builder = _BUILDER
+    builder.request()
+    return None
+
+
+def clear_cancel_route_graphs() -> None:
+    with _LOCK:
+        _GRAPHS.clear()
+        _PENDING.clear()
+
+
+def cancel_route_graph_stats() -> Dict[str, Any]:
+    with _LOCK:
+        out = dict(_STATS)
+        out["graphs"] = len(_GRAPHS)
+        out["pending"] = len(_PENDING)
+    return out
+
+
+# ---- command table ----
+
+COMMAND_ROW_SIZE = 24
+
+_COMMAND_INDEX_LOCK = threading.Lock()
+_COMMAND_INDEX: Dict[int, Tuple[bytes, Dict[int, List[Dict[str, int]]]]] = {}
+
+
+def _signed_u16(value: int) -> int:
+    value &= 0xFFFF
+    return value - 0x10000 if value & 0x8000 else value
+
+
+def command_rows_by_target(table: int, data: bytes) -> Dict[int, List[Dict[str, int]]]:
+    """Normal-command rows of one command-table block, keyed by target action.
+
+    Parsing stops at the first row whose leading halfword is -1, matching the
+    game's walk.  The index is reused while the block bytes are unchanged.
+    """
+    table = int(table)
+    with _COMMAND_INDEX_LOCK:
+        cached = _COMMAND_INDEX.get(table)
+        if cached is not None and cached[0] == data:
+            return cached[1]
+    index: Dict[int, List[Dict[str, int]]] = {}
+    for row_index in range(len(data) // COMMAND_ROW_SIZE):
+        word0, direction, buttons, state_a, state_b, action = struct.unpack_from(
+            ">6I", data, row_index * COMMAND_ROW_SIZE
+        )
+        row_type = _signed_u16(word0 >> 16)
+        if row_type == -1:
+            break
+        target = action & 0xFFFF
+        index.setdefault(target, []).append(
+            {
+                "addr": table + row_index * COMMAND_ROW_SIZE,
+                "index": row_index,
+                "type": row_type,
+                "mode": word0 & 0xFFFF,
+                "direction": direction,
+                "buttons": buttons,
+                "state_a": state_a,
+                "state_b": state_b,
+                "target": target,
+            }
+        )
+    with _COMMAND_INDEX_LOCK:
+        _COMMAND_INDEX[table] = (bytes(data), index)
+        while len(_COMMAND_INDEX) > ROUTE_GRAPH_LIMIT:
+            _COMMAND_INDEX.pop(next(iter(_COMMAND_INDEX)))
+    return index
+
+
+__all__ = [
+    "CANCEL_ROUTE_GRAPH_VERSION",
+    "CancelRouteGraph",
+    "build_cancel_route_graph",
+    "cached_cancel_route_graph",
+    "cancel_route_graph_stats",
+    "clear_cancel_route_graphs",
+    "command_rows_by_target",
+    "ensure_cancel_route_graph",
+    "graph_key",
+    "load_cancel_route_graph",
+    "moves_signature",
+    "request_cancel_route_graph",
+    "route_graph_path",
+    "save_cancel_route_graph",
+]
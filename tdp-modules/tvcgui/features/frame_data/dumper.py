@@ -4,6 +4,12 @@
 # This gives us an assist-scanner-style one-button dump for whatever
 # character/slot is currently open: move heads, command signatures,
 # projectile/template rows, super beam-card candidates, and raw chunks.
+#
+# The scan region is streamed: it is read DUMP_CHUNK_SIZE bytes at a time,
+# every card scanner runs in one pass over each chunk, and each chunk is
+# written zlib-compressed to raw/region_chunks.tvcz with an index that
+# read_region_dump() uses for random access.  Only one chunk of the region is
+# held at a time, so a dump's memory does not grow with the region.
 
 from __future__ import annotations
 
@@ -12,6 +18,8 @@ import os
 import re
 import struct
 import sys
+import zlib
+from bisect import bisect_right
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -26,6 +34,17 @@ REGION_MAX_SIZE = 0x700000
 
 SUPER_BEAM_SIG = b"\x00\x00\x00\x0C\x00\x00\x00\x23"
 PROJECTILE_ANCHOR = b"\x00\x04\x01\x02\x00\x01\x00"
+CARD_23_SIGS = ((b"\x01\x23\x00\x00", "0123_card"), (b"\x00\x23\x00\x00", "0023_card"))
+LOOSE_23_CARD_LIMIT = 256
+
+DUMP_CHUNK_SIZE = 0x40000
+# Bytes past a chunk's end that rows starting inside it may need: the longest
+# is a move's command scan.  Each chunk read includes this much overlap.
+DUMP_CHUNK_AHEAD = max(MOVE_SCAN_LEN, MOVE_HEAD_LEN, 0x180)
+DUMP_CHUNK_LEVEL = 1
+REGION_DUMP_MAGIC = b"TVCDUMPZ"
+REGION_INDEX_MAGIC = b"TVCZIDX1"
+REGION_DUMP_VERSION = 1
 
 # Known command pairs that are useful when staring at a raw move stream.
 COMMAND_NAMES: dict[tuple[int, int], str] = {
@@ -125,6 +144,16 @@ def _get_rbytes():
     return None
 
 
+def _get_move_rbytes(target_slot: dict | None = None):
+    """rbytes for move data, shared with the frame-data windows when possible."""
+    try:
+        from tvcgui.platform.move_memory import move_memory_char_key, move_memory_reader
+
+        return move_memory_reader(move_memory_char_key(target_slot))
+    except Exception:
+        return _get_rbytes()
+
+
 def _read_bytes(addr: int, size: int, rbytes_func=None) -> bytes:
     if not addr or size <= 0:
         return b""
@@ -280,11 +309,12 @@ def _command_hits_for_move(addr: int, data: bytes) -> list[dict[str, Any]]:
     return hits
 
 
-def _move_summary(mv: dict, rbytes_func=None) -> dict[str, Any]:
+def _move_summary(mv: dict, rbytes_func=None, raw: bytes | None = None) -> dict[str, Any]:
     out = {k: _jsonable(mv.get(k)) for k in MOVE_SUMMARY_KEYS if k in mv}
     addr = _move_addr(mv)
     out["abs_hex"] = f"0x{addr:08X}" if addr else ""
-    raw = _read_bytes(addr, MOVE_SCAN_LEN, rbytes_func) if addr else b""
+    if raw is None:
+        raw = _read_bytes(addr, MOVE_SCAN_LEN, rbytes_func) if addr else b""
     out["raw_head_hex"] = _hex(raw, 96) if raw else ""
     out["command_hits"] = _command_hits_for_move(addr, raw) if raw else []
     return out
@@ -300,112 +330,150 @@ def _command_histogram(move_summaries: list[dict[str, Any]]) -> dict[str, int]:
     return dict(sorted(hist.items(), key=lambda kv: (-kv[1], kv[0])))
 
 
-def _scan_super_beam_cards(region_start: int, data: bytes) -> list[dict[str, Any]]:
-    rows: list[dict[str, Any]] = []
-    pos = 0
-    seen: set[int] = set()
-    while True:
-        sig_i = data.find(SUPER_BEAM_SIG, pos)
-        if sig_i < 0:
-            break
-        pos = sig_i + 1
-        idx = sig_i - 8
-        if idx < 0 or idx + 0x158 > len(data):
-            continue
-        addr = region_start + idx
-        if addr in seen:
-            continue
-        seen.add(addr)
-        card = data[idx:idx + 0x180]
-        damage = _u32(card, 0x10)
-        hit_count = _u32(card, 0x24)
-        lifetime = _u32(card, 0x84)
-        if damage is None or not (1 <= int(damage) <= 50000):
-            continue
-        if hit_count is not None and int(hit_count) not in (0xFFFFFFFF, 0xFFFFFFFE) and int(hit_count) > 0x20000:
-            continue
-        if lifetime is not None and int(lifetime) not in (0xFFFFFFFF, 0xFFFFFFFE) and int(lifetime) > 0x20000:
-            continue
-        fields = {}
-        for name, off, typ in SUPER_FIELDS:
-            fields[name] = _read_typed(card, off, typ)
-        rows.append({
-            "addr": addr,
-            "addr_hex": f"0x{addr:08X}",
-            "fmt": "super_beam_card",
-            "fields": fields,
-            "header_hex": _hex(card[:0x40], 0x40),
-        })
-    return rows
+def _super_beam_card_at(region_start: int, data: bytes, sig_i: int) -> dict[str, Any] | None:
+    idx = sig_i - 8
+    if idx < 0 or idx + 0x158 > len(data):
+        return None
+    addr = region_start + idx
+    card = data[idx:idx + 0x180]
+    damage = _u32(card, 0x10)
+    hit_count = _u32(card, 0x24)
+    lifetime = _u32(card, 0x84)
+    if damage is None or not (1 <= int(damage) <= 50000):
+        return None
+    if hit_count is not None and int(hit_count) not in (0xFFFFFFFF, 0xFFFFFFFE) and int(hit_count) > 0x20000:
+        return None
+    if lifetime is not None and int(lifetime) not in (0xFFFFFFFF, 0xFFFFFFFE) and int(lifetime) > 0x20000:
+        return None
+    fields = {}
+    for name, off, typ in SUPER_FIELDS:
+        fields[name] = _read_typed(card, off, typ)
+    return {
+        "addr": addr,
+        "addr_hex": f"0x{addr:08X}",
+        "fmt": "super_beam_card",
+        "fields": fields,
+        "header_hex": _hex(card[:0x40], 0x40),
+    }
 
 
-def _scan_projectile_templates(region_start: int, data: bytes) -> list[dict[str, Any]]:
-    rows: list[dict[str, Any]] = []
+def _projectile_template_at(region_start: int, data: bytes, i: int) -> dict[str, Any] | None:
+    dmg_off = i + 7
+    radius_off = dmg_off + 0x2C
+    if radius_off + 4 > len(data):
+        return None
+    dmg = _u16(data, dmg_off)
+    radius = _f32(data, radius_off)
+    if dmg is None or radius is None:
+        return None
+    if not (1 <= int(dmg) <= 50000):
+        return None
+    if not (0.0 < float(radius) <= 2000.0):
+        return None
+    addr = region_start + i
+    return {
+        "addr": addr,
+        "addr_hex": f"0x{addr:08X}",
+        "fmt": "projectile_template_anchor",
+        "damage_addr": region_start + dmg_off,
+        "damage": int(dmg),
+        "radius_addr": region_start + radius_off,
+        "radius": float(radius),
+        "header_hex": _hex(data[i:i + 0x50], 0x50),
+    }
+
+
+def _card_23_at(region_start: int, data: bytes, i: int, label: str) -> dict[str, Any] | None:
+    if i + 8 > len(data):
+        return None
+    dmg = _u16(data, i + 4)
+    if dmg is None or not (2 <= int(dmg) <= 50000):
+        return None
+    addr = region_start + i
+    return {
+        "addr": addr,
+        "addr_hex": f"0x{addr:08X}",
+        "fmt": label,
+        "damage_addr": region_start + i + 4,
+        "damage": int(dmg),
+        "header_hex": _hex(data[i:i + 0x60], 0x60),
+    }
+
+
+def _find_all(data: bytes, sig: bytes):
     pos = 0
-    seen: set[int] = set()
     while True:
-        i = data.find(PROJECTILE_ANCHOR, pos)
+        i = data.find(sig, pos)
         if i < 0:
-            break
+            return
+        yield i
         pos = i + 1
-        if i in seen:
-            continue
-        seen.add(i)
-        dmg_off = i + 7
-        radius_off = dmg_off + 0x2C
-        if radius_off + 4 > len(data):
-            continue
-        dmg = _u16(data, dmg_off)
-        radius = _f32(data, radius_off)
-        if dmg is None or radius is None:
-            continue
-        if not (1 <= int(dmg) <= 50000):
-            continue
-        if not (0.0 < float(radius) <= 2000.0):
-            continue
-        addr = region_start + i
-        rows.append({
-            "addr": addr,
-            "addr_hex": f"0x{addr:08X}",
-            "fmt": "projectile_template_anchor",
-            "damage_addr": region_start + dmg_off,
-            "damage": int(dmg),
-            "radius_addr": region_start + radius_off,
-            "radius": float(radius),
-            "header_hex": _hex(data[i:i + 0x50], 0x50),
-        })
-    return rows
+
+
+def _scan_super_beam_cards(region_start: int, data: bytes) -> list[dict[str, Any]]:
+    rows = (_super_beam_card_at(region_start, data, i) for i in _find_all(data, SUPER_BEAM_SIG))
+    return [row for row in rows if row is not None]
+
+
+def _scan_projectile_templates(region_start: int, data: bytes) -> list[dict[str, Any]]:
+    rows = (_projectile_template_at(region_start, data, i) for i in _find_all(data, PROJECTILE_ANCHOR))
+    return [row for row in rows if row is not None]
 
 
 def _scan_23_card_candidates(region_start: int, data: bytes) -> list[dict[str, Any]]:
     """Loose exploratory 0x23 card hits for supers that do not use beam_sig."""
     rows: list[dict[str, Any]] = []
-    patterns = ((b"\x01\x23\x00\x00", "0123_card"), (b"\x00\x23\x00\x00", "0023_card"))
-    seen: set[int] = set()
-    for sig, label in patterns:
-        pos = 0
-        while True:
-            i = data.find(sig, pos)
-            if i < 0:
-                break
-            pos = i + 1
-            if i in seen or i + 8 > len(data):
-                continue
-            seen.add(i)
-            dmg = _u16(data, i + 4)
-            if dmg is None or not (2 <= int(dmg) <= 50000):
-                continue
-            addr = region_start + i
-            rows.append({
-                "addr": addr,
-                "addr_hex": f"0x{addr:08X}",
-                "fmt": label,
-                "damage_addr": region_start + i + 4,
-                "damage": int(dmg),
-                "header_hex": _hex(data[i:i + 0x60], 0x60),
-            })
+    for sig, label in CARD_23_SIGS:
+        for i in _find_all(data, sig):
+            row = _card_23_at(region_start, data, i, label)
+            if row is not None:
+                rows.append(row)
     rows.sort(key=lambda row: int(row.get("addr") or 0))
-    return rows[:256]
+    return rows[:LOOSE_23_CARD_LIMIT]
+
+
+def _scan_chunk_cards(
+    base: int,
+    data: bytes,
+    own_end: int,
+    loose_23_wanted: int = LOOSE_23_CARD_LIMIT,
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]], list[dict[str, Any]]]:
+    """Super, projectile and loose 0x23 rows starting before ``own_end``.
+
+    Every signature is searched in the one chunk ``data`` (memory at ``base``)
+    while it is in hand, rather than in a whole-region buffer.  Rows are
+    the same ones the whole-buffer scanners return, as long as ``data`` runs at
+    least DUMP_CHUNK_AHEAD bytes past ``own_end`` or ends where the region does.
+    """
+    supers: list[dict[str, Any]] = []
+    projectiles: list[dict[str, Any]] = []
+    limit = own_end - base
+    for i in _find_all(data, SUPER_BEAM_SIG):
+        if i - 8 >= limit:
+            break
+        row = _super_beam_card_at(base, data, i)
+        if row is not None:
+            supers.append(row)
+    for i in _find_all(data, PROJECTILE_ANCHOR):
+        if i >= limit:
+            break
+        row = _projectile_template_at(base, data, i)
+        if row is not None:
+            projectiles.append(row)
+    hits = []
+    for sig, label in CARD_23_SIGS:
+        for i in _find_all(data, sig):
+            if i >= limit:
+                break
+            hits.append((i, label))
+    loose: list[dict[str, Any]] = []
+    for i, label in sorted(hits):
+        if len(loose) >= loose_23_wanted:
+            break
+        row = _card_23_at(base, data, i, label)
+        if row is not None:
+            loose.append(row)
+    return supers, projectiles, loose
 
 
 def _write_chunk_index(path: str, entries: list[tuple[str, int, bytes]]) -> list[dict[str, Any]]:
@@ -429,6 +497,82 @@ def _write_chunk_index(path: str, entries: list[tuple[str, int, bytes]]) -> list
     return manifest
 
 
+class _RegionChunkWriter:
+    """Compressed region chunks followed by a random-access index.
+
+    Layout: REGION_DUMP_MAGIC, version, base address, chunk size; the zlib
+    streams back to back; then the index (count, then address, raw size, file
+    offset and compressed size per chunk); then the index offset and
+    REGION_INDEX_MAGIC as a fixed-size footer.
+    """
+
+    def __init__(self, path: str, base: int, chunk_size: int, level: int = DUMP_CHUNK_LEVEL) -> None:
+        self.path = path
+        self.level = int(level)
+        self.entries: list[tuple[int, int, int, int]] = []
+        self._fh = open(path, "wb")
+        self._fh.write(REGION_DUMP_MAGIC + struct.pack(">HHII", REGION_DUMP_VERSION, 0, int(base), int(chunk_size)))
+
+    def write(self, addr: int, data: bytes) -> None:
+        packed = zlib.compress(data, self.level)
+        self.entries.append((int(addr), len(data), self._fh.tell(), len(packed)))
+        self._fh.write(packed)
+
+    def close(self) -> int:
+        index_at = self._fh.tell()
+        self._fh.write(struct.pack(">I", len(self.entries)))
+        for entry in self.entries:
+            self._fh.write(struct.pack(">IIQI", *entry))
+        self._fh.write(struct.pack(">Q", index_at) + REGION_INDEX_MAGIC)
+        size = self._fh.tell()
+        self._fh.close()
+        return size
+
+
+def region_dump_index(path: str) -> list[dict[str, int]]:
+    """The chunk index of a region_chunks.tvcz file, in address order."""
+    with open(path, "rb") as f:
+        if f.read(len(REGION_DUMP_MAGIC)) != REGION_DUMP_MAGIC:
+            raise ValueError(f"{path} is not a region dump")
+        f.seek(-(8 + len(REGION_INDEX_MAGIC)), os.SEEK_END)
+        footer = f.read(8 + len(REGION_INDEX_MAGIC))
+        if footer[8:] != REGION_INDEX_MAGIC:
+            raise ValueError(f"{path} has no chunk index")
+        f.seek(struct.unpack(">Q", footer[:8])[0])
+        (count,) = struct.unpack(">I", f.read(4))
+        rows = [struct.unpack(">IIQI", f.read(20)) for _ in range(count)]
+    return [
+        {"addr": addr, "size": size, "offset": offset, "compressed_size": packed}
+        for addr, size, offset, packed in sorted(rows)
+    ]
+
+
+def read_region_dump(path: str, addr: int, size: int, index: list[dict[str, int]] | None = None) -> bytes:
+    """Bytes at ``addr`` from a region dump, decompressing only the chunks hit.
+
+    Stops early at a gap (a chunk that couldn't be read when dumping).
+    """
+    index = index if index is not None else region_dump_index(path)
+    starts = [entry["addr"] for entry in index]
+    addr = int(addr)
+    end = addr + max(0, int(size))
+    out = bytearray()
+    i = max(0, bisect_right(starts, addr) - 1)
+    with open(path, "rb") as f:
+        while addr < end and i < len(index):
+            entry = index[i]
+            lo, hi = entry["addr"], entry["addr"] + entry["size"]
+            if not lo <= addr < hi:
+                break
+            f.seek(entry["offset"])
+            data = zlib.decompress(f.read(entry["compressed_size"]))
+            take = data[addr - lo:min(hi, end) - lo]
+            out += take
+            addr += len(take)
+            i += 1
+    return bytes(out)
+
+
 def _projectile_hit_summary(hit: dict) -> dict[str, Any]:
     keys = (
         "addr", "fmt", "key", "move", "dmg", "dmg_write_addr", "cluster", "proj_role",
@@ -462,6 +606,7 @@ def _write_text_report(path: str, report: dict[str, Any]) -> None:
         lines.append(f"start: {bounds.get('start_hex')}")
         lines.append(f"end:   {bounds.get('end_hex')}")
         lines.append(f"size:  {bounds.get('size')}")
+        lines.append(f"read:  {bounds.get('bytes_read')}")
         lines.append("")
 
     lines.append("Command histogram")
@@ -520,7 +665,7 @@ def _write_text_report(path: str, report: dict[str, Any]) -> None:
 
     lines.append("Raw files")
     lines.append("---------")
-    for key in ("move_head_chunks", "candidate_chunks"):
+    for key in ("move_head_chunks", "candidate_chunks", "region_chunks"):
         lines.append(f"{key}: {report.get(key, {}).get('path', '')}")
     lines.append("")
 
@@ -528,12 +673,75 @@ def _write_text_report(path: str, report: dict[str, Any]) -> None:
         f.write("\n".join(lines))
 
 
+def _stream_region(
+    region_start: int,
+    region_end: int,
+    rbytes_func,
+    moves: list[dict],
+    writer: _RegionChunkWriter | None = None,
+    chunk_size: int = DUMP_CHUNK_SIZE,
+) -> dict[str, Any]:
+    """Read the scan region chunk by chunk and collect everything cut from it.
+
+    Each chunk is read with DUMP_CHUNK_AHEAD bytes of overlap, scanned once for
+    every card signature, and handed to ``writer``.  Move scans, move heads and
+    candidate chunks that fall inside a chunk are sliced out of it; the caller
+    reads the rest (moves outside the region) directly.
+    """
+    chunk_size = max(0x1000, int(chunk_size))
+    by_addr = sorted((_move_addr(mv), n) for n, mv in enumerate(moves) if _move_addr(mv))
+    move_addrs = [addr for addr, _n in by_addr]
+    out: dict[str, Any] = {
+        "super_cards": [],
+        "projectile_templates": [],
+        "loose_23_cards": [],
+        "move_raw": {},
+        "slices": {},
+        "bytes_read": 0,
+        "chunks": 0,
+    }
+    candidate_sizes = (("super_cards", 0x180, None), ("loose_23_cards", 0x100, 64), ("projectile_templates", 0x120, 128))
+    for start in range(region_start, region_end, chunk_size):
+        own_end = min(region_end, start + chunk_size)
+        data = _read_bytes(start, min(region_end, own_end + DUMP_CHUNK_AHEAD) - start, rbytes_func)
+        if not data:
+            continue
+        out["chunks"] += 1
+        out["bytes_read"] += min(len(data), own_end - start)
+        if writer is not None:
+            writer.write(start, data[:own_end - start])
+
+        supers, projectiles, loose = _scan_chunk_cards(
+            start, data, own_end, LOOSE_23_CARD_LIMIT - len(out["loose_23_cards"])
+        )
+        found = {"super_cards": supers, "projectile_templates": projectiles, "loose_23_cards": loose}
+        data_end = start + len(data)
+        for key, size, limit in candidate_sizes:
+            kept = len(out[key])
+            for row in found[key]:
+                if limit is not None and kept >= limit:
+                    break
+                addr = int(row["addr"])
+                if addr + size <= data_end:
+                    out["slices"][(addr, size)] = data[addr - start:addr - start + size]
+                kept += 1
+            out[key].extend(found[key])
+
+        lo = bisect_right(move_addrs, start - 1)
+        hi = bisect_right(move_addrs, own_end - 1)
+        for addr, n in by_addr[lo:hi]:
+            if addr + MOVE_SCAN_LEN <= data_end:
+                out["move_raw"][n] = data[addr - start:addr - start + MOVE_SCAN_LEN]
+    return out
+
+
 def dump_character(target_slot: dict, moves: list[dict], projectile_hits: list[dict] | None = None,
-                   output_root: str | None = None) -> str:
+                   output_root: str | None = None, rbytes_func=None) -> str:
     """Write a read-only dump folder and return its path."""
     projectile_hits = list(projectile_hits or [])
     moves = list(moves or [])
-    rbytes_func = _get_rbytes()
+    region_rbytes = rbytes_func or _get_rbytes()
+    rbytes_func = rbytes_func or _get_move_rbytes(target_slot)
 
     char_name = str(target_slot.get("char_name") or target_slot.get("character") or target_slot.get("name") or "unknown")
     slot_label = str(target_slot.get("slot_label") or target_slot.get("slot") or "slot")
@@ -543,28 +751,44 @@ def dump_character(target_slot: dict, moves: list[dict], projectile_hits: list[d
     raw_dir = os.path.join(outdir, "raw")
     os.makedirs(raw_dir, exist_ok=True)
 
-    move_summaries = [_move_summary(mv, rbytes_func) for mv in moves]
+    # Stream the region straight from Dolphin (bypassing the shared cache, so
+    # a dump doesn't evict the windows' blocks).  Moves and candidates inside
+    # it are cut from the chunks; anything else is read on its own below.
+    region_start, region_end = _scan_region_bounds(moves, projectile_hits)
+    region_bin = os.path.join(raw_dir, "region_chunks.tvcz")
+    region_file_size = 0
+    stream: dict[str, Any] = {"move_raw": {}, "slices": {}, "bytes_read": 0, "chunks": 0}
+    if region_start is not None and region_end is not None and region_rbytes is not None:
+        writer = _RegionChunkWriter(region_bin, region_start, DUMP_CHUNK_SIZE)
+        try:
+            stream = _stream_region(region_start, region_end, region_rbytes, moves, writer, DUMP_CHUNK_SIZE)
+        finally:
+            region_file_size = writer.close()
+        if not stream["chunks"]:
+            os.remove(region_bin)
+            region_file_size = 0
+    move_raw: dict[int, bytes] = stream["move_raw"]
+    slices: dict[tuple[int, int], bytes] = stream["slices"]
+
+    def _region_or_read(addr: int, size: int) -> bytes:
+        data = slices.get((addr, size))
+        return data if data is not None else _read_bytes(addr, size, rbytes_func)
+
+    move_summaries = [_move_summary(mv, rbytes_func, move_raw.get(n)) for n, mv in enumerate(moves)]
     command_hist = _command_histogram(move_summaries)
 
-    region_start, region_end = _scan_region_bounds(moves, projectile_hits)
-    region_data = b""
-    super_cards: list[dict[str, Any]] = []
-    projectile_templates: list[dict[str, Any]] = []
-    loose_23_cards: list[dict[str, Any]] = []
-    if region_start is not None and region_end is not None:
-        region_data = _read_bytes(region_start, region_end - region_start, rbytes_func)
-        if region_data:
-            super_cards = _scan_super_beam_cards(region_start, region_data)
-            projectile_templates = _scan_projectile_templates(region_start, region_data)
-            loose_23_cards = _scan_23_card_candidates(region_start, region_data)
+    super_cards: list[dict[str, Any]] = stream.get("super_cards") or []
+    projectile_templates: list[dict[str, Any]] = stream.get("projectile_templates") or []
+    loose_23_cards: list[dict[str, Any]] = stream.get("loose_23_cards") or []
 
     # Binary move heads.
     move_entries: list[tuple[str, int, bytes]] = []
-    for mv in moves:
+    for n, mv in enumerate(moves):
         addr = _move_addr(mv)
         if not _valid_mem_addr(addr):
             continue
-        data = _read_bytes(addr, MOVE_HEAD_LEN, rbytes_func)
+        raw = move_raw.get(n)
+        data = raw[:MOVE_HEAD_LEN] if raw is not None else _read_bytes(addr, MOVE_HEAD_LEN, rbytes_func)
         if not data:
             continue
         name = mv.get("move_name") or mv.get("pretty_name") or mv.get("name") or "move"
@@ -577,19 +801,19 @@ def dump_character(target_slot: dict, moves: list[dict], projectile_hits: list[d
     for card in super_cards:
         addr = int(card.get("addr") or 0)
         if addr:
-            data = _read_bytes(addr, 0x180, rbytes_func)
+            data = _region_or_read(addr, 0x180)
             if data:
                 cand_entries.append(("super_beam_card", addr, data))
     for row in loose_23_cards[:64]:
         addr = int(row.get("addr") or 0)
         if addr:
-            data = _read_bytes(addr, 0x100, rbytes_func)
+            data = _region_or_read(addr, 0x100)
             if data:
                 cand_entries.append((str(row.get("fmt") or "23_card"), addr, data))
     for row in projectile_templates[:128]:
         addr = int(row.get("addr") or 0)
         if addr:
-            data = _read_bytes(addr, 0x120, rbytes_func)
+            data = _region_or_read(addr, 0x120)
             if data:
                 cand_entries.append(("projectile_template", addr, data))
     cand_bin = os.path.join(raw_dir, "candidate_chunks.bin")
@@ -620,7 +844,7 @@ def dump_character(target_slot: dict, moves: list[dict], projectile_hits: list[d
             "end": region_end,
             "end_hex": f"0x{region_end:08X}" if region_end is not None else "",
             "size": (region_end - region_start) if region_start is not None and region_end is not None else 0,
-            "bytes_read": len(region_data),
+            "bytes_read": stream["bytes_read"],
         },
         "command_histogram": command_hist,
         "moves": move_summaries,
@@ -636,6 +860,13 @@ def dump_character(target_slot: dict, moves: list[dict], projectile_hits: list[d
             "path": os.path.relpath(cand_bin, outdir) if cand_manifest else "",
             "entries": cand_manifest,
         },
+        "region_chunks": {
+            "path": os.path.relpath(region_bin, outdir) if region_file_size else "",
+            "format": "zlib chunks + index (read_region_dump)",
+            "chunk_size": DUMP_CHUNK_SIZE,
+            "chunks": stream["chunks"],
+            "compressed_size": region_file_size,
+        },
     }
 
     json_path = os.path.join(outdir, "character_dump.json")
@@ -0,0 +1,779 @@
+"""Batched frame-data edits with an on-disk undo journal.
+
+The workbench used to apply every cell edit as its own write: a packet check
+read, one ``wd8`` per byte, then a row refresh.  Bulk edits (a patch, or one
+value pushed across a move family) turned into long chains of those.
+
+An :class:`EditSet` stages many cell edits in the patch-entry shape the
+workbench already saves (``group`` / ``value`` / ``original`` /
+``selector``).  :meth:`EditSet.apply` compiles every edit it can into the
+bytes :mod:`move_writer` and :mod:`write_helpers` would write, reads each
+touched span once to check packet headers and capture the old bytes, and
+writes coalesced runs with one ``wbytes`` each.  Edits without a direct byte
+route (animation swaps, projectile/super rows, fields that still need a
+probe) go through the caller's per-entry ``fallback`` exactly as before.
+
+An :class:`EditJournal` appends every applied set to
+``_edit_journal/<character>.jsonl`` next to the frame-data profiles, with the
+before/after bytes of each run, so undo and redo are one coalesced write and
+survive a restart.  :meth:`EditJournal.applied_changes` rebuilds the live
+edits for re-applying after a character reload.  The file is rewritten with
+only the live history once dead rows pile up, and sets older than
+``JOURNAL_HISTORY_LIMIT`` are folded into a base row that can no longer be
+undone but is still re-applied.
+"""
+from __future__ import annotations
+
+import bisect
+import json
+import math
+import os
+import struct
+import tempfile
+import threading
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from tvcgui.features.combat.move_writer import (
+    ACTIVE_END_OFFSET,
+    ACTIVE_START_OFFSET,
+    DAMAGE_VALUE_OFFSET,
+    FALLBACK_HB_OFFSET,
+    KNOCKBACK_AIR_OFFSET,
+    KNOCKBACK_PROFILE_OFFSET,
+    KNOCKBACK_UNKNOWN_OFFSET,
+    KNOCKBACK_X_OFFSET,
+    STUN_BLOCKSTUN_OFFSET,
+    STUN_HITSTOP_OFFSET,
+    STUN_HITSTUN_OFFSET,
+)
+from .patterns import ACTIVE_HDR, DAMAGE_HDR, STUN_HDR
+from .profile_store import _safe_key, default_writable_directory
+
+EDIT_SET_SCHEMA = "tvc_continuo.frame_data_edit_set.v1"
+JOURNAL_DIRECTORY_NAME = "_edit_journal"
+# Undoable sets kept per character; older ones fold into the journal's base row.
+JOURNAL_HISTORY_LIMIT = 100
+# Dead rows (undone branches, undo/redo markers) tolerated before a rewrite.
+JOURNAL_COMPACT_SLACK = 64
+# Writes (and the reads behind them) closer than this are merged into one run;
+# the gap bytes are rewritten with what was just read.
+EDIT_SPAN_GAP = 0x20
+
+# The fixed packet bytes the move_writer functions verify before writing:
+# the scanner headers up to their first wildcard, and the active packet
+# through its 0x3F marker.
+_DAMAGE_HEADER = bytes(DAMAGE_HDR)
+_ACTIVE_HEADER = bytes(ACTIVE_HDR[:5])
+_STUN_HEADER = bytes(STUN_HDR[:STUN_HDR.index(None)])
+_STUN_OFFSETS = {"hitstun": STUN_HITSTUN_OFFSET, "blockstun": STUN_BLOCKSTUN_OFFSET, "hitstop": STUN_HITSTOP_OFFSET}
+_U32_FIELDS = {
+    "hit_spark": ("hit_spark_addr", "hit_spark"),
+    "stretch_part": ("stretch_part_addr", "stretch_part"),
+    "stretch_time": ("stretch_time_addr", "stretch_time"),
+    "post_link": ("post_link_addr", "post_link"),
+    "hit_result_flags": ("hit_result_addr", "hit_result_flags"),
+}
+_F32_FIELDS = {
+    "stretch_len": ("stretch_len_addr", "stretch_len"),
+    "stretch_width": ("stretch_width_addr", "stretch_width"),
+    "stretch_height": ("stretch_height_addr", "stretch_height"),
+}
+_KNOCKBACK_FIELDS = {
+    "launch_profile": (KNOCKBACK_PROFILE_OFFSET, "u32"),
+    "kb_unknown": (KNOCKBACK_UNKNOWN_OFFSET, "u32"),
+    "kb_x": (KNOCKBACK_X_OFFSET, "f32"),
+    "air_kb": (KNOCKBACK_AIR_OFFSET, "f32"),
+}
+_BYTE_FIELDS = {"meter": "meter_addr", "speed_mod": "speed_mod_addr", "combo_kb_mod": "combo_kb_mod_addr"}
+
+
+class CompiledEdit:
+    """Byte writes, packet checks and row updates for one staged edit."""
+
+    __slots__ = ("writes", "checks", "updates")
+
+    def __init__(self) -> None:
+        self.writes: List[Tuple[int, bytes]] = []
+        self.checks: List[Tuple[int, bytes, str]] = []
+        self.updates: Dict[str, Any] = {}
+
+
+def _int(value: Any) -> int:
+    if isinstance(value, str):
+        text = value.strip()
+        return int(text, 16) if text.lower().startswith("0x") else int(text, 10)
+    return int(value)
+
+
+def _addr(value: Any) -> Optional[int]:
+    if value in (None, ""):
+        return None
+    try:
+        return _int(value)
+    except Exception:
+        return None
+
+
+def _finite(value: Any) -> float:
+    number = float(value)
+    if not math.isfinite(number):
+        raise ValueError(f"not a finite number: {value!r}")
+    return number
+
+
+def _field_enabled(mv: Dict[str, Any], field: str) -> bool:
+    key = f"{field}_write_verified"
+    return not (key in mv and not bool(mv.get(key)))
+
+
+def _direct_or_offset(mv: Dict[str, Any], direct_key: str, base_key: str, offset: int) -> Optional[int]:
+    direct = _addr(mv.get(direct_key))
+    if direct is not None:
+        return direct
+    base = _addr(mv.get(base_key))
+    return None if base is None else base + offset
+
+
+def _frame_pair(value: Any) -> Tuple[int, int]:
+    start = _int((value or {}).get("start"))
+    end = _int((value or {}).get("end"))
+    return start, max(start, end)
+
+
+def compile_edit(mv: Dict[str, Any], group: str, value: Any) -> Optional[CompiledEdit]:
+    """Bytes the single-field writers would write for ``group`` = ``value``.
+
+    Returns None when the edit has no direct byte route on this row (the
+    caller applies it through its per-entry writer instead).  Raises
+    ValueError for values the writers would reject.
+    """
+    group = str(group or "")
+    out = CompiledEdit()
+    if group == "damage":
+        base = _addr(mv.get("damage_addr"))
+        addr = _direct_or_offset(mv, "damage_value_addr", "damage_addr", DAMAGE_VALUE_OFFSET)
+        if base is None or addr is None or not _field_enabled(mv, "damage"):
+            return None
+        number = _int(value)
+        out.checks.append((base, _DAMAGE_HEADER, "damage"))
+        out.writes.append((addr, (number & 0xFFFFFF).to_bytes(3, "big")))
+        out.updates["damage"] = number
+    elif group == "active":
+        base = _addr(mv.get("active_addr"))
+        addr_s = _direct_or_offset(mv, "active_start_addr", "active_addr", ACTIVE_START_OFFSET)
+        addr_e = _direct_or_offset(mv, "active_end_addr", "active_addr", ACTIVE_END_OFFSET)
+        if base is None or addr_s is None or addr_e is None or not _field_enabled(mv, "active"):
+            return None
+        start, end = _frame_pair(value)
+        out.checks.append((base, _ACTIVE_HEADER, "active"))
+        out.writes.append((addr_s, bytes([(start - 1) & 0xFF])))
+        out.writes.append((addr_e, bytes([(end - 1) & 0xFF])))
+        out.updates.update(active_start=start, active_end=end)
+    elif group == "active2":
+        base = _addr(mv.get("active2_addr"))
+        if base is None:
+            return None
+        start, end = _frame_pair(value)
+        out.writes.append((base + 4, bytes([start & 0xFF])))
+        out.writes.append((base + 16, bytes([end & 0xFF])))
+        out.updates.update(active2_start=start, active2_end=end)
+    elif group in _STUN_OFFSETS:
+        base = _addr(mv.get("stun_addr"))
+        addr = _direct_or_offset(mv, f"{group}_addr", "stun_addr", _STUN_OFFSETS[group])
+        if base is None or addr is None or not _field_enabled(mv, "stun"):
+            return None
+        number = _int(value)
+        out.checks.append((base, _STUN_HEADER, "stun"))
+        out.writes.append((addr, bytes([number & 0xFF])))
+        out.updates[group] = number
+    elif group in _BYTE_FIELDS:
+        addr = _addr(mv.get(_BYTE_FIELDS[group]))
+        if addr is None:
+            return None
+        number = _int(value)
+        out.writes.append((addr, bytes([number & 0xFF])))
+        out.updates[group] = number if group == "meter" else number & 0xFF
+    elif group in _U32_FIELDS:
+        addr_key, value_key = _U32_FIELDS[group]
+        addr = _addr(mv.get(addr_key))
+        if addr is None:
+            return None
+        number = _int(value) & 0xFFFFFFFF
+        out.writes.append((addr, struct.pack(">I", number)))
+        out.updates[value_key] = number
+    elif group in _F32_FIELDS:
+        addr_key, value_key = _F32_FIELDS[group]
+        addr = _addr(mv.get(addr_key))
+        if addr is None:
+            return None
+        number = _finite(value)
+        out.writes.append((addr, struct.pack(">f", number)))
+        out.updates[value_key] = number
+    elif group in _KNOCKBACK_FIELDS:
+        base = _addr(mv.get("knockback_addr"))
+        if base is None:
+            return None
+        offset, kind = _KNOCKBACK_FIELDS[group]
+        if kind == "u32":
+            number: Any = _int(value) & 0xFFFFFFFF
+            out.writes.append((base + offset, struct.pack(">I", number)))
+        else:
+            number = _finite(value)
+            out.writes.append((base + offset, struct.pack(">f", number)))
+        out.updates[group] = number
+    elif group == "hit_reaction":
+        addr = _addr(mv.get("hit_reaction_addr"))
+        if addr is None:
+            return None
+        number = _int(value) & 0xFFFFFFFF
+        out.writes.append((addr, (number & 0xFFFFFF).to_bytes(3, "big")))
+        out.updates["hit_reaction"] = number
+    elif group == "proj_dmg":
+        addr = _addr(mv.get("proj_tpl"))
+        if addr is None:
+            return None
+        number = min(0xFFFF, max(0, _int(value)))
+        out.writes.append((addr, struct.pack(">I", number)))
+        out.updates.update(proj_dmg=number, proj_tpl=addr)
+    elif group == "hb":
+        base = _addr(mv.get("abs"))
+        if base is None:
+            return None
+        number = _finite(value)
+        offset = mv.get("hb_off")
+        out.writes.append((base + int(FALLBACK_HB_OFFSET if offset is None else offset), struct.pack(">f", number)))
+        out.updates["hb_r"] = number
+    else:
+        # Animation swaps, projectile/super rows, attack property and Super BG
+        # keep their own writers (probes, ID rebinding, shared card groups).
+        return None
+    return out
+
+
+def edit_selector(mv: Dict[str, Any], character: str = "") -> Dict[str, Any]:
+    """Patch-style selector that finds ``mv`` again after a reload."""
+    abs_addr = _addr(mv.get("abs"))
+    return {
+        "character": character,
+        "move_id": mv.get("id"),
+        "kind": mv.get("kind"),
+        "tier": mv.get("dup_index"),
+        "scan_index": mv.get("_scan_index"),
+        "abs": f"0x{abs_addr:08X}" if abs_addr is not None else None,
+    }
+
+
+def _merge_spans(spans: Iterable[Tuple[int, int]], gap: int) -> List[Tuple[int, int]]:
+    merged: List[List[int]] = []
+    for start, end in sorted(spans):
+        if merged and start <= merged[-1][1] + gap:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return [(start, end) for start, end in merged]
+
+
+def _default_read_block():
+    from tvcgui.platform.dolphin import rbytes
+
+    return rbytes
+
+
+def _default_write_block():
+    from tvcgui.platform.dolphin import wbytes
+
+    return wbytes
+
+
+def _read_span(read_block, start: int, end: int) -> Optional[bytes]:
+    try:
+        data = read_block(start, end - start)
+    except Exception:
+        return None
+    if data is None or len(data) < end - start:
+        return None
+    return bytes(data)
+
+
+def _label(entry: Dict[str, Any]) -> str:
+    selector = entry.get("selector") or {}
+    return str(selector.get("move_label") or selector.get("abs") or selector.get("move_id") or entry.get("group") or "unknown")
+
+
+def _write_runs(runs: Sequence[Dict[str, Any]], field: str, write_block) -> List[Dict[str, Any]]:
+    failed = []
+    for run in runs:
+        try:
+            ok = bool(write_block(int(run["addr"]), run[field]))
+        except Exception:
+            ok = False
+        if not ok:
+            failed.append(run)
+    return failed
+
+
+def write_batch(compiled: Sequence[Tuple[Any, CompiledEdit]], *, read_block=None, write_block=None) -> Dict[str, Any]:
+    """Check and write a batch of compiled edits as coalesced runs.
+
+    ``compiled`` pairs a caller token with each :class:`CompiledEdit`.  Every
+    touched span is read once, packet headers are checked against that image,
+    and the surviving writes go out as one ``write_block`` call per merged run.
+    Returns ``written`` / ``failed`` (``(token, reason)``) pairs plus the runs
+    that landed and the read/write counts; rows are left to the caller.
+    """
+    read_block = read_block or _default_read_block()
+    write_block = write_block or _default_write_block()
+    result: Dict[str, Any] = {"written": [], "failed": [], "runs": [], "reads": 0, "writes": 0}
+    pending = list(compiled)
+
+    # Two edits may not write different bytes to the same address.
+    owner: Dict[int, Tuple[int, int]] = {}
+    rejected = set()
+    for n, (_token, edit) in enumerate(pending):
+        for addr, data in edit.writes:
+            for i, byte in enumerate(data):
+                prev = owner.get(addr + i)
+                if prev is not None and prev[1] != byte and prev[0] != n:
+                    rejected.update((prev[0], n))
+                owner[addr + i] = (n, byte)
+    for n in sorted(rejected):
+        result["failed"].append((pending[n][0], "conflicts with another staged edit"))
+    pending = [pair for n, pair in enumerate(pending) if n not in rejected]
+
+    spans = []
+    for _token, edit in pending:
+        spans.extend((addr, addr + len(data)) for addr, data in edit.writes)
+        spans.extend((addr, addr + len(header)) for addr, header, _kind in edit.checks)
+    images: List[Tuple[int, int, Optional[bytes]]] = []
+    for start, end in _merge_spans(spans, EDIT_SPAN_GAP):
+        images.append((start, end, _read_span(read_block, start, end)))
+        result["reads"] += 1
+    image_starts = [start for start, _end, _data in images]
+
+    def image_at(addr: int, size: int) -> Optional[bytes]:
+        pos = bisect.bisect_right(image_starts, addr) - 1
+        if pos < 0:
+            return None
+        start, end, data = images[pos]
+        if addr + size > end or data is None:
+            return None
+        return data[addr - start:addr - start + size]
+
+    ready: List[Tuple[Any, CompiledEdit]] = []
+    for token, edit in pending:
+        reason = ""
+        for addr, header, kind in edit.checks:
+            current = image_at(addr, len(header))
+            if current is None:
+                reason = "read failed"
+            elif current != header:
+                reason = f"stale {kind} packet @ 0x{addr:08X}"
+            if reason:
+                break
+        if not reason and any(image_at(addr, len(data)) is None for addr, data in edit.writes):
+            reason = "read failed"
+        if reason:
+            result["failed"].append((token, reason))
+        else:
+            ready.append((token, edit))
+
+    runs: List[Dict[str, Any]] = []
+    members: List[List[int]] = []
+    write_spans = _merge_spans(
+        ((addr, addr + len(data)) for _token, edit in ready for addr, data in edit.writes), EDIT_SPAN_GAP
+    )
+    afters: List[bytearray] = []
+    for start, end in write_spans:
+        before = image_at(start, end - start) or b""
+        runs.append({"addr": start, "before": before})
+        afters.append(bytearray(before))
+        members.append([])
+    run_starts = [start for start, _end in write_spans]
+    for n, (_token, edit) in enumerate(ready):
+        for addr, data in edit.writes:
+            pos = bisect.bisect_right(run_starts, addr) - 1
+            start = run_starts[pos]
+            afters[pos][addr - start:addr - start + len(data)] = data
+            if not members[pos] or members[pos][-1] != n:
+                members[pos].append(n)
+    for run, after in zip(runs, afters):
+        run["after"] = bytes(after)
+
+    failed_runs = {id(run) for run in _write_runs(runs, "after", write_block)}
+    result["writes"] = len(runs)
+    failed_edits = set()
+    for run, owned in zip(runs, members):
+        if id(run) in failed_runs:
+            failed_edits.update(owned)
+        else:
+            result["runs"].append(run)
+    for n, (token, edit) in enumerate(ready):
+        if n in failed_edits:
+            result["failed"].append((token, "write failed"))
+        else:
+            result["written"].append((token, edit))
+    return result
+
+
+class EditSet:
+    """Staged cell edits for one character, applied together."""
+
+    def __init__(self, character: str = "", changes: Optional[Sequence[Dict[str, Any]]] = None) -> None:
+        self.character = str(character or "")
+        self._entries: List[Dict[str, Any]] = []
+        self._index: Dict[Tuple[Any, str], int] = {}
+        for change in changes or ():
+            if isinstance(change, dict) and change.get("group"):
+                self._entries.append({key: value for key, value in change.items() if key not in ("mode", "item_id", "mv")})
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def entries(self) -> List[Dict[str, Any]]:
+        return self._entries
+
+    def stage(self, mv: Dict[str, Any], group: str, value: Any, *, item_id: Any = None,
+              original: Any = None, selector: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Stage ``group`` = ``value`` on row ``mv``; a later stage of the same cell replaces it."""
+        key = (id(mv), str(group))
+        entry = {
+            "group": str(group),
+            "value": value,
+            "original": original,
+            "selector": selector if selector is not None else edit_selector(mv, self.character),
+            "item_id": item_id,
+            "mv": mv,
+        }
+        if key in self._index:
+            entry["original"] = self._entries[self._index[key]].get("original", original)
+            self._entries[self._index[key]] = entry
+        else:
+            self._index[key] = len(self._entries)
+            self._entries.append(entry)
+        return entry
+
+    def bind(self, resolve: Callable[[Dict[str, Any]], Tuple[Any, Optional[Dict[str, Any]]]]) -> List[Dict[str, Any]]:
+        """Attach rows to loaded entries with ``resolve(entry) -> (item_id, mv)``; return the unresolved."""
+        missing = []
+        for n, entry in enumerate(self._entries):
+            if entry.get("mv") is not None:
+                continue
+            item_id, mv = resolve(entry)
+            if mv is None:
+                missing.append(entry)
+                continue
+            entry["item_id"] = item_id
+            entry["mv"] = mv
+            self._index[(id(mv), str(entry.get("group")))] = n
+        return missing
+
+    def to_payload(self) -> Dict[str, Any]:
+        changes = [{key: value for key, value in entry.items() if key not in ("item_id", "mv")} for entry in self._entries]
+        return {
+            "schema": EDIT_SET_SCHEMA,
+            "character": self.character,
+            "change_count": len(changes),
+            "changes": changes,
+        }
+
+    @classmethod
+    def from_payload(cls, payload: Dict[str, Any]) -> "EditSet":
+        payload = payload if isinstance(payload, dict) else {}
+        return cls(str(payload.get("character") or ""), payload.get("changes") or [])
+
+    def apply(self, *, read_block=None, write_block=None,
+              fallback: Optional[Callable[[Dict[str, Any]], Tuple[bool, str]]] = None) -> Dict[str, Any]:
+        """Validate and write every bound entry; return what happened.
+
+        Compiled entries are checked against one read per touched span and
+        written as coalesced runs.  Other entries go through ``fallback(entry)``
+        afterwards (animation swaps last, as the patch loader does).  Rows of
+        written entries are updated in place.
+        """
+        read_block = read_block or _default_read_block()
+        write_block = write_block or _default_write_block()
+        result: Dict[str, Any] = {"applied": [], "failed": [], "runs": [], "reads": 0, "writes": 0}
+        compiled: List[Tuple[Dict[str, Any], CompiledEdit]] = []
+        deferred: List[Dict[str, Any]] = []
+        for entry in self._entries:
+            mv = entry.get("mv")
+            if mv is None:
+                result["failed"].append((entry, "not found"))
+                continue
+            try:
+                edit = compile_edit(mv, entry["group"], entry.get("value"))
+            except Exception as exc:
+                result["failed"].append((entry, f"invalid value: {exc}"))
+                continue
+            if edit is None:
+                deferred.append(entry)
+            else:
+                compiled.append((entry, edit))
+
+        batch = write_batch(compiled, read_block=read_block, write_block=write_block)
+        for key in ("runs", "reads", "writes"):
+            result[key] = batch[key]
+        result["failed"].extend(batch["failed"])
+        for entry, edit in batch["written"]:
+            entry["mv"].update(edit.updates)
+            entry["mode"] = "write"
+            result["applied"].append(entry)
+
+        deferred.sort(key=lambda entry: 1 if str(entry.get("group") or "") == "move" else 0)
+        for entry in deferred:
+            if fallback is None:
+                result["failed"].append((entry, "no direct write route"))
+                continue
+            try:
+                ok, reason = fallback(entry)
+            except Exception as exc:
+                ok, reason = False, str(exc)
+            if ok:
+                entry["mode"] = "fallback"
+                result["applied"].append(entry)
+            else:
+                result["failed"].append((entry, reason or "write failed"))
+        result["failures"] = [f"{_label(entry)}: {reason}" for entry, reason in result["failed"]]
+        return result
+
+
+def save_edit_set(edit_set: EditSet, path: str) -> bool:
+    from .profile_store import _atomic_write_json
+
+    return _atomic_write_json(path, edit_set.to_payload())
+
+
+def load_edit_set(path: str) -> Optional[EditSet]:
+    try:
+        with open(path, "r", encoding="utf-8") as handle:
+            payload = json.load(handle)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(payload, dict) or payload.get("schema") != EDIT_SET_SCHEMA:
+        return None
+    return EditSet.from_payload(payload)
+
+
+def journal_path(character: str, directory: Optional[str] = None) -> str:
+    base = directory or default_writable_directory()
+    return os.path.join(base, JOURNAL_DIRECTORY_NAME, f"{_safe_key(str(character).lower())}.jsonl")
+
+
+class EditJournal:
+    """Append-only undo/redo history of applied edit sets for one character.
+
+    Each line is one action (``apply``, ``undo`` or ``redo``); opening the
+    journal replays them to rebuild both stacks.  Undo and redo check that the
+    game still holds the bytes the action expects before writing, so history
+    from an earlier session never lands on a reloaded or different character.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._records: Dict[int, Dict[str, Any]] = {}
+        self._applied: List[int] = []
+        self._redo: List[int] = []
+        self._base: List[Dict[str, Any]] = []
+        self._seq = 0
+        self._lines = 0
+        self._replay()
+        with self._lock:
+            self._maybe_compact()
+
+    def _replay(self) -> None:
+        try:
+            with open(self.path, "r", encoding="utf-8") as handle:
+                lines = handle.readlines()
+        except OSError:
+            return
+        self._lines = len(lines)
+        for line in lines:
+            try:
+                row = json.loads(line)
+            except ValueError:
+                # A torn last line from an interrupted append.
+                continue
+            if not isinstance(row, dict):
+                continue
+            seq = int(row.get("seq") or 0)
+            self._seq = max(self._seq, seq)
+            action = row.get("action")
+            target = int(row.get("target") or 0)
+            if action == "base":
+                self._base = list(row.get("changes") or ())
+            elif action == "apply":
+                self._records[seq] = row
+                self._applied.append(seq)
+                self._redo.clear()
+            elif action == "undo" and self._applied and self._applied[-1] == target:
+                self._redo.append(self._applied.pop())
+            elif action == "redo" and self._redo and self._redo[-1] == target:
+                self._applied.append(self._redo.pop())
+
+    @staticmethod
+    def _line(row: Dict[str, Any]) -> str:
+        return json.dumps(row, separators=(",", ":"), sort_keys=True) + "\n"
+
+    def _append(self, row: Dict[str, Any]) -> bool:
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            with open(self.path, "a", encoding="utf-8", newline="\n") as handle:
+                handle.write(self._line(row))
+            self._lines += 1
+            return True
+        except OSError:
+            return False
+
+    def _maybe_compact(self) -> None:
+        """Rewrite the file with only the live history once it has grown stale.
+
+        Sets beyond ``JOURNAL_HISTORY_LIMIT`` are dropped from undo/redo: the
+        oldest applied ones fold into the base row (still re-applied after a
+        reload), the deepest undone ones are discarded.
+        """
+        overflow = len(self._applied) + len(self._redo) - JOURNAL_HISTORY_LIMIT
+        live = len(self._applied) + 2 * len(self._redo) + (1 if self._base else 0)
+        if overflow <= 0 and self._lines <= live + JOURNAL_COMPACT_SLACK:
+            return
+        applied, redo, base = list(self._applied), list(self._redo), list(self._base)
+        if overflow > 0:
+            dropped_redo = min(overflow, max(0, len(redo) - JOURNAL_HISTORY_LIMIT))
+            redo = redo[dropped_redo:]
+            folded = applied[:overflow - dropped_redo]
+            applied = applied[overflow - dropped_redo:]
+            base = _latest_changes([base] + [self._records[seq].get("changes") or () for seq in folded])
+        seq = self._seq
+        rows = [{"seq": 0, "action": "base", "changes": base}] if base else []
+        # Re-create the redo stack the way replay expects it: apply, then undo.
+        rows.extend(self._records[n] for n in applied + redo[::-1])
+        for target in redo:
+            seq += 1
+            rows.append({"seq": seq, "action": "undo", "target": target, "at": self._records[target].get("at")})
+        directory = os.path.dirname(os.path.abspath(self.path))
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(prefix=os.path.basename(self.path) + ".", suffix=".tmp", dir=directory)
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8", newline="\n") as handle:
+                    handle.writelines(self._line(row) for row in rows)
+                os.replace(tmp_name, self.path)
+            finally:
+                if os.path.exists(tmp_name):
+                    os.unlink(tmp_name)
+        except OSError:
+            # The uncompacted file is still a valid journal.
+            return
+        keep = set(applied + redo)
+        self._records = {n: row for n, row in self._records.items() if n in keep}
+        self._applied, self._redo, self._base = applied, redo, base
+        self._seq, self._lines = seq, len(rows)
+
+    def _next(self, action: str) -> Dict[str, Any]:
+        self._seq += 1
+        return {"seq": self._seq, "action": action, "at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")}
+
+    @property
+    def can_undo(self) -> bool:
+        return bool(self._applied)
+
+    @property
+    def can_redo(self) -> bool:
+        return bool(self._redo)
+
+    def record(self, character: str, result: Dict[str, Any]) -> Optional[int]:
+        """Journal one :meth:`EditSet.apply` result; return its sequence number."""
+        applied = result.get("applied") or []
+        if not applied:
+            return None
+        with self._lock:
+            row = self._next("apply")
+            row["character"] = character
+            row["changes"] = [
+                {key: value for key, value in entry.items() if key not in ("item_id", "mv")} for entry in applied
+            ]
+            row["runs"] = [
+                {"addr": f"0x{int(run['addr']):08X}", "before": run["before"].hex(), "after": run["after"].hex()}
+                for run in result.get("runs") or ()
+            ]
+            if not self._append(row):
+                # An unpersisted set can't be undone after a restart; don't
+                # hand out a sequence number for it.
+                self._seq -= 1
+                return None
+            self._records[row["seq"]] = row
+            self._applied.append(row["seq"])
+            self._redo.clear()
+            self._maybe_compact()
+            return row["seq"]
+
+    def _step(self, action: str, source: List[int], target: List[int], expect: str, write: str,
+              read_block, write_block, expect_seq: Optional[int]) -> Tuple[Optional[Dict[str, Any]], str]:
+        read_block = read_block or _default_read_block()
+        write_block = write_block or _default_write_block()
+        with self._lock:
+            if not source:
+                return None, f"nothing to {action}"
+            if expect_seq is not None and source[-1] != int(expect_seq):
+                return None, "edit history changed in another window"
+            record = self._records[source[-1]]
+            runs = [
+                {"addr": int(run["addr"], 16), expect: bytes.fromhex(run[expect]), write: bytes.fromhex(run[write])}
+                for run in record.get("runs") or ()
+            ]
+            for run in runs:
+                if _read_span(read_block, run["addr"], run["addr"] + len(run[expect])) != run[expect]:
+                    return None, f"memory at 0x{run['addr']:08X} changed since this edit"
+            failed = _write_runs(runs, write, write_block)
+            if failed:
+                return None, self._roll_back(runs, failed, expect, write_block, "write failed")
+            row = self._next(action)
+            row["target"] = record["seq"]
+            if not self._append(row):
+                self._seq -= 1
+                return None, self._roll_back(runs, [], expect, write_block, "journal write failed")
+            source.pop()
+            target.append(record["seq"])
+            self._maybe_compact()
+            return record, "ok"
+
+    @staticmethod
+    def _roll_back(runs: List[Dict[str, Any]], failed: List[Dict[str, Any]], expect: str,
+                   write_block, reason: str) -> str:
+        """Restore the ``expect`` bytes of runs already written by a step that failed.
+
+        A half-written step would leave memory matching neither side of the
+        record, so neither undo nor redo could run again.
+        """
+        skip = {id(run) for run in failed}
+        stuck = _write_runs([run for run in runs if id(run) not in skip], expect, write_block)
+        if stuck:
+            return f"{reason}; could not restore 0x{int(stuck[0]['addr']):08X}"
+        return reason
+
+    def undo(self, read_block=None, write_block=None, *, expect_seq: Optional[int] = None) -> Tuple[Optional[Dict[str, Any]], str]:
+        """Write back the last applied set's old bytes; return its record."""
+        return self._step("undo", self._applied, self._redo, "after", "before", read_block, write_block, expect_seq)
+
+    def redo(self, read_block=None, write_block=None, *, expect_seq: Optional[int] = None) -> Tuple[Optional[Dict[str, Any]], str]:
+        """Re-write the last undone set; return its record."""
+        return self._step("redo", self._redo, self._applied, "before", "after", read_block, write_block, expect_seq)
+
+    def applied_changes(self) -> List[Dict[str, Any]]:
+        """Changes of every applied (not undone) set, oldest first, one per cell."""
+        with self._lock:
+            return _latest_changes([self._base] + [self._records[seq].get("changes") or () for seq in self._applied])
+
+
+def _latest_changes(batches: Iterable[Iterable[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """The last change to each cell across ``batches``, in the order they were last set."""
+    latest: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    for changes in batches:
+        for change in changes:
+            selector = json.dumps(change.get("selector") or {}, sort_keys=True, default=str)
+            key = (selector, str(change.get("group") or ""))
+            latest.pop(key, None)
+            latest[key] = change
+    return list(latest.values())
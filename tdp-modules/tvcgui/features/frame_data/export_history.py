@@ -0,0 +1,354 @@
+"""Content-addressed, compressed version history for frame-data CSV exports.
+
+Every export write is recorded here instead of leaving a ``.previous`` copy
+beside the live file.  Versions are addressed by the SHA-256 of their content,
+so identical exports share one object.  Objects are zlib-compressed and, after
+the first version of a file, stored as a line-level delta against the prior
+version; a full keyframe is stored every :data:`KEYFRAME_INTERVAL` deltas so a
+restore never replays a long chain.
+
+Retention keeps the newest ``keep_versions`` versions of each file and prunes
+the oldest non-current versions while the object store is over
+``max_bytes``.  A delta whose base is pruned is rewritten as a keyframe first,
+so every version that is still listed can be restored.
+"""
+from __future__ import annotations
+
+import csv
+import difflib
+import hashlib
+import io
+import json
+import os
+import tempfile
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any
+
+HISTORY_DIRECTORY_NAME = "export_history"
+HISTORY_INDEX_VERSION = 1
+HISTORY_KEEP_VERSIONS = max(1, int(os.environ.get("TVC_FD_EXPORT_HISTORY_KEEP", "12")))
+HISTORY_MAX_BYTES = max(1, int(float(os.environ.get("TVC_FD_EXPORT_HISTORY_MAX_MB", "128")) * 1024 * 1024))
+KEYFRAME_INTERVAL = 16
+
+_KIND_FULL = b"F"
+_KIND_DELTA = b"D"
+
+
+def content_digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _encode_delta(base: bytes, data: bytes) -> bytes:
+    """Line ops against ``base``: ``[start, end]`` copies, strings insert."""
+    old_lines = base.splitlines(keepends=True)
+    new_lines = data.splitlines(keepends=True)
+    ops: list[Any] = []
+    matcher = difflib.SequenceMatcher(None, old_lines, new_lines, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            ops.append([i1, i2])
+        elif j2 > j1:
+            ops.append(b"".join(new_lines[j1:j2]).decode("utf-8", "surrogateescape"))
+    return json.dumps(ops, separators=(",", ":")).encode("utf-8")
+
+
+def _apply_delta(base: bytes, delta: bytes) -> bytes:
+    old_lines = base.splitlines(keepends=True)
+    out: list[bytes] = []
+    for op in json.loads(delta.decode("utf-8")):
+        if isinstance(op, str):
+            out.append(op.encode("utf-8", "surrogateescape"))
+        else:
+            out.extend(old_lines[op[0]:op[1]])
+    return b"".join(out)
+
+
+def _read_csv_rows(data: bytes, key_field: str) -> dict[str, dict[str, str]]:
+    text = data.decode("utf-8-sig", "replace")
+    rows: dict[str, dict[str, str]] = {}
+    for index, row in enumerate(csv.DictReader(io.StringIO(text, newline=""))):
+        rows[row.get(key_field) or f"#{index}"] = {name: value or "" for name, value in row.items() if name}
+    return rows
+
+
+class ExportHistory:
+    """Version store for the files under one export directory."""
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        keep_versions: int = HISTORY_KEEP_VERSIONS,
+        max_bytes: int = HISTORY_MAX_BYTES,
+    ) -> None:
+        self.root = Path(root)
+        self.keep_versions = max(1, int(keep_versions))
+        self.max_bytes = max(1, int(max_bytes))
+        self._lock = threading.RLock()
+        self._index: dict[str, Any] | None = None
+        # Newest content per file, so the next delta does not re-read its base.
+        self._latest: dict[str, tuple[str, bytes]] = {}
+        self.last_error = ""
+
+    @property
+    def index_path(self) -> Path:
+        return self.root / "index.json"
+
+    def _object_path(self, digest: str) -> Path:
+        return self.root / "objects" / digest[:2] / digest
+
+    # ------------------------------------------------------------------
+    # Index
+    # ------------------------------------------------------------------
+    def _load_index(self) -> dict[str, Any]:
+        if self._index is None:
+            index: Any = None
+            try:
+                index = json.loads(self.index_path.read_text(encoding="utf-8"))
+            except Exception:
+                index = None
+            if not isinstance(index, dict) or index.get("version") != HISTORY_INDEX_VERSION:
+                index = {"version": HISTORY_INDEX_VERSION, "files": {}, "objects": {}}
+            index.setdefault("files", {})
+            index.setdefault("objects", {})
+            self._index = index
+        return self._index
+
+    def _save_index(self) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(prefix="index.", suffix=".tmp", dir=str(self.root))
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(self._load_index(), handle, separators=(",", ":"), sort_keys=True)
+            os.replace(tmp_name, self.index_path)
+        finally:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+
+    # ------------------------------------------------------------------
+    # Objects
+    # ------------------------------------------------------------------
+    def _write_object(self, digest: str, kind: bytes, payload: bytes, base: str | None, depth: int, size: int) -> None:
+        path = self._object_path(digest)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        blob = kind + zlib.compress(payload, 6)
+        fd, tmp_name = tempfile.mkstemp(prefix=digest[:8] + ".", suffix=".tmp", dir=str(path.parent))
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(blob)
+            os.replace(tmp_name, path)
+        finally:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+        self._load_index()["objects"][digest] = {
+            "kind": kind.decode("ascii"),
+            "base": base,
+            "depth": depth,
+            "size": size,
+            "stored": len(blob),
+        }
+
+    def _read_object(self, digest: str) -> bytes:
+        data = self._object_path(digest).read_bytes()
+        kind, payload = data[:1], zlib.decompress(data[1:])
+        if kind == _KIND_FULL:
+            content = payload
+        else:
+            base = self._load_index()["objects"][digest]["base"]
+            content = _apply_delta(self._read_object(base), payload)
+        if content_digest(content) != digest:
+            raise ValueError(f"export history object {digest[:12]} is corrupt")
+        return content
+
+    def _store(self, data: bytes, base: str | None, base_content: bytes | None = None) -> str:
+        digest = content_digest(data)
+        objects = self._load_index()["objects"]
+        if digest in objects and self._object_path(digest).exists():
+            return digest
+        base_meta = objects.get(base) if base else None
+        if base_meta is not None and int(base_meta.get("depth", 0)) + 1 < KEYFRAME_INTERVAL:
+            delta = _encode_delta(base_content if base_content is not None else self._read_object(base), data)
+            if len(delta) < len(data):
+                self._write_object(digest, _KIND_DELTA, delta, base, int(base_meta["depth"]) + 1, len(data))
+                return digest
+        self._write_object(digest, _KIND_FULL, data, None, 0, len(data))
+        return digest
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    def record(self, name: str, data: bytes, *, source: str = "export") -> int:
+        """Record ``data`` as the newest version of ``name``; return its number.
+
+        Recording content identical to the newest version is a no-op.
+        """
+        with self._lock:
+            versions = self._load_index()["files"].setdefault(str(name), [])
+            latest = versions[-1] if versions else None
+            digest = content_digest(data)
+            if latest is not None and latest["sha"] == digest:
+                return int(latest["n"])
+            cached = self._latest.get(str(name))
+            base_content = cached[1] if cached and latest and cached[0] == latest["sha"] else None
+            try:
+                self._store(data, latest["sha"] if latest else None, base_content)
+            except Exception as exc:
+                self.last_error = f"history write failed for {name}: {exc!r}"
+                return 0
+            self._latest[str(name)] = (digest, data)
+            number = int(latest["n"]) + 1 if latest else 1
+            versions.append({
+                "n": number,
+                "sha": digest,
+                "size": len(data),
+                "utc": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                "source": source,
+            })
+            self._apply_retention()
+            try:
+                self._save_index()
+            except Exception as exc:
+                self.last_error = f"history index write failed: {exc!r}"
+            return number
+
+    def latest_digest(self, name: str) -> str | None:
+        with self._lock:
+            versions = self._load_index()["files"].get(str(name)) or []
+            return versions[-1]["sha"] if versions else None
+
+    def names(self) -> list[str]:
+        with self._lock:
+            return sorted(self._load_index()["files"])
+
+    def versions(self, name: str) -> list[dict[str, Any]]:
+        with self._lock:
+            return [dict(entry) for entry in self._load_index()["files"].get(str(name)) or []]
+
+    def read_version(self, name: str, number: int) -> bytes:
+        with self._lock:
+            for entry in self._load_index()["files"].get(str(name)) or []:
+                if int(entry["n"]) == int(number):
+                    return self._read_object(entry["sha"])
+        raise KeyError(f"{name} has no export version {number}")
+
+    def restore_version(self, name: str, number: int, target: Path) -> bool:
+        """Atomically write version ``number`` of ``name`` over ``target``.
+
+        The restored content is recorded as a new version, so the state that
+        was replaced stays recoverable too.
+        """
+        with self._lock:
+            data = self.read_version(name, number)
+            target = Path(target)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(prefix=target.stem + ".", suffix=".tmp", dir=str(target.parent))
+            try:
+                with os.fdopen(fd, "wb") as handle:
+                    handle.write(data)
+                os.replace(tmp_name, target)
+            finally:
+                if os.path.exists(tmp_name):
+                    os.unlink(tmp_name)
+            self.record(name, data, source=f"restore:{int(number)}")
+            return True
+
+    def diff_versions(self, name: str, old: int, new: int, *, key_field: str = "row_key") -> dict[str, Any]:
+        """Row-level diff between two CSV versions, keyed by ``key_field``."""
+        old_rows = _read_csv_rows(self.read_version(name, old), key_field)
+        new_rows = _read_csv_rows(self.read_version(name, new), key_field)
+        changed: dict[str, dict[str, tuple[str, str]]] = {}
+        for key in old_rows.keys() & new_rows.keys():
+            before, after = old_rows[key], new_rows[key]
+            fields = {
+                field: (before.get(field, ""), after.get(field, ""))
+                for field in before.keys() | after.keys()
+                if before.get(field, "") != after.get(field, "")
+            }
+            if fields:
+                changed[key] = fields
+        return {
+            "added": sorted(new_rows.keys() - old_rows.keys()),
+            "removed": sorted(old_rows.keys() - new_rows.keys()),
+            "changed": changed,
+        }
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            index = self._load_index()
+            objects = index["objects"].values()
+            return {
+                "files": len(index["files"]),
+                "versions": sum(len(entries) for entries in index["files"].values()),
+                "objects": len(index["objects"]),
+                "stored_bytes": sum(int(meta.get("stored", 0)) for meta in objects),
+                "logical_bytes": sum(int(meta.get("size", 0)) for meta in objects),
+            }
+
+    # ------------------------------------------------------------------
+    # Retention
+    # ------------------------------------------------------------------
+    def _stored_bytes(self) -> int:
+        return sum(int(meta.get("stored", 0)) for meta in self._load_index()["objects"].values())
+
+    def _apply_retention(self) -> None:
+        files = self._load_index()["files"]
+        pruned = False
+        for name, entries in files.items():
+            if len(entries) > self.keep_versions:
+                del entries[: len(entries) - self.keep_versions]
+                pruned = True
+        while self._stored_bytes() > self.max_bytes:
+            # Drop the globally oldest version that is not some file's newest.
+            candidates = [
+                (entry["utc"], int(entry["n"]), name)
+                for name, entries in files.items()
+                for entry in entries[:-1]
+            ]
+            if not candidates:
+                break
+            _utc, _number, name = min(candidates)
+            files[name].pop(0)
+            pruned = True
+            self._collect_garbage()
+        if pruned:
+            self._collect_garbage()
+
+    def _collect_garbage(self) -> None:
+        objects = self._load_index()["objects"]
+        live = {entry["sha"] for entries in self._load_index()["files"].values() for entry in entries}
+        # Rebase live deltas whose chain runs through an object that is no
+        # longer listed, then drop everything that is left unreferenced.
+        for digest in sorted(live, key=lambda item: objects.get(item, {}).get("depth", 0)):
+            chain: list[str] = []
+            base = objects.get(digest, {}).get("base")
+            while base:
+                chain.append(base)
+                base = objects.get(base, {}).get("base")
+            if any(item not in live for item in chain):
+                content = self._read_object(digest)
+                self._write_object(digest, _KIND_FULL, content, None, 0, len(content))
+        needed = set(live)
+        for digest in list(live):
+            base = objects.get(digest, {}).get("base")
+            while base:
+                needed.add(base)
+                base = objects.get(base, {}).get("base")
+        for digest in [item for item in objects if item not in needed]:
+            objects.pop(digest, None)
+            try:
+                self._object_path(digest).unlink()
+            except OSError:
+                pass
+
+
+__all__ = [
+    "HISTORY_DIRECTORY_NAME",
+    "HISTORY_KEEP_VERSIONS",
+    "HISTORY_MAX_BYTES",
+    "KEYFRAME_INTERVAL",
+    "ExportHistory",
+    "content_digest",
+]
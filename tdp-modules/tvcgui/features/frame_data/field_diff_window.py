@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+import threading
+import tkinter as tk
+from tkinter import ttk
+from typing import Any
+
+from tvcgui.core.constants import SLOTS
+from tvcgui.core.tk_host import tk_call
+
+from . import field_diff as FDD
+from .widgets import apply_titlebar_icon
+
+FIGHTER_BLOCK_SIZE = 0x2200
+MOVE_BLOCK_SIZE = 0x800
+
+_COLUMNS = ("offset", "kind", "changes", "distinct", "low", "high", "first", "last", "corr", "co_change")
+_HEADINGS = {
+    "offset": "Offset",
+    "kind": "Type",
+    "changes": "Changes",
+    "distinct": "Distinct",
+    "low": "Min",
+    "high": "Max",
+    "first": "First",
+    "last": "Last",
+    "corr": "Best corr (r)",
+    "co_change": "Changes with",
+}
+_WIDTHS = {"offset": 80, "kind": 50, "changes": 70, "distinct": 70, "low": 150, "high": 150,
+           "first": 150, "last": 150, "corr": 140, "co_change": 140}
+
+
+def _fighter_base(slot_label: str) -> int:
+    try:
+        from tvcgui.platform.dolphin import addr_in_ram, rd32
+    except Exception:
+        return 0
+    for label, ptr, _team in SLOTS:
+        if label == slot_label:
+            try:
+                base = int(rd32(ptr) or 0)
+            except Exception:
+                return 0
+            return base if addr_in_ram(base) else 0
+    return 0
+
+
+def _move_block(move: dict | None, next_abs_map: dict[int, int] | None) -> tuple[int, int]:
+    try:
+        start = int((move or {}).get("abs") or 0)
+    except Exception:
+        return 0, 0
+    nxt = (next_abs_map or {}).get(start)
+    size = int(nxt) - start if nxt and int(nxt) > start else MOVE_BLOCK_SIZE
+    return start, max(0x40, min(FDD.DIFF_MAX_BLOCK, size))
+
+
+class FieldDiffWindow:
+    """Capture a move or fighter block over N frames and list the fields that moved."""
+
+    def __init__(
+        self,
+        parent: tk.Misc,
+        *,
+        slot_label: str,
+        char_name: str = "",
+        move: dict[str, Any] | None = None,
+        next_abs_map: dict[int, int] | None = None,
+    ) -> None:
+        self.slot_label = str(slot_label or "P1-C1")
+        self.char_name = str(char_name or "")
+        self.move = move
+        self.next_abs_map = dict(next_abs_map or {})
+        self._stats: list[FDD.FieldStats] = []
+        self._sort = ("changes", True)
+        self._stop = threading.Event()
+        self._worker: threading.Thread | None = None
+
+        self.window = tk.Toplevel(parent)
+        apply_titlebar_icon(self.window, parent)
+        self.window.title(f"Field Diff Explorer | {self.slot_label} | {self.char_name or 'Unknown'}")
+        self.window.geometry("1320x680")
+        self.window.minsize(900, 420)
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+
+        self.block_var = tk.StringVar(master=self.window, value="move" if move else "fighter")
+        self.frames_var = tk.IntVar(master=self.window, value=FDD.DIFF_DEFAULT_FRAMES)
+        self.status_var = tk.StringVar(master=self.window, value="Pick a block and capture while the move plays.")
+        self._build()
+
+    def _build(self) -> None:
+        toolbar = ttk.Frame(self.window, padding=(12, 10, 12, 6))
+        toolbar.pack(fill="x")
+        move_label = "Selected move"
+        if self.move:
+            move_label += f" (0x{int(self.move.get('abs') or 0):08X})"
+        ttk.Radiobutton(toolbar, text=move_label, value="move", variable=self.block_var,
+                        state="normal" if self.move else "disabled").pack(side="left")
+        ttk.Radiobutton(toolbar, text=f"{self.slot_label} fighter struct", value="fighter",
+                        variable=self.block_var).pack(side="left", padx=(10, 0))
+        ttk.Label(toolbar, text="Frames").pack(side="left", padx=(16, 4))
+        ttk.Spinbox(toolbar, from_=2, to=FDD.DIFF_MAX_FRAMES, increment=60, width=6,
+                    textvariable=self.frames_var).pack(side="left")
+        self.capture_btn = ttk.Button(toolbar, text="Capture", command=self._start_capture)
+        self.capture_btn.pack(side="left", padx=(10, 0))
+        ttk.Button(toolbar, text="Stop", command=self._stop.set).pack(side="left", padx=(6, 0))
+        ttk.Button(toolbar, text="Copy selected", command=self._copy_selected).pack(side="right")
+
+        body = ttk.Frame(self.window, padding=(12, 0, 12, 0))
+        body.pack(fill="both", expand=True)
+        self.tree = ttk.Treeview(body, columns=_COLUMNS, show="headings", selectmode="extended")
+        for col in _COLUMNS:
+            self.tree.heading(col, text=_HEADINGS[col], command=lambda c=col: self._sort_by(c))
+            self.tree.column(col, width=_WIDTHS[col], anchor="w")
+        vsb = ttk.Scrollbar(body, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=vsb.set)
+        self.tree.pack(side="left", fill="both", expand=True)
+        vsb.pack(side="right", fill="y")
+
+        ttk.Label(self.window, textvariable=self.status_var, padding=(12, 6)).pack(fill="x")
+
+    def _block(self) -> tuple[int, int, str]:
+        if self.block_var.get() == "move" and self.move:
+            start, size = _move_block(self.move, self.next_abs_map)
+            return start, size, "move"
+        return _fighter_base(self.slot_label), FIGHTER_BLOCK_SIZE, "fighter"
+
+    def _start_capture(self) -> None:
+        if self._worker is not None and self._worker.is_alive():
+            return
+        base, size, label = self._block()
+        if not base:
+            self.status_var.set(f"No {label} block to capture for {self.slot_label}.")
+            return
+        try:
+            frames = int(self.frames_var.get())
+        except Exception:
+            frames = FDD.DIFF_DEFAULT_FRAMES
+        fighter_base = _fighter_base(self.slot_label)
+        self._stop.clear()
+        self.capture_btn.configure(state="disabled")
+        self.status_var.set(f"Capturing {size:#x} bytes at 0x{base:08X} for {frames} frames...")
+
+        def progress(done: int, total: int) -> None:
+            if done % 30 == 0:
+                tk_call(lambda _root: self.status_var.set(f"Capturing frame {done}/{total}..."))
+
+        def worker() -> None:
+            try:
+                from tvcgui.platform.dolphin import rbytes
+
+                capture = FDD.capture_block(
+                    base, size, frames, rbytes,
+                    fighter_base=fighter_base or None,
+                    should_stop=self._stop.is_set,
+                    progress=progress,
+                    label=label,
+                )
+                stats = FDD.analyze_capture(capture)
+                tk_call(lambda _root: self._finish(capture, stats, None))
+            except Exception as exc:
+                tk_call(lambda _root, err=exc: self._finish(None, [], err))
+
+        self._worker = threading.Thread(target=worker, name="fd-field-diff", daemon=True)
+        self._worker.start()
+
+    def _finish(self, capture: FDD.BlockCapture | None, stats: list[FDD.FieldStats], error: Exception | None) -> None:
+        try:
+            if not self.window.winfo_exists():
+                return
+        except Exception:
+            return
+        self.capture_btn.configure(state="normal")
+        if error is not None or capture is None:
+            self.status_var.set(f"Capture failed: {error}")
+            return
+        self._stats = stats
+        self._populate()
+        known = ", ".join(sorted(capture.known)) or "none"
+        self.status_var.set(
+            f"{capture.count} frames of {capture.size:#x} bytes at 0x{capture.base:08X}: "
+            f"{len(stats)} changing fields. Reference fields: {known}."
+        )
+
+    def _populate(self) -> None:
+        column, descending = self._sort
+        self.tree.delete(*self.tree.get_children())
+        for n, row in enumerate(FDD.sort_field_stats(self._stats, column, descending)):
+            corr_name, corr = row.best_correlation
+            co_name, co = row.best_co_change
+            self.tree.insert("", "end", iid=f"f{n}", values=(
+                f"+0x{row.offset:04X}",
+                row.kind,
+                row.changes,
+                row.distinct,
+                FDD.format_value(row.low, row.kind),
+                FDD.format_value(row.high, row.kind),
+                FDD.format_value(row.first, row.kind),
+                FDD.format_value(row.last, row.kind),
+                f"{corr_name} {corr:+.2f}" if corr_name else "",
+                f"{co_name} {co:.0%}" if co_name else "",
+            ))
+
+    def _sort_by(self, column: str) -> None:
+        current, descending = self._sort
+        self._sort = (column, not descending if column == current else column in ("changes", "distinct", "corr", "co_change"))
+        self._populate()
+
+    def _copy_selected(self) -> None:
+        items = self.tree.selection() or self.tree.get_children()
+        lines = ["\t".join(_HEADINGS[col] for col in _COLUMNS)]
+        lines.extend("\t".join(str(value) for value in self.tree.item(item, "values")) for item in items)
+        try:
+            self.window.clipboard_clear()
+            self.window.clipboard_append("\n".join(lines))
+            self.status_var.set(f"Copied {len(items)} row(s).")
+        except Exception as exc:
+            self.status_var.set(f"Clipboard failed: {exc}")
+
+    def close(self) -> None:
+        self._stop.set()
+        try:
+            self.window.destroy()
+        except Exception:
+            pass
+
+
+def open_field_diff_explorer(
+    parent: tk.Misc,
+    *,
+    slot_label: str,
+    char_name: str = "",
+    move: dict[str, Any] | None = None,
+    next_abs_map: dict[int, int] | None = None,
+) -> FieldDiffWindow:
+    return FieldDiffWindow(parent, slot_label=slot_label, char_name=char_name, move=move, next_abs_map=next_abs_map)
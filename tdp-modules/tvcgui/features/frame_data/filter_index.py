@@ -0,0 +1,290 @@
+"""In-memory mirror of the frame-data tree used for filtering.
+
+Filtering used to ask Tk for every cell it tested (one ``tree.set`` Tcl call
+per row per filtered column), then reattach every hidden row and detach the
+misses again one by one.  On the largest profiles that is thousands of Tcl
+crossings for each keystroke.
+
+:class:`FrameFilterIndex` keeps the hierarchy and the cell text of every row,
+fed by :class:`tree.IndexedTreeview` as rows are inserted, edited, moved or
+deleted, so a filter never reads from the widget.  For matching, each column
+is packed into one lower-cased blob with a NUL between rows; a substring
+query is a handful of ``str.find`` calls plus a bisect back to the row,
+instead of a Python loop over every cell.  Blobs are rebuilt lazily, per
+column, after a change.
+
+:meth:`FrameFilterIndex.plan` turns a hidden set into the ordered child list
+for each parent, so the caller can apply a filter with one ``set_children``
+per parent whose visible rows actually changed.
+"""
+from __future__ import annotations
+
+from bisect import bisect_right
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+GLOBAL_FILTER_COLUMNS = ("move", "kind", "abs")
+_GLOBAL = "\x00global"
+_SEP = "\x00"
+
+
+def _cell_text(value) -> str:
+    return "" if value is None else str(value)
+
+
+class FrameFilterIndex:
+    """Row hierarchy plus per-column text for one frame-data Treeview."""
+
+    def __init__(self, columns: Sequence[str]) -> None:
+        self.columns = tuple(columns or ())
+        self._col_pos = {name: i for i, name in enumerate(self.columns)}
+        self._values: Dict[str, List[str]] = {}
+        self._parent: Dict[str, str] = {}
+        self._children: Dict[str, List[str]] = {"": []}
+        self._order: List[str] = []
+        self._order_dirty = False
+        self._blobs: Dict[str, Tuple[str, List[int], List[str]]] = {}
+        # Bumped whenever rows are added, removed or reordered.  Callers that
+        # cache what the widget currently shows compare against it.
+        self.structure_version = 0
+
+    # ---- mirror maintenance ----
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __contains__(self, iid) -> bool:
+        return str(iid) in self._values
+
+    def clear(self) -> None:
+        self._values.clear()
+        self._parent.clear()
+        self._children = {"": []}
+        self._order = []
+        self._order_dirty = False
+        self._blobs.clear()
+        self.structure_version += 1
+
+    def insert(self, parent, index, iid, values: Iterable = ()) -> None:
+        iid = str(iid)
+        parent = str(parent or "")
+        if iid in self._values:
+            self.delete(iid)
+        self._values[iid] = [_cell_text(v) for v in tuple(values or ())]
+        self._parent[iid] = parent
+        self._children.setdefault(iid, [])
+        siblings = self._children.setdefault(parent, [])
+        if index in ("end", "", None):
+            siblings.append(iid)
+        else:
+            try:
+                siblings.insert(max(0, int(index)), iid)
+            except Exception:
+                siblings.append(iid)
+        self._order_dirty = True
+        self._blobs.clear()
+        self.structure_version += 1
+
+    def delete(self, iid) -> None:
+        iid = str(iid)
+        if iid not in self._values:
+            return
+        stack = [iid]
+        removed: Set[str] = set()
+        while stack:
+            current = stack.pop()
+            removed.add(current)
+            stack.extend(self._children.get(current, ()))
+        parent = self._parent.get(iid, "")
+        try:
+            self._children.get(parent, []).remove(iid)
+        except ValueError:
+            pass
+        for current in removed:
+            self._values.pop(current, None)
+            self._parent.pop(current, None)
+            self._children.pop(current, None)
+        self._order_dirty = True
+        self._blobs.clear()
+        self.structure_version += 1
+
+    def move(self, iid, parent, index) -> None:
+        iid = str(iid)
+        if iid not in self._values:
+            return
+        parent = str(parent or "")
+        try:
+            self._children.get(self._parent.get(iid, ""), []).remove(iid)
+        except ValueError:
+            pass
+        self._parent[iid] = parent
+        siblings = self._children.setdefault(parent, [])
+        if index in ("end", "", None):
+            siblings.append(iid)
+        else:
+            try:
+                siblings.insert(max(0, int(index)), iid)
+            except Exception:
+                siblings.append(iid)
+        self._order_dirty = True
+        self._blobs.clear()
+        self.structure_version += 1
+
+    def reorder(self, parent, iids: Iterable) -> None:
+        """Put ``parent``'s children in the order of ``iids``.
+
+        Children missing from ``iids`` keep their relative order after the
+        listed ones; ids that are not children of ``parent`` are ignored.
+        """
+        parent = str(parent or "")
+        current = self._children.get(parent, [])
+        members = set(current)
+        listed = list(dict.fromkeys(str(iid) for iid in iids if str(iid) in members))
+        seen = set(listed)
+        ordered = listed + [iid for iid in current if iid not in seen]
+        if ordered == current:
+            return
+        self._children[parent] = ordered
+        self._order_dirty = True
+        self._blobs.clear()
+        self.structure_version += 1
+
+    def set_value(self, iid, column: str, value) -> None:
+        row = self._values.get(str(iid))
+        pos = self._col_pos.get(column)
+        if row is None or pos is None:
+            return
+        if len(row) <= pos:
+            row.extend("" for _ in range(pos + 1 - len(row)))
+        text = _cell_text(value)
+        if row[pos] != text:
+            row[pos] = text
+            self._blobs.pop(column, None)
+            if column in GLOBAL_FILTER_COLUMNS:
+                self._blobs.pop(_GLOBAL, None)
+
+    def set_values(self, iid, values: Iterable) -> None:
+        iid = str(iid)
+        if iid in self._values:
+            self._values[iid] = [_cell_text(v) for v in tuple(values or ())]
+            self._blobs.clear()
+
+    # ---- queries ----
+
+    def value(self, iid, column: str) -> str:
+        row = self._values.get(str(iid))
+        pos = self._col_pos.get(column)
+        if row is None or pos is None or pos >= len(row):
+            return ""
+        return row[pos]
+
+    def parent(self, iid) -> str:
+        return self._parent.get(str(iid), "")
+
+    def children(self, parent="") -> Tuple[str, ...]:
+        return tuple(self._children.get(str(parent or ""), ()))
+
+    def parents(self) -> List[str]:
+        """Every item (root included) that currently has children."""
+        return [parent for parent, kids in self._children.items() if kids]
+
+    def order(self) -> List[str]:
+        """All rows in display order (depth-first, children after parent)."""
+        if self._order_dirty:
+            out: List[str] = []
+            stack = list(reversed(self._children.get("", ())))
+            while stack:
+                iid = stack.pop()
+                out.append(iid)
+                stack.extend(reversed(self._children.get(iid, ())))
+            self._order = out
+            self._order_dirty = False
+        return self._order
+
+    def _blob(self, column: str) -> Tuple[str, List[int], List[str]]:
+        cached = self._blobs.get(column)
+        if cached is not None:
+            return cached
+        rows = self.order()
+        if column == _GLOBAL:
+            positions = [self._col_pos.get(c) for c in GLOBAL_FILTER_COLUMNS]
+            texts = [
+                " ".join(row[p] if p is not None and p < len(row) else "" for p in positions)
+                for row in (self._values[iid] for iid in rows)
+            ]
+        else:
+            pos = self._col_pos.get(column)
+            texts = [
+                row[pos] if pos is not None and pos < len(row) else ""
+                for row in (self._values[iid] for iid in rows)
+            ]
+        # Lower-case per row: a few characters change length when lowered, so
+        # offsets must be taken from the lowered text.
+        texts = [text.lower() for text in texts]
+        starts: List[int] = []
+        cursor = 0
+        for text in texts:
+            starts.append(cursor)
+            cursor += len(text) + 1
+        blob = (_SEP.join(texts), starts, list(rows))
+        self._blobs[column] = blob
+        return blob
+
+    def _find(self, column: str, needle: str) -> Set[str]:
+        text, starts, rows = self._blob(column)
+        found: Set[str] = set()
+        pos = text.find(needle)
+        while pos >= 0:
+            row = bisect_right(starts, pos) - 1
+            found.add(rows[row])
+            nxt = starts[row + 1] if row + 1 < len(starts) else len(text)
+            pos = text.find(needle, nxt)
+        return found
+
+    def match(
+        self,
+        global_query: str = "",
+        column_filters: Optional[Dict[str, str]] = None,
+        *,
+        candidates: Optional[Iterable[str]] = None,
+    ) -> Set[str]:
+        """Rows whose cells contain every lower-cased needle.
+
+        ``global_query`` is matched against move, kind and address joined by
+        spaces, like the old per-row check.  Needles are case-insensitive
+        substrings; column filters are ANDed.
+        """
+        needles: List[Tuple[str, str]] = []
+        if global_query:
+            needles.append((_GLOBAL, global_query.lower()))
+        for column, needle in (column_filters or {}).items():
+            if needle:
+                needles.append((column, str(needle).lower()))
+        pool = set(self._values) if candidates is None else set(candidates)
+        for column, needle in needles:
+            if _SEP in needle:
+                return set()
+            if column != _GLOBAL and column not in self._col_pos:
+                return set()
+            pool &= self._find(column, needle)
+            if not pool:
+                break
+        return pool
+
+    def with_ancestors(self, rows: Iterable[str]) -> Set[str]:
+        keep: Set[str] = set()
+        for iid in rows:
+            while iid and iid not in keep:
+                keep.add(iid)
+                iid = self._parent.get(iid, "")
+        return keep
+
+    def plan(self, hidden: Optional[Set[str]] = None) -> Dict[str, Tuple[str, ...]]:
+        """Ordered visible children for every parent, leaving out ``hidden``."""
+        out: Dict[str, Tuple[str, ...]] = {}
+        for parent in self.parents():
+            kids = self._children.get(parent, ())
+            out[parent] = tuple(kids) if not hidden else tuple([k for k in kids if k not in hidden])
+        return out
+
+
+__all__ = ["FrameFilterIndex", "GLOBAL_FILTER_COLUMNS"]
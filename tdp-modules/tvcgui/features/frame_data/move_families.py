@@ -5,11 +5,21 @@
 # it only annotates rows so fd_tree can present command wrappers, internal
 # start/spin/end sections, and repeated A/B/C or L/M/H variants as one readable
 # family.
+#
+# Grouping runs every time the tree is populated, so the name parsing is
+# memoised: the string helpers are cached on their text, and classify_move()
+# is cached on the handful of row fields it reads.  After a single-row edit
+# only that row is parsed again.  The nearby-row passes look neighbours up in
+# address-sorted indexes instead of comparing every pair of rows.
 
 from __future__ import annotations
 
 import re
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+_NAME_CACHE_SIZE = 8192
 
 
 def _text(v: Any) -> str:
@@ -17,11 +27,21 @@ def _text(v: Any) -> str:
 
 
 def _safe_key(text: str) -> str:
-    return re.sub(r"[^a-z0-9]+", "_", _text(text).lower()).strip("_") or "group"
+    return _safe_key_text(_text(text))
+
+
+@lru_cache(maxsize=_NAME_CACHE_SIZE)
+def _safe_key_text(text: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "_", text.lower()).strip("_") or "group"
 
 
 def _clean_label(text: str) -> str:
-    s = _text(text).strip()
+    return _clean_text(_text(text))
+
+
+@lru_cache(maxsize=_NAME_CACHE_SIZE)
+def _clean_text(text: str) -> str:
+    s = text.strip()
     s = re.sub(r"\s+", " ", s)
     # Display family/link labels should not inherit scouting uncertainty
     # punctuation from the map.  The raw Move column can still show the original
@@ -39,6 +59,7 @@ def _move_name(mv: Dict[str, Any]) -> str:
     return f"anim_{int(aid):04X}" if aid is not None else ""
 
 
+@lru_cache(maxsize=_NAME_CACHE_SIZE)
 def _strength_from_name(name: str) -> Optional[str]:
     s = _clean_label(name)
     m = re.search(r"(?:^|\s)([LMHABC])(?:\s|$)", s, flags=re.IGNORECASE)
@@ -47,6 +68,7 @@ def _strength_from_name(name: str) -> Optional[str]:
     return None
 
 
+@lru_cache(maxsize=_NAME_CACHE_SIZE)
 def _context_from_name(name: str) -> str:
     low = _text(name).lower()
     if "assist" in low:
@@ -56,6 +78,7 @@ def _context_from_name(name: str) -> str:
     return "Ground"
 
 
+@lru_cache(maxsize=_NAME_CACHE_SIZE)
 def _phase_from_name(name: str) -> Optional[str]:
     low = _text(name).lower()
     checks = (
@@ -259,6 +282,7 @@ def _can_absorb_unnamed_row(mv: Dict[str, Any]) -> bool:
     return low.startswith("anim_") or "filler" in low or _text(mv.get("move_name_source")).lower() in {"anim", "anim_map", "none"}
 
 
+@lru_cache(maxsize=_NAME_CACHE_SIZE)
 def _normal_command_name(name: str) -> bool:
     low = _clean_label(name).lower().replace(" ", "")
     return low in {"5a", "2a", "5b", "2b", "6b", "5c", "2c", "6c", "4c", "3c", "j.a", "ja", "j.b", "jb", "j.c", "jc", "j.2c", "j2c"}
@@ -347,6 +371,34 @@ def _helper_duplicates_existing_multihit(helper: Dict[str, Any], moves: List[Dic
             return True
     return False
 
+
+def _segment_damage_addrs(mv: Dict[str, Any]) -> Tuple[int, ...]:
+    out: List[int] = []
+    for seg in mv.get("hit_segments") or []:
+        try:
+            addr = int(seg.get("damage_addr") or 0)
+        except Exception:
+            addr = 0
+        if addr:
+            out.append(addr)
+    return tuple(out)
+
+
+def _owned_multihit_damage_addrs(moves: List[Dict[str, Any]]) -> Set[Tuple[int, ...]]:
+    """Damage-address lists of rows that already own their hit bundles.
+
+    A helper whose list is in this set duplicates an existing multi-hit row;
+    this is _helper_duplicates_existing_multihit for every helper at once.
+    """
+    owned: Set[Tuple[int, ...]] = set()
+    for mv in moves:
+        if _is_multihit_helper_row(mv) or not _has_meaningful_hit_segments(mv):
+            continue
+        addrs = _segment_damage_addrs(mv)
+        if addrs:
+            owned.add(addrs)
+    return owned
+
 def _segment_addrs(mv: Dict[str, Any]) -> List[int]:
     out: List[int] = []
     for seg in mv.get("hit_segments") or []:
@@ -368,12 +420,19 @@ def _attach_multihit_helper_rows_to_nearby_named_rows(moves: List[Dict[str, Any]
     This pass keeps those helpers near the command a player recognizes, without
     changing any write address.
     """
-    helpers = [mv for mv in moves if _is_multihit_helper_row(mv) and not _helper_duplicates_existing_multihit(mv, moves)]
+    owned = _owned_multihit_damage_addrs(moves)
+    helpers = [mv for mv in moves if _is_multihit_helper_row(mv) and _segment_damage_addrs(mv) not in owned]
     owners = [mv for mv in moves if _is_multihit_owner_candidate(mv) and _family_addr(mv)]
     if not helpers or not owners:
         return
 
     ckey = _safe_key(char_name or "char")
+    # Owners by address.  No owner further than the widest allowed gap from
+    # every helper point can win, so each helper only scores the owners in
+    # those windows, still in list order so ties resolve as before.
+    by_addr = sorted((_family_addr(owner), n) for n, owner in enumerate(owners))
+    owner_addrs = [addr for addr, _n in by_addr]
+    reach = 0x1C00
 
     for helper in helpers:
         haddr = _family_addr(helper)
@@ -382,7 +441,15 @@ def _attach_multihit_helper_rows_to_nearby_named_rows(moves: List[Dict[str, Any]
         hpoints = [haddr] + _segment_addrs(helper)
         best: Optional[Tuple[int, Dict[str, Any]]] = None
 
-        for owner in owners:
+        nearby: Set[int] = set()
+        for hp in hpoints:
+            if not hp:
+                continue
+            lo = bisect_left(owner_addrs, hp - reach)
+            hi = bisect_right(owner_addrs, hp + reach)
+            nearby.update(n for _addr, n in by_addr[lo:hi])
+
+        for owner in (owners[n] for n in sorted(nearby)):
             oaddr = _family_addr(owner)
             if not oaddr:
                 continue
@@ -492,6 +559,7 @@ def _base_kind(mv: Dict[str, Any]) -> str:
     return _text(mv.get("kind")).strip().lower()
 
 
+@lru_cache(maxsize=_NAME_CACHE_SIZE)
 def _strip_context_words(s: str) -> Tuple[str, str]:
     context = _context_from_name(s)
     out = _clean_label(s)
@@ -502,6 +570,7 @@ def _strip_context_words(s: str) -> Tuple[str, str]:
     return out, context
 
 
+@lru_cache(maxsize=_NAME_CACHE_SIZE)
 def _strip_phase_words(s: str) -> Tuple[str, Optional[str]]:
     out = _clean_label(s)
     phase = _phase_from_name(out)
@@ -533,6 +602,7 @@ def _strip_phase_words(s: str) -> Tuple[str, Optional[str]]:
     return _clean_label(out), phase
 
 
+@lru_cache(maxsize=_NAME_CACHE_SIZE)
 def _strip_strength_words(s: str) -> Tuple[str, Optional[str]]:
     out = _clean_label(s)
     strength: Optional[str] = None
@@ -554,6 +624,11 @@ def _strip_strength_words(s: str) -> Tuple[str, Optional[str]]:
 
 
 def _looks_like_noise_name(name: str, mv: Dict[str, Any]) -> bool:
+    return _noise_name(_text(name))
+
+
+@lru_cache(maxsize=_NAME_CACHE_SIZE)
+def _noise_name(name: str) -> bool:
     s = _clean_label(name)
     low = s.lower()
     compact = low.replace(" ", "").replace(".", "")
@@ -631,6 +706,15 @@ def classify_move(mv: Dict[str, Any], char_name: Optional[str] = None) -> Dict[s
         aid = None
 
     name = _move_name(mv)
+    src = _text(mv.get("move_name_source")).lower()
+    return dict(_classify_name(name, aid, _base_kind(mv), src, _text(char_name)))
+
+
+@lru_cache(maxsize=_NAME_CACHE_SIZE)
+def _classify_name(name: str, aid: Optional[int], kind: str, src: str, char_name: str) -> Dict[str, Any]:
+    # Everything classify_move reads from the row is in the arguments; the
+    # result is shared between calls, so callers must copy it.
+    mv = {"id": aid, "kind": kind, "move_name_source": src}
     low = name.lower()
 
     family_label = ""
@@ -887,6 +971,7 @@ def _attach_nearby_ryu_tatsu_entries_to_chains(moves: List[Dict[str, Any]]) -> N
                 mv["family_link_label"] = f"Tatsu / Entry-helper{suffix} / {phase}"
 
 
+@lru_cache(maxsize=_NAME_CACHE_SIZE)
 def _phase_sort_value(phase: str) -> int:
     return _PHASE_ORDER.get(_clean_label(phase), 99)
 
@@ -985,6 +1070,16 @@ def _annotate_generic_phase_chains(moves: List[Dict[str, Any]], char_name: Optio
             group_label = chain[0].get("family_group_label") or f"{label} {chain_label}"
             chain_ranges.append((idx, min(addrs), max(addrs), str(group_key), str(group_label)))
 
+        # Chain strength depends on the chain's members, which grow as entries
+        # attach, so it is cached per chain and dropped when one does.
+        chain_strengths: Dict[int, str] = {}
+
+        def chain_strength_for(idx: int) -> str:
+            if idx not in chain_strengths:
+                chain_members = [m for m in members if m.get("family_chain_index") == idx]
+                chain_strengths[idx] = _infer_chain_strength(label, idx, chain_members or members)
+            return chain_strengths[idx]
+
         for mv in members:
             if mv.get("family_role") != "entry" or mv.get("family_chain_index"):
                 continue
@@ -1003,8 +1098,7 @@ def _annotate_generic_phase_chains(moves: List[Dict[str, Any]], char_name: Optio
                     gap = lo - addr
                 if gap > 0x600:
                     continue
-                chain_members = [m for m in members if m.get("family_chain_index") == idx]
-                chain_strength = _infer_chain_strength(label, idx, chain_members or members)
+                chain_strength = chain_strength_for(idx)
                 if entry_strength and chain_strength and entry_strength != chain_strength:
                     continue
                 if best_gap is None or gap < best_gap:
@@ -1012,6 +1106,7 @@ def _annotate_generic_phase_chains(moves: List[Dict[str, Any]], char_name: Optio
                     best_gap = gap
             if best:
                 idx, gkey, glabel, chain_strength = best
+                chain_strengths.pop(idx, None)
                 mv["family_chain_index"] = idx
                 mv["family_group_key"] = gkey
                 mv["family_group_label"] = glabel
@@ -1076,30 +1171,35 @@ def _attach_unlabeled_rows_to_nearby_families(moves: List[Dict[str, Any]]) -> No
     if not candidates:
         return
 
+    # Every candidate member address, sorted, tagged with its candidate.
+    # Range alone is not enough; big super/family groups can cover a whole
+    # script neighborhood.  Only rows physically close to an existing linked
+    # member are absorbed, so each row only looks at members within reach.
+    reach = 0x140
+    member_points = sorted(
+        (_family_addr(m), n)
+        for n, (_gkey, _lo, _hi, info) in enumerate(candidates)
+        for m in (info.get("members") or [])
+        if _family_addr(m)
+    )
+    point_addrs = [addr for addr, _n in member_points]
+
     for mv in moves:
         if not _can_absorb_unnamed_row(mv):
             continue
         addr = _family_addr(mv)
         if not addr:
             continue
-        best = None
-        best_gap = None
-        for gkey, lo, hi, info in candidates:
-            member_addrs = [_family_addr(m) for m in (info.get("members") or []) if _family_addr(m)]
-            if not member_addrs:
-                continue
-            gap = min(abs(addr - ma) for ma in member_addrs)
-            # Range alone is not enough; big super/family groups can cover a
-            # whole script neighborhood.  Only absorb rows that are physically
-            # close to an existing linked member.
-            if gap > 0x140:
-                continue
-            if best_gap is None or gap < best_gap:
-                best = (gkey, info)
-                best_gap = gap
-        if not best:
+        gaps: Dict[int, int] = {}
+        for ma, n in member_points[bisect_left(point_addrs, addr - reach):bisect_right(point_addrs, addr + reach)]:
+            gap = abs(addr - ma)
+            if gap < gaps.get(n, reach + 1):
+                gaps[n] = gap
+        if not gaps:
             continue
-        gkey, info = best
+        # Closest member wins; on a tie, the earlier candidate, as before.
+        n = min(gaps, key=lambda k: (gaps[k], k))
+        gkey, _lo, _hi, info = candidates[n]
         members = info.get("members") or []
         label = _clean_label(info.get("label") or info.get("group_label") or gkey)
         group_label = _clean_label(info.get("group_label") or label)
@@ -9,9 +9,12 @@
 from __future__ import annotations
 
 import glob
+import hashlib
 import json
 import os
 import sys
+import threading
+import time
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -20,6 +23,14 @@ from tvcgui.core.paths import resource_path
 SCHEMA = "tvc_continuo.frame_data_patch.v1"
 PATCH_DIR_NAME = "fd_patches"
 
+# Compiled patch documents keyed by content digest. A document is compiled once
+# into per-character byte operations relative to each row's base; loading a
+# character only rebases and writes them.
+PATCH_COMPILE_CACHE_LIMIT = 32
+_COMPILED_PATCHES: dict[str, "CompiledPatch"] = {}
+_COMPILE_LOCK = threading.Lock()
+_COMPILE_STATS = {"compiles": 0, "hits": 0}
+
 # In-memory display overlays. These are intentionally separate from the actual
 # Dolphin writes. They let already-scanned data reflect GUI edits immediately
 # even before the next scan_worker result lands.
@@ -732,21 +743,22 @@ def add_live_entries_for_character(char_key: str, entries: list[dict] | None) ->
     if not clean:
         return
     existing = _LIVE_ENTRIES_BY_CHAR.setdefault(key, [])
+
+    def ident(entry: dict) -> tuple:
+        selector = entry.get("selector") or {}
+        return str(entry.get("group") or ""), repr(selector.get("abs") or selector.get("move_id") or selector.get("scan_index"))
+
     # Replace by selector abs + group where possible to avoid stacking stale
     # versions of the same value.
+    positions: dict[tuple, int] = {}
+    for i, old in enumerate(existing):
+        positions.setdefault(ident(old), i)
     for entry in clean:
-        group = str(entry.get("group") or "")
-        selector = entry.get("selector") or {}
-        ident = selector.get("abs") or selector.get("move_id") or selector.get("scan_index")
-        replaced = False
-        for i, old in enumerate(list(existing)):
-            old_sel = old.get("selector") or {}
-            old_ident = old_sel.get("abs") or old_sel.get("move_id") or old_sel.get("scan_index")
-            if str(old.get("group") or "") == group and old_ident == ident:
-                existing[i] = entry
-                replaced = True
-                break
-        if not replaced:
+        k = ident(entry)
+        if k in positions:
+            existing[positions[k]] = entry
+        else:
+            positions[k] = len(existing)
             existing.append(entry)
 
 
@@ -767,8 +779,9 @@ def overlay_scan_data(scan_data: list[dict] | None) -> int:
         entries = _LIVE_ENTRIES_BY_CHAR.get(normalize_char_key(char_key)) or []
         if not entries:
             continue
+        index = _slot_abs_index(slot_data)
         for entry in entries:
-            mv, _match = find_patch_target_in_slot(slot_data, entry)
+            mv, _match = _find_indexed_target(slot_data, index, entry)
             if not mv:
                 continue
             _inject_entry_addresses(mv, entry)
@@ -777,6 +790,213 @@ def overlay_scan_data(scan_data: list[dict] | None) -> int:
     return applied
 
 
+class _ConsultedRow(dict):
+    """Row stand-in that remembers which keys compile_edit looked at."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.consulted: list[str] = []
+
+    def _note(self, key: Any) -> None:
+        if key not in self.consulted:
+            self.consulted.append(key)
+
+    def get(self, key, default=None):
+        self._note(key)
+        return super().get(key, default)
+
+    def __contains__(self, key) -> bool:
+        self._note(key)
+        return super().__contains__(key)
+
+
+@dataclass(frozen=True)
+class CompiledPatchOp:
+    """One patch entry as byte operations relative to its row's ``abs``.
+
+    ``bases`` lists every row key the compiler consulted with the value it
+    assumed (addresses as offsets from ``abs``), so a live row that disagrees
+    is recompiled instead of written blind.
+    """
+
+    entry: dict
+    writes: tuple
+    checks: tuple
+    bases: tuple
+
+    def rebase(self, mv: dict):
+        from .edit_sets import CompiledEdit, _addr
+
+        base = _addr(mv.get("abs"))
+        if base is None:
+            return None
+        for key, assumed in self.bases:
+            live = mv.get(key)
+            if str(key).endswith("_write_verified"):
+                if key in mv and not bool(live):
+                    return None
+                continue
+            if key == "hb_off":
+                if _coerce_int(live, None) != assumed:
+                    return None
+                continue
+            live_addr = _addr(live)
+            if (live_addr is None) != (assumed is None):
+                return None
+            if live_addr is not None and live_addr != base + assumed:
+                return None
+        edit = CompiledEdit()
+        edit.writes = [(base + rel, data) for rel, data in self.writes]
+        edit.checks = [(base + rel, header, kind) for rel, header, kind in self.checks]
+        return edit
+
+
+@dataclass
+class CompiledPatchSection:
+    ops: list[CompiledPatchOp] = field(default_factory=list)
+    deferred: list[dict] = field(default_factory=list)
+    errors: list[tuple[dict, str]] = field(default_factory=list)
+
+
+@dataclass
+class CompiledPatch:
+    digest: str
+    sections: dict[str, CompiledPatchSection] = field(default_factory=dict)
+    compile_ms: float = 0.0
+
+
+def patch_document_digest(doc: dict) -> str:
+    body = {k: v for k, v in (doc or {}).items() if not str(k).startswith("_")}
+    raw = json.dumps(body, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def _relative_row(entry: dict) -> _ConsultedRow:
+    """A row at ``abs`` 0 carrying the entry's relative addresses."""
+    row = _ConsultedRow(abs=0)
+    addresses = entry.get("addresses") or {}
+    if not isinstance(addresses, dict):
+        return row
+    for key, value in addresses.items():
+        key = str(key)
+        if key.endswith("_rel"):
+            rel = _coerce_int(value, None)
+            if rel is not None:
+                dict.__setitem__(row, key[:-4], rel)
+    hb_off = _coerce_int(addresses.get("hb_off"), None)
+    if hb_off is not None:
+        dict.__setitem__(row, "hb_off", hb_off)
+    return row
+
+
+def compile_patch_entry(entry: dict) -> tuple[CompiledPatchOp | None, str]:
+    """Compile one entry; ``(None, "")`` means it keeps the per-entry writer."""
+    from .edit_sets import compile_edit
+
+    group = str(entry.get("group") or "")
+    if not group:
+        return None, "missing group"
+    row = _relative_row(entry)
+    try:
+        edit = compile_edit(row, group, entry.get("value"))
+    except Exception as e:
+        return None, f"invalid value: {e}"
+    if edit is None:
+        return None, ""
+    bases = tuple((key, dict.get(row, key)) for key in row.consulted if key != "abs")
+    return CompiledPatchOp(entry=entry, writes=tuple(edit.writes), checks=tuple(edit.checks), bases=bases), ""
+
+
+def compile_patch_document(doc: dict) -> CompiledPatch:
+    """Compile every character section of ``doc``, reusing an earlier compile of the same content."""
+    digest = patch_document_digest(doc)
+    with _COMPILE_LOCK:
+        cached = _COMPILED_PATCHES.get(digest)
+        if cached is not None:
+            _COMPILE_STATS["hits"] += 1
+            return cached
+
+    started = time.perf_counter()
+    compiled = CompiledPatch(digest=digest)
+    for sec_key, sec in (doc.get("characters") or {}).items():
+        if not isinstance(sec, dict):
+            continue
+        section = CompiledPatchSection()
+        for entry in sec.get("changes") or []:
+            if not isinstance(entry, dict):
+                continue
+            op, error = compile_patch_entry(entry)
+            if op is not None:
+                section.ops.append(op)
+            elif error:
+                section.errors.append((entry, error))
+            else:
+                section.deferred.append(entry)
+        compiled.sections[str(sec_key)] = section
+    compiled.compile_ms = (time.perf_counter() - started) * 1000.0
+
+    with _COMPILE_LOCK:
+        _COMPILE_STATS["compiles"] += 1
+        while len(_COMPILED_PATCHES) >= PATCH_COMPILE_CACHE_LIMIT:
+            _COMPILED_PATCHES.pop(next(iter(_COMPILED_PATCHES)))
+        _COMPILED_PATCHES[digest] = compiled
+    return compiled
+
+
+def patch_compile_stats() -> dict:
+    with _COMPILE_LOCK:
+        return dict(_COMPILE_STATS, cached=len(_COMPILED_PATCHES))
+
+
+def clear_compiled_patches() -> None:
+    with _COMPILE_LOCK:
+        _COMPILED_PATCHES.clear()
+        _COMPILE_STATS.update(compiles=0, hits=0)
+
+
+def _patch_writer_available() -> bool:
+    try:
+        from . import utils as U
+    except Exception:
+        return False
+    return bool(getattr(U, "WRITER_AVAILABLE", False))
+
+
+def _slot_abs_index(slot_data: dict) -> dict[int, dict]:
+    """``abs`` -> row for one slot, normal rows ahead of per-hit rows, as the selector walk orders them."""
+    index: dict[int, dict] = {}
+    moves = slot_data.get("moves") or []
+    if not isinstance(moves, list):
+        return index
+    for mv in moves:
+        if not isinstance(mv, dict):
+            continue
+        try:
+            index.setdefault(int(mv.get("abs") or -1), mv)
+        except Exception:
+            pass
+    for _parent, seg in _iter_move_hit_segments(moves):
+        try:
+            index.setdefault(int(seg.get("abs") or seg.get("active_addr") or -1), seg)
+        except Exception:
+            pass
+    index.pop(-1, None)
+    return index
+
+
+def _find_indexed_target(slot_data: dict, index: dict[int, dict], entry: dict) -> tuple[dict | None, str]:
+    selector = entry.get("selector") or {}
+    wanted_abs = parse_patch_abs(selector.get("abs") or (entry.get("addresses") or {}).get("abs"))
+    if wanted_abs is not None and wanted_abs in index:
+        return index[wanted_abs], "abs"
+    return find_patch_target_in_slot(slot_data, entry)
+
+
+def _entry_label(entry: dict) -> str:
+    selector = entry.get("selector") or {}
+    return str(selector.get("move_label") or selector.get("abs") or entry.get("group") or "unknown")
+
+
 @dataclass
 class LoadedPatch:
     path: str
@@ -848,12 +1068,99 @@ class PatchAutoloadController:
             print(f"[fd patch] per-character prompt failed for {char_key}: {e}")
             return False
 
-    def apply_to_scan_data(self, scan_data: list[dict] | None, *, write_to_dolphin: bool = True) -> dict:
-        result = {"applied": 0, "skipped": 0, "failures": []}
+    def _apply_entries(self, slot_data: dict, char_key: str, entries: list[dict], result: dict,
+                       entries_for_live: list[dict], *, write_to_dolphin: bool) -> None:
+        # Apply animation swaps last so old ID selectors still find the
+        # row for the rest of that move's edits.
+        ordered = sorted(entries, key=lambda e: 1 if str(e.get("group") or "") == "move" else 0)
+        for entry in ordered:
+            mv, match_kind = find_patch_target_in_slot(slot_data, entry)
+            if not mv:
+                result["skipped"] += 1
+                result["failures"].append(f"{char_key}: not found: {_entry_label(entry)}")
+                continue
+            ok, reason = apply_patch_change_to_move(mv, entry, write_to_dolphin=write_to_dolphin)
+            if ok:
+                result["applied"] += 1
+                entries_for_live.append(entry)
+            else:
+                result["skipped"] += 1
+                result["failures"].append(f"{char_key}: {_entry_label(entry)}: {reason}")
+
+    def _apply_compiled(self, slot_data: dict, char_key: str, section: CompiledPatchSection, result: dict,
+                        entries_for_live: list[dict], *, read_block=None, write_block=None) -> None:
+        """Rebase a compiled section onto this slot's rows and write it as one batch."""
+        from .edit_sets import compile_edit, write_batch
+
+        index = _slot_abs_index(slot_data)
+        deferred = list(section.deferred)
+        for entry, error in section.errors:
+            result["skipped"] += 1
+            result["failures"].append(f"{char_key}: {_entry_label(entry)}: {error}")
+
+        # Later entries for the same cell replace earlier ones, as sequential
+        # writes would; the batch refuses two different values for one address.
+        staged: dict[tuple[int, str], list] = {}
+        for op in section.ops:
+            entry = op.entry
+            mv, _match_kind = _find_indexed_target(slot_data, index, entry)
+            if not mv:
+                result["skipped"] += 1
+                result["failures"].append(f"{char_key}: not found: {_entry_label(entry)}")
+                continue
+            _inject_entry_addresses(mv, entry)
+            edit = op.rebase(mv)
+            if edit is None:
+                # The live row disagrees with the saved layout: compile against it.
+                try:
+                    edit = compile_edit(mv, str(entry.get("group") or ""), entry.get("value"))
+                except Exception as e:
+                    result["skipped"] += 1
+                    result["failures"].append(f"{char_key}: {_entry_label(entry)}: invalid value: {e}")
+                    continue
+                if edit is None:
+                    deferred.append(entry)
+                    continue
+                result["recompiled"] += 1
+            key = (id(mv), str(entry.get("group") or ""))
+            superseded = staged[key][1] + [staged[key][2]] if key in staged else []
+            staged[key] = [mv, superseded, entry, edit]
+
+        batch = write_batch(
+            [((mv, superseded, entry), edit) for mv, superseded, entry, edit in staged.values()],
+            read_block=read_block,
+            write_block=write_block,
+        )
+        result["reads"] += batch["reads"]
+        result["writes"] += batch["writes"]
+        for (mv, superseded, entry), _edit in batch["written"]:
+            for done in superseded + [entry]:
+                apply_patch_value_to_move(mv, done)
+                entries_for_live.append(done)
+            result["applied"] += 1 + len(superseded)
+        for (mv, superseded, entry), reason in batch["failed"]:
+            result["skipped"] += 1 + len(superseded)
+            for failed in superseded + [entry]:
+                result["failures"].append(f"{char_key}: {_entry_label(failed)}: {reason}")
+
+        self._apply_entries(slot_data, char_key, deferred, result, entries_for_live, write_to_dolphin=True)
+
+    def apply_to_scan_data(self, scan_data: list[dict] | None, *, write_to_dolphin: bool = True,
+                           read_block=None, write_block=None) -> dict:
+        """Apply matching patch sections to newly scanned characters.
+
+        Dolphin writes use each document's compiled form: every direct-route
+        entry for a character goes out in one batched write, and only entries
+        without a byte route (animation swaps, probed fields) fall back to the
+        per-entry writers.
+        """
+        result = {"applied": 0, "skipped": 0, "failures": [], "recompiled": 0, "reads": 0, "writes": 0, "ms": 0.0}
         if self.mode == "none" or not self.patches or not scan_data:
             overlay_scan_data(scan_data)
             return result
 
+        started = time.perf_counter()
+        compiled_writes = write_to_dolphin and (write_block is not None or _patch_writer_available())
         for slot_data in list(scan_data or []):
             if not isinstance(slot_data, dict):
                 continue
@@ -874,37 +1181,29 @@ class PatchAutoloadController:
                     entries_for_live.extend([e for e in changes if isinstance(e, dict)])
                     continue
 
-                # Apply animation swaps last so old ID selectors still find the
-                # row for the rest of that move's edits.
-                ordered = sorted(
-                    [e for e in changes if isinstance(e, dict)],
-                    key=lambda e: 1 if str(e.get("group") or "") == "move" else 0,
-                )
-                for entry in ordered:
-                    mv, match_kind = find_patch_target_in_slot(slot_data, entry)
-                    if not mv:
-                        result["skipped"] += 1
-                        selector = entry.get("selector") or {}
-                        label = selector.get("move_label") or selector.get("abs") or entry.get("group") or "unknown"
-                        result["failures"].append(f"{char_key}: not found: {label}")
-                        continue
-                    ok, reason = apply_patch_change_to_move(mv, entry, write_to_dolphin=write_to_dolphin)
-                    if ok:
-                        result["applied"] += 1
-                        entries_for_live.append(entry)
-                    else:
-                        result["skipped"] += 1
-                        selector = entry.get("selector") or {}
-                        label = selector.get("move_label") or selector.get("abs") or entry.get("group") or "unknown"
-                        result["failures"].append(f"{char_key}: {label}: {reason}")
+                if compiled_writes:
+                    section = compile_patch_document(patch.document).sections.get(str(sec_key)) or CompiledPatchSection()
+                    self._apply_compiled(
+                        slot_data, char_key, section, result, entries_for_live,
+                        read_block=read_block, write_block=write_block,
+                    )
+                else:
+                    self._apply_entries(
+                        slot_data, char_key, [e for e in changes if isinstance(e, dict)], result, entries_for_live,
+                        write_to_dolphin=write_to_dolphin,
+                    )
                 self.loaded_slot_keys.add(slot_key)
 
             if entries_for_live:
                 add_live_entries_for_character(char_key, entries_for_live)
 
         overlay_scan_data(scan_data)
+        result["ms"] = (time.perf_counter() - started) * 1000.0
         if result["applied"] or result["skipped"]:
-            print(f"[fd patch] applied={result['applied']} skipped={result['skipped']}")
+            print(
+                f"[fd patch] applied={result['applied']} skipped={result['skipped']} "
+                f"in {result['ms']:.1f} ms (reads={result['reads']} writes={result['writes']})"
+            )
             for line in result["failures"][:10]:
                 print(f"[fd patch] {line}")
         return result
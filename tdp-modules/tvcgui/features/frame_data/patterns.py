@@ -3,6 +3,11 @@
 # Pattern scanners / address discovery for move blocks.
 
 from __future__ import annotations
+import bisect as _bisect
+import hashlib as _hashlib
+import threading as _threading
+import time as _time
+from collections import OrderedDict as _OrderedDict
 from typing import Callable, Optional, Tuple
 
 # ---- Combo-only KB/Vacuum modifier pattern ----
@@ -37,6 +42,23 @@ PHASE_REC_HDR_LEN = 4
 PHASE_REC_PHASE_LEN = 4
 PHASE_REC_ANIM_LEN = 2
 PHASE_REC_TOTAL_LEN = PHASE_REC_HDR_LEN + PHASE_REC_PHASE_LEN + PHASE_REC_ANIM_LEN
+
+# ---- Hit packet headers (shared by the normal scanner and the edit writers) ----
+# None marks a byte that varies per move.
+ACTIVE_HDR = [
+    0x20, 0x35, 0x01, 0x20,
+    0x3F, 0x00, 0x00, 0x00,
+]
+DAMAGE_HDR = [0x35, 0x10, 0x20, 0x3F, 0x00]
+STUN_HDR = [
+    0x04, 0x01, 0x60, 0x00, 0x00, 0x00, 0x02, 0x54,
+    0x3F, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, None,
+    0x04, 0x01, 0x60, 0x00, 0x00, 0x00, 0x02, 0x58,
+    0x3F, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, None,
+    0x33, 0x32, 0x00, 0x20, 0x00, 0x00, 0x00, None,
+    0x04, 0x15, 0x60,
+]
+
 ASSIST_TABLE_SIG = bytes([
     0x34,0x32,0x3F,0x00,0x00,0x00,0x00,0x02,
     0x20,0x00,0x00,0x00,0x3E,0xD7,0x0A,0x3D,
@@ -953,3 +975,188 @@ def find_hit_result_flags_addr(
             return move_abs + i, move_abs + i + 0x0C, int(val), None, ctx
 
     return None, None, None, None, None
+
+
+# ---- Move-region prefetch ----
+# Every finder above reads its own window starting at move_abs, so resolving
+# the optional columns for one move costs up to eight Dolphin reads and a
+# full character costs thousands.  MoveRegionPrefetch reads the character's
+# move script region once (split into clusters where moves are far apart)
+# and serves each finder a slice of that buffer.  Finder results are memoised
+# per (region fingerprint, move address, finder); the fingerprint is a hash of
+# the region bytes, so an edit that changes memory simply misses the memo.
+
+MOVE_REGION_TAIL = 0x900        # widest regular finder window past the last move
+MOVE_REGION_GAP = 0x4000        # start a new cluster when moves are further apart
+MOVE_REGION_MAX_SPAN = 0x80000  # never read more than 512 KiB in one request
+FINDER_MEMO_LIMIT = 16384
+
+_FINDER_MEMO: "_OrderedDict[tuple, object]" = _OrderedDict()
+_FINDER_MEMO_LOCK = _threading.Lock()
+
+
+class _RegionCluster:
+    __slots__ = ("start", "end", "data", "fingerprint", "loaded_at")
+
+    def __init__(self, start: int, end: int) -> None:
+        self.start = start
+        self.end = end
+        self.data: bytes | None = None
+        self.fingerprint: str | None = None
+        self.loaded_at = 0.0
+
+
+class MoveRegionPrefetch:
+    """Serve finder reads for one character's moves from a single region read.
+
+    Instances are callable with the usual ``rbytes(addr, size)`` signature, so
+    they can be passed straight to any finder.  Reads that fall outside the
+    prefetched clusters go to the wrapped ``rbytes``.  ``max_age`` (seconds)
+    makes long-lived contexts re-read a cluster before serving it again, which
+    keeps them honest after the game or an editor writes to a move.
+    """
+
+    def __init__(
+        self,
+        rbytes: Callable[[int, int], bytes],
+        move_addrs,
+        *,
+        tail: int = MOVE_REGION_TAIL,
+        gap: int = MOVE_REGION_GAP,
+        max_span: int = MOVE_REGION_MAX_SPAN,
+        max_age: float | None = None,
+    ) -> None:
+        self._rbytes = rbytes
+        self._max_age = max_age
+        self._lock = _threading.RLock()
+        self.stats = {"region_reads": 0, "region_bytes": 0, "direct_reads": 0, "served": 0, "memo_hits": 0, "memo_misses": 0}
+        addrs = []
+        for addr in move_addrs or ():
+            try:
+                addr_i = int(addr or 0)
+            except Exception:
+                continue
+            if addr_i > 0:
+                addrs.append(addr_i)
+        self._clusters: list[_RegionCluster] = []
+        for addr in sorted(set(addrs)):
+            last = self._clusters[-1] if self._clusters else None
+            if last is not None and addr <= last.end + gap and addr + tail - last.start <= max_span:
+                last.end = max(last.end, addr + tail)
+            else:
+                self._clusters.append(_RegionCluster(addr, addr + tail))
+        self._starts = [cluster.start for cluster in self._clusters]
+
+    def _cluster_for(self, addr: int, size: int = 1) -> _RegionCluster | None:
+        i = _bisect.bisect_right(self._starts, addr) - 1
+        if i < 0:
+            return None
+        cluster = self._clusters[i]
+        if addr + size > cluster.end:
+            return None
+        return cluster
+
+    def _load(self, cluster: _RegionCluster) -> bytes:
+        if cluster.data is not None and self._max_age is None:
+            return cluster.data
+        with self._lock:
+            stale = (
+                cluster.data is not None
+                and self._max_age is not None
+                and _time.monotonic() - cluster.loaded_at > self._max_age
+            )
+            if cluster.data is None or stale:
+                try:
+                    data = bytes(self._rbytes(cluster.start, cluster.end - cluster.start) or b"")
+                except Exception:
+                    data = b""
+                cluster.data = data
+                cluster.fingerprint = _hashlib.blake2b(data, digest_size=12).hexdigest() if data else None
+                cluster.loaded_at = _time.monotonic()
+                self.stats["region_reads"] += 1
+                self.stats["region_bytes"] += len(data)
+            return cluster.data
+
+    def __call__(self, addr: int, size: int) -> bytes:
+        try:
+            addr_i = int(addr or 0)
+            size_i = max(0, int(size or 0))
+        except Exception:
+            return b""
+        cluster = self._cluster_for(addr_i, size_i)
+        if cluster is not None:
+            data = self._load(cluster)
+            off = addr_i - cluster.start
+            if off + size_i <= len(data):
+                self.stats["served"] += 1
+                return data[off:off + size_i]
+        # Outside the region (legacy anim lookahead, projectile templates) or
+        # the region read came back short: fall through to a real read.
+        self.stats["direct_reads"] += 1
+        return self._rbytes(addr_i, size_i)
+
+    def rd8(self, addr: int) -> int | None:
+        data = self(addr, 1)
+        return data[0] if data else None
+
+    def fingerprint(self, addr: int) -> str | None:
+        """Hash of the prefetched cluster holding ``addr``, or None outside it."""
+        try:
+            cluster = self._cluster_for(int(addr or 0))
+        except Exception:
+            return None
+        if cluster is None:
+            return None
+        self._load(cluster)
+        return cluster.fingerprint
+
+    def invalidate(self) -> None:
+        """Drop every prefetched cluster so the next read goes to memory."""
+        with self._lock:
+            for cluster in self._clusters:
+                cluster.data = None
+                cluster.fingerprint = None
+
+    def run(self, finder: Callable, move_abs: int, *args, **kwargs):
+        """Call ``finder(move_abs, self, *args)`` through the result memo.
+
+        Callable arguments (such as an ``rd8`` reader) are left out of the key.
+        Results that needed a read outside the region are not memoised.
+        """
+        fingerprint = self.fingerprint(move_abs)
+        if fingerprint is None:
+            return finder(move_abs, self, *args, **kwargs)
+        key = (
+            fingerprint,
+            int(move_abs),
+            finder,
+            tuple(arg for arg in args if not callable(arg)) if args else (),
+            tuple(sorted(kwargs.items())) if kwargs else (),
+        )
+        with _FINDER_MEMO_LOCK:
+            if key in _FINDER_MEMO:
+                _FINDER_MEMO.move_to_end(key)
+                self.stats["memo_hits"] += 1
+                return _copy_finder_result(_FINDER_MEMO[key])
+        self.stats["memo_misses"] += 1
+        direct_before = self.stats["direct_reads"]
+        result = finder(move_abs, self, *args, **kwargs)
+        if self.stats["direct_reads"] != direct_before:
+            # Part of the answer came from outside the fingerprinted region.
+            return result
+        with _FINDER_MEMO_LOCK:
+            _FINDER_MEMO[key] = _copy_finder_result(result)
+            while len(_FINDER_MEMO) > FINDER_MEMO_LIMIT:
+                _FINDER_MEMO.popitem(last=False)
+        return result
+
+
+def _copy_finder_result(result):
+    # Finders return tuples of ints/bytes or a plain dict (limb stretch);
+    # callers may annotate the dict, so never hand out the memoised one.
+    return dict(result) if isinstance(result, dict) else result
+
+
+def clear_finder_memo() -> None:
+    with _FINDER_MEMO_LOCK:
+        _FINDER_MEMO.clear()
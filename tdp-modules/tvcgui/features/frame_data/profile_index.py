@@ -0,0 +1,250 @@
+"""Indexed single-file backend for frame-data profiles.
+
+Per-character JSON shards run to several MB each and every lookup parses a
+whole shard.  This backend keeps the same profiles in one SQLite file: the
+profile header (everything except ``moves``) is one row, and each move is its
+own row keyed by ``(profile key, move id, table address)``.  A single move or
+a profile header can be read without decoding the rest of the roster, and
+every write runs in one SQLite transaction so readers never see a partial
+profile.
+
+The JSON shards stay the interchange format.  ``profile_store`` re-imports a
+profile whenever the stamp of its source files changes, and
+:meth:`ProfileIndex.export_shards` writes the index back out as shards.
+"""
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+from typing import Any, Dict, Iterable, Iterator, Optional, Sequence
+
+PROFILE_INDEX_FILENAME = "frame_data_profiles.sqlite3"
+PROFILE_INDEX_SCHEMA = 1
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS meta (
+        name TEXT PRIMARY KEY,
+        value TEXT NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS profiles (
+        key TEXT PRIMARY KEY,
+        char_id INTEGER,
+        version INTEGER,
+        move_count INTEGER NOT NULL,
+        header TEXT NOT NULL,
+        source_stamp TEXT NOT NULL DEFAULT ''
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS moves (
+        key TEXT NOT NULL,
+        seq INTEGER NOT NULL,
+        move_id INTEGER,
+        abs INTEGER,
+        record TEXT NOT NULL,
+        PRIMARY KEY (key, seq)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS moves_by_id ON moves (key, move_id, abs)",
+    "CREATE INDEX IF NOT EXISTS moves_by_abs ON moves (key, abs)",
+)
+
+
+def _int_or_none(value: Any) -> Optional[int]:
+    try:
+        return int(value) if value is not None else None
+    except Exception:
+        return None
+
+
+def _dumps(value: Any) -> str:
+    # Profiles carry NaN floats from unread hitbox slots; keep them round-trippable.
+    return json.dumps(value, separators=(",", ":"), sort_keys=True)
+
+
+def source_stamp(paths: Iterable[str]) -> str:
+    """Return a cheap change stamp for the JSON files behind one profile."""
+    parts: list[str] = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        parts.append(f"{os.path.abspath(path)}:{int(stat.st_mtime_ns)}:{int(stat.st_size)}")
+    return "|".join(parts)
+
+
+class ProfileIndex:
+    """SQLite-backed profile store with per-move random access."""
+
+    def __init__(self, path: str) -> None:
+        self.path = os.path.abspath(os.path.expanduser(os.fspath(path)))
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=5.0, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            with conn:
+                for statement in _SCHEMA:
+                    conn.execute(statement)
+                conn.execute(
+                    "INSERT OR IGNORE INTO meta (name, value) VALUES ('schema', ?)",
+                    (str(PROFILE_INDEX_SCHEMA),),
+                )
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                try:
+                    self._conn.close()
+                finally:
+                    self._conn = None
+
+    def __enter__(self) -> "ProfileIndex":
+        return self
+
+    def __exit__(self, *_exc: Any) -> None:
+        self.close()
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+    def put_profile(self, key: str, profile: Dict[str, Any], *, stamp: str = "") -> bool:
+        """Replace one profile atomically."""
+        if not isinstance(profile, dict):
+            return False
+        header = {name: value for name, value in profile.items() if name != "moves"}
+        moves = [row for row in (profile.get("moves") or []) if isinstance(row, dict)]
+        rows = [
+            (str(key), seq, _int_or_none(move.get("id")), _int_or_none(move.get("abs")), _dumps(move))
+            for seq, move in enumerate(moves)
+        ]
+        with self._lock:
+            conn = self._connection()
+            try:
+                with conn:
+                    conn.execute("DELETE FROM moves WHERE key = ?", (str(key),))
+                    conn.executemany(
+                        "INSERT INTO moves (key, seq, move_id, abs, record) VALUES (?, ?, ?, ?, ?)",
+                        rows,
+                    )
+                    conn.execute(
+                        "INSERT OR REPLACE INTO profiles (key, char_id, version, move_count, header, source_stamp)"
+                        " VALUES (?, ?, ?, ?, ?, ?)",
+                        (
+                            str(key),
+                            _int_or_none(header.get("char_id")),
+                            _int_or_none(header.get("version")),
+                            len(rows),
+                            _dumps(header),
+                            str(stamp or ""),
+                        ),
+                    )
+            except sqlite3.Error:
+                return False
+        return True
+
+    def delete_profile(self, key: str) -> bool:
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute("DELETE FROM moves WHERE key = ?", (str(key),))
+                removed = conn.execute("DELETE FROM profiles WHERE key = ?", (str(key),)).rowcount
+        return bool(removed)
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+    def keys(self) -> list[str]:
+        with self._lock:
+            rows = self._connection().execute("SELECT key FROM profiles ORDER BY key").fetchall()
+        return [row[0] for row in rows]
+
+    def stamp(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT source_stamp FROM profiles WHERE key = ?", (str(key),)
+            ).fetchone()
+        return row[0] if row is not None else None
+
+    def load_header(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a profile without its ``moves`` list."""
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT header FROM profiles WHERE key = ?", (str(key),)
+            ).fetchone()
+        return json.loads(row[0]) if row is not None else None
+
+    def load_profile(self, key: str) -> Optional[Dict[str, Any]]:
+        header = self.load_header(key)
+        if header is None:
+            return None
+        header["moves"] = list(self.iter_moves(key))
+        return header
+
+    def iter_moves(self, key: str) -> Iterator[Dict[str, Any]]:
+        with self._lock:
+            rows = self._connection().execute(
+                "SELECT record FROM moves WHERE key = ? ORDER BY seq", (str(key),)
+            ).fetchall()
+        for (record,) in rows:
+            yield json.loads(record)
+
+    def find_moves(
+        self,
+        key: str,
+        *,
+        move_id: Optional[int] = None,
+        abs_addr: Optional[int] = None,
+    ) -> list[Dict[str, Any]]:
+        """Return moves matching ``move_id`` and/or table address, in profile order."""
+        clauses = ["key = ?"]
+        params: list[Any] = [str(key)]
+        if move_id is not None:
+            clauses.append("move_id = ?")
+            params.append(int(move_id))
+        if abs_addr is not None:
+            clauses.append("abs = ?")
+            params.append(int(abs_addr))
+        with self._lock:
+            rows = self._connection().execute(
+                f"SELECT record FROM moves WHERE {' AND '.join(clauses)} ORDER BY seq", params
+            ).fetchall()
+        return [json.loads(record) for (record,) in rows]
+
+    # ------------------------------------------------------------------
+    # Migration / export
+    # ------------------------------------------------------------------
+    def export_shards(self, output_directory: str, *, keys: Optional[Sequence[str]] = None) -> dict[str, Any]:
+        """Write indexed profiles back out as per-character JSON shards."""
+        from tvcgui.features.frame_data.profile_store import _atomic_write_json, profile_file_path
+
+        written: list[str] = []
+        failed: list[str] = []
+        for key in (list(keys) if keys else self.keys()):
+            profile = self.load_profile(key)
+            target = profile_file_path(output_directory, key)
+            if isinstance(profile, dict) and _atomic_write_json(target, profile):
+                written.append(target)
+            else:
+                failed.append(target)
+        return {"output_directory": os.path.abspath(output_directory), "written": written, "failed": failed}
+
+
+__all__ = [
+    "PROFILE_INDEX_FILENAME",
+    "PROFILE_INDEX_SCHEMA",
+    "ProfileIndex",
+    "source_stamp",
+]
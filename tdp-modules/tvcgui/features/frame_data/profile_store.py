@@ -21,11 +21,14 @@ from tvcgui.core.paths import data_path, user_data_path
 PROFILE_DIRECTORY_NAME = "frame_data_profiles"
 LEGACY_PROFILE_FILENAME = "frame_data_profiles.json"
 PROFILE_FILE_SUFFIX = ".json"
+PROFILE_BACKEND_JSON = "json"
+PROFILE_BACKEND_INDEX = "index"
 
 _IO_LOCK = threading.RLock()
 _LEGACY_CACHE: dict[str, tuple[int, int, Dict[str, Any]]] = {}
 _MIGRATION_CHECKED: set[tuple[str, str]] = set()
 _SAFE_KEY_RE = re.compile(r"[^a-zA-Z0-9_.-]+")
+_PROFILE_INDEXES: dict[str, Any] = {}
 
 
 def _safe_key(key: Any) -> str:
@@ -61,6 +64,21 @@ def default_writable_legacy_file() -> str:
     return user_data_path("frame_data", LEGACY_PROFILE_FILENAME)
 
 
+def default_profile_index_file() -> str:
+    override = str(os.environ.get("TVC_FD_PROFILE_INDEX_FILE", "") or "").strip()
+    if override:
+        return os.path.abspath(os.path.expanduser(override))
+    from tvcgui.features.frame_data.profile_index import PROFILE_INDEX_FILENAME
+
+    return user_data_path("frame_data", PROFILE_INDEX_FILENAME)
+
+
+def profile_backend() -> str:
+    """Return ``"index"`` when the SQLite index serves profile reads."""
+    value = str(os.environ.get("TVC_FD_PROFILE_BACKEND", "") or "").strip().lower()
+    return PROFILE_BACKEND_INDEX if value in {"index", "sqlite"} else PROFILE_BACKEND_JSON
+
+
 def profile_file_path(directory: str | os.PathLike[str], key: Any) -> str:
     return os.path.join(os.fspath(directory), _safe_key(key) + PROFILE_FILE_SUFFIX)
 
@@ -243,7 +261,86 @@ def load_frame_data_profile(
     writable_legacy_file: Optional[str] = None,
 ) -> Optional[Dict[str, Any]]:
     """Load one profile, preferring writable data over bundled seed data."""
-    safe_key = _safe_key(key)
+    sources = _resolve_sources(
+        key,
+        expected_version=expected_version,
+        bundled_directory=bundled_directory,
+        writable_directory=writable_directory,
+        bundled_legacy_file=bundled_legacy_file,
+        writable_legacy_file=writable_legacy_file,
+    )
+    if profile_backend() == PROFILE_BACKEND_INDEX:
+        index = _synced_index(_safe_key(key), sources, expected_version)
+        if index is not None:
+            return index.load_profile(_safe_key(key))
+    return _load_profile_from_sources(sources, _safe_key(key), expected_version)
+
+
+def load_frame_data_profile_header(
+    key: Any,
+    *,
+    expected_version: Optional[int] = None,
+    bundled_directory: Optional[str] = None,
+    writable_directory: Optional[str] = None,
+    bundled_legacy_file: Optional[str] = None,
+    writable_legacy_file: Optional[str] = None,
+) -> Optional[Dict[str, Any]]:
+    """Load one profile without its ``moves`` list.
+
+    With the index backend only the header row is decoded; the JSON backend
+    reads the whole profile and drops the moves.
+    """
+    sources = _resolve_sources(
+        key,
+        expected_version=expected_version,
+        bundled_directory=bundled_directory,
+        writable_directory=writable_directory,
+        bundled_legacy_file=bundled_legacy_file,
+        writable_legacy_file=writable_legacy_file,
+    )
+    if profile_backend() == PROFILE_BACKEND_INDEX:
+        index = _synced_index(_safe_key(key), sources, expected_version)
+        if index is not None:
+            return index.load_header(_safe_key(key))
+    profile = _load_profile_from_sources(sources, _safe_key(key), expected_version)
+    if not isinstance(profile, dict):
+        return None
+    profile.pop("moves", None)
+    return profile
+
+
+def frame_data_profile_stamp(
+    key: Any,
+    *,
+    expected_version: Optional[int] = None,
+    bundled_directory: Optional[str] = None,
+    writable_directory: Optional[str] = None,
+    bundled_legacy_file: Optional[str] = None,
+    writable_legacy_file: Optional[str] = None,
+) -> str:
+    """Return a cheap change stamp for every file that can supply ``key``."""
+    from tvcgui.features.frame_data.profile_index import source_stamp
+
+    sources = _resolve_sources(
+        key,
+        expected_version=expected_version,
+        bundled_directory=bundled_directory,
+        writable_directory=writable_directory,
+        bundled_legacy_file=bundled_legacy_file,
+        writable_legacy_file=writable_legacy_file,
+    )
+    return source_stamp(path for _kind, path in sources)
+
+
+def _resolve_sources(
+    key: Any,
+    *,
+    expected_version: Optional[int],
+    bundled_directory: Optional[str],
+    writable_directory: Optional[str],
+    bundled_legacy_file: Optional[str],
+    writable_legacy_file: Optional[str],
+) -> list[tuple[str, str]]:
     if bundled_directory is None:
         bundled_directory = default_bundled_directory()
     if writable_directory is None:
@@ -259,16 +356,23 @@ def load_frame_data_profile(
             writable_directory=writable_directory,
             expected_version=expected_version,
         )
-
+    return _candidate_paths(
+        _safe_key(key),
+        bundled_directory=bundled_directory,
+        writable_directory=writable_directory,
+        bundled_legacy_file=bundled_legacy_file,
+        writable_legacy_file=writable_legacy_file,
+    )
+
+
+def _load_profile_from_sources(
+    sources: list[tuple[str, str]],
+    safe_key: str,
+    expected_version: Optional[int],
+) -> Optional[Dict[str, Any]]:
     selected: Optional[Dict[str, Any]] = None
     with _IO_LOCK:
-        for kind, path in _candidate_paths(
-            safe_key,
-            bundled_directory=bundled_directory,
-            writable_directory=writable_directory,
-            bundled_legacy_file=bundled_legacy_file,
-            writable_legacy_file=writable_legacy_file,
-        ):
+        for kind, path in sources:
             if kind == "shard":
                 candidate = _read_shard(path, expected_version)
             else:
@@ -283,6 +387,127 @@ def load_frame_data_profile(
     return copy.deepcopy(selected) if isinstance(selected, dict) else None
 
 
+def profile_index(path: Optional[str] = None):
+    """Return the shared :class:`ProfileIndex` for ``path`` (default index file)."""
+    from tvcgui.features.frame_data.profile_index import ProfileIndex
+
+    target = os.path.abspath(path or default_profile_index_file())
+    with _IO_LOCK:
+        index = _PROFILE_INDEXES.get(target)
+        if index is None:
+            index = ProfileIndex(target)
+            _PROFILE_INDEXES[target] = index
+        return index
+
+
+def _synced_index(safe_key: str, sources: list[tuple[str, str]], expected_version: Optional[int] = None):
+    """Return the index with ``safe_key`` current, re-importing if its JSON changed.
+
+    The stamp covers every candidate source file, so a save to any shard or
+    legacy document invalidates the indexed copy on the next read.  The index
+    holds the highest-precedence profile of any version; callers asking for a
+    specific version get ``None`` on mismatch and fall back to the JSON path.
+    """
+    from tvcgui.features.frame_data.profile_index import source_stamp
+
+    try:
+        index = profile_index()
+        stamp = source_stamp(path for _kind, path in sources)
+        if index.stamp(safe_key) != stamp:
+            profile = _load_profile_from_sources(sources, safe_key, None)
+            if not isinstance(profile, dict):
+                index.delete_profile(safe_key)
+                return None
+            if not index.put_profile(safe_key, profile, stamp=stamp):
+                return None
+        if expected_version is not None and not _valid_profile(index.load_header(safe_key), expected_version):
+            return None
+        return index
+    except Exception:
+        return None
+
+
+def sync_frame_data_profile_index(
+    *,
+    keys: Optional[Iterable[Any]] = None,
+    bundled_directory: Optional[str] = None,
+    writable_directory: Optional[str] = None,
+    bundled_legacy_file: Optional[str] = None,
+    writable_legacy_file: Optional[str] = None,
+) -> dict[str, Any]:
+    """Import every known profile (or ``keys``) into the index; the migration path."""
+    if keys is None:
+        found: set[str] = set()
+        for directory in (
+            default_bundled_directory() if bundled_directory is None else bundled_directory,
+            default_writable_directory() if writable_directory is None else writable_directory,
+        ):
+            found.update(key for key, _profile in _iter_shard_profiles(directory, None))
+        for legacy in (
+            default_bundled_legacy_file() if bundled_legacy_file is None else bundled_legacy_file,
+            default_writable_legacy_file() if writable_legacy_file is None else writable_legacy_file,
+        ):
+            doc = _read_legacy_document(legacy or "")
+            if isinstance(doc, dict):
+                found.update(_safe_key(key) for key in (doc.get("profiles") or {}))
+        keys = sorted(found)
+    synced: list[str] = []
+    failed: list[str] = []
+    for key in keys:
+        safe_key = _safe_key(key)
+        sources = _resolve_sources(
+            safe_key,
+            expected_version=None,
+            bundled_directory=bundled_directory,
+            writable_directory=writable_directory,
+            bundled_legacy_file=bundled_legacy_file,
+            writable_legacy_file=writable_legacy_file,
+        )
+        (synced if _synced_index(safe_key, sources) is not None else failed).append(safe_key)
+    return {"index": profile_index().path, "synced": synced, "failed": failed}
+
+
+def load_frame_data_moves(
+    key: Any,
+    *,
+    move_id: Optional[int] = None,
+    abs_addr: Optional[int] = None,
+    expected_version: Optional[int] = None,
+    bundled_directory: Optional[str] = None,
+    writable_directory: Optional[str] = None,
+    bundled_legacy_file: Optional[str] = None,
+    writable_legacy_file: Optional[str] = None,
+) -> list[Dict[str, Any]]:
+    """Return the moves of one profile matching ``move_id`` and/or ``abs_addr``.
+
+    Served from the SQLite index without decoding the rest of the profile;
+    falls back to a full JSON load when the index is unavailable.
+    """
+    safe_key = _safe_key(key)
+    sources = _resolve_sources(
+        safe_key,
+        expected_version=expected_version,
+        bundled_directory=bundled_directory,
+        writable_directory=writable_directory,
+        bundled_legacy_file=bundled_legacy_file,
+        writable_legacy_file=writable_legacy_file,
+    )
+    index = _synced_index(safe_key, sources, expected_version)
+    if index is not None:
+        return index.find_moves(safe_key, move_id=move_id, abs_addr=abs_addr)
+    profile = _load_profile_from_sources(sources, safe_key, expected_version) or {}
+    out: list[Dict[str, Any]] = []
+    for move in profile.get("moves") or []:
+        if not isinstance(move, dict):
+            continue
+        if move_id is not None and move.get("id") != move_id:
+            continue
+        if abs_addr is not None and move.get("abs") != abs_addr:
+            continue
+        out.append(move)
+    return out
+
+
 def _atomic_write_json(path: str, payload: Dict[str, Any]) -> bool:
     directory = os.path.dirname(os.path.abspath(path))
     os.makedirs(directory, exist_ok=True)
@@ -473,6 +698,13 @@ __all__ = [
     "default_writable_legacy_file",
     "profile_file_path",
     "load_frame_data_profile",
+    "load_frame_data_profile_header",
+    "load_frame_data_moves",
+    "frame_data_profile_stamp",
+    "sync_frame_data_profile_index",
+    "default_profile_index_file",
+    "profile_backend",
+    "profile_index",
     "save_frame_data_profile",
     "iter_frame_data_profiles",
     "split_legacy_profile_file",
@@ -5,10 +5,23 @@ character.  The exporter then rebuilds the shared master CSV from the complete
 per-character folder, while preserving any older master rows and the two manual
 review columns.  The game scanner therefore never has to write a monolithic
 workbook directly from a transient live result.
+
+Each logical row is hashed without its ``last_seen_*`` columns.  A character
+whose scan hashes the same as last time is skipped outright, and the master is
+patched from the rows that actually changed instead of being recompiled from
+every source file.  Hashes and source-file stamps persist in a small manifest
+beside the per-character CSVs.
+
+Replaced exports are kept in a compressed, content-addressed history under
+``data/exports/export_history`` rather than as ``.previous`` copies; see
+:mod:`tvcgui.features.frame_data.export_history`.
 """
 from __future__ import annotations
 
 import csv
+import hashlib
+import io
+import json
 import os
 import re
 import shutil
@@ -19,6 +32,7 @@ from pathlib import Path
 from typing import Any, Iterable, Mapping
 
 from tvcgui.core.paths import resource_path, user_data_path
+from tvcgui.features.frame_data.export_history import HISTORY_DIRECTORY_NAME, ExportHistory, content_digest
 from tvcgui.features.combat.move_filters import is_purged_move_label
 
 EXPORT_FILE_NAME = "TvC_Frame_Data_Observed.csv"
@@ -95,6 +109,13 @@ CSV_FIELDS = (
     "row_key",
 )
 
+EXPORT_MANIFEST_NAME = "_export_manifest.json"
+EXPORT_MANIFEST_VERSION = 1
+# Refreshed on every scan; excluded from change detection so an unchanged
+# character does not rewrite its CSV only to bump a timestamp.
+VOLATILE_FIELDS = frozenset({"last_seen_utc", "last_seen_slot"})
+_HASHED_FIELDS = tuple(field for field in CSV_FIELDS if field not in VOLATILE_FIELDS)
+
 
 def master_export_path() -> Path:
     """Return the persistent compiled master CSV under ``data/exports``.
@@ -381,6 +402,40 @@ def _iter_export_moves(slot: Mapping[str, Any]) -> Iterable[Mapping[str, Any]]:
                 yield _super_export_move(hit, index)
 
 
+def _row_digest(row: Mapping[str, str]) -> str:
+    # Rows are already normalized to text by _build_row/_read_rows.
+    text = "\x1f".join([row.get(field) or "" for field in _HASHED_FIELDS])
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _rows_digest(digests: Iterable[str]) -> str:
+    return hashlib.blake2b("".join(sorted(digests)).encode("ascii"), digest_size=12).hexdigest()
+
+
+def _row_sort_key(row: Mapping[str, Any]) -> tuple:
+    return (
+        row.get("character", "").lower(),
+        row.get("move_kind", "").lower(),
+        _as_int(row.get("move_id_decimal")) or 0,
+        _as_int(row.get("hit_segment")) or 0,
+        row.get("move_label", "").lower(),
+    )
+
+
+def _csv_line(row: Mapping[str, Any]) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow([row.get(field, "") for field in CSV_FIELDS])
+    return buffer.getvalue()
+
+
+def _file_stamp(path: Path) -> list[int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return [int(stat.st_mtime_ns), int(stat.st_size)]
+
+
 def _safe_file_stem(value: Any) -> str:
     """Make a stable Windows-safe character filename stem."""
     text = _as_text(value).strip()
@@ -423,13 +478,27 @@ class FrameDataSpreadsheetExporter:
         self._worker: threading.Thread | None = None
         self._rows_by_path: dict[Path, dict[str, dict[str, str]]] = {}
         self._loaded_paths: set[Path] = set()
+        self._manifest: dict[str, Any] | None = None
+        self._manifest_dirty = False
+        # Master rows as (sort key, digest, serialized line, manual columns);
+        # kept instead of row dicts so the master can be patched cheaply.
+        self._master_index: dict[str, tuple[tuple, str, str, tuple[str, str]]] | None = None
+        self._master_stamp: list[int] | None = None
+        self._pending_master_rows: dict[str, dict[str, str]] = {}
+        self.history = ExportHistory(self.path.parent / HISTORY_DIRECTORY_NAME)
+        # File stamps right after our own writes; anything else is recorded
+        # into history before it is overwritten.
+        self._history_stamps: dict[Path, list[int] | None] = {}
         self.last_error = ""
         self.last_write_count = 0
         self.last_character_write_count = 0
+        self.last_character_skip_count = 0
         self.last_master_row_count = 0
+        self.last_master_changed_rows = 0
         self.character_directory.mkdir(parents=True, exist_ok=True)
         self.path.parent.mkdir(parents=True, exist_ok=True)
         self._migrate_prior_export_layout_if_needed()
+        self._import_legacy_backups()
         if self._startup_rebuild:
             self.compile_master_from_character_exports()
 
@@ -472,20 +541,68 @@ class FrameDataSpreadsheetExporter:
         char_name = _safe_file_stem(slot.get("char_name") or slot.get("profile_key") or "Unknown")
         return self.character_directory / f"{char_id:02d}_{char_name}.csv"
 
-    @staticmethod
-    def _data_row_count(path: Path) -> int:
-        try:
-            if not path.is_file():
-                return 0
-            with path.open("r", encoding="utf-8-sig", newline="") as handle:
-                return sum(1 for row in csv.DictReader(handle) if isinstance(row, dict))
-        except Exception:
-            return 0
-
     @staticmethod
     def _backup_path(path: Path) -> Path:
+        """Legacy one-generation backup, now only read to seed export history."""
         return path.with_name(f"{path.stem}.previous.csv")
 
+    def _import_legacy_backups(self) -> None:
+        """Fold ``.previous`` copies into export history, then remove them."""
+        candidates = [self._backup_path(self.path)]
+        if self.character_directory.is_dir():
+            candidates.extend(self.character_directory.glob("*.previous.csv"))
+        for backup in candidates:
+            try:
+                if not backup.is_file():
+                    continue
+                live = backup.with_name(backup.name[: -len(".previous.csv")] + ".csv")
+                name = self._history_name(live)
+                previous = backup.read_bytes()
+                if not self.history.versions(name):
+                    self.history.record(name, previous, source="legacy-previous")
+                    if live.is_file():
+                        self.history.record(name, live.read_bytes(), source="legacy-current")
+                        self._history_stamps[live] = _file_stamp(live)
+                digest = content_digest(previous)
+                recorded = [entry["n"] for entry in self.history.versions(name) if entry["sha"] == digest]
+                if recorded and self.history.read_version(name, recorded[0]) == previous:
+                    backup.unlink()
+            except Exception as exc:
+                self.last_error = f"history import failed for {backup.name}: {exc!r}"
+
+    def export_versions(self, path: Path | str | None = None) -> list[dict[str, Any]]:
+        """List recorded versions of the master or one per-character CSV."""
+        return self.history.versions(self._history_name(self._export_target(path)))
+
+    def diff_export_versions(self, old: int, new: int, path: Path | str | None = None) -> dict[str, Any]:
+        """Row-level diff (added/removed/changed by ``row_key``) between two versions."""
+        return self.history.diff_versions(self._history_name(self._export_target(path)), old, new)
+
+    def restore_export_version(self, number: int, path: Path | str | None = None) -> bool:
+        """Restore version ``number`` of an export; the replaced content stays in history."""
+        target = self._export_target(path)
+        with self._lock:
+            try:
+                self._record_unseen_version(target)
+                self.history.restore_version(self._history_name(target), number, target)
+            except Exception as exc:
+                self.last_error = f"restore failed for {target.name}: {exc!r}"
+                return False
+            self._history_stamps[target] = _file_stamp(target)
+            self._rows_by_path.pop(target, None)
+            self._loaded_paths.discard(target)
+            if target == self.path:
+                self._master_index = None
+            return True
+
+    def _export_target(self, path: Path | str | None) -> Path:
+        if path is None:
+            return self.path
+        candidate = Path(path)
+        if not candidate.is_absolute():
+            candidate = self.path.parent / candidate
+        return candidate
+
     def _read_rows(self, path: Path) -> dict[str, dict[str, str]]:
         """Read one CSV as normalized logical rows without mutating its file."""
         rows: dict[str, dict[str, str]] = {}
@@ -522,47 +639,63 @@ class FrameDataSpreadsheetExporter:
     def _rows_equal(left: Mapping[str, Mapping[str, str]], right: Mapping[str, Mapping[str, str]]) -> bool:
         return dict(left) == dict(right)
 
-    def _write_rows(self, path: Path, rows_by_key: Mapping[str, Mapping[str, str]]) -> bool:
-        """Atomically replace one CSV after retaining a one-generation backup."""
+    def _history_name(self, path: Path) -> str:
         try:
-            path.parent.mkdir(parents=True, exist_ok=True)
-            if self._data_row_count(path) > 0:
-                try:
-                    shutil.copy2(path, self._backup_path(path))
-                except Exception as backup_exc:
-                    self.last_error = f"backup failed for {path.name}: {backup_exc!r}"
-            fd, tmp_name = tempfile.mkstemp(
-                prefix=path.stem + ".",
-                suffix=".tmp",
-                dir=str(path.parent),
-            )
-            try:
-                with os.fdopen(fd, "w", newline="", encoding="utf-8-sig") as handle:
-                    writer = csv.DictWriter(handle, fieldnames=CSV_FIELDS, extrasaction="ignore")
-                    writer.writeheader()
-                    writer.writerows(sorted(
-                        rows_by_key.values(),
-                        key=lambda row: (
-                            row.get("character", "").lower(),
-                            row.get("move_kind", "").lower(),
-                            _as_int(row.get("move_id_decimal")) or 0,
-                            _as_int(row.get("hit_segment")) or 0,
-                            row.get("move_label", "").lower(),
-                        ),
-                    ))
-                    handle.flush()
-                    try:
-                        os.fsync(handle.fileno())
-                    except OSError:
-                        pass
-                os.replace(tmp_name, path)
-            finally:
+            return Path(path).resolve().relative_to(self.path.parent.resolve()).as_posix()
+        except ValueError:
+            return Path(path).name
+
+    def _record_unseen_version(self, path: Path) -> None:
+        """Record a file's current content if it was written outside the exporter."""
+        stamp = _file_stamp(path)
+        if stamp is None or self._history_stamps.get(path) == stamp:
+            return
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return
+        if data:
+            self.history.record(self._history_name(path), data, source="external")
+
+    def _replace_file(self, path: Path, data: bytes) -> None:
+        """Atomically replace one export and record the new content in history."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._record_unseen_version(path)
+        fd, tmp_name = tempfile.mkstemp(
+            prefix=path.stem + ".",
+            suffix=".tmp",
+            dir=str(path.parent),
+        )
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(data)
+                handle.flush()
                 try:
-                    if os.path.exists(tmp_name):
-                        os.unlink(tmp_name)
+                    os.fsync(handle.fileno())
                 except OSError:
                     pass
+            os.replace(tmp_name, path)
+        finally:
+            try:
+                if os.path.exists(tmp_name):
+                    os.unlink(tmp_name)
+            except OSError:
+                pass
+        self._history_stamps[path] = _file_stamp(path)
+        self.history.record(self._history_name(path), data)
+        if self.history.last_error:
+            self.last_error = self.history.last_error
+            self.history.last_error = ""
+
+    def _write_rows(self, path: Path, rows_by_key: Mapping[str, Mapping[str, str]]) -> bool:
+        """Atomically replace one CSV; the replaced version stays in export history."""
+        try:
+            buffer = io.StringIO(newline="")
+            writer = csv.DictWriter(buffer, fieldnames=CSV_FIELDS, extrasaction="ignore")
+            writer.writeheader()
+            writer.writerows(sorted(rows_by_key.values(), key=_row_sort_key))
             self.last_error = ""
+            self._replace_file(path, buffer.getvalue().encode("utf-8-sig"))
             self.last_write_count = len(rows_by_key)
             return True
         except Exception as exc:
@@ -661,6 +794,132 @@ class FrameDataSpreadsheetExporter:
             if path.is_file() and not path.name.lower().endswith(".previous.csv")
         )
 
+    @property
+    def manifest_path(self) -> Path:
+        return self.character_directory / EXPORT_MANIFEST_NAME
+
+    def _load_manifest(self) -> dict[str, Any]:
+        if self._manifest is None:
+            manifest: Any = None
+            try:
+                manifest = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+            except Exception:
+                manifest = None
+            if not isinstance(manifest, dict) or manifest.get("version") != EXPORT_MANIFEST_VERSION:
+                manifest = {"version": EXPORT_MANIFEST_VERSION, "sources": {}}
+            if not isinstance(manifest.get("sources"), dict):
+                manifest["sources"] = {}
+            self._manifest = manifest
+        return self._manifest
+
+    def _save_manifest(self) -> None:
+        if not self._manifest_dirty:
+            return
+        manifest = self._load_manifest()
+        try:
+            fd, tmp_name = tempfile.mkstemp(prefix="_export_manifest.", suffix=".tmp", dir=str(self.character_directory))
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                    json.dump(manifest, handle, separators=(",", ":"), sort_keys=True)
+                os.replace(tmp_name, self.manifest_path)
+                self._manifest_dirty = False
+            finally:
+                if os.path.exists(tmp_name):
+                    os.unlink(tmp_name)
+        except Exception as exc:
+            self.last_error = f"manifest write failed: {exc!r}"
+
+    def _record_source(self, path: Path, rows: Mapping[str, Mapping[str, str]], *, scan_digest: str = "") -> None:
+        self._manifest_dirty = True
+        self._load_manifest()["sources"][path.name] = {
+            "stamp": _file_stamp(path),
+            "scan_digest": scan_digest,
+            "rows": {key: _row_digest(row) for key, row in rows.items()},
+        }
+
+    def _external_source_changes(self) -> dict[str, dict[str, str]]:
+        """Rows from source CSVs changed outside this exporter since the manifest."""
+        sources = self._load_manifest()["sources"]
+        changed: dict[str, dict[str, str]] = {}
+        for path in self._source_csv_paths():
+            entry = sources.get(path.name)
+            if isinstance(entry, dict) and entry.get("stamp") == _file_stamp(path):
+                continue
+            rows = self._read_rows(path)
+            known = entry.get("rows") if isinstance(entry, dict) else None
+            for key, row in rows.items():
+                if not isinstance(known, dict) or known.get(key) != _row_digest(row):
+                    changed[key] = row
+            self._record_source(path, rows, scan_digest="")
+            self._rows_by_path.pop(path, None)
+            self._loaded_paths.discard(path)
+        return changed
+
+    def _master_rows_index(self) -> dict[str, tuple[tuple, str, str, tuple[str, str]]]:
+        stamp = _file_stamp(self.path)
+        if self._master_index is None or stamp != self._master_stamp:
+            self._master_index = {
+                key: (_row_sort_key(row), _row_digest(row), _csv_line(row),
+                      (row.get("manual_verification", ""), row.get("research_notes", "")))
+                for key, row in self._read_rows(self.path).items()
+            }
+            self._master_stamp = stamp
+        return self._master_index
+
+    def _write_master_index(self, index: Mapping[str, tuple[tuple, str, str, tuple[str, str]]]) -> bool:
+        """Write the master from cached serialized lines, keeping the same layout."""
+        path = self.path
+        try:
+            parts = [_csv_line({field: field for field in CSV_FIELDS})]
+            parts.extend(entry[2] for entry in sorted(index.values(), key=lambda item: item[0]))
+            self.last_error = ""
+            self._replace_file(path, "".join(parts).encode("utf-8-sig"))
+            self._master_stamp = _file_stamp(path)
+            self.last_write_count = len(index)
+            return True
+        except Exception as exc:
+            self.last_error = f"write failed for {path.name}: {exc!r}"
+            return False
+
+    def update_master_incrementally(self, changed_rows: Mapping[str, Mapping[str, str]] | None = None) -> bool:
+        """Patch the master with changed rows instead of recompiling every source.
+
+        Source files edited outside the exporter (detected through the manifest
+        stamps) are folded in as well.  Manual review columns already in the
+        master survive exactly as in a full compile.
+        """
+        with self._lock:
+            index = self._master_rows_index()
+            incoming: dict[str, Mapping[str, str]] = dict(changed_rows or {})
+            incoming.update(self._external_source_changes())
+            changed = 0
+            for key, row in incoming.items():
+                updated = {field: _as_text(row.get(field)) for field in CSV_FIELDS}
+                updated["row_key"] = key
+                prior = index.get(key)
+                if prior is not None:
+                    for manual_key, manual_value in zip(("manual_verification", "research_notes"), prior[3]):
+                        if not updated[manual_key]:
+                            updated[manual_key] = manual_value
+                digest = _row_digest(updated)
+                if prior is not None and prior[1] == digest:
+                    continue
+                index[key] = (
+                    _row_sort_key(updated),
+                    digest,
+                    _csv_line(updated),
+                    (updated["manual_verification"], updated["research_notes"]),
+                )
+                changed += 1
+            self.last_master_row_count = len(index)
+            self.last_master_changed_rows = changed
+            self._save_manifest()
+            if not index:
+                return False
+            if changed == 0 and self.path.exists():
+                return True
+            return self._write_master_index(index)
+
     def compile_master_from_character_exports(self) -> bool:
         """Merge every per-character CSV into the established master workbook.
 
@@ -676,6 +935,7 @@ class FrameDataSpreadsheetExporter:
             source_count = 0
             for source_path in self._source_csv_paths():
                 source_rows = self._read_rows(source_path)
+                self._record_source(source_path, source_rows)
                 if not source_rows:
                     continue
                 source_count += 1
@@ -684,6 +944,8 @@ class FrameDataSpreadsheetExporter:
                     updated["row_key"] = key
                     merged[key] = self._preserve_manual_columns(updated, existing_master.get(key))
             self.last_master_row_count = len(merged)
+            self._master_index = None
+            self._save_manifest()
             # No sources and no existing master means there is nothing to create.
             if source_count == 0 and not existing_master:
                 return False
@@ -695,11 +957,12 @@ class FrameDataSpreadsheetExporter:
     rebuild_master = compile_master_from_character_exports
 
     def _upsert_scan_rows_sync(self, scan_rows: Iterable[Mapping[str, Any]] | None, *, rebuild_master: bool = True) -> bool:
-        """Write each observed character first, then rebuild the shared master.
+        """Write each changed character first, then patch the shared master.
 
-        A four-character rich scan updates at most four durable source files.
-        Only after those writes succeed does the compiler scan the entire source
-        folder and merge it into ``data/exports/TvC_Frame_Data_Observed.csv``.
+        A four-character rich scan updates at most four durable source files,
+        and characters whose logical rows hash the same as last time are not
+        touched at all.  Only rows that changed are then merged into
+        ``data/exports/TvC_Frame_Data_Observed.csv``.
         """
         with self._lock:
             seen_utc = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
@@ -721,33 +984,58 @@ class FrameDataSpreadsheetExporter:
             wrote_character_source = False
             observed_character_file = False
             self.last_character_write_count = 0
+            self.last_character_skip_count = 0
+            sources = self._load_manifest()["sources"]
+            changed_rows: dict[str, dict[str, str]] = {}
             for char_path, (slot, moves) in grouped.items():
-                rows = self._load_existing(char_path)
-                changed = False
+                built: dict[str, dict[str, str]] = {}
                 for move in moves:
                     key = _row_key(slot, move)
                     if not key or key.startswith("0|"):
                         continue
-                    updated = self._build_row(slot, move, seen_utc=seen_utc)
-                    updated = self._preserve_manual_columns(updated, rows.get(key))
-                    if rows.get(key) != updated:
-                        rows[key] = updated
-                        changed = True
-                if changed:
+                    built[key] = self._build_row(slot, move, seen_utc=seen_utc)
+                scan_digest = _rows_digest(_row_digest(row) for row in built.values())
+                entry = sources.get(char_path.name)
+                if (
+                    isinstance(entry, dict)
+                    and entry.get("scan_digest") == scan_digest
+                    and entry.get("stamp") == _file_stamp(char_path)
+                ):
+                    self.last_character_skip_count += 1
+                    observed_character_file = True
+                    continue
+
+                rows = self._load_existing(char_path)
+                changed_keys: list[str] = []
+                for key, updated in built.items():
+                    prior = rows.get(key)
+                    updated = self._preserve_manual_columns(updated, prior)
+                    if prior is not None and _row_digest(prior) == _row_digest(updated):
+                        continue
+                    rows[key] = updated
+                    changed_keys.append(key)
+                if changed_keys:
                     if self._write_rows(char_path, rows):
                         wrote_character_source = True
                         observed_character_file = True
                         self.last_character_write_count += 1
+                        changed_rows.update((key, rows[key]) for key in changed_keys)
+                        self._record_source(char_path, rows, scan_digest=scan_digest)
                 elif char_path.exists():
                     observed_character_file = True
+                    self._record_source(char_path, rows, scan_digest=scan_digest)
 
             if wrote_character_source:
                 if not rebuild_master:
+                    self._pending_master_rows.update(changed_rows)
+                    self._save_manifest()
                     return True
-                master_ok = self.compile_master_from_character_exports()
+                master_ok = self.update_master_incrementally(changed_rows)
                 if not master_ok and not self.last_error:
                     self.last_error = "master compile did not produce a CSV"
                 return master_ok
+            if grouped:
+                self._save_manifest()
             # A prior source may have been created by another run; still allow
             # a completed rich result to heal a missing master without touching
             # scanner behavior.
@@ -773,7 +1061,10 @@ class FrameDataSpreadsheetExporter:
 
             if processed:
                 try:
-                    self.compile_master_from_character_exports()
+                    with self._lock:
+                        changed_rows, self._pending_master_rows = self._pending_master_rows, {}
+                    if changed_rows or not self.path.exists():
+                        self.update_master_incrementally(changed_rows)
                     print(f"[fd sheet] background export complete: {self.path}", flush=True)
                 except Exception as exc:
                     self.last_error = f"background master compile failed: {exc!r}"
@@ -1,14 +1,23 @@
-"""Persistent observed timing values collected during normal play."""
+"""Persistent observed timing values collected during normal play.
+
+Samples are folded into the in-memory document on the caller's thread and
+written out later by a background flusher, one file per character, so
+recording a sample never serializes the whole roster.  The original single
+document is still read as the seed; a character's partition file replaces its
+seed entry once that character has been written.
+"""
 from __future__ import annotations
 
 import json
 import os
 import threading
+import time
 from collections import Counter
 from copy import deepcopy
 from typing import Any
 
 from tvcgui.core.paths import user_data_path
+from tvcgui.runtime.deferred_work import DeferredWorkLoop
 
 OBSERVATION_VERSION = 1
 OBSERVATION_FILE = user_data_path("frame_data", "timing_observations.json")
@@ -16,9 +25,24 @@ AUTO_FILL_MATCHES = 2
 CONFIRMED_MATCHES = 3
 MAX_SAMPLES_PER_FIELD = 16
 BLOCK_ADVANTAGE_OBSERVATION_ENABLED = False
+# Samples recorded within this window are written by one flush.
+FLUSH_COALESCE_SEC = 1.0
+PARTITION_DIR_SUFFIX = "_by_character"
 
 _LOCK = threading.RLock()
 _DOC: dict[str, Any] | None = None
+# char id -> partition directory captured when the character was dirtied.
+_DIRTY: dict[str, str] = {}
+_PENDING_SAMPLES = 0
+_FLUSHER: DeferredWorkLoop | None = None
+_STATS: dict[str, Any] = {
+    "recorded": 0,
+    "flushes": 0,
+    "partitions_written": 0,
+    "write_errors": 0,
+    "last_flush_ms": 0.0,
+    "max_flush_ms": 0.0,
+}
 
 
 def _empty_doc() -> dict[str, Any]:
@@ -49,6 +73,33 @@ def _write_doc_file(doc: dict[str, Any]) -> None:
     os.replace(tmp, OBSERVATION_FILE)
 
 
+def _partition_dir() -> str:
+    return os.path.splitext(os.path.abspath(OBSERVATION_FILE))[0] + PARTITION_DIR_SUFFIX
+
+
+def _partition_path(directory: str, char_id: str) -> str:
+    return os.path.join(directory, f"char_{char_id}.json")
+
+
+def _read_partitions(directory: str) -> dict[str, dict[str, Any]]:
+    out: dict[str, dict[str, Any]] = {}
+    try:
+        names = sorted(os.listdir(directory))
+    except OSError:
+        return out
+    for name in names:
+        if not (name.startswith("char_") and name.endswith(".json")):
+            continue
+        try:
+            with open(os.path.join(directory, name), "r", encoding="utf-8") as handle:
+                row = json.load(handle)
+        except Exception:
+            continue
+        if isinstance(row, dict) and int(row.get("version") or 0) == OBSERVATION_VERSION:
+            out[name[len("char_"):-len(".json")]] = {"moves": row.get("moves") or {}}
+    return out
+
+
 def _load() -> dict[str, Any]:
     global _DOC
     with _LOCK:
@@ -67,15 +118,91 @@ def _load() -> dict[str, Any]:
                 _write_doc_file(data)
             except Exception:
                 pass
+        partitions = _read_partitions(_partition_dir())
+        if partitions:
+            data["characters"].update(partitions)
+            stripped = {"characters": partitions}
+            if _strip_untrusted_block_advantage(stripped):
+                _DIRTY.update((char_id, _partition_dir()) for char_id in partitions)
         _DOC = data
         return _DOC
 
 
-def _save(doc: dict[str, Any]) -> None:
-    global _DOC
+def _write_partition(directory: str, char_id: str, serialized: str) -> None:
+    os.makedirs(directory, exist_ok=True)
+    target = _partition_path(directory, char_id)
+    tmp = f"{target}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as handle:
+        handle.write(serialized)
+    os.replace(tmp, target)
+
+
+def flush_timing_observations() -> int:
+    """Write every dirty character partition now; return how many were written."""
+    global _PENDING_SAMPLES
+    started = time.perf_counter()
     with _LOCK:
-        _write_doc_file(doc)
-        _DOC = doc
+        if not _DIRTY or _DOC is None:
+            return 0
+        chars = _DOC.get("characters") or {}
+        batch: list[tuple[str, str, str]] = []
+        for char_id, directory in _DIRTY.items():
+            row = chars.get(char_id)
+            if isinstance(row, dict):
+                payload = {"version": OBSERVATION_VERSION, "char_id": char_id, "moves": row.get("moves") or {}}
+                batch.append((char_id, directory, json.dumps(payload, sort_keys=True, separators=(",", ":"))))
+        _DIRTY.clear()
+        _PENDING_SAMPLES = 0
+
+    failed: list[tuple[str, str]] = []
+    for char_id, directory, serialized in batch:
+        try:
+            _write_partition(directory, char_id, serialized)
+        except Exception:
+            failed.append((char_id, directory))
+
+    elapsed_ms = (time.perf_counter() - started) * 1000.0
+    with _LOCK:
+        for char_id, directory in failed:
+            _DIRTY.setdefault(char_id, directory)
+        _STATS["flushes"] += 1
+        _STATS["partitions_written"] += len(batch) - len(failed)
+        _STATS["write_errors"] += len(failed)
+        _STATS["last_flush_ms"] = round(elapsed_ms, 3)
+        _STATS["max_flush_ms"] = round(max(float(_STATS["max_flush_ms"]), elapsed_ms), 3)
+    return len(batch) - len(failed)
+
+
+def _request_flush() -> None:
+    global _FLUSHER
+    with _LOCK:
+        if _FLUSHER is None:
+            _FLUSHER = DeferredWorkLoop(
+                flush_timing_observations,
+                interval=FLUSH_COALESCE_SEC,
+                name="TvCTimingObservationWriter",
+            )
+        flusher = _FLUSHER
+    flusher.request()
+
+
+def close_timing_observations() -> None:
+    """Stop the background writer and flush whatever is still pending."""
+    global _FLUSHER
+    with _LOCK:
+        flusher, _FLUSHER = _FLUSHER, None
+    if flusher is not None:
+        flusher.close(final_callback=flush_timing_observations)
+    else:
+        flush_timing_observations()
+
+
+def get_observation_store_stats() -> dict[str, Any]:
+    with _LOCK:
+        out = dict(_STATS)
+        out["queue_depth"] = _PENDING_SAMPLES
+        out["dirty_partitions"] = len(_DIRTY)
+    return out
 
 
 def _consensus(samples: list[int]) -> dict[str, Any]:
@@ -121,8 +248,9 @@ def record_timing_result(result: Any) -> dict[str, Any]:
     if not fields:
         return {}
 
+    global _PENDING_SAMPLES
     with _LOCK:
-        doc = deepcopy(_load())
+        doc = _load()
         chars = doc.setdefault("characters", {})
         char_row = chars.setdefault(str(char_id), {"moves": {}})
         moves = char_row.setdefault("moves", {})
@@ -136,8 +264,12 @@ def record_timing_result(result: Any) -> dict[str, Any]:
             samples.append(int(value))
             row["samples"] = samples[-MAX_SAMPLES_PER_FIELD:]
             row.update(_consensus(row["samples"]))
-        _save(doc)
-        return deepcopy(move)
+        _DIRTY[str(char_id)] = _partition_dir()
+        _PENDING_SAMPLES += 1
+        _STATS["recorded"] += 1
+        result = deepcopy(move)
+    _request_flush()
+    return result
 
 
 def get_move_observations(char_id: int, action_id: int) -> dict[str, Any]:
@@ -236,6 +368,9 @@ __all__ = [
     "CONFIRMED_MATCHES",
     "BLOCK_ADVANTAGE_OBSERVATION_ENABLED",
     "record_timing_result",
+    "flush_timing_observations",
+    "close_timing_observations",
+    "get_observation_store_stats",
     "get_move_observations",
     "apply_observations_to_scan_data",
     "summarize_move_observations",
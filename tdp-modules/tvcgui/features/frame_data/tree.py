@@ -23,9 +23,12 @@ from .patterns import (
     find_post_animation_link_addr,
     fmt_attack_property,
     find_hit_result_flags_addr,
+    MoveRegionPrefetch,
 )
 from .widgets import Tooltip, get_field_help
 from .move_families import annotate_move_families
+from .filter_index import FrameFilterIndex
+from tvcgui.platform.move_memory import move_memory_char_key, move_memory_reader
 from . import projectile_integration as FPI
 from . import super_integration as FSI
 
@@ -1068,6 +1071,47 @@ def _build_inspector(win, parent: ttk.Frame) -> None:
     except Exception:
         pass
 
+class IndexedTreeview(ttk.Treeview):
+    """Treeview that mirrors its rows into a :class:`FrameFilterIndex`.
+
+    Every insert, cell write, move and delete already goes through these
+    methods, so the mirror stays current without touching the hundred-odd
+    editor call sites.  Filtering reads the mirror instead of Tk.
+    """
+
+    def __init__(self, master=None, **kw):
+        super().__init__(master, **kw)
+        self.filter_index = FrameFilterIndex(self["columns"])
+
+    def insert(self, parent, index, iid=None, **kw):
+        iid = super().insert(parent, index, iid=iid, **kw)
+        self.filter_index.insert(parent, index, iid, kw.get("values") or ())
+        return iid
+
+    def delete(self, *items):
+        super().delete(*items)
+        for item in items:
+            self.filter_index.delete(item)
+
+    def move(self, item, parent, index):
+        super().move(item, parent, index)
+        self.filter_index.move(item, parent, index)
+
+    reattach = move
+
+    def set(self, item, column=None, value=None):
+        result = super().set(item, column, value)
+        if column is not None and value is not None:
+            self.filter_index.set_value(item, column, value)
+        return result
+
+    def item(self, item, option=None, **kw):
+        result = super().item(item, option, **kw)
+        if "values" in kw:
+            self.filter_index.set_values(item, kw.get("values") or ())
+        return result
+
+
 def build_tree_widget(win) -> ttk.Frame:
     body = ttk.Panedwindow(win.root, orient="horizontal")
     body.pack(fill="both", expand=True, padx=10, pady=(0, 8))
@@ -1453,7 +1497,7 @@ def build_tree_widget(win) -> ttk.Frame:
     win._toggle_advanced_filters = _toggle_advanced_filters
 
     # --- Tree ---
-    win.tree = ttk.Treeview(tree_wrap, columns=cols, show="tree headings", height=30, selectmode="browse")
+    win.tree = IndexedTreeview(tree_wrap, columns=cols, show="tree headings", height=30, selectmode="browse")
 
     vsb = ttk.Scrollbar(tree_wrap, orient="vertical", command=win.tree.yview)
     hsb = ttk.Scrollbar(tree_wrap, orient="horizontal", command=win.tree.xview)
@@ -1962,30 +2006,23 @@ def _populate_tree_sync(win) -> None:
 
     # Opening the workbench used to issue several separate Dolphin reads per
     # row while resolving optional fields such as speed, SuperBG, hit spark,
-    # stretch, and post-link.  Cache reads for the duration of this population
-    # pass so each move block is normally read once at the largest requested
-    # size, then sliced for the smaller scanners.  Refresh/rebuild still gets
-    # fresh memory because this cache is intentionally local to populate_tree().
-    _fd_read_cache: dict[int, bytes] = {}
-    _fd_rbytes_func = None
-
-    def _fd_cached_rbytes(addr: int, size: int) -> bytes:
-        nonlocal _fd_rbytes_func
-        if _fd_rbytes_func is None:
-            from tvcgui.platform.dolphin import rbytes as _real_rbytes
-            _fd_rbytes_func = _real_rbytes
-        try:
-            addr_i = int(addr or 0)
-            size_i = max(0, int(size or 0))
-        except Exception:
-            return b""
-        cached = _fd_read_cache.get(addr_i)
-        if cached is not None and len(cached) >= size_i:
-            return cached[:size_i]
-        data = _fd_rbytes_func(addr_i, size_i) or b""
-        if cached is None or len(data) >= len(cached):
-            _fd_read_cache[addr_i] = data
-        return data
+    # stretch, and post-link.  When deep probing is on, read the character's
+    # move script region once for the whole population pass and run every
+    # finder against that buffer; finder results are memoised per region
+    # fingerprint, so repopulating an unchanged character skips the scans.
+    # The region read goes through the session move-memory cache, so a
+    # workbench, cancel lab or dump that already read this character's moves
+    # in the current memory generation is reused.
+    _fd_prefetch = None
+
+    def _fd_region():
+        nonlocal _fd_prefetch
+        if _fd_prefetch is None:
+            _fd_prefetch = MoveRegionPrefetch(
+                move_memory_reader(move_memory_char_key(win.target_slot)),
+                (m.get("abs") for m in (win.moves or []) if isinstance(m, dict)),
+            )
+        return _fd_prefetch
 
     # Fast open path: the normal scanner already provides damage/startup/active/
     # stun/KB.  These extra probe finders are expensive because they read and
@@ -2104,16 +2141,16 @@ def _populate_tree_sync(win) -> None:
 
         if move_abs and deep_probe:
             try:
-                rbytes = _fd_cached_rbytes
+                region = _fd_region()
                 if mv.get("hit_spark_addr") is None:
-                    _sp_pkt, _sp_addr, _sp_val, _sp_ctx = find_hit_spark_addr(move_abs, rbytes)
+                    _sp_pkt, _sp_addr, _sp_val, _sp_ctx = region.run(find_hit_spark_addr, move_abs)
                     if _sp_addr:
                         mv["hit_spark_packet_addr"] = _sp_pkt
                         mv["hit_spark_addr"] = _sp_addr
                         mv["hit_spark"] = _sp_val
                         mv["hit_spark_sig"] = _sp_ctx
                 if mv.get("stretch_packet_addr") is None:
-                    _stretch = find_limb_stretch_packet(move_abs, rbytes)
+                    _stretch = region.run(find_limb_stretch_packet, move_abs)
                     if _stretch:
                         mv["stretch_packet_addr"] = _stretch.get("packet_addr")
                         mv["stretch_part_addr"] = _stretch.get("part_addr")
@@ -2128,7 +2165,7 @@ def _populate_tree_sync(win) -> None:
                         mv["stretch_time"] = _stretch.get("timing")
                         mv["stretch_sig"] = _stretch.get("context")
                 if mv.get("post_link_addr") is None:
-                    _pl_pkt, _pl_addr, _pl_val, _pl_ctx = find_post_animation_link_addr(move_abs, rbytes)
+                    _pl_pkt, _pl_addr, _pl_val, _pl_ctx = region.run(find_post_animation_link_addr, move_abs)
                     if _pl_addr:
                         mv["post_link_packet_addr"] = _pl_pkt
                         mv["post_link_addr"] = _pl_addr
@@ -2149,8 +2186,7 @@ def _populate_tree_sync(win) -> None:
         if move_abs and deep_probe:
             if mv.get("speed_mod_addr") is None:
                 try:
-                    rbytes = _fd_cached_rbytes
-                    saddr, sval, _ = find_speed_mod_addr(move_abs, rbytes)
+                    saddr, sval, _ = _fd_region().run(find_speed_mod_addr, move_abs)
                     if saddr:
                         mv["speed_mod_addr"] = saddr
                         mv["speed_mod"] = sval
@@ -2165,8 +2201,7 @@ def _populate_tree_sync(win) -> None:
         if move_abs and deep_probe:
             if mv.get("attack_property_addr") is None:
                 try:
-                    rbytes = _fd_cached_rbytes
-                    ap_addr, ap_val, _ = find_attack_property_addr(move_abs, rbytes)
+                    ap_addr, ap_val, _ = _fd_region().run(find_attack_property_addr, move_abs)
                     if ap_addr:
                         mv["attack_property_addr"] = ap_addr
                         mv["attack_property"] = ap_val
@@ -2179,9 +2214,8 @@ def _populate_tree_sync(win) -> None:
         if move_abs and deep_probe:
             if mv.get("superbg_addr") is None:
                 try:
-                    from tvcgui.platform.dolphin import rd8
-                    rbytes = _fd_cached_rbytes
-                    saddr, sval = find_superbg_addr(move_abs, rbytes, rd8)
+                    region = _fd_region()
+                    saddr, sval = region.run(find_superbg_addr, move_abs, region.rd8)
                     if saddr:
                         mv["superbg_addr"] = saddr
                         mv["superbg_val"] = sval
@@ -2200,8 +2234,7 @@ def _populate_tree_sync(win) -> None:
         # resolves it on demand.
         if move_abs and deep_probe and mv.get("hit_result_addr") is None:
             try:
-                rbytes = _fd_cached_rbytes
-                _pkt, _addr, _val, _mask, _ctx = find_hit_result_flags_addr(move_abs, rbytes)
+                _pkt, _addr, _val, _mask, _ctx = _fd_region().run(find_hit_result_flags_addr, move_abs)
                 if _addr is not None:
                     mv["hit_result_packet_addr"] = _pkt
                     mv["hit_result_addr"] = _addr
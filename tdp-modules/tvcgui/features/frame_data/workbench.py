@@ -4,6 +4,7 @@ import os
 import sys
 import struct
 import threading
+import time
 import re
 from collections import deque
 from datetime import datetime
@@ -15,6 +16,7 @@ from . import utils as U
 from . import tree as fd_tree
 from . import projectile_integration as FPI
 from . import super_integration as FSI
+from . import edit_sets as FES
 from . import ui_prefs as FDUIPrefs
 from .timing_observations import apply_observations_to_scan_data
 try:
@@ -42,6 +44,7 @@ from .patterns import (
     parse_attack_property,
     ATTACK_PROPERTY_VALUES,
     SUPERBG_ON,
+    MoveRegionPrefetch,
 )
 
 from .write_helpers import (
@@ -57,6 +60,7 @@ from .write_helpers import (
 
 from tvcgui.core.tk_host import tk_call
 from tvcgui.core.paths import resource_path
+from tvcgui.platform.move_memory import invalidate_move_memory, move_memory_char_key, move_memory_reader
 from tvcgui.features.combat.move_filters import filter_purged_moves_for_char, is_purged_move_label
 try:
     from tvcgui.features.training.protection_profiler import apply_runtime_protection_observations, default_profile_path
@@ -270,6 +274,8 @@ class EditableFrameDataWindow(FDCellEditorsMixin):
         self._session_summary_var: tk.StringVar | None = None
         self._undo_stack: list[tuple] = []
         self._redo_stack: list[dict] = []
+        # Disk journal for batched edit sets (opened on first use).
+        self._edit_journal: FES.EditJournal | None = None
         self._undo_button: ttk.Button | None = None
         self._redo_button: ttk.Button | None = None
         self._changed_only = False
@@ -337,6 +343,7 @@ class EditableFrameDataWindow(FDCellEditorsMixin):
         self._optional_probe_generation = 0
         self._optional_probe_total = 0
         self._optional_probe_done_count = 0
+        self._optional_probe_prefetch = None
 
 
         # Shareable frame-data patch config support. A saved patch stores only
@@ -928,6 +935,8 @@ class EditableFrameDataWindow(FDCellEditorsMixin):
             ("Refresh visible optional fields", self._refresh_visible),
             ("Save patch", self._save_fd_patch_config),
             ("Load patch", self._load_fd_patch_config),
+            ("Reapply journaled edits", self._reapply_journaled_edits),
+            ("Field diff explorer", self._open_field_diff_explorer),
             ("Undo last edit", self._undo_last_change),
             ("Redo last edit", self._redo_last_change),
             ("Reset all changed values", self._reset_all_moves),
@@ -2265,7 +2274,7 @@ class EditableFrameDataWindow(FDCellEditorsMixin):
         except Exception:
             pass
 
-    def _compute_optional_probe_updates(self, mv_snapshot: dict, *, force: bool = False) -> dict:
+    def _compute_optional_probe_updates(self, mv_snapshot: dict, *, force: bool = False, region=None) -> dict:
         """Pure/background-safe optional probe scanner.
 
         Never touches Tk objects.  It reads Dolphin memory, resolves loose packet
@@ -2282,11 +2291,7 @@ class EditableFrameDataWindow(FDCellEditorsMixin):
         if not move_abs:
             return updates
 
-        try:
-            from tvcgui.platform.dolphin import rbytes as _real_rbytes
-        except Exception as e:
-            updates["_optional_probe_error"] = repr(e)
-            return updates
+        _real_rbytes = move_memory_reader(move_memory_char_key(self.target_slot))
 
         read_cache: dict[tuple[int, int], bytes] = {}
 
@@ -2314,13 +2319,22 @@ class EditableFrameDataWindow(FDCellEditorsMixin):
             read_cache[(addr_i, size_i)] = data
             return data
 
-        def _cached_rd8(addr: int):
-            data = _cached_rbytes(addr, 1)
-            return data[0] if data and len(data) >= 1 else None
+        # A worker batch passes the character's MoveRegionPrefetch so every
+        # finder slices one region read and repeats hit the finder memo.
+        if region is not None:
+            _find = region.run
+            _cached_rd8 = region.rd8
+        else:
+            def _find(finder, addr, *args):
+                return finder(addr, _cached_rbytes, *args)
+
+            def _cached_rd8(addr: int):
+                data = _cached_rbytes(addr, 1)
+                return data[0] if data and len(data) >= 1 else None
 
         try:
             if force or mv_snapshot.get("hit_spark_addr") is None:
-                sp_pkt, sp_addr, sp_val, sp_ctx = find_hit_spark_addr(move_abs, _cached_rbytes)
+                sp_pkt, sp_addr, sp_val, sp_ctx = _find(find_hit_spark_addr, move_abs)
                 if sp_addr:
                     updates.update({
                         "hit_spark_packet_addr": sp_pkt,
@@ -2333,7 +2347,7 @@ class EditableFrameDataWindow(FDCellEditorsMixin):
 
         try:
             if force or mv_snapshot.get("stretch_packet_addr") is None:
-                stretch = find_limb_stretch_packet(move_abs, _cached_rbytes)
+                stretch = _find(find_limb_stretch_packet, move_abs)
                 if stretch:
                     updates.update({
                         "stretch_packet_addr": stretch.get("packet_addr"),
@@ -2354,7 +2368,7 @@ class EditableFrameDataWindow(FDCellEditorsMixin):
 
         try:
             if force or mv_snapshot.get("post_link_addr") is None:
-                pl_pkt, pl_addr, pl_val, pl_ctx = find_post_animation_link_addr(move_abs, _cached_rbytes)
+                pl_pkt, pl_addr, pl_val, pl_ctx = _find(find_post_animation_link_addr, move_abs)
                 if pl_addr:
                     updates.update({
                         "post_link_packet_addr": pl_pkt,
@@ -2367,7 +2381,7 @@ class EditableFrameDataWindow(FDCellEditorsMixin):
 
         try:
             if force or mv_snapshot.get("speed_mod_addr") is None:
-                saddr, sval, ssig = find_speed_mod_addr(move_abs, _cached_rbytes)
+                saddr, sval, ssig = _find(find_speed_mod_addr, move_abs)
                 if saddr:
                     updates.update({
                         "speed_mod_addr": saddr,
@@ -2379,7 +2393,7 @@ class EditableFrameDataWindow(FDCellEditorsMixin):
 
         try:
             if force or mv_snapshot.get("attack_property_addr") is None:
-                ap_addr, ap_val, ap_sig = find_attack_property_addr(move_abs, _cached_rbytes)
+                ap_addr, ap_val, ap_sig = _find(find_attack_property_addr, move_abs)
                 if ap_addr:
                     updates.update({
                         "attack_property_addr": ap_addr,
@@ -2391,7 +2405,7 @@ class EditableFrameDataWindow(FDCellEditorsMixin):
 
         try:
             if force or mv_snapshot.get("superbg_addr") is None:
-                saddr, sval = find_superbg_addr(move_abs, _cached_rbytes, _cached_rd8)
+                saddr, sval = _find(find_superbg_addr, move_abs, _cached_rd8)
                 if saddr:
                     updates.update({
                         "superbg_addr": saddr,
@@ -2406,7 +2420,7 @@ class EditableFrameDataWindow(FDCellEditorsMixin):
         try:
             if force or mv_snapshot.get("hit_result_addr") is None:
                 from .patterns import find_hit_result_flags_addr
-                pkt, addr, value, clear_mask, ctx = find_hit_result_flags_addr(move_abs, _cached_rbytes)
+                pkt, addr, value, clear_mask, ctx = _find(find_hit_result_flags_addr, move_abs)
                 if addr is not None:
                     updates.update({
                         "hit_result_packet_addr": pkt,
@@ -2461,16 +2475,37 @@ class EditableFrameDataWindow(FDCellEditorsMixin):
                 pass
         return True
 
+    def _optional_probe_region(self, generation: int):
+        """Character-wide MoveRegionPrefetch for one worker batch.
+
+        Rebuilt when the probe generation changes (new character / rebuild);
+        ``max_age`` re-reads a cluster after a couple of seconds so edits made
+        while a long Refresh batch is running are still picked up.  Reads go
+        through the session move-memory cache, which drops them after a write.
+        """
+        region = getattr(self, "_optional_probe_prefetch", None)
+        if region is not None and region[0] == generation:
+            return region[1]
+        prefetch = MoveRegionPrefetch(
+            move_memory_reader(move_memory_char_key(self.target_slot)),
+            [mv.get("abs") for mv in list(getattr(self, "moves", None) or []) if isinstance(mv, dict)],
+            max_age=2.0,
+        )
+        self._optional_probe_prefetch = (generation, prefetch)
+        return prefetch
+
     def _optional_probe_worker(self) -> None:
         while True:
             with self._optional_probe_lock:
                 if self._optional_probe_stop or not self._optional_probe_queue:
                     self._optional_probe_thread = None
+                    self._optional_probe_prefetch = None
                     return
                 generation, item_id, mv_snapshot, force = self._optional_probe_queue.popleft()
                 self._optional_probe_queued_keys.discard((generation, item_id, bool(force)))
             try:
-                updates = self._compute_optional_probe_updates(mv_snapshot, force=force)
+                region = self._optional_probe_region(generation)
+                updates = self._compute_optional_probe_updates(mv_snapshot, force=force, region=region)
             except Exception as e:
                 updates = {"_optional_probe_done": True, "_optional_probe_error": repr(e)}
             with self._optional_probe_lock:
@@ -3247,6 +3282,7 @@ class EditableFrameDataWindow(FDCellEditorsMixin):
         mv = self.move_to_tree_item.get(item_id)
         if not mv:
             return
+        invalidate_move_memory("reload")
         try:
             mv.pop("_optional_probe_done", None)
             mv.pop("_optional_probe_error", None)
@@ -3654,12 +3690,15 @@ class EditableFrameDataWindow(FDCellEditorsMixin):
                 out[c] = ""
         return out
 
-    def _after_cell_write(self, item_id: str, mv: dict, col_name: str | None = None):
+    def _after_cell_write(self, item_id: str, mv: dict, col_name: str | None = None, *,
+                          history: bool = True, refresh: bool = True):
         """Called after an editor writes and updates the row.
 
         It refreshes the inspector immediately and tracks the original value for
         reset-changed. Editors that close later (custom Toplevels) call this from
-        their OK handler, which fixes the stale side-panel problem.
+        their OK handler, which fixes the stale side-panel problem.  Edit sets
+        pass ``history=False, refresh=False``: they push one undo entry for the
+        whole set and refresh once.
         """
         if self._suppress_dirty_tracking or not self.tree:
             return
@@ -3677,7 +3716,7 @@ class EditableFrameDataWindow(FDCellEditorsMixin):
                     # One history entry per field group preserves the original
                     # session baseline and makes Undo deterministic even when a
                     # value is edited several times.
-                    if not was_dirty and key not in self._undo_stack:
+                    if history and not was_dirty and key not in self._undo_stack:
                         self._undo_stack.append(key)
                         self._redo_stack.clear()
                 else:
@@ -3686,7 +3725,8 @@ class EditableFrameDataWindow(FDCellEditorsMixin):
                         self._undo_stack = [k for k in self._undo_stack if k != key]
                     except Exception:
                         pass
-        self._update_dirty_ui(item_id, mv)
+        if refresh:
+            self._update_dirty_ui(item_id, mv)
 
     def _update_dirty_ui(self, item_id: str | None = None, mv: dict | None = None):
         # Recompute row set from tracked cells so reset/edit/cancel states stay honest.
@@ -3765,6 +3805,8 @@ class EditableFrameDataWindow(FDCellEditorsMixin):
             return "break"
         while self._undo_stack:
             key = self._undo_stack.pop()
+            if isinstance(key, dict):
+                return self._undo_edit_set(key)
             snap = self._dirty_cells.get(key)
             if not snap:
                 continue
@@ -3795,6 +3837,8 @@ class EditableFrameDataWindow(FDCellEditorsMixin):
             return "break"
         while self._redo_stack:
             record = self._redo_stack.pop()
+            if record.get("edit_set") is not None:
+                return self._redo_edit_set(record)
             snap = record.get("snap") or {}
             entry = record.get("entry") or {}
             key = record.get("key")
@@ -4413,18 +4457,8 @@ class EditableFrameDataWindow(FDCellEditorsMixin):
 
         self._update_sort_visuals(col_name, asc)
 
-        parents = list(tree.get_children(""))
-
-        def parent_key(item):
-            v = tree.set(item, col_name)
-            if not v:
-                return ""
-            return v.lower()
+        self._sort_top_level_rows(col_name, lambda v: v.lower() if v else "", reverse=not asc)
 
-        parents.sort(key=parent_key, reverse=not asc)
-
-        for idx, parent in enumerate(parents):
-            tree.move(parent, "", idx)
     def _sort_treeview_only(self, col_name: str):
         tree = self.tree
         if not tree:
@@ -4435,11 +4469,6 @@ class EditableFrameDataWindow(FDCellEditorsMixin):
 
         self._update_sort_visuals(col_name, asc)
 
-        rows = []
-        for item in tree.get_children(""):
-            val = tree.set(item, col_name)
-            rows.append((val, item))
-
         def key(v):
             """
             Return a comparable tuple:
@@ -4465,10 +4494,33 @@ class EditableFrameDataWindow(FDCellEditorsMixin):
             # string fallback
             return (1, str(v).lower())
 
-        rows.sort(key=lambda x: key(x[0]), reverse=not asc)
+        self._sort_top_level_rows(col_name, key, reverse=not asc)
+
+    def _sort_top_level_rows(self, col_name: str, key, *, reverse: bool) -> None:
+        """Sort every top-level row by ``key(cell)``, then restore the filter.
 
-        for idx, (_, item) in enumerate(rows):
-            tree.move(item, "", idx)
+        Rows hidden by a filter are sorted too, so clearing the filter does
+        not put them back in their pre-sort places.
+        """
+        tree = self.tree
+        index = getattr(tree, "filter_index", None)
+        if index is None:
+            filtered = bool(self._detached)
+            if filtered:
+                self._reattach_all()
+            rows = sorted(tree.get_children(""), key=lambda item: key(tree.set(item, col_name)), reverse=reverse)
+            for idx, item in enumerate(rows):
+                tree.move(item, "", idx)
+            if filtered:
+                self._apply_filter()
+            return
+        rows = sorted(index.children(""), key=lambda item: key(index.value(item, col_name)), reverse=reverse)
+        index.reorder("", rows)
+        try:
+            tree.set_children("", *rows)
+        except Exception:
+            pass
+        self._show_filtered_rows(index, set(self._detached))
 
     def _on_sort_column(self, col_name: str):
         # Toggle direction per column
@@ -4490,6 +4542,10 @@ class EditableFrameDataWindow(FDCellEditorsMixin):
             return False
 
     def _reattach_all(self):
+        index = getattr(self.tree, "filter_index", None)
+        if index is not None:
+            self._show_filtered_rows(index, set())
+            return
         if not self._detached:
             return
         for item_id in list(self._detached):
@@ -4522,6 +4578,41 @@ class EditableFrameDataWindow(FDCellEditorsMixin):
         if self._status_var is not None:
             self._status_var.set("Showing changed rows only" if self._changed_only else "Showing all rows")
 
+    def _show_filtered_rows(self, index, hidden: set[str]) -> int:
+        """Show every mirrored row except ``hidden`` in mirror order.
+
+        One ``set_children`` per parent whose visible rows changed, instead of
+        a detach/reattach Tcl call per row.  What was last applied is cached
+        against the mirror's structure version.  After inserts, moves or
+        deletes the widget matches the mirror when nothing was hidden;
+        otherwise it is asked once per parent.
+        """
+        shown = getattr(self, "_filter_shown", None)
+        unfiltered = not self._detached
+        if getattr(self, "_filter_shown_version", None) != index.structure_version:
+            shown = None
+        plan = index.plan(hidden)
+        for parent, kids in plan.items():
+            if shown is not None:
+                current = shown.get(parent)
+            elif unfiltered:
+                current = index.children(parent)
+            else:
+                try:
+                    current = tuple(self.tree.get_children(parent))
+                except Exception:
+                    current = None
+            if current == kids:
+                continue
+            try:
+                self.tree.set_children(parent, *kids)
+            except Exception:
+                pass
+        self._filter_shown = plan
+        self._filter_shown_version = index.structure_version
+        self._detached = set(hidden)
+        return len(hidden)
+
     def _apply_filter(self):
         global_q = (self._filter_var.get() or "").strip().lower()
 
@@ -4532,8 +4623,41 @@ class EditableFrameDataWindow(FDCellEditorsMixin):
             if v:
                 col_filters[col] = v
 
-        self._reattach_all()
         changed_only = bool(getattr(self, "_changed_only", False))
+        index = getattr(self.tree, "filter_index", None)
+        if index is None:
+            return self._apply_filter_by_cells(global_q, col_filters, changed_only)
+
+        if not global_q and not col_filters and not changed_only:
+            self._show_filtered_rows(index, set())
+            self._status_var.set("Filter cleared")
+            return
+
+        started = time.perf_counter()
+        candidates = [item_id for item_id in self._all_item_ids if item_id in index]
+        pool = candidates
+        if changed_only:
+            changed_keep = index.with_ancestors(
+                item for item in set(getattr(self, "_dirty_row_items", set()) or set()) if item
+            )
+            pool = [item_id for item_id in candidates if item_id in changed_keep]
+        keep = index.with_ancestors(index.match(global_q, col_filters, candidates=pool))
+        hidden = {item_id for item_id in candidates if item_id not in keep}
+        detached = self._show_filtered_rows(index, hidden)
+        self._last_filter_ms = (time.perf_counter() - started) * 1000.0
+
+        parts = []
+        if global_q:
+            parts.append(f"q='{global_q}'")
+        if col_filters:
+            parts.append("cols=" + ", ".join(f"{k}:{v}" for k, v in col_filters.items()))
+        if changed_only:
+            parts.append("changed only")
+        self._status_var.set(f"Filter applied ({' | '.join(parts)}), hidden {detached}")
+
+    def _apply_filter_by_cells(self, global_q: str, col_filters: dict[str, str], changed_only: bool):
+        """Legacy filter for trees without a mirror: reads every cell from Tk."""
+        self._reattach_all()
 
         if not global_q and not col_filters and not changed_only:
             self._status_var.set("Filter cleared")
@@ -4853,6 +4977,8 @@ class EditableFrameDataWindow(FDCellEditorsMixin):
         # update cells as results arrive.
         if not self.tree:
             return
+        # An explicit refresh means "read the game again", not "reuse reads".
+        invalidate_move_memory("reload")
         queued = 0
         visible = 0
         for item_id in list(getattr(self, "_all_item_ids", []) or []):
@@ -5649,64 +5775,247 @@ class EditableFrameDataWindow(FDCellEditorsMixin):
             self._status_var.set(f"Patch section for {char_key} has no changes")
             return
 
-        applied = 0
-        skipped = 0
-        failures = []
-        touched = set()
-
-        # Apply animation swaps last. That preserves ID-based matching for
-        # other entries in the same row when a patch is applied without relying
-        # on exact absolute addresses.
-        ordered_changes = sorted(
-            changes,
-            key=lambda e: 1 if isinstance(e, dict) and str(e.get("group") or "") == "move" else 0,
+        # One edit set: targets are all matched before anything is written (so
+        # animation swaps cannot break ID matching), direct fields go out as
+        # coalesced writes, and the whole patch is a single undo step.
+        edit_set = FES.EditSet(self._patch_char_key(), [entry for entry in changes if isinstance(entry, dict)])
+        result = self._apply_edit_set(edit_set)
+        applied = len(result["applied"])
+        skipped = len(changes) - applied
+        failures = result["failures"]
+
+        self._last_patch_config_path = path
+        msg = f"Loaded patch for {char_key}: applied {applied}, skipped {skipped}"
+        self._status_var.set(msg)
+        if failures:
+            messagebox.showwarning("Load patch", msg + "\n\n" + "\n".join(failures[:10]))
+        else:
+            messagebox.showinfo("Load patch", msg)
+
+    # ---------- Edit sets ----------
+
+    def _edit_journal_for_session(self) -> FES.EditJournal:
+        if self._edit_journal is None:
+            self._edit_journal = FES.EditJournal(FES.journal_path(self._patch_char_key()))
+        return self._edit_journal
+
+    def _edit_selector(self, item_id: str, mv: dict) -> dict:
+        selector = FES.edit_selector(mv, self._patch_char_key())
+        try:
+            selector["move_label"] = self.tree.set(item_id, "move") if self.tree else ""
+        except Exception:
+            selector["move_label"] = ""
+        if FPI.is_projectile_row(mv):
+            hit = mv.get("_proj_hit") or {}
+            selector["projectile"] = True
+            selector["projectile_move"] = str(hit.get("move") or mv.get("move_name") or "")
+            selector["projectile_fmt"] = str(hit.get("fmt") or "")
+        return selector
+
+    def _stage_cell_edit(self, edit_set: FES.EditSet, item_id: str, mv: dict, group: str, value) -> dict:
+        """Stage one field on a tree row; apply the set with :meth:`_apply_edit_set`."""
+        return edit_set.stage(mv, group, value, item_id=item_id, selector=self._edit_selector(item_id, mv))
+
+    # Scalar fields that can be set across a move family at once, with their parser.
+    _FAMILY_EDIT_GROUPS = {
+        "damage": int, "meter": int, "hitstun": int, "blockstun": int, "hitstop": int,
+        "speed_mod": int, "combo_kb_mod": int, "hit_reaction": int,
+        "kb_x": float, "air_kb": float, "hb": float,
+    }
+
+    def _family_edit_group(self, col_name: str) -> str | None:
+        group, _cols = self._dirty_group_for_col(col_name)
+        return group if group in self._FAMILY_EDIT_GROUPS else None
+
+    def _family_rows(self, mv: dict) -> list[tuple[str, dict]]:
+        """Tree rows in the same move family as ``mv`` (just ``mv`` when it has none)."""
+        family = mv.get("family_group_label") or mv.get("family_label")
+        rows = []
+        for item_id, other in self.move_to_tree_item.items():
+            if other is mv or (family and (other.get("family_group_label") or other.get("family_label")) == family):
+                if not FPI.is_projectile_row(other) and not FSI.is_super_row(other):
+                    rows.append((item_id, other))
+        return rows
+
+    def _set_column_on_family(self, item: str, mv: dict, col_name: str):
+        """Write one value to ``col_name`` on every row of ``mv``'s family as a single edit set."""
+        group = self._family_edit_group(col_name)
+        if not self.tree or group is None:
+            return
+        if not U.WRITER_AVAILABLE:
+            messagebox.showerror("Set across family", "Writer unavailable")
+            return
+        rows = [(item_id, row) for item_id, row in self._family_rows(mv) if self._generic_field_is_verified(row, col_name)]
+        if not rows:
+            if self._status_var is not None:
+                self._status_var.set(self._generic_field_unverified_message(col_name))
+            return
+        family = mv.get("family_group_label") or mv.get("family_label") or mv.get("move_name") or "move"
+        text = simpledialog.askstring(
+            f"Set {col_name} across family",
+            f"Family: {family}\nField: {col_name}\nRows: {len(rows)}\n\nNew value:",
+            parent=self.root,
+            initialvalue=str(self.tree.set(item, col_name) or ""),
         )
+        if text is None:
+            return
+        try:
+            parse = self._FAMILY_EDIT_GROUPS[group]
+            value = int(text.strip(), 0) if parse is int else parse(text.strip())
+        except ValueError:
+            messagebox.showerror("Invalid", f"Invalid {col_name}: {text!r}", parent=self.root)
+            return
+
+        edit_set = FES.EditSet(self._patch_char_key())
+        for item_id, row in rows:
+            self._stage_cell_edit(edit_set, item_id, row, group, value)
+        result = self._apply_edit_set(edit_set)
+        msg = f"Set {col_name} = {value} on {len(result['applied'])} of {len(rows)} {family} rows"
+        if self._status_var is not None:
+            self._status_var.set(msg)
+        if result["failures"]:
+            messagebox.showwarning("Set across family", msg + "\n\n" + "\n".join(result["failures"][:10]))
+
+    def _apply_edit_set(self, edit_set: FES.EditSet) -> dict:
+        """Write a whole edit set, refresh once and record it as one undo step.
 
-        for entry in ordered_changes:
-            if not isinstance(entry, dict):
-                skipped += 1
+        Entries loaded from a file are matched to rows like patch entries.
+        Direct fields are validated together and written as coalesced runs;
+        the rest go through :meth:`_apply_patch_change`.
+        """
+        if not U.WRITER_AVAILABLE:
+            return {"applied": [], "failed": [], "failures": ["writer unavailable"]}
+        edit_set.bind(lambda entry: self._find_patch_target(entry)[:2])
+        dirty_before = set(self._dirty_cells)
+        for entry in edit_set.entries:
+            mv = entry.get("mv")
+            if mv is None or not entry.get("item_id"):
                 continue
-            item_id, mv, match_kind = self._find_patch_target(entry)
-            if not item_id or not mv:
-                skipped += 1
-                selector = entry.get("selector") or {}
-                label = selector.get("move_label") or selector.get("abs") or entry.get("group") or "unknown"
-                failures.append(f"not found: {label}")
+            group = str(entry.get("group") or "")
+            # Undo restores the row to what it showed before this set.
+            entry["original"] = self._patch_json_value(self._patch_value_for_group(mv, group))
+            self._begin_edit_snapshot(entry["item_id"], mv, group)
+
+        result = edit_set.apply(fallback=lambda entry: self._apply_patch_change(entry["item_id"], entry["mv"], entry))
+        keys = []
+        for entry in result["applied"]:
+            item_id, mv, group = entry["item_id"], entry["mv"], str(entry.get("group") or "")
+            if entry.get("mode") == "write":
+                self._apply_patch_tree_update(item_id, mv, group)
+            self._after_cell_write(item_id, mv, group, history=False, refresh=False)
+            group_key, _cols = self._dirty_group_for_cell(mv, group)
+            if group_key:
+                keys.append(self._dirty_key(item_id, mv, group_key))
+        for entry, _reason in result["failed"]:
+            if entry.get("mv") is not None and entry.get("item_id"):
+                group_key, _cols = self._dirty_group_for_cell(entry["mv"], str(entry.get("group") or ""))
+                if group_key:
+                    self._pending_edit_snapshots.pop(self._dirty_key(entry["item_id"], entry["mv"], group_key), None)
+
+        seq = self._edit_journal_for_session().record(self._patch_char_key(), result)
+        if seq is not None:
+            self._undo_stack.append({
+                "edit_set": seq,
+                "entries": list(result["applied"]),
+                "keys": keys,
+                "fresh": [key for key in keys if key not in dirty_before],
+            })
+            self._redo_stack.clear()
+        self._update_dirty_ui()
+        return result
+
+    def _restore_edit_set_rows(self, entries: list, field: str) -> list[str]:
+        """Bring rows in line after the journal rewrote an edit set's bytes."""
+        failures = []
+        for entry in entries:
+            item_id, mv, group = entry.get("item_id"), entry.get("mv"), str(entry.get("group") or "")
+            value = entry.get(field)
+            if not item_id or mv is None or value is None:
+                continue
+            if entry.get("mode") == "write":
+                try:
+                    mv.update(FES.compile_edit(mv, group, value).updates)
+                    self._apply_patch_tree_update(item_id, mv, group)
+                except Exception as e:
+                    failures.append(f"{group}: {e}")
                 continue
+            ok, reason = self._apply_patch_change(item_id, mv, {"group": group, "value": value})
+            if not ok:
+                failures.append(f"{group}: {reason}")
+        return failures
+
+    def _undo_edit_set(self, marker: dict):
+        record, reason = self._edit_journal_for_session().undo(expect_seq=marker.get("edit_set"))
+        if record is None:
+            self._undo_stack.append(marker)
+            self._update_history_controls()
+            if self._status_var is not None:
+                self._status_var.set(f"Undo failed: {reason}")
+            return "break"
+        failures = self._restore_edit_set_rows(marker.get("entries") or [], "original")
+        snaps = {key: self._dirty_cells.pop(key) for key in marker.get("fresh") or () if key in self._dirty_cells}
+        self._redo_stack.append({"edit_set": marker.get("edit_set"), "marker": marker, "snaps": snaps})
+        self._update_dirty_ui()
+        if self._status_var is not None:
+            count = len(marker.get("entries") or ())
+            msg = f"Undid edit set ({count} field{'s' if count != 1 else ''})"
+            self._status_var.set(msg + (" | failed: " + ", ".join(failures[:6]) if failures else ""))
+        return "break"
 
-            group = str(entry.get("group") or "")
-            self._begin_edit_snapshot(item_id, mv, group)
-            ok, reason = self._apply_patch_change(item_id, mv, entry)
-            if ok:
-                applied += 1
-                touched.add(item_id)
-                self._after_cell_write(item_id, mv, group)
-            else:
-                skipped += 1
-                selector = entry.get("selector") or {}
-                label = selector.get("move_label") or selector.get("abs") or group or "unknown"
-                failures.append(f"{label}: {reason}")
+    def _redo_edit_set(self, record: dict):
+        marker = record.get("marker") or {}
+        done, reason = self._edit_journal_for_session().redo(expect_seq=record.get("edit_set"))
+        if done is None:
+            self._redo_stack.append(record)
+            self._update_history_controls()
+            if self._status_var is not None:
+                self._status_var.set(f"Redo failed: {reason}")
+            return "break"
+        failures = self._restore_edit_set_rows(marker.get("entries") or [], "value")
+        self._dirty_cells.update(record.get("snaps") or {})
+        self._undo_stack.append(marker)
+        self._update_dirty_ui()
+        if self._status_var is not None:
+            count = len(marker.get("entries") or ())
+            msg = f"Redid edit set ({count} field{'s' if count != 1 else ''})"
+            self._status_var.set(msg + (" | failed: " + ", ".join(failures[:6]) if failures else ""))
+        return "break"
 
-        for item_id in touched:
-            try:
-                self._apply_row_tags(item_id, self.move_to_tree_item.get(item_id) or {})
-            except Exception:
-                pass
+    def _reapply_journaled_edits(self):
+        """Re-apply this character's journaled edits, e.g. after a reload."""
+        if not U.WRITER_AVAILABLE:
+            messagebox.showerror("Reapply edits", "Writer unavailable")
+            return
+        changes = self._edit_journal_for_session().applied_changes()
+        if not changes:
+            if self._status_var is not None:
+                self._status_var.set(f"No journaled edits for {self._patch_char_key()}")
+            return
+        result = self._apply_edit_set(FES.EditSet(self._patch_char_key(), changes))
+        msg = f"Reapplied edits for {self._patch_char_key()}: applied {len(result['applied'])}, skipped {len(result['failed'])}"
+        if self._status_var is not None:
+            self._status_var.set(msg)
+        if result["failures"]:
+            messagebox.showwarning("Reapply edits", msg + "\n\n" + "\n".join(result["failures"][:10]))
 
+    def _open_field_diff_explorer(self):
+        """Capture the selected move's block (or this slot's fighter) over frames and rank changing fields."""
+        from .field_diff_window import open_field_diff_explorer
+
+        mv = None
         try:
-            sel = self.tree.selection()
-            if sel:
-                self._refresh_inspector(sel[0], self.move_to_tree_item.get(sel[0]))
+            selected = self.tree.selection() if self.tree else ()
         except Exception:
-            pass
-
-        self._last_patch_config_path = path
-        msg = f"Loaded patch for {char_key}: applied {applied}, skipped {skipped}"
-        self._status_var.set(msg)
-        if failures:
-            messagebox.showwarning("Load patch", msg + "\n\n" + "\n".join(failures[:10]))
-        else:
-            messagebox.showinfo("Load patch", msg)
+            selected = ()
+        if selected:
+            mv = self.move_to_tree_item.get(selected[0])
+        open_field_diff_explorer(
+            self.root,
+            slot_label=self.slot_label,
+            char_name=self.target_slot.get("char_name", ""),
+            move=mv,
+            next_abs_map=self.next_abs_map,
+        )
 
     # ---------- Reset to original ----------
 
@@ -6073,7 +6382,11 @@ class EditableFrameDataWindow(FDCellEditorsMixin):
 
         if not preserve_history:
             active_keys = set(self._dirty_cells.keys())
-            self._undo_stack = [key for key in self._undo_stack if key in active_keys]
+            self._undo_stack = [
+                key for key in self._undo_stack
+                if (isinstance(key, dict) and active_keys.intersection(key.get("keys") or ()))
+                or (not isinstance(key, dict) and key in active_keys)
+            ]
             self._redo_stack.clear()
         self._update_history_controls()
         self._restore_editor_interactivity_after_reset(touched_items | routing_refresh_items)
@@ -6273,6 +6586,8 @@ class EditableFrameDataWindow(FDCellEditorsMixin):
             menu.add_command(label="Edit value", command=lambda: self._edit_super_dispatch_cell(col_name, parent_item, mv, self.tree.set(parent_item, col_name)))
         else:
             menu.add_command(label="Edit value", command=lambda: self._edit_selected_column(col_name))
+            if self._family_edit_group(col_name):
+                menu.add_command(label="Set across move family...", command=lambda: self._set_column_on_family(parent_item, mv, col_name))
         if addresses:
             menu.add_separator()
             if len(addresses) == 1:
@@ -6761,6 +7076,10 @@ class EditableFrameDataWindow(FDCellEditorsMixin):
             else:
                 menu.add_command(label=f"No {label} Address", state="disabled")
 
+        if self._family_edit_group(col_name):
+            menu.add_separator()
+            menu.add_command(label="Set across move family...", command=lambda: self._set_column_on_family(item, mv, col_name))
+
         menu.add_separator()
         menu.add_command(label="View Raw Move Data", command=lambda: self._show_raw_data(mv))
 
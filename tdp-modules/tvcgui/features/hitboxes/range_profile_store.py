@@ -0,0 +1,191 @@
+"""Background persistence for learned hitbox range profiles.
+
+The renderer learns attack/body envelopes on its draw thread.  It keeps
+reading and updating the live ``view`` dictionary exactly as before, but only
+*marks* the entries it touched.  Once per batch interval the marked entries
+are copied (on the draw thread, so the writer never iterates a dictionary
+that is being mutated) and handed to a :class:`DeferredWorkLoop` that merges
+them into its own persisted copy and replaces the JSON atomically.  The draw
+loop therefore never waits on the filesystem.
+"""
+from __future__ import annotations
+
+import atexit
+import copy
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from tvcgui.runtime.deferred_work import DeferredWorkLoop
+
+_KINDS = ("attacks", "bodies")
+
+
+class RangeProfileStore:
+    """Own one range-profile JSON file and batch its writes off-thread."""
+
+    def __init__(
+        self,
+        path: str,
+        profiles: Dict[str, Any],
+        *,
+        write_payload: Callable[[str, Dict[str, Any]], None],
+        schema: int,
+        interval: float = 0.75,
+        enabled: bool = True,
+        background: bool = True,
+    ) -> None:
+        self.path = str(path)
+        self.schema = int(schema)
+        self.enabled = bool(enabled)
+        self._write_payload = write_payload
+        self._interval = max(0.0, float(interval))
+        self.view: Dict[str, Any] = profiles
+        for kind in _KINDS:
+            if not isinstance(self.view.get(kind), dict):
+                self.view[kind] = {}
+        # Writer-thread copy of what is (or is about to be) on disk.
+        self._persisted: Dict[str, Dict[str, Any]] = {kind: copy.deepcopy(self.view[kind]) for kind in _KINDS}
+        self._lock = threading.RLock()
+        self._marked: set[Tuple[str, str]] = set()
+        self._handoff: Dict[Tuple[str, str], Any] = {}
+        self._retry = False
+        self._last_commit = 0.0
+        self._closed = False
+        self._stats: Dict[str, Any] = {
+            "flushes": 0,
+            "failures": 0,
+            "entries_written": 0,
+            "last_flush_ms": 0.0,
+            "max_flush_ms": 0.0,
+            "total_flush_ms": 0.0,
+            "last_error": "",
+        }
+        self._writer: Optional[DeferredWorkLoop] = None
+        if background:
+            self._writer = DeferredWorkLoop(self._write_batch, interval=max(0.05, self._interval), name="TvCRangeProfileWriter")
+            atexit.register(self.close)
+
+    def _locate(self, entry: Any) -> Optional[Tuple[str, str]]:
+        if not isinstance(entry, dict):
+            return None
+        # Attack keys are "char:move" and body keys are the char id; try those
+        # first, then fall back to an identity scan.
+        try:
+            guesses = (
+                ("attacks", f"{int(entry['char_id'])}:{int(entry['move_id'])}"),
+                ("bodies", str(int(entry["char_id"]))),
+            )
+        except Exception:
+            guesses = ()
+        for kind, key in guesses:
+            if self.view.get(kind, {}).get(key) is entry:
+                return kind, key
+        for kind in _KINDS:
+            for key, value in self.view.get(kind, {}).items():
+                if value is entry:
+                    return kind, str(key)
+        return None
+
+    def mark(self, entry: Any) -> bool:
+        """Record that ``entry`` (a dict held by ``view``) changed.  Draw-thread cheap."""
+        if not self.enabled:
+            return False
+        located = self._locate(entry)
+        if located is None:
+            return False
+        self._marked.add(located)
+        return True
+
+    def commit(self, force: bool = False) -> bool:
+        """Hand marked entries to the writer once per batch interval.
+
+        Called from the draw thread; copies only the touched entries and never
+        touches the filesystem.  Returns True when a batch was queued.
+        """
+        if not self._marked:
+            return False
+        now = time.monotonic()
+        if not force and now - self._last_commit < self._interval:
+            return False
+        batch = {}
+        for kind, key in self._marked:
+            value = self.view.get(kind, {}).get(key)
+            batch[(kind, key)] = copy.deepcopy(value) if isinstance(value, dict) else None
+        self._marked.clear()
+        self._last_commit = now
+        with self._lock:
+            self._handoff.update(batch)
+        if self._writer is not None:
+            self._writer.request()
+        else:
+            self._write_batch()
+        return True
+
+    @property
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._marked) + len(self._handoff)
+
+    def _write_batch(self) -> bool:
+        # Only the handoff swap is locked; ``_persisted`` belongs to the writer
+        # thread, so the draw thread can keep committing during the write.
+        with self._lock:
+            batch = self._handoff
+            self._handoff = {}
+            if not batch and not self._retry:
+                return False
+        for (kind, key), value in batch.items():
+            if value is None:
+                self._persisted[kind].pop(key, None)
+            else:
+                self._persisted[kind][key] = value
+        payload = {"schema": self.schema, "attacks": self._persisted["attacks"], "bodies": self._persisted["bodies"]}
+        started = time.perf_counter()
+        try:
+            self._write_payload(self.path, payload)
+        except Exception as exc:
+            with self._lock:
+                self._retry = True
+                self._stats["failures"] += 1
+                self._stats["last_error"] = repr(exc)
+            print(f"[range profile] export FAILED; keeping data in memory for retry: {exc!r}")
+            return False
+        elapsed = (time.perf_counter() - started) * 1000.0
+        with self._lock:
+            self._retry = False
+            self._stats["flushes"] += 1
+            self._stats["entries_written"] += len(batch)
+            self._stats["last_flush_ms"] = round(elapsed, 3)
+            self._stats["max_flush_ms"] = round(max(self._stats["max_flush_ms"], elapsed), 3)
+            self._stats["total_flush_ms"] += elapsed
+            self._stats["last_error"] = ""
+        print(
+            f"[range profile] export OK: {len(payload['attacks'])} attacks / "
+            f"{len(payload['bodies'])} bodies -> {self.path} ({elapsed:.1f} ms, {len(batch)} changed)"
+        )
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            out = dict(self._stats)
+            flushes = int(out["flushes"])
+            out["avg_flush_ms"] = round(out.pop("total_flush_ms") / flushes, 3) if flushes else 0.0
+            out["pending"] = len(self._marked) + len(self._handoff)
+        return out
+
+    def close(self) -> None:
+        """Write anything still marked or queued, then stop the writer."""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self.commit(force=True)
+        except Exception:
+            pass
+        if self._writer is not None:
+            self._writer.close(final_callback=self._write_batch, timeout=1.5)
+            self._writer = None
+
+
+__all__ = ["RangeProfileStore"]
@@ -32,6 +32,7 @@ from tvcgui.core.paths import data_path, user_data_path
 from tvcgui.platform.dolphin import hook, rd32, rbytes
 from tvcgui.core.constants import CHAR_NAMES, RUNTIME_IMPACT_FREEZE_OFF, ATT_ID_OFF_PRIMARY
 from tvcgui.features.combat.move_id_map import lookup_move_name
+from tvcgui.features.hitboxes.range_profile_store import RangeProfileStore
 
 import json as _json
 
@@ -3787,9 +3788,17 @@ class HitboxRenderer:
         # borrowing a standing ruler when TvC switches through a generic state
         # during startup/recovery.
         self._range_posture_locks: Dict[str, Dict[str, Any]] = {}
-        self._range_profiles: Dict[str, Any] = self._load_range_profiles()
-        self._range_profiles_dirty = False
-        self._last_range_profile_flush_ms = 0
+        self._range_profile_store = RangeProfileStore(
+            RANGE_PROFILE_FILE,
+            self._load_range_profiles(),
+            write_payload=_write_range_profile_payload_atomic,
+            schema=RANGE_PROFILE_SCHEMA,
+            interval=RANGE_PROFILE_FLUSH_MS / 1000.0,
+            enabled=RANGE_PROFILE_WRITE_ENABLED,
+        )
+        # Live view the learners update in place; the store persists the
+        # entries passed to _mark_range_profile().
+        self._range_profiles: Dict[str, Any] = self._range_profile_store.view
         # One active calibration attempt per raw fighter slot.  HP loss is used
         # as a lightweight resolved-hit signal; the broad resolver scan remains
         # disabled during ordinary overlay play.
@@ -3877,38 +3886,22 @@ class HitboxRenderer:
         except Exception:
             return fallback
 
+    def _mark_range_profile(self, entry: Any) -> None:
+        self._range_profile_store.mark(entry)
+
     def _flush_range_profiles(self, force: bool = False) -> bool:
-        """Persist learned range data and report whether this call exported it.
+        """Queue marked range data for the background writer.
 
-        The JSON is first written and re-parsed in a temporary sibling file,
-        then atomically replaced.  A failed write leaves the previous good file
-        intact and keeps ``_range_profiles_dirty`` true for a later retry.
+        Only the touched entries are copied here; the store's writer thread
+        writes and re-parses a temporary sibling file, then atomically
+        replaces the JSON.  A failed write keeps the previous good file and is
+        retried on the writer's next tick.  Returns True when a batch was
+        queued.
         """
-        if not RANGE_PROFILE_WRITE_ENABLED:
-            self._range_profiles_dirty = False
-            return False
-        if not self._range_profiles_dirty:
-            return False
-        now_ms = pygame.time.get_ticks()
-        if not force and now_ms - int(self._last_range_profile_flush_ms) < RANGE_PROFILE_FLUSH_MS:
-            return False
-        payload = {
-            "schema": RANGE_PROFILE_SCHEMA,
-            "attacks": self._range_profiles.get("attacks", {}),
-            "bodies": self._range_profiles.get("bodies", {}),
-        }
-        try:
-            _write_range_profile_payload_atomic(RANGE_PROFILE_FILE, payload)
-            self._range_profiles_dirty = False
-            self._last_range_profile_flush_ms = now_ms
-            print(
-                f"[range profile] export OK: {len(payload['attacks'])} attacks / "
-                f"{len(payload['bodies'])} bodies -> {RANGE_PROFILE_FILE}"
-            )
-            return True
-        except Exception as exc:
-            print(f"[range profile] export FAILED; keeping data in memory for retry: {exc!r}")
-            return False
+        return self._range_profile_store.commit(force=force)
+
+    def range_profile_store_stats(self) -> Dict[str, Any]:
+        return self._range_profile_store.stats()
 
     @staticmethod
     def _range_calibration_entry(profile: Dict[str, Any]) -> Dict[str, Any]:
@@ -4111,7 +4104,7 @@ class HitboxRenderer:
         profile["tip_center_from_active_root"] = persisted["tip_center_from_active_root"]
         profile["ruler_geometry_source"] = "max_horizontal_active_envelope"
         profile["updated_ms"] = int(pygame.time.get_ticks())
-        self._range_profiles_dirty = True
+        self._mark_range_profile(profile)
         return True
 
     @staticmethod
@@ -4285,7 +4278,7 @@ class HitboxRenderer:
         profile["vertical_envelope"] = persisted
         profile["vertical_geometry_source"] = "full_active_envelope"
         profile["updated_ms"] = int(pygame.time.get_ticks())
-        self._range_profiles_dirty = True
+        self._mark_range_profile(profile)
         return True
 
     @staticmethod
@@ -4406,7 +4399,7 @@ class HitboxRenderer:
             return False
         profile["dynamic_sweep"] = payload
         profile["updated_ms"] = int(pygame.time.get_ticks())
-        self._range_profiles_dirty = True
+        self._mark_range_profile(profile)
         return True
 
     @staticmethod
@@ -5170,7 +5163,7 @@ class HitboxRenderer:
             reverse=True,
         )[:RANGE_CONTACT_MAX_WITNESSES]
         profile["updated_ms"] = int(now_ms)
-        self._range_profiles_dirty = True
+        self._mark_range_profile(profile)
 
     def _process_range_contact_audit(
         self,
@@ -5236,7 +5229,7 @@ class HitboxRenderer:
             audit = self._range_contact_audit_entry(profile)
             if float(gap) > RANGE_CONTACT_WITNESS_MAX_GAP:
                 audit["unresolved_events"] = int(audit.get("unresolved_events") or 0) + 1
-                self._range_profiles_dirty = True
+                self._mark_range_profile(profile)
                 continue
             predicted_touch, predicted_gap = self._range_profile_prediction_for_snapshot(profile, snapshot, target_hurtboxes)
             signal = "damage" if int(hp_drops.get(target_slot) or 0) > 0 else "impact"
@@ -5358,7 +5351,7 @@ class HitboxRenderer:
         else:
             calibration["false_positive_adjustments"] = int(calibration.get("false_positive_adjustments") or 0) + 1
             calibration["false_positive_streak"] = 0
-        self._range_profiles_dirty = True
+        self._mark_range_profile(profile)
         print(f"[range calibration] {profile_key} {reason}: pip {before:+d} -> {after:+d}")
 
     def _observe_range_calibration(
@@ -5432,7 +5425,7 @@ class HitboxRenderer:
                     calibration["false_positive_streak"] = streak
                     if streak >= RANGE_CALIBRATION_FALSE_POSITIVE_LIMIT:
                         self._apply_range_calibration(profile_key, -1, "repeated touching whiff")
-                    self._range_profiles_dirty = True
+                    self._mark_range_profile(profile)
             self._range_calibration_attempts.pop(source_slot, None)
 
     def _range_move_origin(
@@ -6254,7 +6247,7 @@ class HitboxRenderer:
         }
         self._remember_range_for_posture(source_slot, saved_entry, saved_entry.get("posture"))
         exported = self._flush_range_profiles(force=True)
-        export_note = "saved" if exported else "queued for retry"
+        export_note = "queued for background save" if exported else "already queued"
         if horizontal_saved and vertical_saved:
             mode_note = "Horz + Vert envelopes"
         elif horizontal_saved:
@@ -6406,7 +6399,7 @@ class HitboxRenderer:
                 "tip_center_from_active_root": tip_center_from_active_root,
             }
             entry["updated_ms"] = int(pygame.time.get_ticks())
-            self._range_profiles_dirty = True
+            self._mark_range_profile(entry)
             return entry
         except Exception:
             return None
@@ -6450,7 +6443,7 @@ class HitboxRenderer:
                 bounds["max_z"] = max(float(bounds["max_z"]), z + r - rz)
             entry["samples"] = int(entry.get("samples") or 0) + 1
             entry["updated_ms"] = int(pygame.time.get_ticks())
-            self._range_profiles_dirty = True
+            self._mark_range_profile(entry)
             return entry
         except Exception:
             return None
@@ -7,12 +7,18 @@ build.  Archive writes occur only through that explicit installer.
 """
 from __future__ import annotations
 
+import copy
 from dataclasses import dataclass
+import json
 import os
+import tempfile
+import threading
 from hashlib import sha1
 from pathlib import Path
 from typing import Any
 
+from tvcgui.core.paths import user_data_path
+
 _FPK_HEADER_SIZE = 0x10
 _FPK_ENTRY_SIZE = 0x30
 _NAME_SIZE = 0x20
@@ -98,6 +104,107 @@ def _prs_decompress(data: bytes, expected_size: int) -> bytes:
     This variant has no usable end marker for FPK entry decoding.  A zero long
     copy is valid and the directory's uncompressed size is therefore the stop
     condition.
+
+    Control bits are consumed from a local counter instead of a closure, and
+    back-references are copied as slices (repeating the source run when it
+    overlaps the bytes being written).  Output and errors match
+    :func:`_prs_decompress_bitwise` exactly.
+    """
+    if expected_size < 0:
+        raise PrsFormatError("Invalid expected PRS output size.")
+    if expected_size == 0:
+        return b""
+
+    data = bytes(data)
+    size = len(data)
+    source = 0
+    out = bytearray()
+    written = 0
+    control = 0
+    bits = 0
+
+    while written < expected_size:
+        if not bits:
+            if source >= size:
+                raise PrsFormatError("PRS control stream ended early.")
+            control = data[source]
+            source += 1
+            if control == 0xFF and source + 8 <= size and expected_size - written >= 8:
+                # Eight literals in a row; common in both stock and
+                # repacked streams.
+                out += data[source : source + 8]
+                source += 8
+                written += 8
+                continue
+            bits = 8
+        bits -= 1
+        if (control >> bits) & 1:
+            if source >= size:
+                raise PrsFormatError("PRS literal stream ended early.")
+            out.append(data[source])
+            source += 1
+            written += 1
+            continue
+
+        if not bits:
+            if source >= size:
+                raise PrsFormatError("PRS control stream ended early.")
+            control = data[source]
+            source += 1
+            bits = 8
+        bits -= 1
+        if (control >> bits) & 1:
+            if source + 2 > size:
+                raise PrsFormatError("PRS long-copy stream ended early.")
+            word = (data[source] << 8) | data[source + 1]
+            source += 2
+            count = word & 0x07
+            distance = 0x2000 - (word >> 3)
+            if count == 0:
+                if source >= size:
+                    raise PrsFormatError("PRS extended-copy stream ended early.")
+                count = data[source] + 1
+                source += 1
+            else:
+                count += 2
+        else:
+            count = 0
+            for _ in range(2):
+                if not bits:
+                    if source >= size:
+                        raise PrsFormatError("PRS control stream ended early.")
+                    control = data[source]
+                    source += 1
+                    bits = 8
+                bits -= 1
+                count = (count << 1) | ((control >> bits) & 1)
+            count += 2
+            if source >= size:
+                raise PrsFormatError("PRS short-copy stream ended early.")
+            distance = 0x100 - data[source]
+            source += 1
+
+        start = written - distance
+        if start < 0:
+            raise PrsFormatError("PRS copy references bytes before the output buffer.")
+        if count > expected_size - written:
+            count = expected_size - written
+        if count <= distance:
+            out += out[start : start + count]
+        else:
+            # Overlapping copy: the run repeats the last ``distance`` bytes.
+            run = out[start:]
+            out += (run * (count // distance + 1))[:count]
+        written += count
+
+    return bytes(out)
+
+
+def _prs_decompress_bitwise(data: bytes, expected_size: int) -> bytes:
+    """Reference bit-at-a-time PRS decoder.
+
+    Kept as the readable specification :func:`_prs_decompress` is checked
+    against; nothing on the scan path calls it.
     """
     if expected_size < 0:
         raise PrsFormatError("Invalid expected PRS output size.")
@@ -233,6 +340,7 @@ def _stage_menu_details(data: bytes, entries: list[FpkEntry]) -> dict[str, Any]
             "compressed_size": sequence.compressed_size,
             "uncompressed_size": sequence.uncompressed_size,
             "sha1": sha1(sequence_bytes).hexdigest()[:16],
+            "decoded_sha1": sha1(decoded).hexdigest()[:16],
         },
         "layout": {
             "name": layout.name,
@@ -301,9 +409,154 @@ def classify_archive(entries: list[FpkEntry], *, data: bytes | None = None) -> t
     )
 
 
-def inspect_fpk(path: str | Path) -> dict[str, Any]:
-    """Produce a compact, UI-safe summary for one archive."""
+# --- Persistent archive index -----------------------------------------------
+#
+# Inspecting an archive reads the whole file and PRS-decodes its stage
+# sequence.  Extracted discs hold thousands of FPKs that never change, so each
+# inspection result is kept on disk keyed by absolute path, size and mtime.
+FPK_INDEX_VERSION = 1
+FPK_INDEX_PATH = os.environ.get("TVC_FPK_INDEX_FILE") or user_data_path("stage_select", "fpk_index.json")
+
+
+def _index_key(archive: Path) -> str:
+    return os.path.normcase(os.path.abspath(str(archive)))
+
+
+class FpkArchiveIndex:
+    """JSON index of ``inspect_fpk`` results and decoded-entry hashes."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._lock = threading.RLock()
+        self._entries: dict[str, dict[str, Any]] | None = None
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        if self._entries is None:
+            entries: dict[str, dict[str, Any]] = {}
+            try:
+                payload = json.loads(self.path.read_text(encoding="utf-8"))
+                if isinstance(payload, dict) and payload.get("version") == FPK_INDEX_VERSION:
+                    entries = {str(key): value for key, value in (payload.get("archives") or {}).items() if isinstance(value, dict)}
+            except (OSError, ValueError):
+                pass
+            self._entries = entries
+        return self._entries
+
+    def lookup(self, archive: Path, stat: os.stat_result) -> dict[str, Any] | None:
+        """Return a copy of the stored summary when size and mtime still match."""
+        with self._lock:
+            record = self._load().get(_index_key(archive))
+            if record and record.get("size") == stat.st_size and record.get("mtime_ns") == stat.st_mtime_ns:
+                self.hits += 1
+                info = copy.deepcopy(record.get("info") or {})
+                info["path"] = str(archive)
+                return info
+            self.misses += 1
+            return None
+
+    def store(self, archive: Path, stat: os.stat_result, info: dict[str, Any]) -> None:
+        sequence = (info.get("stage_menu") or {}).get("sequence") or {}
+        decoded = {sequence["name"]: sequence["decoded_sha1"]} if sequence.get("decoded_sha1") else {}
+        with self._lock:
+            self._load()[_index_key(archive)] = {
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "info": copy.deepcopy(info),
+                "decoded_sha1": decoded,
+            }
+            self._dirty = True
+
+    def forget(self, archive: str | Path) -> None:
+        with self._lock:
+            if self._load().pop(_index_key(Path(archive)), None) is not None:
+                self._dirty = True
+
+    def prune(self, root: str | Path, seen: set[str]) -> int:
+        """Drop entries below ``root`` that a complete scan no longer found."""
+        prefix = _index_key(Path(root)).rstrip(os.sep) + os.sep
+        with self._lock:
+            entries = self._load()
+            stale = [key for key in entries if key.startswith(prefix) and key not in seen]
+            for key in stale:
+                del entries[key]
+            if stale:
+                self._dirty = True
+            return len(stale)
+
+    def decoded_hashes(self, archive: str | Path) -> dict[str, str]:
+        with self._lock:
+            return dict((self._load().get(_index_key(Path(archive))) or {}).get("decoded_sha1") or {})
+
+    def save(self) -> bool:
+        with self._lock:
+            if not self._dirty:
+                return False
+            payload = {"version": FPK_INDEX_VERSION, "archives": self._load()}
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp_name = tempfile.mkstemp(prefix=self.path.name + ".", suffix=".tmp", dir=str(self.path.parent))
+                try:
+                    with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                        json.dump(payload, handle, separators=(",", ":"))
+                    os.replace(tmp_name, self.path)
+                finally:
+                    if os.path.exists(tmp_name):
+                        os.unlink(tmp_name)
+            except OSError:
+                return False
+            self._dirty = False
+            return True
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {"path": str(self.path), "archives": len(self._load()), "hits": self.hits, "misses": self.misses}
+
+
+_ARCHIVE_INDEX: FpkArchiveIndex | None = None
+
+
+def archive_index() -> FpkArchiveIndex:
+    """Return the process-wide archive index, created on first use."""
+    global _ARCHIVE_INDEX
+    if _ARCHIVE_INDEX is None:
+        _ARCHIVE_INDEX = FpkArchiveIndex(FPK_INDEX_PATH)
+    return _ARCHIVE_INDEX
+
+
+def _inspect_indexed(archive: Path, index: FpkArchiveIndex | None) -> tuple[dict[str, Any], bool]:
+    """Return ``(info, stored)``; ``stored`` is True when the index gained an entry."""
+    if index is None:
+        return _inspect_fpk_uncached(archive), False
+    try:
+        stat = archive.stat()
+    except OSError:
+        return _inspect_fpk_uncached(archive), False
+    info = index.lookup(archive, stat)
+    if info is not None:
+        return info, False
+    info = _inspect_fpk_uncached(archive)
+    index.store(archive, stat, info)
+    return info, True
+
+
+def inspect_fpk(path: str | Path, *, use_index: bool = True) -> dict[str, Any]:
+    """Produce a compact, UI-safe summary for one archive.
+
+    Results are served from the persistent archive index while the file's
+    size and mtime are unchanged.
+    """
     archive = Path(path)
+    index = archive_index() if use_index else None
+    info, stored = _inspect_indexed(archive, index)
+    if stored:
+        index.save()
+    return info
+
+
+def _inspect_fpk_uncached(archive: Path) -> dict[str, Any]:
     try:
         _, data, entries = _read_fpk(archive)
         classification, score, reason = classify_archive(entries, data=data)
@@ -329,12 +582,13 @@ def inspect_fpk(path: str | Path) -> dict[str, Any]:
     }
 
 
-def scan_for_stage_archives(root: str | Path, *, limit: int = 4000) -> dict[str, Any]:
+def scan_for_stage_archives(root: str | Path, *, limit: int = 4000, use_index: bool = True) -> dict[str, Any]:
     """Inspect FPK directories below ``root`` and group real stage packages.
 
     No game files are decompressed to disk, changed, copied, or backed up by
     this scan.  The sequence is decoded only in memory when an archive has both
-    known stage-select internal entries.
+    known stage-select internal entries.  Unchanged archives are answered from
+    the persistent archive index, which is written once at the end.
     """
     base = Path(root)
     if not base.is_dir():
@@ -352,13 +606,17 @@ def scan_for_stage_archives(root: str | Path, *, limit: int = 4000) -> dict[str,
     candidates: list[dict[str, Any]] = []
     stage_sets_by_signature: dict[str, dict[str, Any]] = {}
     truncated = False
+    index = archive_index() if use_index else None
+    seen: set[str] = set()
     try:
         for archive in base.rglob("*.fpk"):
             if scanned >= limit:
                 truncated = True
                 break
             scanned += 1
-            info = inspect_fpk(archive)
+            info, _stored = _inspect_indexed(archive, index)
+            if index is not None:
+                seen.add(_index_key(archive))
             if not info.get("ok") or int(info.get("score") or 0) <= 0:
                 continue
             entry_names = [str(item.get("name") or "") for item in info.get("entries") or []]
@@ -389,6 +647,8 @@ def scan_for_stage_archives(root: str | Path, *, limit: int = 4000) -> dict[str,
                 )
                 group["paths"].append(str(archive))
     except OSError as exc:
+        if index is not None:
+            index.save()
         return {
             "ok": False,
             "root": str(base),
@@ -399,6 +659,11 @@ def scan_for_stage_archives(root: str | Path, *, limit: int = 4000) -> dict[str,
             "reason": str(exc),
         }
 
+    if index is not None:
+        if not truncated:
+            index.prune(base, seen)
+        index.save()
+
     candidates.sort(key=lambda row: (-int(row["score"]), row["path"].lower()))
     stage_sets = sorted(stage_sets_by_signature.values(), key=lambda row: (row["paths"][0].lower(), row["signature"]))
     for group in stage_sets:
@@ -628,6 +893,7 @@ def install_wasteland_clones(path: str | Path) -> dict[str, Any]:
         try:
             temp_write.write_bytes(rebuilt)
             os.replace(temp_write, archive)
+            _forget_indexed(archive)
         finally:
             try:
                 temp_write.unlink()
@@ -658,6 +924,7 @@ def restore_wasteland_clones(path: str | Path) -> dict[str, Any]:
         try:
             temp_write.write_bytes(backup.read_bytes())
             os.replace(temp_write, archive)
+            _forget_indexed(archive)
         finally:
             try:
                 temp_write.unlink()
@@ -675,6 +942,14 @@ def restore_wasteland_clones(path: str | Path) -> dict[str, Any]:
         return {"ok": False, "path": str(archive), "status": "failed", "changed": False, "reason": str(exc)}
 
 
+def _forget_indexed(archive: Path) -> None:
+    # The size/mtime key already goes stale on rewrite; dropping the entry
+    # also covers filesystems with coarse timestamps.
+    index = archive_index()
+    index.forget(archive)
+    index.save()
+
+
 def _stage_clone_targets(root: str | Path) -> list[Path]:
     """Return all verified stage-menu FPKs below the chosen game root."""
     scan = scan_for_stage_archives(root)
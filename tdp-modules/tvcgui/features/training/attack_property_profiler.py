@@ -215,6 +215,13 @@ DEFAULT_POLL_HZ = 240.0
 MAX_EVENT_HISTORY = 20000
 WRITE_INTERVAL_SEC = 0.75
 
+# Journal mode appends each observation to ``<profile>.journal`` and folds the
+# journal into the snapshot document only every so often, so a routine flush
+# costs the new records rather than the whole learned dataset.
+JOURNAL_SUFFIX = ".journal"
+JOURNAL_COMPACT_RECORDS = 4000
+JOURNAL_COMPACT_INTERVAL_SEC = 120.0
+
 PROPERTY_A_GUARD_BITS = {
     0x08: "Mid",
     0x10: "High",
@@ -724,6 +731,73 @@ def _read_doc(path: Path) -> dict:
     return raw
 
 
+def _apply_observation(doc: dict, key: str, event: dict) -> None:
+    """Fold one observation into ``doc``; shared by live capture and journal replay."""
+    seen_utc = str(event.get("timestamp_utc") or "")
+    signatures = doc.setdefault("signatures", {})
+    aggregate = signatures.get(key)
+    if not isinstance(aggregate, dict):
+        aggregate = dict(event)
+        aggregate["first_seen_utc"] = seen_utc
+        aggregate["observations"] = 0
+        aggregate["actors"] = []
+        aggregate["owner_slots"] = []
+        aggregate["victim_slots"] = []
+    aggregate["last_seen_utc"] = seen_utc
+    aggregate["observations"] = _safe_int(aggregate.get("observations")) + 1
+    actors = {str(value) for value in aggregate.get("actors") or []}
+    actors.add(_hex32(event.get("actor")))
+    aggregate["actors"] = sorted(actors)
+    owner_slots = {str(value) for value in aggregate.get("owner_slots") or [] if str(value)}
+    if event.get("owner_slot"):
+        owner_slots.add(str(event["owner_slot"]))
+    aggregate["owner_slots"] = sorted(owner_slots)
+    victim_slots = {str(value) for value in aggregate.get("victim_slots") or [] if str(value)}
+    if event.get("victim_slot"):
+        victim_slots.add(str(event["victim_slot"]))
+    aggregate["victim_slots"] = sorted(victim_slots)
+    signatures[key] = aggregate
+
+    history = doc.setdefault("events", [])
+    history.append(event)
+    if len(history) > MAX_EVENT_HISTORY:
+        del history[:-MAX_EVENT_HISTORY]
+
+
+def journal_path_for(path: Path) -> Path:
+    return path.with_name(path.name + JOURNAL_SUFFIX)
+
+
+def _replay_journal(doc: dict, path: Path) -> int:
+    """Apply journal records newer than the snapshot's ``journal_seq``.
+
+    Records at or below the snapshot sequence were already compacted (the
+    process stopped between writing the snapshot and truncating the journal).
+    A torn final line from an interrupted append is ignored.
+    """
+    try:
+        handle = path.open("r", encoding="utf-8")
+    except OSError:
+        return 0
+    applied = 0
+    floor = _safe_int(doc.get("journal_seq"))
+    with handle:
+        for line in handle:
+            try:
+                record = json.loads(line)
+                seq = int(record["seq"])
+                key = str(record["key"])
+                event = record["event"]
+            except Exception:
+                continue
+            if seq <= floor or not isinstance(event, dict):
+                continue
+            _apply_observation(doc, key, event)
+            doc["journal_seq"] = floor = seq
+            applied += 1
+    return applied
+
+
 def _write_json_atomic(path: Path, doc: dict) -> bool:
     try:
         path.parent.mkdir(parents=True, exist_ok=True)
@@ -789,10 +863,27 @@ class RuntimeAttackPropertyProfiler:
         start_worker: bool = True,
         emit_console: bool = True,
         enable_resolver_hook: bool = False,
+        journal: Optional[bool] = None,
     ):
         self.path = Path(path or default_profile_path())
         self.event_path = Path(event_path or default_event_path())
         self.doc = _read_doc(self.path)
+        if journal is None:
+            journal = str(os.environ.get("TVC_ATTACK_PROPERTY_JOURNAL", "1")).strip().lower() not in {"0", "false", "no", "off"}
+        self._journal = bool(journal)
+        self.journal_path = journal_path_for(self.path)
+        self._journal_records = _replay_journal(self.doc, self.journal_path) if self._journal else 0
+        self._journal_seq = _safe_int(self.doc.get("journal_seq"))
+        self._pending_journal: list[str] = []
+        self._last_compact = time.monotonic()
+        self._persist_stats: Dict[str, Any] = {
+            "mode": "journal" if self._journal else "snapshot",
+            "replayed": self._journal_records,
+            "flushes": 0,
+            "compactions": 0,
+            "last_flush_ms": 0.0,
+            "last_compact_ms": 0.0,
+        }
         self._read_u32 = read_u32 or rd32
         self._read_block = read_block or rbytes
         self._enable_resolver_hook = bool(enable_resolver_hook)
@@ -1553,34 +1644,13 @@ class RuntimeAttackPropertyProfiler:
         event["gui_frame"] = int(gui_frame)
 
         key = self._signature_key(record)
-        signatures = self.doc.setdefault("signatures", {})
-        aggregate = signatures.get(key)
-        if not isinstance(aggregate, dict):
-            aggregate = dict(event)
-            aggregate["first_seen_utc"] = now_utc
-            aggregate["observations"] = 0
-            aggregate["actors"] = []
-            aggregate["owner_slots"] = []
-            aggregate["victim_slots"] = []
-        aggregate["last_seen_utc"] = now_utc
-        aggregate["observations"] = _safe_int(aggregate.get("observations")) + 1
-        actors = {str(value) for value in aggregate.get("actors") or []}
-        actors.add(_hex32(record.get("actor")))
-        aggregate["actors"] = sorted(actors)
-        owner_slots = {str(value) for value in aggregate.get("owner_slots") or [] if str(value)}
-        if record.get("owner_slot"):
-            owner_slots.add(str(record["owner_slot"]))
-        aggregate["owner_slots"] = sorted(owner_slots)
-        victim_slots = {str(value) for value in aggregate.get("victim_slots") or [] if str(value)}
-        if record.get("victim_slot"):
-            victim_slots.add(str(record["victim_slot"]))
-        aggregate["victim_slots"] = sorted(victim_slots)
-        signatures[key] = aggregate
-
-        history = self.doc.setdefault("events", [])
-        history.append(event)
-        if len(history) > MAX_EVENT_HISTORY:
-            del history[:-MAX_EVENT_HISTORY]
+        _apply_observation(self.doc, key, event)
+        if self._journal:
+            self._journal_seq += 1
+            self.doc["journal_seq"] = self._journal_seq
+            self._pending_journal.append(
+                json.dumps({"seq": self._journal_seq, "key": key, "event": event}, separators=(",", ":"))
+            )
         self._pending_csv.append(event)
         self._dirty = True
         self._change_serial += 1
@@ -1675,22 +1745,65 @@ class RuntimeAttackPropertyProfiler:
                 delay = 0.0005
             self._stop.wait(delay)
 
+    def _write_journal(self, lines: list[str], *, compact: bool, doc_copy: Optional[dict]) -> bool:
+        """Append ``lines``, or fold everything into the snapshot when compacting."""
+        if compact and doc_copy is not None:
+            started = time.perf_counter()
+            if _write_json_atomic(self.path, doc_copy):
+                try:
+                    self.journal_path.open("w", encoding="utf-8").close()
+                except OSError:
+                    pass
+                with self._lock:
+                    self._journal_records = 0
+                    self._last_compact = time.monotonic()
+                    self._persist_stats["compactions"] += 1
+                    self._persist_stats["last_compact_ms"] = round((time.perf_counter() - started) * 1000.0, 3)
+                return True
+        if not lines:
+            return not compact
+        try:
+            self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+            with self.journal_path.open("a", encoding="utf-8", newline="\n") as handle:
+                handle.write("\n".join(lines))
+                handle.write("\n")
+        except Exception:
+            return False
+        with self._lock:
+            self._journal_records += len(lines)
+        return True
+
     def _write_pending(self, *, force: bool = False) -> bool:
         now = time.monotonic()
+        started = time.perf_counter()
         with self._lock:
             if not force and now - self._last_write < WRITE_INTERVAL_SEC:
                 return True
             dirty = self._dirty
             change_serial = self._change_serial
             pending = list(self._pending_csv)
+            journal_lines = list(self._pending_journal)
+            compact = False
+            if self._journal:
+                held = self._journal_records + len(journal_lines)
+                compact = held > 0 and (
+                    force
+                    or held >= JOURNAL_COMPACT_RECORDS
+                    or now - self._last_compact >= JOURNAL_COMPACT_INTERVAL_SEC
+                )
+                dirty = dirty or compact
             if not dirty and not pending:
                 self._last_write = now
                 return True
-            doc_copy = json.loads(json.dumps(self.doc))
+            # Snapshot mode copies the doc every flush; journal mode only when compacting.
+            doc_copy = json.loads(json.dumps(self.doc)) if dirty and (compact or not self._journal) else None
 
         json_ok = True
         csv_ok = True
-        if dirty:
+        if self._journal:
+            if journal_lines or compact:
+                json_ok = self._write_journal(journal_lines, compact=compact, doc_copy=doc_copy)
+        elif dirty:
             json_ok = _write_json_atomic(self.path, doc_copy)
         if pending:
             try:
@@ -1719,11 +1832,22 @@ class RuntimeAttackPropertyProfiler:
         with self._lock:
             if json_ok and self._change_serial == change_serial:
                 self._dirty = False
+            if json_ok and journal_lines:
+                del self._pending_journal[:len(journal_lines)]
             if csv_ok and pending:
                 del self._pending_csv[:len(pending)]
             self._last_write = now
+            self._persist_stats["flushes"] += 1
+            self._persist_stats["last_flush_ms"] = round((time.perf_counter() - started) * 1000.0, 3)
         return bool(json_ok and csv_ok)
 
+    def persistence_stats(self) -> dict:
+        with self._lock:
+            out = dict(self._persist_stats)
+            out["journal_records"] = self._journal_records
+            out["pending_records"] = len(self._pending_journal)
+        return out
+
     @staticmethod
     def _debug_hex(value: Any, width: int = 8) -> str:
         return f"0x{_safe_int(value) & 0xFFFFFFFF:0{int(width)}X}"
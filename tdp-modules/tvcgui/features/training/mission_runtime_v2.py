@@ -90,6 +90,10 @@ class CompiledStep:
     immediate: bool = False
     mash_button: str = ""
     mash_family: str = ""
+    # Precomputed by compile_steps so consume() never rebuilds the expected
+    # label list or re-derives which owner events a step can react to.
+    expected: tuple[str, ...] = ()
+    owner_event_kinds: frozenset[str] = frozenset()
 
     @property
     def label(self) -> str:
@@ -171,6 +175,18 @@ class RuntimeResult:
     goal_max_hits: int = 0
 
 
+# Owner-slot events each step kind can possibly consume.  Everything else from
+# the owner is skipped before label resolution, which is the expensive part of
+# matching an ACTION event (move-map lookup plus label normalisation).
+STEP_OWNER_EVENT_KINDS: dict[StepKind, frozenset[str]] = {
+    StepKind.ACTION: frozenset({EVENT_ACTION}),
+    StepKind.JUMP_CANCEL: frozenset({EVENT_INPUT, EVENT_JUMP}),
+    StepKind.BAROQUE: frozenset({EVENT_INPUT}),
+    StepKind.ASSIST: frozenset({EVENT_INPUT}),
+}
+LABEL_MATCH_CACHE_LIMIT = 2048
+
+
 LabelMatcher = Callable[[str, Sequence[str]], bool]
 ActionLabelResolver = Callable[[MissionEvent], Sequence[str]]
 WhiffPolicy = Callable[[Sequence[str], object], bool]
@@ -246,6 +262,11 @@ def compile_steps(
                 if notation_buttons and len(set(notation_buttons)) == 1:
                     mash_button = notation_buttons[0]
 
+        expected = (*labels, notation) if notation else labels
+        owner_event_kinds = STEP_OWNER_EVENT_KINDS[kind]
+        if mash_button:
+            owner_event_kinds = owner_event_kinds | {EVENT_INPUT}
+
         compiled.append(
             CompiledStep(
                 index=index,
@@ -258,11 +279,16 @@ def compile_steps(
                 immediate=immediate,
                 mash_button=mash_button,
                 mash_family=mash_family,
+                expected=expected,
+                owner_event_kinds=owner_event_kinds,
             )
         )
     return tuple(compiled)
 
 
+_OWNER_ROUTE_EVENT_KINDS = frozenset({EVENT_INPUT, EVENT_JUMP, EVENT_ACTION})
+
+
 class MissionRuntimeV2:
     """Small event-driven state machine for one active Mission Mode route."""
 
@@ -272,6 +298,12 @@ class MissionRuntimeV2:
         self._goal: dict = {}
         self._state = AttemptState()
         self._latest_sequence = 0
+        self._tracks_mash = False
+        # (step index, live label) -> matcher verdict.  Live labels come from a
+        # small per-character move map, so the same handful of strings repeat
+        # for the whole attempt and the matcher's normalisation runs once each.
+        self._label_match_cache: dict[tuple[int, str], bool] = {}
+        self._label_match_owner: LabelMatcher | None = None
 
     @property
     def state(self) -> AttemptState:
@@ -285,6 +317,8 @@ class MissionRuntimeV2:
         self._mission_key = None
         self._steps = ()
         self._goal = {}
+        self._tracks_mash = False
+        self._label_match_cache.clear()
         self._latest_sequence = max(0, int(event_floor or 0))
         self._state = AttemptState(event_floor=self._latest_sequence)
 
@@ -304,6 +338,8 @@ class MissionRuntimeV2:
             return
         self._mission_key = key
         self._steps = compile_steps(raw_steps, whiff_policy=whiff_policy)
+        self._tracks_mash = any(step.mash_button for step in self._steps)
+        self._label_match_cache.clear()
         self._goal = dict(goal or {})
         floor = max(0, int(event_floor or 0))
         self._latest_sequence = floor
@@ -458,12 +494,13 @@ class MissionRuntimeV2:
         step = self._current_step()
         if step is None or step.kind != StepKind.ACTION:
             return False
-        expected = list(step.labels)
-        if step.input_notation:
-            expected.append(step.input_notation)
-        if not expected:
+        if not step.expected:
             return False
-        if any(label_matcher(str(candidate), expected) for candidate in labels if str(candidate).strip()):
+        if any(
+            self._cached_label_match(step, str(candidate), label_matcher)
+            for candidate in labels
+            if str(candidate).strip()
+        ):
             return True
 
         # Chun-Li's Lightning Legs strengths can share a generic action family.
@@ -482,6 +519,24 @@ class MissionRuntimeV2:
             return int(event.action_id or 0) >= 0x100
         return False
 
+    def _cached_label_match(
+        self,
+        step: CompiledStep,
+        candidate: str,
+        label_matcher: LabelMatcher,
+    ) -> bool:
+        if label_matcher != self._label_match_owner:
+            self._label_match_owner = label_matcher
+            self._label_match_cache.clear()
+        key = (step.index, candidate)
+        cached = self._label_match_cache.get(key)
+        if cached is None:
+            cached = bool(label_matcher(candidate, list(step.expected)))
+            if len(self._label_match_cache) >= LABEL_MATCH_CACHE_LIMIT:
+                self._label_match_cache.clear()
+            self._label_match_cache[key] = cached
+        return cached
+
     def _recent_damage_for_action(self, action: MissionEvent) -> RecentDamage | None:
         for damage in reversed(self._state.recent_damage):
             if damage.consumed:
@@ -530,7 +585,8 @@ class MissionRuntimeV2:
         )
 
     def _consume_input(self, event: MissionEvent) -> None:
-        self._record_mash_edges(event)
+        if self._tracks_mash:
+            self._record_mash_edges(event)
         step = self._current_step()
         if step is None:
             return
@@ -624,17 +680,21 @@ class MissionRuntimeV2:
         is_owner = str(event.slot) == str(owner_slot)
         is_enemy = self._is_enemy(event, owner_team)
 
-        if event.kind == EVENT_INPUT and is_owner:
-            self._consume_input(event)
-            return
-
-        if event.kind == EVENT_JUMP and is_owner:
-            self._consume_jump(event, jump_cancel_checker)
-            return
-
-        if event.kind == EVENT_ACTION and is_owner:
-            labels = tuple(action_label_resolver(event) or ())
-            self._consume_action(event, labels, label_matcher)
+        if is_owner and event.kind in _OWNER_ROUTE_EVENT_KINDS:
+            step = self._current_step()
+            if step is None or event.kind not in step.owner_event_kinds:
+                # The current step cannot use this event.  Only mash history
+                # has to keep accumulating for a later Legs-style step.
+                if event.kind == EVENT_INPUT and self._tracks_mash:
+                    self._record_mash_edges(event)
+                return
+            if event.kind == EVENT_INPUT:
+                self._consume_input(event)
+            elif event.kind == EVENT_JUMP:
+                self._consume_jump(event, jump_cancel_checker)
+            else:
+                labels = tuple(action_label_resolver(event) or ())
+                self._consume_action(event, labels, label_matcher)
             return
 
         if event.kind == EVENT_DAMAGE and is_enemy:
@@ -38,6 +38,7 @@ from ctypes import wintypes
 import dolphin_memory_engine as dme
 from tvcgui.core.constants import MEM1_LO, MEM1_HI, MEM2_LO, MEM2_HI
 from tvcgui.core.paths import user_data_path
+from tvcgui.platform.move_memory import shared_move_memory
 
 # Character-select write quarantine is controlled by main.py. It blocks tool-side
 # emulated-memory writes while the select scene is active and records attempts.
@@ -912,16 +913,23 @@ def wbytes(addr, data, *, bypass_quarantine: bool = False):
         _trace_quarantined_write(int(addr), payload)
         return False
 
+    ok = _write_payload(addr, payload)
+    # Attempted writes count as well: a failed WPM can still have landed.
+    _note_move_memory_write(addr, len(payload))
+    return ok
+
+
+def _write_payload(addr, payload):
     # MEM2: latched write if possible
     if _IS_WINDOWS and (MEM2_LO <= addr < MEM2_HI):
         if _ensure_mem2_latched():
             host = _mem2_host_addr(addr)
-            if _wpm(_mem2_proc_handle, host, bytes(data)):
+            if _wpm(_mem2_proc_handle, host, payload):
                 return True
 
         # fallback
         try:
-            dme.write_bytes(addr, data)
+            dme.write_bytes(addr, payload)
             return True
         except Exception as e:
             print(f"wbytes failed at {addr:08X}: {e}")
@@ -929,13 +937,21 @@ def wbytes(addr, data, *, bypass_quarantine: bool = False):
 
     # MEM1 or non-windows
     try:
-        dme.write_bytes(addr, data)
+        dme.write_bytes(addr, payload)
         return True
     except Exception as e:
         print(f"wbytes failed at {addr:08X}: {e}")
         return False
 
 
+def _note_move_memory_write(addr, size):
+    # Drop shared move-memory reads that this write may have made stale.
+    try:
+        shared_move_memory().note_write(addr, size)
+    except Exception:
+        pass
+
+
 def wd8(addr, value, *, bypass_quarantine: bool = False):
     try:
         val = int(value) & 0xFF
@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+import struct
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable
+
+try:
+    from tvcgui.platform.dolphin import rbytes
+except Exception:  # pragma: no cover
+    rbytes = None
+
+# Watched spans closer than this are fetched by one read.  Fighter and team
+# blocks keep their interesting words within a few hundred bytes of each other.
+WATCH_READ_GAP = 0x80
+WATCH_MAX_READ_SPAN = 0x1000
+DEFAULT_MAX_POLLED_BYTES = 0x4000
+
+WatchCallback = Callable[[int, bytes | None, bytes], None]
+
+
+@dataclass(slots=True)
+class MemoryWatch:
+    watch_id: int
+    addr: int
+    size: int
+    label: str = ""
+    callback: WatchCallback | None = None
+    queue: Any = None
+    value: bytes | None = None
+    polled_at: float = 0.0
+    polls: int = 0
+    hits: int = 0
+    read_misses: int = 0
+
+
+def _span_plan(watches: list[MemoryWatch]) -> list[tuple[int, int, list[MemoryWatch]]]:
+    plan: list[list[Any]] = []
+    for watch in sorted(watches, key=lambda row: row.addr):
+        end = watch.addr + watch.size
+        if plan:
+            start, cur_end, members = plan[-1]
+            if watch.addr <= cur_end + WATCH_READ_GAP and max(end, cur_end) - start <= WATCH_MAX_READ_SPAN:
+                plan[-1][1] = max(cur_end, end)
+                members.append(watch)
+                continue
+        plan.append([watch.addr, end, [watch]])
+    return [(start, end, members) for start, end, members in plan]
+
+
+class WatchRegistry:
+    """Poll registered memory spans once per tick and dispatch only changes.
+
+    Consumers register ``(addr, size)`` with a callback, a queue, or neither
+    (and read :meth:`value` afterwards).  :meth:`poll` reads every watched span
+    in coalesced batches, so the per-tick cost is one read per cluster instead
+    of one per consumer.  ``max_polled_bytes`` caps the total watched bytes;
+    registrations that would exceed it are refused and counted as rejected.
+    """
+
+    def __init__(
+        self,
+        *,
+        read_func: Callable[[int, int], bytes | None] | None = None,
+        max_polled_bytes: int = DEFAULT_MAX_POLLED_BYTES,
+    ) -> None:
+        self._read_func = read_func
+        self._lock = threading.RLock()
+        self._watches: dict[int, MemoryWatch] = {}
+        self._next_id = 1
+        self._plan: list[tuple[int, int, list[MemoryWatch]]] | None = None
+        self.max_polled_bytes = max(1, int(max_polled_bytes))
+        self._stats: dict[str, Any] = {
+            "polls": 0,
+            "read_calls": 0,
+            "bytes_read": 0,
+            "changes": 0,
+            "rejected": 0,
+            "dispatch_errors": 0,
+            "last_poll_ms": 0.0,
+        }
+
+    def _read(self, addr: int, size: int) -> bytes | None:
+        reader = self._read_func or rbytes
+        if reader is None:
+            return None
+        try:
+            data = reader(int(addr), int(size))
+        except Exception:
+            return None
+        if not data or len(data) != int(size):
+            return None
+        return bytes(data)
+
+    def polled_bytes(self) -> int:
+        with self._lock:
+            return sum(watch.size for watch in self._watches.values())
+
+    def register(
+        self,
+        addr: int,
+        size: int,
+        *,
+        callback: WatchCallback | None = None,
+        queue: Any = None,
+        label: str = "",
+    ) -> int:
+        """Return a watch id, or ``0`` when the span is invalid or over budget."""
+        try:
+            addr_i = int(addr)
+            size_i = int(size)
+        except Exception:
+            addr_i, size_i = 0, 0
+        with self._lock:
+            if addr_i <= 0 or size_i <= 0 or self.polled_bytes() + size_i > self.max_polled_bytes:
+                self._stats["rejected"] += 1
+                return 0
+            watch_id = self._next_id
+            self._next_id += 1
+            self._watches[watch_id] = MemoryWatch(
+                watch_id=watch_id,
+                addr=addr_i,
+                size=size_i,
+                label=str(label or f"0x{addr_i:08X}"),
+                callback=callback,
+                queue=queue,
+            )
+            self._plan = None
+        return watch_id
+
+    def unregister(self, watch_id: int) -> bool:
+        with self._lock:
+            removed = self._watches.pop(int(watch_id or 0), None) is not None
+            if removed:
+                self._plan = None
+        return removed
+
+    def clear(self) -> None:
+        with self._lock:
+            self._watches.clear()
+            self._plan = None
+
+    def value(self, watch_id: int, *, max_age_sec: float | None = None) -> bytes | None:
+        """Return the last polled bytes, or ``None`` if unknown or too old."""
+        with self._lock:
+            watch = self._watches.get(int(watch_id or 0))
+            if watch is None or watch.value is None:
+                return None
+            if max_age_sec is not None and time.monotonic() - watch.polled_at > float(max_age_sec):
+                return None
+            return watch.value
+
+    def value_u32(self, watch_id: int, *, max_age_sec: float | None = None) -> int | None:
+        data = self.value(watch_id, max_age_sec=max_age_sec)
+        if data is None or len(data) < 4:
+            return None
+        return struct.unpack_from(">I", data, 0)[0]
+
+    def poll(self) -> int:
+        """Read all watched spans once and dispatch changes; return change count."""
+        t0 = time.perf_counter()
+        with self._lock:
+            if self._plan is None:
+                self._plan = _span_plan(list(self._watches.values()))
+            plan = self._plan
+        changed: list[tuple[MemoryWatch, bytes | None, bytes]] = []
+        reads = 0
+        read_bytes = 0
+        now = time.monotonic()
+        for start, end, members in plan:
+            block = self._read(start, end - start)
+            reads += 1
+            read_bytes += end - start
+            for watch in members:
+                watch.polls += 1
+                if block is None:
+                    watch.read_misses += 1
+                    continue
+                off = watch.addr - start
+                current = block[off:off + watch.size]
+                watch.polled_at = now
+                if current != watch.value:
+                    previous = watch.value
+                    watch.value = current
+                    watch.hits += 1
+                    changed.append((watch, previous, current))
+
+        errors = 0
+        for watch, previous, current in changed:
+            try:
+                if watch.callback is not None:
+                    watch.callback(watch.addr, previous, current)
+                if watch.queue is not None:
+                    watch.queue.put_nowait((watch.label, watch.addr, previous, current))
+            except Exception:
+                errors += 1
+
+        with self._lock:
+            self._stats["polls"] += 1
+            self._stats["read_calls"] += reads
+            self._stats["bytes_read"] += read_bytes
+            self._stats["changes"] += len(changed)
+            self._stats["dispatch_errors"] += errors
+            self._stats["last_poll_ms"] = (time.perf_counter() - t0) * 1000.0
+        return len(changed)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            out = dict(self._stats)
+            out["watches"] = len(self._watches)
+            out["polled_bytes"] = sum(watch.size for watch in self._watches.values())
+            out["max_polled_bytes"] = self.max_polled_bytes
+            out["spans"] = len(self._plan) if self._plan is not None else len(_span_plan(list(self._watches.values())))
+            out["per_watch"] = {
+                watch.label: {
+                    "addr": watch.addr,
+                    "size": watch.size,
+                    "hits": watch.hits,
+                    "polls": watch.polls,
+                    "read_misses": watch.read_misses,
+                }
+                for watch in self._watches.values()
+            }
+        return out
+
+
+WATCHES = WatchRegistry()
+
+
+def register_watch(addr: int, size: int, **kwargs: Any) -> int:
+    return WATCHES.register(addr, size, **kwargs)
+
+
+def unregister_watch(watch_id: int) -> bool:
+    return WATCHES.unregister(watch_id)
+
+
+def poll_watches() -> int:
+    return WATCHES.poll()
+
+
+def get_watch_stats() -> dict[str, Any]:
+    return WATCHES.stats()
@@ -0,0 +1,301 @@
+"""Session-wide cache of character move memory.
+
+The frame-data window, the workbench probes, the cancel lab and the dumper
+all read the same move scripts and command tables, each through its own
+private ``rbytes`` calls.  :class:`MoveMemoryCache` sits in front of
+``dolphin.rbytes`` and lets them share those reads.
+
+Blocks are keyed by character and start address, and a read that falls
+inside a cached block is served as a slice of it.  Everything cached belongs
+to one *generation*.  The generation is bumped, and the cache emptied, when
+the roster changes, when a character is reloaded, or when a write through
+``dolphin.wbytes`` overlaps a cached block.  A read that was in flight while
+the generation moved, or while a write landed on its range, is returned to
+its caller but never stored, so neither can be undone by a slow worker thread.
+
+Only static move data should go through here.  Live fighter state (health,
+timers, input buffers) changes every frame and must keep reading directly.
+"""
+from __future__ import annotations
+
+import os
+import threading
+from bisect import bisect_left, bisect_right, insort
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Set, Tuple
+
+ReadBytes = Callable[[int, int], bytes]
+
+MOVE_MEMORY_CACHE_BYTES = int(os.environ.get("TVC_MOVE_MEMORY_CACHE_KB", "16384") or 16384) * 1024
+
+
+def _dolphin_rbytes(addr: int, size: int) -> bytes:
+    from tvcgui.platform.dolphin import rbytes
+
+    return rbytes(addr, size)
+
+
+class MoveMemoryCache:
+    """Generation-tagged byte blocks keyed by ``(char, addr)``."""
+
+    def __init__(self, rbytes: Optional[ReadBytes] = None, *, max_bytes: int = MOVE_MEMORY_CACHE_BYTES) -> None:
+        self._rbytes = rbytes or _dolphin_rbytes
+        self.max_bytes = max(0, int(max_bytes))
+        self._lock = threading.RLock()
+        self._blocks: "OrderedDict[Tuple[Hashable, int], bytes]" = OrderedDict()
+        # Sorted block starts per character, for containment lookups, and the
+        # longest block per character so a lookup knows how far back to look.
+        self._starts: Dict[Hashable, List[int]] = {}
+        self._longest: Dict[Hashable, int] = {}
+        self._bytes = 0
+        self._generation = 0
+        self._roster: Any = None
+        # Spans other caches derive data from; writes into them bump the
+        # generation even when none of their bytes are cached here.
+        self._watched: Dict[Hashable, Tuple[int, int]] = {}
+        # Uncached reads still waiting on Dolphin, by ticket, and the tickets
+        # a write has overlapped since they started.
+        self._in_flight: Dict[int, Tuple[int, int]] = {}
+        self._overwritten: Set[int] = set()
+        self._tickets = 0
+        self._stats: Dict[str, Any] = {
+            "hits": 0,
+            "misses": 0,
+            "bytes_read": 0,
+            "bytes_served": 0,
+            "stale_drops": 0,
+            "evictions": 0,
+            "invalidations": {},
+        }
+
+    # ---- reads ----
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def _lookup(self, char: Hashable, addr: int, size: int) -> Optional[bytes]:
+        starts = self._starts.get(char)
+        if not starts:
+            return None
+        end = addr + size
+        i = bisect_right(starts, addr) - 1
+        floor = addr - self._longest.get(char, 0)
+        while i >= 0 and starts[i] >= floor:
+            start = starts[i]
+            block = self._blocks.get((char, start))
+            if block is not None and start + len(block) >= end:
+                self._blocks.move_to_end((char, start))
+                off = addr - start
+                return block[off:off + size]
+            i -= 1
+        return None
+
+    def read(self, addr: int, size: int, *, char: Hashable = None) -> bytes:
+        """Return ``size`` bytes at ``addr``, from the cache when possible."""
+        addr = int(addr)
+        size = int(size)
+        if size <= 0:
+            return b""
+        with self._lock:
+            hit = self._lookup(char, addr, size)
+            if hit is not None:
+                self._stats["hits"] += 1
+                self._stats["bytes_served"] += len(hit)
+                return hit
+            self._stats["misses"] += 1
+            generation = self._generation
+            self._tickets += 1
+            ticket = self._tickets
+            self._in_flight[ticket] = (addr, addr + size)
+        try:
+            data = bytes(self._rbytes(addr, size) or b"")
+        finally:
+            with self._lock:
+                self._in_flight.pop(ticket, None)
+                overwritten = ticket in self._overwritten
+                self._overwritten.discard(ticket)
+        with self._lock:
+            self._stats["bytes_read"] += len(data)
+            if len(data) != size:
+                return data
+            if overwritten or generation != self._generation:
+                self._stats["stale_drops"] += 1
+                return data
+            self._store(char, addr, data)
+        return data
+
+    def reader(self, char: Hashable = None) -> ReadBytes:
+        """An ``rbytes(addr, size)`` callable bound to one character."""
+
+        def rbytes(addr: int, size: int) -> bytes:
+            return self.read(addr, size, char=char)
+
+        return rbytes
+
+    def _store(self, char: Hashable, addr: int, data: bytes) -> None:
+        size = len(data)
+        if size > self.max_bytes // 2:
+            return
+        key = (char, addr)
+        old = self._blocks.pop(key, None)
+        if old is not None:
+            self._bytes -= len(old)
+        else:
+            insort(self._starts.setdefault(char, []), addr)
+        self._blocks[key] = data
+        self._bytes += size
+        if size > self._longest.get(char, 0):
+            self._longest[char] = size
+        while self._bytes > self.max_bytes and self._blocks:
+            self._evict_oldest()
+
+    def _evict_oldest(self) -> None:
+        (char, start), block = self._blocks.popitem(last=False)
+        self._bytes -= len(block)
+        self._stats["evictions"] += 1
+        starts = self._starts.get(char)
+        if starts:
+            i = bisect_left(starts, start)
+            if i < len(starts) and starts[i] == start:
+                del starts[i]
+            if not starts:
+                self._starts.pop(char, None)
+                self._longest.pop(char, None)
+
+    # ---- invalidation ----
+
+    def bump(self, reason: str = "manual") -> int:
+        """Start a new generation and drop every cached block."""
+        with self._lock:
+            self._generation += 1
+            self._blocks.clear()
+            self._starts.clear()
+            self._longest.clear()
+            self._bytes = 0
+            counts = self._stats["invalidations"]
+            counts[reason] = counts.get(reason, 0) + 1
+            return self._generation
+
+    def _overlaps(self, addr: int, end: int) -> bool:
+        for char, starts in self._starts.items():
+            i = bisect_left(starts, end) - 1
+            floor = addr - self._longest.get(char, 0)
+            while i >= 0 and starts[i] >= floor:
+                block = self._blocks.get((char, starts[i]))
+                if block is not None and starts[i] + len(block) > addr:
+                    return True
+                i -= 1
+        return False
+
+    def watch_span(self, key: Hashable, addr: int, size: int) -> None:
+        """Treat writes into ``[addr, addr + size)`` as invalidating."""
+        with self._lock:
+            self._watched[key] = (int(addr), int(addr) + max(0, int(size)))
+
+    def unwatch_span(self, key: Hashable) -> None:
+        with self._lock:
+            self._watched.pop(key, None)
+
+    def note_write(self, addr: int, size: int) -> bool:
+        """Invalidate when a write lands on cached, watched or in-flight bytes.
+
+        Writes elsewhere (training flags, fighter state) leave the generation
+        alone, so the per-frame writes from the main loop don't flush the cache.
+        A read in flight over the written range is marked so its result is not
+        stored; it is returned to its caller as read.
+        """
+        try:
+            addr = int(addr)
+            end = addr + max(1, int(size))
+        except Exception:
+            return False
+        with self._lock:
+            for ticket, (lo, hi) in self._in_flight.items():
+                if lo < end and addr < hi:
+                    self._overwritten.add(ticket)
+            watched = any(lo < end and addr < hi for lo, hi in self._watched.values())
+            if not watched and (not self._blocks or not self._overlaps(addr, end)):
+                return False
+            self.bump("write")
+            return True
+
+    def note_roster(self, signature: Any) -> bool:
+        """Bump when the loaded characters differ from the last call."""
+        with self._lock:
+            if signature == self._roster:
+                return False
+            first = self._roster is None
+            self._roster = signature
+            if first and not self._blocks:
+                return False
+            self.bump("roster")
+            return True
+
+    def clear(self) -> None:
+        self.bump("clear")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            out = dict(self._stats)
+            out["invalidations"] = dict(self._stats["invalidations"])
+            lookups = out["hits"] + out["misses"]
+            out["hit_rate"] = round(out["hits"] / lookups, 4) if lookups else 0.0
+            out["generation"] = self._generation
+            out["blocks"] = len(self._blocks)
+            out["watched"] = len(self._watched)
+            out["bytes"] = self._bytes
+        return out
+
+
+_SHARED = MoveMemoryCache()
+
+
+def shared_move_memory() -> MoveMemoryCache:
+    return _SHARED
+
+
+def move_memory_reader(char: Hashable = None) -> ReadBytes:
+    return _SHARED.reader(char)
+
+
+def move_memory_char_key(target_slot: Any) -> Hashable:
+    """Cache key for a scanned slot dict: its character id, or None."""
+    if not isinstance(target_slot, dict):
+        return None
+    for field in ("char_id", "csv_char_id", "id"):
+        try:
+            value = int(target_slot.get(field) or 0)
+        except Exception:
+            continue
+        if value > 0:
+            return value
+    return None
+
+
+def invalidate_move_memory(reason: str = "manual") -> int:
+    return _SHARED.bump(reason)
+
+
+def move_memory_debug_rows() -> List[Tuple[str, str, str]]:
+    """Rows for the debug panel: ``(name, "move_memory", text)``."""
+    stats = _SHARED.stats()
+    lookups = stats["hits"] + stats["misses"]
+    invalidations = stats["invalidations"]
+    reasons = ", ".join(f"{name} {count}" for name, count in sorted(invalidations.items()))
+    return [
+        ("MoveMemHits", "move_memory", f"{stats['hits']}/{lookups} ({stats['hit_rate'] * 100:.0f}%)"),
+        ("MoveMemGen", "move_memory", f"{stats['generation']} ({stats['blocks']} blk, {stats['bytes'] // 1024} KB)"),
+        ("MoveMemInval", "move_memory", f"{sum(invalidations.values())}" + (f" ({reasons})" if reasons else "")),
+    ]
+
+
+__all__ = [
+    "MOVE_MEMORY_CACHE_BYTES",
+    "MoveMemoryCache",
+    "invalidate_move_memory",
+    "move_memory_char_key",
+    "move_memory_debug_rows",
+    "move_memory_reader",
+    "shared_move_memory",
+]
@@ -27,11 +27,28 @@ _STATS: dict[str, Any] = {
     "last_write_addr": 0,
     "last_write_size": 0,
     "last_write_ms": 0.0,
+    "txn_count": 0,
+    "txn_edits": 0,
+    "txn_edits_skipped": 0,
+    "txn_read_calls": 0,
+    "txn_write_calls": 0,
+    "txn_bytes_written": 0,
+    "slow_txns": 0,
+    "last_txn_key": "",
+    "last_txn_edits": 0,
+    "last_txn_dirty": 0,
+    "last_txn_reads": 0,
+    "last_txn_writes": 0,
+    "last_txn_ms": 0.0,
 }
 _SLOW_LOG_UNTIL: dict[str, float] = {}
 SLOW_WRITE_MS = 20.0
 SLOW_LOG_TTL_SEC = 1.0
 DEFAULT_CACHE_TTL_SEC = 0.0
+# Transaction reads merge spans separated by at most this many bytes, so a
+# fighter-base packet scattered over a few hundred bytes costs one read.
+TXN_READ_GAP = 0x40
+TXN_MAX_READ_SPAN = 0x1000
 
 
 def _now() -> float:
@@ -191,20 +208,261 @@ def write_many(
 ) -> bool:
     if not isinstance(writes, dict) or not writes:
         return True
+    result = commit_writes(
+        list(writes.items()),
+        key=key,
+        priority=priority,
+        dirty=dirty,
+        force=force,
+        cache_ttl_sec=cache_ttl_sec,
+    )
+    return bool(result["ok"])
+
+
+def _normalize_edits(edits) -> tuple[list[tuple[int, bytes]], list[tuple[int, str]]]:
+    """Split ``edits`` into valid ``(addr, bytes)`` rows and ``(index, reason)`` rejects."""
+    rows: list[tuple[int, bytes]] = []
+    invalid: list[tuple[int, str]] = []
+    for index, edit in enumerate(edits):
+        try:
+            addr, payload = edit
+            if isinstance(payload, int):
+                # bytes(n) would silently write n zero bytes.
+                raise TypeError(f"payload is an int ({payload!r}), not bytes")
+            addr_i = int(addr)
+            data = bytes(payload)
+        except Exception as e:
+            invalid.append((index, repr(e)))
+            continue
+        if addr_i <= 0:
+            invalid.append((index, f"bad address {addr_i:#x}"))
+        elif not data:
+            invalid.append((index, f"empty payload at 0x{addr_i:08X}"))
+        else:
+            rows.append((addr_i, data))
+    return rows, invalid
+
+
+def _coalesce_spans(rows: list[tuple[int, bytes]], gap: int, max_span: int) -> list[tuple[int, int]]:
+    """Return sorted ``(start, end)`` spans covering every edit."""
+    spans: list[list[int]] = []
+    for addr, data in sorted(rows, key=lambda row: row[0]):
+        end = addr + len(data)
+        if spans and addr <= spans[-1][1] + gap and max(end, spans[-1][1]) - spans[-1][0] <= max_span:
+            spans[-1][1] = max(spans[-1][1], end)
+        else:
+            spans.append([addr, end])
+    return [(start, end) for start, end in spans]
+
+
+def _read_spans(spans: list[tuple[int, int]]) -> tuple[list[tuple[int, bytes]], int]:
+    views: list[tuple[int, bytes]] = []
+    reads = 0
+    for start, end in spans:
+        reads += 1
+        data = _read_current(start, end - start)
+        if data is not None:
+            views.append((start, data))
+    return views, reads
+
+
+def _current_from_views(views: list[tuple[int, bytes]], addr: int, size: int) -> bytes | None:
+    for start, data in views:
+        off = addr - start
+        if 0 <= off and off + size <= len(data):
+            return data[off:off + size]
+    return None
+
+
+def commit_writes(
+    edits,
+    *,
+    key: str = "runtime:txn",
+    priority: int = 50,
+    dirty: bool = True,
+    force: bool = False,
+    cache_ttl_sec: float = DEFAULT_CACHE_TTL_SEC,
+    bypass_quarantine: bool = False,
+    log_slow: bool = True,
+) -> dict[str, Any]:
+    """Commit a batch of ``(addr, bytes)`` edits as one write transaction.
+
+    Edits are applied in order, so a later edit wins where two overlap. With
+    ``dirty`` the target spans are read once in coalesced batches and edits
+    that already match live memory are dropped. The remaining dirty edits are
+    merged into contiguous runs, and each run is one ``wbytes`` call.
+
+    Malformed edits are skipped and listed in ``invalid`` as
+    ``(index, reason)``; the rest of the batch still commits, but ``ok`` is
+    only true when every edit was valid and written.
+    """
+    result: dict[str, Any] = {"ok": False, "edits": 0, "dirty": 0, "reads": 0, "writes": 0, "failed": [], "invalid": []}
+    if wbytes is None:
+        _inc_stat("write_fail")
+        _set_stat("last_error", "dolphin_io.wbytes unavailable")
+        return result
+    try:
+        rows, invalid = _normalize_edits(edits)
+    except Exception as e:
+        _inc_stat("write_fail")
+        _set_stat("last_error", f"bad transaction args: {e!r}")
+        return result
+    if invalid:
+        result["invalid"] = invalid
+        _inc_stat("write_fail")
+        index, reason = invalid[0]
+        _set_stat("last_error", f"skipped {len(invalid)} bad edit(s); first at index {index}: {reason}")
+
+    key_s = str(key or "runtime:txn")
+    result["edits"] = len(rows)
+    if not rows:
+        result["ok"] = not invalid
+        return result
+
+    t0 = _now()
+    pending: list[tuple[int, bytes]] = []
+    if not force and cache_ttl_sec and cache_ttl_sec > 0:
+        with _LOCK:
+            for addr, data in rows:
+                cached = _LAST_WRITES.get(addr)
+                if cached and cached[0] == data and (t0 - cached[1]) <= float(cache_ttl_sec):
+                    continue
+                pending.append((addr, data))
+        _inc_stat("skip_cache", len(rows) - len(pending))
+    else:
+        pending = list(rows)
+
+    # Overlay edits in order so overlapping writes keep last-writer-wins
+    # semantics before diffing against live memory.
+    desired: dict[int, int] = {}
+    for addr, data in pending:
+        for i, value in enumerate(data):
+            desired[addr + i] = value
+
+    dirty_rows = pending
+    if pending and not force and dirty:
+        views, reads = _read_spans(_coalesce_spans(pending, TXN_READ_GAP, TXN_MAX_READ_SPAN))
+        result["reads"] = reads
+        dirty_rows = []
+        skipped = 0
+        now = _now()
+        for addr, data in pending:
+            wanted = bytes(desired[addr + i] for i in range(len(data)))
+            current = _current_from_views(views, addr, len(data))
+            if current == wanted:
+                skipped += 1
+                with _LOCK:
+                    _LAST_WRITES[addr] = (wanted, now, key_s)
+                continue
+            dirty_rows.append((addr, data))
+        _inc_stat("skip_dirty", skipped)
+
+    runs = _coalesce_spans(dirty_rows, 0, TXN_MAX_READ_SPAN) if dirty_rows else []
+    result["dirty"] = len(dirty_rows)
     ok_all = True
-    for addr, payload in list(writes.items()):
-        ok = write_bytes(
-            int(addr),
-            bytes(payload),
-            key=f"{key}:0x{int(addr):08X}",
-            priority=priority,
-            dirty=dirty,
-            force=force,
-            cache_ttl_sec=cache_ttl_sec,
-        )
-        if not ok:
+    written = 0
+    for start, end in runs:
+        payload = bytes(desired[addr] for addr in range(start, end))
+        try:
+            if bypass_quarantine:
+                try:
+                    ok = bool(wbytes(start, payload, bypass_quarantine=True))
+                except TypeError:
+                    ok = bool(wbytes(start, payload))
+            else:
+                ok = bool(wbytes(start, payload))
+        except Exception as e:
+            ok = False
+            _set_stat("last_error", repr(e))
+        result["writes"] += 1
+        if ok:
+            written += len(payload)
+            with _LOCK:
+                stamp = _now()
+                for addr, data in dirty_rows:
+                    if start <= addr and addr + len(data) <= end:
+                        _LAST_WRITES[addr] = (payload[addr - start:addr - start + len(data)], stamp, key_s)
+        else:
             ok_all = False
-    return ok_all
+            result["failed"].append(start)
+
+    elapsed_ms = max(0.0, (_now() - t0) * 1000.0)
+    with _LOCK:
+        _STATS["txn_count"] = int(_STATS.get("txn_count", 0) or 0) + 1
+        _STATS["txn_edits"] = int(_STATS.get("txn_edits", 0) or 0) + len(rows)
+        _STATS["txn_edits_skipped"] = int(_STATS.get("txn_edits_skipped", 0) or 0) + (len(rows) - len(dirty_rows))
+        _STATS["txn_read_calls"] = int(_STATS.get("txn_read_calls", 0) or 0) + int(result["reads"])
+        _STATS["txn_write_calls"] = int(_STATS.get("txn_write_calls", 0) or 0) + int(result["writes"])
+        _STATS["txn_bytes_written"] = int(_STATS.get("txn_bytes_written", 0) or 0) + written
+        _STATS["write_calls"] = int(_STATS.get("write_calls", 0) or 0) + int(result["writes"])
+        _STATS["write_ok"] = int(_STATS.get("write_ok", 0) or 0) + (int(result["writes"]) - len(result["failed"]))
+        _STATS["write_fail"] = int(_STATS.get("write_fail", 0) or 0) + len(result["failed"])
+        _STATS["bytes_written"] = int(_STATS.get("bytes_written", 0) or 0) + written
+        _STATS["last_txn_key"] = key_s
+        _STATS["last_txn_edits"] = len(rows)
+        _STATS["last_txn_dirty"] = len(dirty_rows)
+        _STATS["last_txn_reads"] = int(result["reads"])
+        _STATS["last_txn_writes"] = int(result["writes"])
+        _STATS["last_txn_ms"] = elapsed_ms
+        if runs and ok_all:
+            _STATS["last_write_key"] = key_s
+            _STATS["last_write_addr"] = runs[-1][0]
+            _STATS["last_write_size"] = runs[-1][1] - runs[-1][0]
+            _STATS["last_write_ms"] = elapsed_ms
+            if not invalid:
+                _STATS["last_error"] = ""
+        if result["failed"] and not _STATS.get("last_error"):
+            _STATS["last_error"] = f"wbytes returned false at 0x{result['failed'][0]:08X}"
+
+    if log_slow and elapsed_ms >= SLOW_WRITE_MS:
+        _inc_stat("slow_txns")
+        _rate_limited_slow_log(
+            key_s,
+            f"[runtime patch] slow transaction {elapsed_ms:.1f}ms key={key_s} "
+            f"edits={len(rows)} dirty={len(dirty_rows)} reads={result['reads']} writes={result['writes']}",
+        )
+    result["ok"] = ok_all and not invalid
+    result["elapsed_ms"] = elapsed_ms
+    return result
+
+
+class WriteTransaction:
+    """Collect edits and commit them through :func:`commit_writes`.
+
+    Usable as a context manager; leaving the block commits unless an exception
+    escaped it.  ``result`` holds the last commit report.
+    """
+
+    def __init__(self, *, key: str = "runtime:txn", **commit_kwargs: Any) -> None:
+        self.key = str(key or "runtime:txn")
+        self.commit_kwargs = dict(commit_kwargs)
+        self.edits: list[tuple[int, bytes]] = []
+        self.result: dict[str, Any] = {}
+
+    def write(self, addr: int, payload: bytes | bytearray) -> "WriteTransaction":
+        self.edits.append((int(addr), bytes(payload)))
+        return self
+
+    def u8(self, addr: int, value: int) -> "WriteTransaction":
+        return self.write(addr, bytes([int(value) & 0xFF]))
+
+    def u16(self, addr: int, value: int) -> "WriteTransaction":
+        return self.write(addr, struct.pack(">H", int(value) & 0xFFFF))
+
+    def u32(self, addr: int, value: int) -> "WriteTransaction":
+        return self.write(addr, struct.pack(">I", int(value) & 0xFFFFFFFF))
+
+    def commit(self) -> dict[str, Any]:
+        edits, self.edits = self.edits, []
+        self.result = commit_writes(edits, key=self.key, **self.commit_kwargs)
+        return self.result
+
+    def __enter__(self) -> "WriteTransaction":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.commit()
 
 
 def clear_runtime_patch_state(*, clear_cache: bool = True, clear_slow_log: bool = True) -> dict[str, Any]:
@@ -10,6 +10,11 @@ import time
 
 from tvcgui.platform.dolphin import rd32, wd32
 
+try:
+    import tvcgui.platform.patch_manager as runtime_pm
+except Exception:
+    runtime_pm = None
+
 def _ko_wd32(addr: int, value: int) -> bool:
     """Write a KO control word even while the select-write barrier is active."""
     try:
@@ -18,6 +23,34 @@ def _ko_wd32(addr: int, value: int) -> bool:
         return bool(wd32(addr, value))
 
 
+def _ko_write_packet_u32(base: int, packet, *, key: str, dirty: bool = False) -> int:
+    """Write ``(offset, value)`` words as one transaction; return words landed.
+
+    Adjacent words collapse into a single memory write.  Without the patch
+    manager this falls back to one ``_ko_wd32`` per word.
+    """
+    base_i = int(base or 0)
+    rows = [(base_i + int(off), int(value) & 0xFFFFFFFF) for off, value in packet]
+    if runtime_pm is not None:
+        try:
+            txn = runtime_pm.WriteTransaction(key=key, dirty=dirty, force=not dirty, bypass_quarantine=True)
+            for addr, value in rows:
+                txn.u32(addr, value)
+            result = txn.commit()
+            if result.get("ok"):
+                return len(rows)
+        except Exception:
+            pass
+    wrote = 0
+    for addr, value in rows:
+        try:
+            if _ko_wd32(addr, value):
+                wrote += 1
+        except Exception:
+            pass
+    return wrote
+
+
 # KO lab: base-relative packet that forces a fighter object back to the
 # idle-ish action cluster observed before KO.  This is intentionally a
 # live poke/test helper, not a permanent patch: use the per-panel
@@ -303,15 +336,12 @@ def _ko_ctrl_apply_neutral_baseline(slot: str, base: int, snap: dict, baseline:
     stored_char = int(entry.get("neutral_char_id") or 0) & 0xFFFFFFFF
     if stored_char and live_char and stored_char != live_char:
         return {"ok": False, "wrote": 0, "mode": "char-mismatch"}
-    wrote = 0
-    for off in KO_NEUTRAL_RESTORE_OFFSETS_U32:
-        if int(off) not in values:
-            continue
-        try:
-            if _ko_wd32(base_i + int(off), int(values[int(off)]) & 0xFFFFFFFF):
-                wrote += 1
-        except Exception:
-            pass
+    packet = [
+        (int(off), int(values[int(off)]) & 0xFFFFFFFF)
+        for off in KO_NEUTRAL_RESTORE_OFFSETS_U32
+        if int(off) in values
+    ]
+    wrote = _ko_write_packet_u32(base_i, packet, key="ko:neutral_restore") if packet else 0
     return {"ok": wrote > 0, "wrote": wrote, "mode": "learned-neutral", "slot": str(slot or "?")}
 
 def _ko_ctrl_apply_neutral_controls(slot: str, base: int, snap: dict, baseline: dict | None) -> dict:
@@ -1246,13 +1276,7 @@ def _ko_ctrl_bridge_survivor_input(slot: str, base: int) -> dict:
         (0x13D8, pressed),
         (0x13DC, token),
     )
-    wrote = 0
-    for off, value in packet:
-        try:
-            if _ko_wd32(base_i + off, int(value) & 0xFFFFFFFF):
-                wrote += 1
-        except Exception:
-            pass
+    wrote = _ko_write_packet_u32(base_i, packet, key="ko:survivor_input")
 
     _KO_SURVIVOR_INPUT_PREV[base_i] = token
     if base_i not in _KO_SURVIVOR_INPUT_LOGGED and needs_bridge:
@@ -1390,9 +1414,7 @@ def _ko_ctrl_release_survivors(snaps: dict, state: dict, now: float, baseline_by
                 # Fallback for a fighter that never produced one clean idle
                 # sample before KO. Keep the legacy packet rather than leaving
                 # the character trapped in Win Pose.
-                for off, value in IDLE_RESTORE_PACKET_U32:
-                    if _ko_wd32(base + int(off), int(value) & 0xFFFFFFFF):
-                        wrote += 1
+                wrote += _ko_write_packet_u32(base, IDLE_RESTORE_PACKET_U32, key="ko:idle_restore")
             released += 1
             touched.append(slot)
             if base not in _KO_SURVIVOR_RELEASE_LOGGED:
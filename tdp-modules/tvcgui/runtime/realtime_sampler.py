@@ -4,13 +4,21 @@ This scheduler is the only realtime lane used by Mission Mode and the input
 HUD. It reads the small combat packet at 240 Hz, stores a bounded cache, and
 publishes packets to listeners. It never writes JSON and never calls mission or
 overlay code.
+
+Readers never take the sampler lock. Each published sample builds a new frozen
+:class:`SamplerFrame` and swaps it in with one reference assignment, so the main
+loop always sees a coherent view of every slot and cannot stall the 240 Hz
+thread. Sample dicts are shared, not copied, between the frame and listeners;
+treat them as read-only.
 """
 
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 import threading
 import time
-from typing import Callable
+from types import MappingProxyType
+from typing import Callable, Mapping
 
 from tvcgui.runtime import input_monitor
 
@@ -18,6 +26,18 @@ from tvcgui.runtime import input_monitor
 REALTIME_SAMPLER_HZ = 240.0
 REALTIME_SAMPLE_QUEUE_LIMIT = 128
 
+_EMPTY_MAPPING: Mapping = MappingProxyType({})
+
+
+@dataclass(frozen=True, slots=True)
+class SamplerFrame:
+    """Immutable per-publish view of every slot's latest sample and queue."""
+
+    sample_sequence: int = 0
+    latest_by_slot: Mapping[str, dict] = field(default_factory=lambda: _EMPTY_MAPPING)
+    samples_by_slot: Mapping[str, tuple[dict, ...]] = field(default_factory=lambda: _EMPTY_MAPPING)
+    published_ns: int = 0
+
 
 class RealtimeCombatSampler:
     """Read inputs, actions, HP, hitstun, and combo state off the GUI thread."""
@@ -37,12 +57,18 @@ class RealtimeCombatSampler:
         self._read_combo = read_combo_fn or input_monitor.read_global_combo_count
 
         self._sample_sequence = 0
-        self._samples_by_slot: dict[str, list[dict]] = {}
+        self._frame = SamplerFrame()
         self._targets: dict[str, int] = {}
-        self._latest_by_slot: dict[str, dict] = {}
         self._raw_state_by_slot: dict[str, tuple] = {}
-        self._listeners: list[Callable] = []
+        # Copy-on-write: publish reads this tuple without the lock.
+        self._listeners: tuple[Callable, ...] = ()
         self._lock = threading.RLock()
+        self._lock_stats = {
+            "publishes": 0,
+            "hold_ns_total": 0,
+            "hold_ns_max": 0,
+            "snapshot_reads": 0,
+        }
         self._stop = threading.Event()
         self._thread = threading.Thread(
             target=self._run,
@@ -72,11 +98,11 @@ class RealtimeCombatSampler:
             return
         with self._lock:
             if listener not in self._listeners:
-                self._listeners.append(listener)
+                self._listeners = (*self._listeners, listener)
 
     def remove_listener(self, listener) -> None:
         with self._lock:
-            self._listeners = [item for item in self._listeners if item is not listener]
+            self._listeners = tuple(item for item in self._listeners if item is not listener)
 
     def publish_packet(self, slot_label: str, packet: dict) -> None:
         """Normalize and publish one packet.
@@ -114,6 +140,7 @@ class RealtimeCombatSampler:
         )
 
         with self._lock:
+            hold_start_ns = time.perf_counter_ns()
             previous = self._raw_state_by_slot.get(slot)
             if previous is None:
                 previous_held = held
@@ -227,6 +254,7 @@ class RealtimeCombatSampler:
                 or state_flags_changed
             )
             if not meaningful_change and not action_frame_changed:
+                self._note_lock_hold(hold_start_ns)
                 return
 
             # Action-frame-only samples still reach realtime listeners for
@@ -258,21 +286,51 @@ class RealtimeCombatSampler:
                 "point_active": point_active,
                 "sample_ns": int(packet.get("sample_ns", 0) or time.monotonic_ns()),
             }
-            self._latest_by_slot[slot] = dict(sample)
+            frame = self._frame
+            latest_by_slot = dict(frame.latest_by_slot)
+            latest_by_slot[slot] = sample
+            samples_by_slot = frame.samples_by_slot
             if meaningful_change:
-                queue = self._samples_by_slot.setdefault(slot, [])
-                queue.append(dict(sample))
-                del queue[:-self._queue_limit]
-            listeners = tuple(self._listeners)
+                samples_by_slot = dict(samples_by_slot)
+                queue = samples_by_slot.get(slot, ())
+                samples_by_slot[slot] = (*queue[-(self._queue_limit - 1):], sample)
+                samples_by_slot = MappingProxyType(samples_by_slot)
+            self._frame = SamplerFrame(
+                sample_sequence=self._sample_sequence,
+                latest_by_slot=MappingProxyType(latest_by_slot),
+                samples_by_slot=samples_by_slot,
+                published_ns=int(sample["sample_ns"]),
+            )
+            self._note_lock_hold(hold_start_ns)
 
         # Listener work runs outside the sampler lock. The event publishers are
         # intentionally tiny, and a failed listener cannot stop the scheduler.
-        for listener in listeners:
+        for listener in self._listeners:
             try:
-                listener(slot, dict(sample))
+                listener(slot, sample)
             except Exception:
                 continue
 
+    def _note_lock_hold(self, start_ns: int) -> None:
+        held_ns = time.perf_counter_ns() - start_ns
+        stats = self._lock_stats
+        stats["publishes"] += 1
+        stats["hold_ns_total"] += held_ns
+        if held_ns > stats["hold_ns_max"]:
+            stats["hold_ns_max"] = held_ns
+
+    def current_frame(self) -> SamplerFrame:
+        """Return the latest published frame without taking the sampler lock."""
+        return self._frame
+
+    def lock_stats(self) -> dict:
+        """Return publish lock hold times; readers never hold the lock."""
+        stats = dict(self._lock_stats)
+        publishes = max(1, int(stats["publishes"]))
+        stats["hold_us_avg"] = stats["hold_ns_total"] / publishes / 1000.0
+        stats["hold_us_max"] = stats["hold_ns_max"] / 1000.0
+        return stats
+
     def snapshot_for_slot(
         self,
         slot_label: str,
@@ -280,10 +338,9 @@ class RealtimeCombatSampler:
     ) -> tuple[dict, list[dict]]:
         """Return cached state only. This method never reads Dolphin."""
         slot = str(slot_label or "")
-        with self._lock:
-            latest = dict(self._latest_by_slot.get(slot) or {})
-            samples = [dict(item) for item in self._samples_by_slot.get(slot, ())]
-        return latest, samples
+        frame = self._frame
+        self._lock_stats["snapshot_reads"] += 1
+        return dict(frame.latest_by_slot.get(slot) or {}), list(frame.samples_by_slot.get(slot, ()))
 
     def _run(self) -> None:
         interval = 1.0 / self._hz
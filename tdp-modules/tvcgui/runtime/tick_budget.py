@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+# Work the loop may spend on scheduled ticks per frame.  The whole frame is
+# allowed PERF_FRAME_WARN_MS, but rendering and polling need most of it.
+FRAME_TICK_BUDGET_MS = float(os.environ.get("TVC_FRAME_TICK_BUDGET_MS", "10"))
+
+# Overrun histogram buckets, as multiples of the tick's own budget.
+OVERRUN_BUCKETS: tuple[tuple[str, float], ...] = (
+    ("x1.5", 1.5),
+    ("x2", 2.0),
+    ("x4", 4.0),
+    ("x8", 8.0),
+)
+OVERRUN_BUCKET_MAX = ">x8"
+
+# Cost estimate smoothing; a single slow frame should not park a tick for long.
+COST_EWMA_ALPHA = 0.25
+
+
+@dataclass(slots=True)
+class ScheduledTick:
+    name: str
+    priority: int
+    budget_ms: float
+    critical: bool = False
+    max_defer_frames: int = 4
+    est_ms: float = 0.0
+    runs: int = 0
+    deferrals: int = 0
+    forced_runs: int = 0
+    consecutive_deferrals: int = 0
+    max_consecutive_deferrals: int = 0
+    overruns: int = 0
+    errors: int = 0
+    last_ms: float = 0.0
+    max_ms: float = 0.0
+    last_frame: int = -1
+    overrun_histogram: dict[str, int] = field(default_factory=dict)
+
+
+def _overrun_bucket(elapsed_ms: float, budget_ms: float) -> str:
+    ratio = elapsed_ms / budget_ms if budget_ms > 0 else float("inf")
+    for label, limit in OVERRUN_BUCKETS:
+        if ratio <= limit:
+            return label
+    return OVERRUN_BUCKET_MAX
+
+
+class FrameTickScheduler:
+    """Cooperative per-frame budget for the main-loop ticks.
+
+    Ticks still run at their own call sites in ``main.py``: :meth:`should_run`
+    decides whether a tick fits this frame and :meth:`record` charges what it
+    cost (:meth:`run` wraps both).  Critical ticks always run.  A
+    non-critical tick is deferred to a later frame when the remaining frame
+    budget, minus the estimated cost of higher-priority ticks that have not
+    run yet this frame, cannot cover its estimated cost.  A tick deferred
+    ``max_defer_frames`` frames in a row runs regardless, so nothing starves.
+    """
+
+    def __init__(self, *, frame_budget_ms: float = FRAME_TICK_BUDGET_MS) -> None:
+        self.frame_budget_ms = max(0.1, float(frame_budget_ms))
+        self._lock = threading.Lock()
+        self._ticks: dict[str, ScheduledTick] = {}
+        self._frame = -1
+        self._used_ms = 0.0
+        self._pending: set[str] = set()
+        self._stats: dict[str, Any] = {
+            "frames": 0,
+            "frames_over_budget": 0,
+            "last_frame_ms": 0.0,
+            "deferrals": 0,
+            "forced_runs": 0,
+        }
+
+    def register(
+        self,
+        name: str,
+        *,
+        priority: int = 50,
+        budget_ms: float = 2.0,
+        critical: bool = False,
+        max_defer_frames: int = 4,
+    ) -> ScheduledTick:
+        with self._lock:
+            tick = self._ticks.get(name)
+            if tick is None:
+                tick = ScheduledTick(name=str(name), priority=int(priority), budget_ms=max(0.01, float(budget_ms)))
+                self._ticks[name] = tick
+            tick.priority = int(priority)
+            tick.budget_ms = max(0.01, float(budget_ms))
+            tick.critical = bool(critical)
+            tick.max_defer_frames = max(0, int(max_defer_frames))
+            if tick.est_ms <= 0.0:
+                tick.est_ms = tick.budget_ms
+            self._pending.add(tick.name)
+            return tick
+
+    def begin_frame(self, frame_idx: int) -> None:
+        with self._lock:
+            if self._frame >= 0:
+                self._stats["frames"] += 1
+                self._stats["last_frame_ms"] = round(self._used_ms, 3)
+                if self._used_ms > self.frame_budget_ms:
+                    self._stats["frames_over_budget"] += 1
+            self._frame = int(frame_idx)
+            self._used_ms = 0.0
+            self._pending = set(self._ticks)
+
+    def remaining_ms(self) -> float:
+        with self._lock:
+            return self.frame_budget_ms - self._used_ms
+
+    def _reserved_ms(self, tick: ScheduledTick) -> float:
+        return sum(
+            other.est_ms
+            for name in self._pending
+            if name != tick.name
+            and (other := self._ticks[name]).priority > tick.priority
+        )
+
+    def should_run(self, name: str) -> bool:
+        """Decide (and account for) one tick slot this frame."""
+        with self._lock:
+            tick = self._ticks.get(name)
+            if tick is None:
+                return True
+            self._pending.discard(tick.name)
+            if tick.critical:
+                return True
+            available = self.frame_budget_ms - self._used_ms - self._reserved_ms(tick)
+            if tick.est_ms <= available:
+                return True
+            if tick.consecutive_deferrals >= tick.max_defer_frames:
+                tick.forced_runs += 1
+                self._stats["forced_runs"] += 1
+                return True
+            tick.deferrals += 1
+            tick.consecutive_deferrals += 1
+            tick.max_consecutive_deferrals = max(tick.max_consecutive_deferrals, tick.consecutive_deferrals)
+            self._stats["deferrals"] += 1
+            return False
+
+    def record(self, name: str, elapsed_ms: float, *, failed: bool = False) -> None:
+        with self._lock:
+            tick = self._ticks.get(name)
+            if tick is None:
+                return
+            elapsed = max(0.0, float(elapsed_ms))
+            self._pending.discard(tick.name)
+            self._used_ms += elapsed
+            tick.runs += 1
+            tick.consecutive_deferrals = 0
+            tick.last_frame = self._frame
+            tick.last_ms = elapsed
+            tick.max_ms = max(tick.max_ms, elapsed)
+            tick.est_ms += (elapsed - tick.est_ms) * COST_EWMA_ALPHA
+            if failed:
+                tick.errors += 1
+            if elapsed > tick.budget_ms:
+                tick.overruns += 1
+                bucket = _overrun_bucket(elapsed, tick.budget_ms)
+                tick.overrun_histogram[bucket] = tick.overrun_histogram.get(bucket, 0) + 1
+
+    def run(self, name: str, func: Callable[..., Any], *args: Any, **kwargs: Any) -> tuple[bool, Any]:
+        """Run ``func`` if the tick fits; return ``(ran, result)``.
+
+        Exceptions propagate to the caller after the elapsed time is recorded,
+        so existing per-call-site error handling stays where it was.
+        """
+        if not self.should_run(name):
+            return False, None
+        start = time.perf_counter()
+        failed = True
+        try:
+            result = func(*args, **kwargs)
+            failed = False
+            return True, result
+        finally:
+            self.record(name, (time.perf_counter() - start) * 1000.0, failed=failed)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            out = dict(self._stats)
+            out["frame_budget_ms"] = self.frame_budget_ms
+            out["ticks"] = {
+                tick.name: {
+                    "priority": tick.priority,
+                    "budget_ms": tick.budget_ms,
+                    "critical": tick.critical,
+                    "est_ms": round(tick.est_ms, 3),
+                    "last_ms": round(tick.last_ms, 3),
+                    "max_ms": round(tick.max_ms, 3),
+                    "runs": tick.runs,
+                    "deferrals": tick.deferrals,
+                    "forced_runs": tick.forced_runs,
+                    "max_consecutive_deferrals": tick.max_consecutive_deferrals,
+                    "overruns": tick.overruns,
+                    "errors": tick.errors,
+                    "overrun_histogram": dict(tick.overrun_histogram),
+                }
+                for tick in sorted(self._ticks.values(), key=lambda row: -row.priority)
+            }
+        return out
+
+
+TICKS = FrameTickScheduler()
+
+
+def get_tick_budget_stats() -> dict[str, Any]:
+    return TICKS.stats()
@@ -0,0 +1,32 @@
+"""Rebuild the per-character animation frame index from animation_frames.json."""
+from __future__ import annotations
+
+import argparse
+
+from tvcgui.features.animation.database import (
+    build_animation_index,
+    default_animation_index_directory,
+)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Split animation_frames.json into a manifest plus one JSON file per character."
+    )
+    parser.add_argument("source", nargs="?", default=None)
+    parser.add_argument("--output", default=str(default_animation_index_directory()))
+    args = parser.parse_args()
+
+    try:
+        report = build_animation_index(args.source, args.output)
+    except (OSError, ValueError) as exc:
+        print(f"FAILED: {exc}")
+        return 1
+    print(f"Source: {report['source']}")
+    print(f"Characters written: {report['characters']}")
+    print(f"Output: {report['output_directory']}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
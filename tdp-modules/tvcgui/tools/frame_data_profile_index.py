@@ -0,0 +1,44 @@
+"""Build the indexed frame-data profile store from JSON profiles, or export it back."""
+from __future__ import annotations
+
+import argparse
+
+from tvcgui.features.frame_data.profile_store import (
+    default_profile_index_file,
+    profile_index,
+    sync_frame_data_profile_index,
+)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Migrate frame-data JSON profiles into the SQLite index, or export it as shards."
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    migrate = sub.add_parser("migrate", help="import every bundled and writable profile")
+    migrate.add_argument("--key", action="append", dest="keys")
+
+    export = sub.add_parser("export", help="write indexed profiles back out as JSON shards")
+    export.add_argument("output")
+    export.add_argument("--key", action="append", dest="keys")
+
+    args = parser.parse_args()
+    print(f"Index: {default_profile_index_file()}")
+    if args.command == "migrate":
+        report = sync_frame_data_profile_index(keys=args.keys)
+        print(f"Profiles synced: {len(report['synced'])}")
+        for key in report["failed"]:
+            print(f"FAILED: {key}")
+        return 1 if report["failed"] else 0
+
+    report = profile_index().export_shards(args.output, keys=args.keys)
+    print(f"Profiles written: {len(report['written'])}")
+    for path in report["failed"]:
+        print(f"FAILED: {path}")
+    print(f"Output: {report['output_directory']}")
+    return 1 if report["failed"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
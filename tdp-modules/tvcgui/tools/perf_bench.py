@@ -0,0 +1,1330 @@
+"""Offline micro-benchmarks for hot paths that do not need Dolphin.
+
+Each subcommand replays shipped data through one runtime path and prints the
+per-call cost, so a change to that path can be compared before and after.
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import time
+from pathlib import Path
+
+from tvcgui.core.paths import resource_path
+
+
+def _mission_files(directory: Path) -> list[Path]:
+    return sorted(directory.glob("*.json"))
+
+
+def _mission_routes(path: Path) -> list[tuple[str, list]]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+        return []
+    routes: list[tuple[str, list]] = []
+    for mission in data.get("missions") or []:
+        if not isinstance(mission, dict):
+            continue
+        steps = mission.get("steps")
+        if isinstance(steps, list) and steps and not mission.get("goal"):
+            routes.append((str(mission.get("mission_id") or path.stem), steps))
+    return routes
+
+
+def _synthetic_route_events(steps: list, *, owner_slot: str = "P1-C1"):
+    """Build one clean attempt per route: input, action and damage per step."""
+    from tvcgui.runtime.mission_events import (
+        EVENT_ACTION,
+        EVENT_DAMAGE,
+        EVENT_INPUT,
+        MissionEvent,
+    )
+
+    events = []
+    sequence = 0
+    labels_by_action: dict[int, list[str]] = {}
+    for index, step in enumerate(steps):
+        action_id = 0x100 + index
+        label = step.get("label") if isinstance(step, dict) else step
+        labels_by_action[action_id] = [str(label or "")]
+        for kind, slot, extra in (
+            (EVENT_INPUT, owner_slot, {"pressed": 0x80, "held": 0x80}),
+            (EVENT_ACTION, owner_slot, {"action_id": action_id}),
+            (EVENT_DAMAGE, "P2-C1", {"damage": 100}),
+        ):
+            sequence += 1
+            events.append(
+                MissionEvent(
+                    sequence=sequence,
+                    sample_sequence=sequence,
+                    timestamp_ns=sequence * 4_000_000,
+                    kind=kind,
+                    slot=slot,
+                    **extra,
+                )
+            )
+    return events, labels_by_action
+
+
+def bench_mission_matching(directory: Path, repeats: int = 20) -> dict:
+    from tvcgui.features.training.mission_runtime_v2 import MissionRuntimeV2
+
+    def matcher(candidate, expected):
+        value = candidate.lower().replace(" ", "")
+        return any(value == str(item).lower().replace(" ", "") for item in expected)
+
+    files = _mission_files(directory)
+    total_events = 0
+    total_ns = 0
+    routes = 0
+    for path in files:
+        for mission_id, steps in _mission_routes(path):
+            events, labels_by_action = _synthetic_route_events(steps)
+
+            def resolver(event, _labels=labels_by_action):
+                return _labels.get(int(event.action_id or 0), [])
+
+            routes += 1
+            for _ in range(repeats):
+                runtime = MissionRuntimeV2()
+                runtime.configure(
+                    slot="P1-C1",
+                    character=path.stem,
+                    mission_id=mission_id,
+                    raw_steps=steps,
+                    goal={},
+                    event_floor=0,
+                )
+                start = time.perf_counter_ns()
+                runtime.consume(
+                    events,
+                    owner_slot="P1-C1",
+                    label_matcher=matcher,
+                    action_label_resolver=resolver,
+                    newest_sequence=len(events),
+                )
+                total_ns += time.perf_counter_ns() - start
+                total_events += len(events)
+    return {
+        "files": len(files),
+        "routes": routes,
+        "events": total_events,
+        "ns_per_event": (total_ns / total_events) if total_events else 0.0,
+    }
+
+
+def bench_sampler_handoff(seconds: float = 1.0) -> dict:
+    """Publish four slots flat-out on a thread while the caller reads snapshots."""
+    import threading
+
+    from tvcgui.runtime.realtime_sampler import RealtimeCombatSampler
+
+    sampler = RealtimeCombatSampler(autostart=False, read_packet_fn=lambda *_a, **_k: None)
+    sampler.add_listener(lambda _slot, _sample: None)
+    slots = ("P1-C1", "P1-C2", "P2-C1", "P2-C2")
+    stop = threading.Event()
+    publish_ns: list[int] = []
+
+    def publisher() -> None:
+        tick = 0
+        while not stop.is_set():
+            tick += 1
+            for index, slot in enumerate(slots):
+                start = time.perf_counter_ns()
+                sampler.publish_packet(slot, {
+                    "held": tick & 0xF0,
+                    "action_id": 0x100 + (tick % 7),
+                    "action_frame": tick,
+                    "current_hp": 10000 - index,
+                    "sample_ns": tick,
+                })
+                publish_ns.append(time.perf_counter_ns() - start)
+
+    thread = threading.Thread(target=publisher, daemon=True)
+    thread.start()
+    read_ns: list[int] = []
+    deadline = time.perf_counter() + float(seconds)
+    while time.perf_counter() < deadline:
+        start = time.perf_counter_ns()
+        for slot in slots:
+            sampler.snapshot_for_slot(slot)
+        read_ns.append(time.perf_counter_ns() - start)
+    stop.set()
+    thread.join(timeout=1.0)
+
+    def _pct(values: list[int], q: float) -> float:
+        if not values:
+            return 0.0
+        ordered = sorted(values)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * q))] / 1000.0
+
+    report = {
+        "publishes": len(publish_ns),
+        "reads": len(read_ns),
+        "publish_us_p50": _pct(publish_ns, 0.50),
+        "publish_us_p99": _pct(publish_ns, 0.99),
+        "read4_us_p50": _pct(read_ns, 0.50),
+        "read4_us_p99": _pct(read_ns, 0.99),
+    }
+    lock_stats = getattr(sampler, "lock_stats", None)
+    if callable(lock_stats):
+        report["lock"] = lock_stats()
+    return report
+
+
+def bench_profile_lookup(repeats: int = 5) -> dict:
+    """Scanner profile reads: whole JSON shard parse versus the SQLite index.
+
+    ``header`` is what the normal scanner's profile gates and the extras
+    loader read; ``full`` is the accepted fast path, which needs every move.
+    """
+    import os
+    import tempfile
+    import tracemalloc
+
+    from tvcgui.features.frame_data import profile_store
+
+    directory = profile_store.default_bundled_directory()
+    keys = sorted(path.stem for path in Path(directory).glob("*.json") if not path.name.startswith("_"))
+    if not keys:
+        return {"profiles": 0}
+    dirs = {
+        "bundled_directory": directory,
+        "writable_directory": "",
+        "bundled_legacy_file": "",
+        "writable_legacy_file": "",
+    }
+
+    def _measure(lookup) -> tuple[float, float]:
+        # Time and memory are separate passes; tracemalloc skews timings badly.
+        total_ns = 0
+        for _ in range(repeats):
+            for key in keys:
+                start = time.perf_counter_ns()
+                lookup(key)
+                total_ns += time.perf_counter_ns() - start
+        peak = 0
+        for key in keys:
+            tracemalloc.start()
+            lookup(key)
+            peak = max(peak, tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+        return total_ns / max(1, repeats * len(keys)) / 1e6, peak / (1024 * 1024)
+
+    report: dict = {"profiles": len(keys)}
+    previous = {name: os.environ.get(name) for name in ("TVC_FD_PROFILE_INDEX_FILE", "TVC_FD_PROFILE_BACKEND")}
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["TVC_FD_PROFILE_INDEX_FILE"] = os.path.join(tmp, "bench.sqlite3")
+        try:
+            start = time.perf_counter()
+            profile_store.sync_frame_data_profile_index(**dirs)
+            report["migrate_ms"] = (time.perf_counter() - start) * 1000.0
+            for backend in ("json", "index"):
+                os.environ["TVC_FD_PROFILE_BACKEND"] = backend
+                report[f"{backend}_header_ms"], report[f"{backend}_header_mb"] = _measure(
+                    lambda key: profile_store.load_frame_data_profile_header(key, **dirs)
+                )
+                report[f"{backend}_full_ms"], report[f"{backend}_full_mb"] = _measure(
+                    lambda key: profile_store.load_frame_data_profile(key, **dirs)
+                )
+            profile_store.profile_index().close()
+        finally:
+            for name, value in previous.items():
+                if value is None:
+                    os.environ.pop(name, None)
+                else:
+                    os.environ[name] = value
+    return report
+
+
+def bench_attack_property_flush(sizes: tuple[int, ...] = (1000, 5000, 20000), batch: int = 20) -> dict:
+    """Flush cost after ``batch`` new observations on top of datasets of each size."""
+    import tempfile
+
+    from tvcgui.features.training.attack_property_profiler import RuntimeAttackPropertyProfiler
+
+    def observe(profiler, index: int) -> None:
+        record = {
+            "actor": 0x90000000 + index * 0x40,
+            "owner_slot": "P1-C1",
+            "victim_slot": "P2-C1",
+            "owner_action_id": 0x100 + (index % 200),
+            "property_a": index % 0x40,
+            "property_b": index % 0x400,
+            "base_damage": 1000 + index % 50,
+        }
+        with profiler._lock:
+            profiler._record_transition_locked(record, gui_frame=index)
+
+    report: dict = {}
+    for journal in (False, True):
+        mode = "journal" if journal else "snapshot"
+        report[mode] = {}
+        for size in sizes:
+            with tempfile.TemporaryDirectory() as tmp:
+                profiler = RuntimeAttackPropertyProfiler(
+                    path=Path(tmp) / "profiles.json",
+                    event_path=Path(tmp) / "events.csv",
+                    read_u32=lambda _address: None,
+                    read_block=lambda _address, _size: b"",
+                    start_worker=False,
+                    emit_console=False,
+                    journal=journal,
+                )
+                for index in range(size):
+                    observe(profiler, index)
+                profiler._write_pending(force=True)
+                for index in range(size, size + batch):
+                    observe(profiler, index)
+                profiler._last_write = 0.0
+                start = time.perf_counter()
+                profiler._write_pending(force=False)
+                report[mode][size] = (time.perf_counter() - start) * 1000.0
+                profiler.flush()
+    return report
+
+
+def bench_export_rescan(characters: int = 24, moves: int = 600) -> dict:
+    """Cost of one four-character rescan, incremental export vs full master compile."""
+    import tempfile
+
+    from tvcgui.features.frame_data import spreadsheet_export
+
+    def slot(char_id: int, damage: int) -> dict:
+        return {
+            "char_id": char_id,
+            "char_name": f"Char{char_id:02d}",
+            "profile_key": f"id_{char_id:02d}",
+            "slot_label": "P1-C1",
+            "moves": [
+                {"id": 0x100 + index, "kind": "normal", "move_label": f"{index}A", "damage": damage + index}
+                for index in range(moves)
+            ],
+        }
+
+    report: dict = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        exporter = spreadsheet_export.FrameDataSpreadsheetExporter(
+            master_path=Path(tmp) / "master.csv", background=False, startup_rebuild=False
+        )
+        exporter.upsert_scan_rows([slot(char_id, 1000) for char_id in range(1, characters + 1)])
+        rescan = [slot(1, 1000), slot(2, 1000), slot(3, 1000), slot(4, 1000)]
+
+        start = time.perf_counter()
+        exporter.upsert_scan_rows(rescan)
+        report["unchanged_ms"] = (time.perf_counter() - start) * 1000.0
+
+        rescan[0] = slot(1, 1200)
+        start = time.perf_counter()
+        exporter.upsert_scan_rows(rescan)
+        report["one_changed_ms"] = (time.perf_counter() - start) * 1000.0
+
+        start = time.perf_counter()
+        exporter.compile_master_from_character_exports()
+        report["full_compile_ms"] = (time.perf_counter() - start) * 1000.0
+        report["master_rows"] = exporter.last_master_row_count
+    return report
+
+
+def bench_prs_decode(size: int = 0x582E0, repeats: int = 3) -> dict:
+    """Stage-sequence-sized PRS decode, table-free fast path vs bitwise reference."""
+    from tvcgui.features.stage_select import fpk
+
+    payload = bytes((index * 7) & 0xFF for index in range(size))
+    literal_stream = fpk._literal_prs_compress(payload)
+    # Eight literals, then long copies of the same 8-byte run (distance 8,
+    # 256 bytes each): the shape of the padded tables in real sequences.
+    run_stream = bytearray(b"\xFF" + payload[:8])
+    word = ((0x2000 - 8) << 3).to_bytes(2, "big")
+    while len(run_stream) < size // 64 * 3:
+        run_stream += b"\x55" + (word + b"\xFF") * 4
+
+    report: dict = {}
+    for label, stream in (("literal", literal_stream), ("runs", bytes(run_stream))):
+        for name, decoder in (("fast", fpk._prs_decompress), ("bitwise", fpk._prs_decompress_bitwise)):
+            best = float("inf")
+            for _ in range(max(1, repeats)):
+                start = time.perf_counter()
+                decoder(stream, size)
+                best = min(best, time.perf_counter() - start)
+            report[f"{label}_{name}_ms"] = best * 1000.0
+    return report
+
+
+def bench_move_name_lookup(calls: int = 200000) -> dict:
+    """move_id_map cold load (CSV parse vs pickled index) and per-call lookup cost."""
+    import contextlib
+    import io
+    import os
+
+    from tvcgui.features.combat import move_id_map
+
+    report: dict = {}
+    quiet = contextlib.redirect_stdout(io.StringIO())
+    with quiet:
+        try:
+            os.unlink(move_id_map._index_path())
+        except OSError:
+            pass
+        for label in ("csv", "index"):
+            move_id_map.reload_move_id_map()
+            move_id_map.lookup_move_name(0, 1)
+            stats = move_id_map.get_move_id_map_stats()
+            report[f"{label}_load_ms"] = stats["load_ms"]
+            report[f"{label}_source"] = stats["source"]
+
+    keys = [(anim_id, char_id) for char_id in (1, 7, 12, 29) for anim_id in range(0x100, 0x140)]
+    reps = max(1, calls // len(keys))
+
+    def run(resolve) -> float:
+        start = time.perf_counter()
+        for _ in range(reps):
+            for anim_id, char_id in keys:
+                resolve(anim_id, char_id)
+        return (time.perf_counter() - start) * 1e9 / (reps * len(keys))
+
+    report["uncached_ns"] = run(move_id_map._resolve_move_name)
+    report["memo_ns"] = run(move_id_map.lookup_move_name)
+    return report
+
+
+def bench_animation_lookup() -> dict:
+    """First animation lookup: whole-JSON loader vs per-character index.
+
+    ``runtime`` is the MOT-table path the animation editor and patch writes use.
+    """
+    import tracemalloc
+
+    from tvcgui.features.animation import database, runtime
+
+    def reset() -> None:
+        database._DB_CACHE = None
+        database._DB_PATH = None
+        database._INDEX_MANIFEST = None
+        database._INDEX_SOURCE_STAMP = None
+        database._CHARACTER_LRU.clear()
+
+    moves = [{"id": action, "active_end": 8} for action in range(0x100, 0x120)]
+    database.build_animation_index()
+    report: dict = {}
+    for label in ("json", "index", "runtime"):
+        reset()
+        tracemalloc.start()
+        start = time.perf_counter()
+        if label == "json":
+            doc = database._load_database()
+            actions = doc["characters"]["ryu"]["motions"]["0000.mot"]["actions"]
+            for move in moves:
+                actions.get(f"0x{move['id']:04X}")
+        elif label == "index":
+            database.apply_animation_metadata([dict(move) for move in moves], "Ryu")
+        else:
+            char_key = runtime.resolve_char_key("Ryu")
+            for move in moves:
+                runtime.motion_descriptor(char_key, move["id"])
+        report[f"{label}_first_ms"] = (time.perf_counter() - start) * 1000.0
+        report[f"{label}_retained_kb"] = tracemalloc.get_traced_memory()[0] / 1024.0
+        tracemalloc.stop()
+        if label == "json":
+            del doc, actions
+    reset()
+    return report
+
+
+def bench_move_region_probe(moves: int = 320, read_latency_us: float = 50.0) -> dict:
+    """Deep-probe cost for one character: per-finder reads vs region prefetch + memo.
+
+    Memory is a synthetic move script; every read pays ``read_latency_us`` to
+    model one Dolphin process-memory round trip.
+    """
+    import random
+
+    from tvcgui.features.frame_data import patterns
+
+    rng = random.Random(41)
+    base = 0x90800000
+    stride = 0x640
+    image = bytearray(rng.randrange(256) for _ in range(moves * stride + 0x1000))
+    for index in range(moves):
+        off = index * stride
+        image[off + 0x10:off + 0x1A] = b"\x04\x01\x02\x3F\x00\x00\x02\x02\x01\x3C"
+        image[off + 0x40:off + 0x4C] = b"\x20\x3F\x00\x00\x00\x0A\x04\x17\x60\x00\x00\x00"
+        image[off + 0x80:off + 0x84] = patterns.HIT_SPARK_SIG
+        image[off + 0xC0:off + 0xCC] = patterns.HIT_RESULT_OR_SIG
+    image = bytes(image)
+    addrs = [base + index * stride for index in range(moves)]
+    reads = [0]
+
+    def rbytes(addr: int, size: int) -> bytes:
+        reads[0] += 1
+        if read_latency_us:
+            deadline = time.perf_counter() + read_latency_us / 1e6
+            while time.perf_counter() < deadline:
+                pass
+        off = addr - base
+        return image[max(0, off):max(0, off + size)]
+
+    finders = (
+        patterns.find_hit_spark_addr,
+        patterns.find_limb_stretch_packet,
+        patterns.find_post_animation_link_addr,
+        patterns.find_speed_mod_addr,
+        patterns.find_attack_property_addr,
+        patterns.find_hit_result_flags_addr,
+    )
+
+    def rd8(addr: int):
+        data = rbytes(addr, 1)
+        return data[0] if data else None
+
+    def per_finder() -> list:
+        out = []
+        for addr in addrs:
+            out.extend(finder(addr, rbytes) for finder in finders)
+            out.append(patterns.find_superbg_addr(addr, rbytes, rd8))
+        return out
+
+    def prefetched() -> list:
+        region = patterns.MoveRegionPrefetch(rbytes, addrs)
+        out = []
+        for addr in addrs:
+            out.extend(region.run(finder, addr) for finder in finders)
+            out.append(region.run(patterns.find_superbg_addr, addr, region.rd8))
+        return out
+
+    report: dict = {"moves": moves, "read_latency_us": read_latency_us}
+    patterns.clear_finder_memo()
+    results = {}
+    for label, func in (("per_finder", per_finder), ("prefetch", prefetched), ("memo", prefetched)):
+        reads[0] = 0
+        start = time.perf_counter()
+        results[label] = func()
+        report[f"{label}_ms"] = (time.perf_counter() - start) * 1000.0
+        report[f"{label}_reads"] = reads[0]
+    report["identical"] = results["per_finder"] == results["prefetch"] == results["memo"]
+    patterns.clear_finder_memo()
+    return report
+
+
+def bench_move_memory_session(moves: int = 320, frames: int = 600, read_latency_us: float = 50.0) -> dict:
+    """Reads one character costs across the frame-data tools, private vs shared.
+
+    Models one session: the frame-data window and a workbench probe batch each
+    prefetch the move region, the dumper reads the region then every move
+    head, and the cancel lab checks the command table for ``frames`` frames.
+    """
+    from tvcgui.features.frame_data.patterns import MoveRegionPrefetch
+    from tvcgui.platform.move_memory import MoveMemoryCache
+
+    base = 0x90800000
+    stride = 0x640
+    table = base + moves * stride + 0x1000
+    image = bytes(n & 0xFF for n in range(moves * stride + 0x4000))
+    addrs = [base + index * stride for index in range(moves)]
+    reads = [0]
+
+    def rbytes(addr: int, size: int) -> bytes:
+        reads[0] += 1
+        if read_latency_us:
+            deadline = time.perf_counter() + read_latency_us / 1e6
+            while time.perf_counter() < deadline:
+                pass
+        off = addr - base
+        return image[max(0, off):max(0, off + size)]
+
+    def session(read_move, read_table) -> None:
+        for _window in ("frame_data", "workbench"):
+            region = MoveRegionPrefetch(read_move, addrs)
+            for addr in addrs:
+                region(addr, 0x100)
+        read_move(base, moves * stride + 0x900)
+        for addr in addrs:
+            read_move(addr, 0x200)
+        for _frame in range(frames):
+            read_table(table, 192 * 24)
+
+    report: dict = {"moves": moves, "frames": frames, "read_latency_us": read_latency_us}
+    cache = MoveMemoryCache(rbytes)
+    for label, read_move, read_table in (
+        ("private", rbytes, rbytes),
+        ("shared", cache.reader(1), cache.reader(("command_table", table))),
+    ):
+        reads[0] = 0
+        start = time.perf_counter()
+        session(read_move, read_table)
+        report[f"{label}_ms"] = (time.perf_counter() - start) * 1000.0
+        report[f"{label}_reads"] = reads[0]
+    report["hit_rate"] = cache.stats()["hit_rate"]
+    return report
+
+
+def bench_attack_property_lookup(lookups: int = 2000, read_latency_us: float = 50.0) -> dict:
+    """HUD attack-property lookups: validated definition cache vs per-character index.
+
+    Both paths already have the definition; the cache path still re-reads the
+    table anchors on every call, the index path only samples every interval.
+    """
+    import struct
+
+    from tvcgui.features.frame_data import attack_property_runtime as runtime
+
+    fighter = 0x9246B9C0
+    table = 0x90896640
+    memory: dict[int, int] = {}
+    reads = [0]
+
+    def put(addr: int, payload: bytes) -> None:
+        for offset, value in enumerate(payload):
+            memory[addr + offset] = value
+
+    put(fighter + 0x01E0, struct.pack(">I", table))
+    actions = list(range(0x0100, 0x0180))
+    for n, action in enumerate(actions):
+        rel = 0x10000 + n * 0x400
+        put(table + action * 4, struct.pack(">I", rel))
+        put(table + rel + 0x20, b"\x04\x01\x60\x00" + struct.pack(">III", 0x240, 0x3F000000, 0x0C))
+
+    def rbytes(addr: int, size: int) -> bytes:
+        reads[0] += 1
+        if read_latency_us:
+            deadline = time.perf_counter() + read_latency_us / 1e6
+            while time.perf_counter() < deadline:
+                pass
+        return bytes(memory.get(addr + offset, 0) for offset in range(size))
+
+    def rd32(addr: int) -> int:
+        return struct.unpack(">I", rbytes(addr, 4))[0]
+
+    def run() -> None:
+        for n in range(lookups):
+            runtime.resolve_live_attack_definition(
+                fighter, actions[n % len(actions)], chr_tbl_abs=table, read_u32=rd32, read_block=rbytes
+            )
+
+    report: dict = {"lookups": lookups, "read_latency_us": read_latency_us}
+    request = runtime.request_attack_property_index
+    runtime.request_attack_property_index = lambda *_args, **_kwargs: False
+    try:
+        runtime.clear_attack_property_runtime_cache()
+        run()
+        reads[0] = 0
+        start = time.perf_counter()
+        run()
+        report["cache_us"] = (time.perf_counter() - start) * 1e6 / lookups
+        report["cache_reads"] = reads[0]
+
+        runtime.clear_attack_property_runtime_cache()
+        start = time.perf_counter()
+        runtime.install_attack_property_index(runtime.build_attack_property_index(table, rbytes))
+        report["build_ms"] = (time.perf_counter() - start) * 1000.0
+        reads[0] = 0
+        start = time.perf_counter()
+        run()
+        report["index_us"] = (time.perf_counter() - start) * 1e6 / lookups
+        report["index_reads"] = reads[0]
+    finally:
+        runtime.request_attack_property_index = request
+        runtime.clear_attack_property_runtime_cache()
+    return report
+
+
+def bench_cancel_route_graph(moves: int = 400, repeats: int = 3) -> dict:
+    """Cancel Mapper open cost: per-open classification vs the cached route graph."""
+    import tempfile
+
+    from tvcgui.features.frame_data import cancel_mapper as mapper
+    from tvcgui.features.frame_data import cancel_routes as routes
+
+    names = ["5A", "5B", "5C", "2A", "2B", "2C", "6B", "6C", "3C", "j.A", "j.B", "j.C"]
+    rows: list[dict] = []
+    for n in range(moves):
+        if n < len(names):
+            aid, kind, name = 0x0100 + n, "normal", names[n]
+        elif n % 3:
+            aid, kind, name = 0x0130 + n % 0x30, "special", f"Special {n}"
+        else:
+            aid, kind, name = 0x0160 + n % 0x20, "super", f"Super {n}"
+        windows = [
+            {"kind": "normal", "target_id": 0x0100 + (n + k) % len(names), "addr": 0x90900000 + n * 0x40 + k * 4}
+            for k in range(3)
+        ] if kind == "normal" else []
+        rows.append({"id": aid, "abs": 0x90900000 + n * 0x640, "move_name": name, "kind": kind, "cancel_windows": windows})
+
+    def open_legacy() -> int:
+        count = 0
+        for source in mapper.canonical_moves(rows):
+            count += len(mapper.build_cancel_rows(source, rows))
+        return count
+
+    report: dict = {"moves": moves}
+    start = time.perf_counter()
+    for _ in range(repeats):
+        pairs = open_legacy()
+    report["pairs"] = pairs
+    report["legacy_ms"] = (time.perf_counter() - start) * 1000.0 / repeats
+
+    with tempfile.TemporaryDirectory() as directory:
+        routes.clear_cancel_route_graphs()
+        start = time.perf_counter()
+        routes.ensure_cancel_route_graph("bench", rows, directory=directory)
+        report["build_ms"] = (time.perf_counter() - start) * 1000.0
+        routes.clear_cancel_route_graphs()
+        start = time.perf_counter()
+        routes.ensure_cancel_route_graph("bench", [dict(row) for row in rows], directory=directory)
+        report["load_ms"] = (time.perf_counter() - start) * 1000.0
+        graph = routes.cached_cancel_route_graph("bench", rows)
+        start = time.perf_counter()
+        for _ in range(repeats):
+            graph = routes.cached_cancel_route_graph("bench", rows)
+            for source in graph.sources:
+                graph.rows_for(source)
+        report["graph_ms"] = (time.perf_counter() - start) * 1000.0 / repeats
+        routes.clear_cancel_route_graphs()
+    return report
+
+
+def bench_move_families(profiles: int = 4, repeats: int = 5) -> dict:
+    """Move-family grouping on the largest bundled profiles: cold, warm, one-row edit."""
+    import copy
+
+    from tvcgui.features.frame_data import move_families, profile_store
+
+    directory = Path(profile_store.default_bundled_directory())
+    paths = sorted(
+        (path for path in directory.glob("*.json") if not path.name.startswith("_")),
+        key=lambda path: path.stat().st_size,
+        reverse=True,
+    )[:profiles]
+    dirs = {
+        "bundled_directory": str(directory),
+        "writable_directory": "",
+        "bundled_legacy_file": "",
+        "writable_legacy_file": "",
+    }
+    loaded = []
+    for path in paths:
+        profile = profile_store.load_frame_data_profile(path.stem, **dirs) or {}
+        moves = profile.get("moves") or []
+        if moves:
+            loaded.append((path.stem, str(profile.get("char_name") or ""), moves))
+    report: dict = {"profiles": [(key, len(moves)) for key, _name, moves in loaded]}
+    if not loaded:
+        return report
+
+    def clear() -> None:
+        for name in dir(move_families):
+            cached = getattr(move_families, name)
+            if hasattr(cached, "cache_clear"):
+                cached.cache_clear()
+
+    cold = warm = edit = 0.0
+    for _ in range(repeats):
+        for _key, char_name, moves in loaded:
+            rows = copy.deepcopy(moves)
+            clear()
+            start = time.perf_counter()
+            move_families.annotate_move_families(rows, char_name)
+            cold += time.perf_counter() - start
+            start = time.perf_counter()
+            move_families.annotate_move_families(rows, char_name)
+            warm += time.perf_counter() - start
+            rows[len(rows) // 2]["move_name"] = "Renamed Section Start"
+            start = time.perf_counter()
+            move_families.annotate_move_families(rows, char_name)
+            edit += time.perf_counter() - start
+    runs = repeats * len(loaded)
+    report["cold_ms"] = cold * 1000.0 / runs
+    report["warm_ms"] = warm * 1000.0 / runs
+    report["edit_ms"] = edit * 1000.0 / runs
+    return report
+
+
+def bench_character_dump(region_mib: float = 7.0, repeats: int = 3) -> dict:
+    """Character dump region pass: whole-buffer scanners vs streamed compressed chunks."""
+    import random
+    import struct
+    import tempfile
+    import tracemalloc
+
+    from tvcgui.features.frame_data import dumper
+
+    base = 0x90800000
+    size = int(region_mib * 1024 * 1024) & ~0xFFF
+    rng = random.Random(47)
+    mem = bytearray(rng.getrandbits(8) if n % 3 == 0 else 0 for n in range(size))
+    for n in range(64):
+        sig = rng.randrange(0x100, size - 0x200)
+        mem[sig:sig + 8] = dumper.SUPER_BEAM_SIG
+        struct.pack_into(">I", mem, sig + 8, 1000 + n)
+    memory = bytes(mem)
+    moves = [{"abs": base + rng.randrange(0, size - 0x600) & ~3} for _ in range(320)]
+    reads = {"legacy": 0, "stream": 0}
+
+    def reader(label: str):
+        def rbytes(addr: int, count: int) -> bytes:
+            reads[label] += 1
+            return memory[addr - base:addr - base + count]
+
+        return rbytes
+
+    def legacy() -> None:
+        rbytes = reader("legacy")
+        data = rbytes(base, size)
+        dumper._scan_super_beam_cards(base, data)
+        dumper._scan_projectile_templates(base, data)
+        dumper._scan_23_card_candidates(base, data)
+        for mv in moves:
+            rbytes(mv["abs"], dumper.MOVE_SCAN_LEN)
+
+    def stream() -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            writer = dumper._RegionChunkWriter(str(Path(tmp) / "region.tvcz"), base, dumper.DUMP_CHUNK_SIZE)
+            try:
+                dumper._stream_region(base, base + size, reader("stream"), moves, writer)
+            finally:
+                report["compressed_kb"] = writer.close() / 1024.0
+
+    report: dict = {"region_kb": size / 1024.0}
+    for label, fn in (("legacy", legacy), ("stream", stream)):
+        best = float("inf")
+        for _ in range(repeats):
+            reads[label] = 0
+            start = time.perf_counter()
+            fn()
+            best = min(best, time.perf_counter() - start)
+        report[f"{label}_ms"] = best * 1000.0
+        report[f"{label}_reads"] = reads[label]
+        # Time and memory are separate passes; tracemalloc skews timings badly.
+        tracemalloc.start()
+        fn()
+        report[f"{label}_peak_kb"] = tracemalloc.get_traced_memory()[1] / 1024.0
+        tracemalloc.stop()
+    return report
+
+
+def bench_edit_set(rows: int = 40, latency_us: float = 50.0) -> dict:
+    """One family-wide edit (damage, stun, KB X on every row): per-field writes vs one edit set.
+
+    The per-field path mirrors move_writer: a packet check read per field and
+    one ``wd8`` per byte.  Every read and write pays ``latency_us``.
+    """
+    from tvcgui.features.frame_data import edit_sets
+
+    base = 0x90900000
+    stun = bytes((0x04, 0x01, 0x60, 0x00, 0x00, 0x00, 0x02, 0x54, 0x3F)) + bytes(6)
+    image = bytearray(rows * 0x400)
+    moves = []
+    for n in range(rows):
+        off = n * 0x400
+        image[off + 0x40:off + 0x45] = bytes((0x35, 0x10, 0x20, 0x3F, 0x00))
+        image[off + 0x50:off + 0x50 + len(stun)] = stun
+        moves.append({"abs": base + off, "damage_addr": base + off + 0x40, "stun_addr": base + off + 0x50,
+                      "knockback_addr": base + off + 0x200})
+    edits = (("damage", 1200), ("hitstun", 18), ("blockstun", 12), ("kb_x", 2.5))
+    calls = {"reads": 0, "writes": 0}
+
+    def pay() -> None:
+        if latency_us:
+            deadline = time.perf_counter() + latency_us / 1e6
+            while time.perf_counter() < deadline:
+                pass
+
+    def make_io(memory: bytearray):
+        def read(addr: int, size: int) -> bytes:
+            calls["reads"] += 1
+            pay()
+            return bytes(memory[addr - base:addr - base + size])
+
+        def write(addr: int, data: bytes) -> bool:
+            calls["writes"] += 1
+            pay()
+            memory[addr - base:addr - base + len(data)] = data
+            return True
+
+        return read, write
+
+    def per_field(memory: bytearray) -> None:
+        read, write = make_io(memory)
+        for mv in moves:
+            for group, value in edits:
+                edit = edit_sets.compile_edit(mv, group, value)
+                for addr, header, _kind in edit.checks:
+                    if read(addr, len(header) + 16)[:len(header)] != header:
+                        break
+                else:
+                    for addr, data in edit.writes:
+                        if group == "kb_x":
+                            write(addr, data)  # wdf32: one 4-byte write
+                        else:
+                            for i, byte in enumerate(data):
+                                write(addr + i, bytes([byte]))
+
+    def batched(memory: bytearray) -> None:
+        read, write = make_io(memory)
+        edit_set = edit_sets.EditSet("bench")
+        for mv in moves:
+            for group, value in edits:
+                edit_set.stage(mv, group, value)
+        edit_set.apply(read_block=read, write_block=write)
+
+    report: dict = {"rows": rows, "fields": rows * len(edits), "latency_us": latency_us}
+    images = {}
+    for label, func in (("per_field", per_field), ("edit_set", batched)):
+        memory = bytearray(image)
+        calls.update(reads=0, writes=0)
+        start = time.perf_counter()
+        func(memory)
+        report[f"{label}_ms"] = (time.perf_counter() - start) * 1000.0
+        report[f"{label}_reads"] = calls["reads"]
+        report[f"{label}_writes"] = calls["writes"]
+        images[label] = bytes(memory)
+    report["identical"] = images["per_field"] == images["edit_set"]
+    return report
+
+
+def bench_patch_load(rows: int = 60, latency_us: float = 50.0) -> dict:
+    """Loading a saved patch for one character: per-entry writers vs the compiled batch.
+
+    The per-entry path mirrors ``apply_patch_change_to_move``: a selector walk,
+    a packet check read and one ``wd8`` per byte for every entry.  Every read
+    and write pays ``latency_us``.
+    """
+    from tvcgui.features.frame_data import edit_sets
+    from tvcgui.features.frame_data import patch_runtime
+
+    base = 0x90900000
+    stun = bytes((0x04, 0x01, 0x60, 0x00, 0x00, 0x00, 0x02, 0x54, 0x3F)) + bytes(6)
+    image = bytearray(rows * 0x400)
+    changes = []
+    for n in range(rows):
+        off = n * 0x400
+        image[off + 0x40:off + 0x45] = bytes((0x35, 0x10, 0x20, 0x3F, 0x00))
+        image[off + 0x50:off + 0x50 + len(stun)] = stun
+        addresses = {"abs": f"0x{base + off:08X}", "damage_addr_rel": 0x40, "stun_addr_rel": 0x50, "knockback_addr_rel": 0x200}
+        selector = {"abs": f"0x{base + off:08X}", "move_id": 0x100 + n, "kind": "normal"}
+        for group, value in (("damage", 1200), ("hitstun", 18), ("blockstun", 12), ("kb_x", 2.5)):
+            changes.append({"group": group, "value": value, "selector": selector, "addresses": addresses})
+    document = {"schema": patch_runtime.SCHEMA, "characters": {"Bench": {"changes": changes}}}
+    calls = {"reads": 0, "writes": 0}
+
+    def pay() -> None:
+        if latency_us:
+            deadline = time.perf_counter() + latency_us / 1e6
+            while time.perf_counter() < deadline:
+                pass
+
+    def make_io(memory: bytearray):
+        def read(addr: int, size: int) -> bytes:
+            calls["reads"] += 1
+            pay()
+            return bytes(memory[addr - base:addr - base + size])
+
+        def write(addr: int, data: bytes) -> bool:
+            calls["writes"] += 1
+            pay()
+            memory[addr - base:addr - base + len(data)] = data
+            return True
+
+        return read, write
+
+    def slot() -> dict:
+        moves = [{"id": 0x100 + n, "abs": base + n * 0x400, "kind": "normal"} for n in range(rows)]
+        return {"char_name": "Bench", "slot_label": "P1-C1", "moves": moves}
+
+    def per_entry(memory: bytearray) -> None:
+        read, write = make_io(memory)
+        slot_data = slot()
+        for entry in changes:
+            mv, _match = patch_runtime.find_patch_target_in_slot(slot_data, entry)
+            patch_runtime._inject_entry_addresses(mv, entry)
+            edit = edit_sets.compile_edit(mv, entry["group"], entry["value"])
+            for addr, header, _kind in edit.checks:
+                if read(addr, len(header) + 16)[:len(header)] != header:
+                    break
+            else:
+                for addr, data in edit.writes:
+                    if entry["group"] == "kb_x":
+                        write(addr, data)  # wdf32: one 4-byte write
+                    else:
+                        for i, byte in enumerate(data):
+                            write(addr + i, bytes([byte]))
+
+    def compiled(memory: bytearray) -> None:
+        read, write = make_io(memory)
+        controller = patch_runtime.PatchAutoloadController(
+            mode="all", patches=[patch_runtime.LoadedPatch("bench.json", document)]
+        )
+        controller.apply_to_scan_data([slot()], read_block=read, write_block=write)
+
+    report: dict = {"rows": rows, "entries": len(changes), "latency_us": latency_us}
+    images = {}
+    patch_runtime.clear_compiled_patches()
+    for label, func in (("per_entry", per_entry), ("compiled_cold", compiled), ("compiled", compiled)):
+        memory = bytearray(image)
+        calls.update(reads=0, writes=0)
+        with contextlib.redirect_stdout(io.StringIO()):  # the loader's own summary line
+            start = time.perf_counter()
+            func(memory)
+            report[f"{label}_ms"] = (time.perf_counter() - start) * 1000.0
+        report[f"{label}_reads"] = calls["reads"]
+        report[f"{label}_writes"] = calls["writes"]
+        images[label] = bytes(memory)
+    patch_runtime._LIVE_ENTRIES_BY_CHAR.pop("bench", None)
+    report["identical"] = images["per_entry"] == images["compiled"] == images["compiled_cold"]
+    return report
+
+
+def bench_field_diff(frames: int = 300, size: int = 0x800, live: int = 96) -> dict:
+    """Unknown-field diff over a captured block: per-frame walk vs the column pass.
+
+    ``live`` offsets of a ``size``-byte block change every few frames, the rest
+    stay put.  The per-frame walk decodes every aligned field of every frame
+    and correlates each with the known series, as a hand-rolled script would.
+    """
+    import random
+    import statistics
+    import struct
+
+    from tvcgui.features.frame_data import field_diff
+
+    rng = random.Random(11)
+    capture = field_diff.BlockCapture(0x92000000, size)
+    data = bytearray(rng.randbytes(size))
+    offsets = rng.sample(range(size), live)
+    for n in range(frames):
+        for off in offsets:
+            if rng.random() < 0.3:
+                data[off] = rng.randrange(256)
+        capture.add(bytes(data), {"hp": 10000.0 - n, "action_id": float(n // 20), "pos_x": float(n % 50)})
+
+    def per_frame() -> int:
+        rows = 0
+        known = {name: [float(v) for v in series] for name, series in capture.known.items()}
+        for kind, fmt, width in (("u8", ">B", 1), ("u16", ">H", 2), ("u32", ">I", 4)):
+            for offset in range(0, size - width + 1, width):
+                values = [struct.unpack_from(fmt, capture.frames, n * size + offset)[0] for n in range(capture.count)]
+                changes = sum(a != b for a, b in zip(values, values[1:]))
+                if not changes:
+                    continue
+                rows += 1
+                _summary = (len(set(values)), min(values), max(values))
+                for series in known.values():
+                    try:
+                        statistics.correlation(values, series)
+                    except statistics.StatisticsError:
+                        pass
+        return rows
+
+    report: dict = {"frames": frames, "size": size, "live": live}
+    start = time.perf_counter()
+    report["per_frame_rows"] = per_frame()
+    report["per_frame_ms"] = (time.perf_counter() - start) * 1000.0
+    start = time.perf_counter()
+    report["column_rows"] = len(field_diff.analyze_capture(capture))
+    report["column_ms"] = (time.perf_counter() - start) * 1000.0
+    return report
+
+
+def bench_tree_filter(rows: int = 1500, repeats: int = 5) -> dict:
+    """Per-keystroke frame-data filter cost: mirrored column index vs per-cell reads.
+
+    The legacy path is timed against a dictionary instead of Tk, so it is a
+    lower bound; both paths also report the Tcl calls they would issue.
+    """
+    import random
+
+    from tvcgui.features.frame_data.filter_index import FrameFilterIndex
+
+    rng = random.Random(42)
+    columns = ("move", "kind", "hits", "link", "context", "damage", "startup", "active", "hitstun", "blockstun") + tuple(
+        f"extra_{n}" for n in range(50)
+    ) + ("abs",)
+    names = ["5A", "5B", "5C", "2A", "2B", "2C", "j.A", "j.B", "j.C", "Hadouken", "Shoryuken", "Tatsumaki", "Shinku Hadouken"]
+    index = FrameFilterIndex(columns)
+    cells: dict[str, tuple] = {}
+    parents: dict[str, str] = {}
+    parent = ""
+    for n in range(rows):
+        values = (
+            f"{rng.choice(names)} ({n})",
+            rng.choice(("normal", "special", "super", "linked")),
+            str(rng.randrange(1, 5)),
+            "",
+            "High, Knockdown" if n % 7 == 0 else "",
+            str(rng.randrange(0, 3000)),
+            str(rng.randrange(3, 30)),
+            f"{rng.randrange(3, 30)}-{rng.randrange(30, 40)}",
+            str(rng.randrange(10, 30)),
+            str(rng.randrange(8, 25)),
+        ) + tuple(str(rng.randrange(100)) for _ in range(50)) + (f"0x{0x90800000 + n * 0x640:08X}",)
+        iid = f"I{n:04X}"
+        parent_iid = parent if n % 4 else ""
+        index.insert(parent_iid, "end", iid, values)
+        cells[iid] = values
+        parents[iid] = parent_iid
+        if not parent_iid:
+            parent = iid
+    order = list(cells)
+    col_pos = {c: i for i, c in enumerate(columns)}
+    keystrokes = ["h", "ha", "had", "hado", "hadou", "hadouk", "hadouke", "hadouken"]
+    column_keystrokes = ["1", "12", "120"]
+
+    def legacy(global_q: str, col_filters: dict) -> int:
+        calls = 0
+        keep = set()
+        for iid in order:
+            values = cells[iid]
+            calls += 3
+            hay = " ".join((values[0], values[1], values[-1])).lower()
+            if global_q and global_q not in hay:
+                continue
+            ok = True
+            for column, needle in col_filters.items():
+                calls += 1
+                if needle not in values[col_pos[column]].lower():
+                    ok = False
+                    break
+            if not ok:
+                continue
+            while iid and iid not in keep:
+                keep.add(iid)
+                iid = parents[iid]
+        # reattach every row, then detach every miss
+        return calls + rows + (rows - len(keep))
+
+    def indexed(global_q: str, col_filters: dict, last: dict) -> int:
+        keep = index.with_ancestors(index.match(global_q, col_filters, candidates=order))
+        hidden = {iid for iid in order if iid not in keep}
+        plan = index.plan(hidden)
+        changed = sum(1 for parent_iid, kids in plan.items() if last.get(parent_iid) != kids)
+        last.clear()
+        last.update(plan)
+        return changed
+
+    report: dict = {"rows": rows}
+    for label, queries in (("global", [(q, {}) for q in keystrokes]), ("column", [("", {"damage": q}) for q in column_keystrokes])):
+        best_legacy = best_index = float("inf")
+        for _ in range(repeats):
+            start = time.perf_counter()
+            legacy_calls = [legacy(q, f) for q, f in queries]
+            best_legacy = min(best_legacy, time.perf_counter() - start)
+            last: dict = index.plan()
+            start = time.perf_counter()
+            index_calls = [indexed(q, f, last) for q, f in queries]
+            best_index = min(best_index, time.perf_counter() - start)
+        report[f"{label}_legacy_ms"] = best_legacy * 1000.0 / len(queries)
+        report[f"{label}_index_ms"] = best_index * 1000.0 / len(queries)
+        report[f"{label}_legacy_tcl"] = max(legacy_calls)
+        report[f"{label}_index_tcl"] = max(index_calls)
+    return report
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Run offline TvC GUI micro-benchmarks.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    missions = sub.add_parser("missions", help="MissionRuntimeV2 per-event matching cost")
+    missions.add_argument("--dir", default=resource_path("missions"))
+    missions.add_argument("--repeats", type=int, default=20)
+
+    sampler = sub.add_parser("sampler", help="realtime sampler publish/snapshot contention")
+    sampler.add_argument("--seconds", type=float, default=1.0)
+
+    profiles = sub.add_parser("profiles", help="frame-data profile header and full loads, JSON shard vs SQLite index")
+    profiles.add_argument("--repeats", type=int, default=5)
+
+    sub.add_parser("attack-journal", help="attack property profiler flush cost, snapshot vs journal")
+
+    export = sub.add_parser("export", help="frame-data CSV export cost for one four-character rescan")
+    export.add_argument("--characters", type=int, default=24)
+    export.add_argument("--moves", type=int, default=600)
+
+    prs = sub.add_parser("prs", help="FPK PRS decode cost, fast decoder vs bitwise reference")
+    prs.add_argument("--repeats", type=int, default=3)
+
+    move_names = sub.add_parser("move-names", help="move_id_map cold load and per-call lookup cost")
+    move_names.add_argument("--calls", type=int, default=200000)
+
+    sub.add_parser("animation", help="first animation-frame lookup, whole JSON vs per-character index and MOT runtime")
+
+    tree_filter = sub.add_parser("filter", help="frame-data filter cost per keystroke, column index vs per-cell reads")
+    tree_filter.add_argument("--rows", type=int, default=1500)
+    tree_filter.add_argument("--repeats", type=int, default=5)
+
+    probe = sub.add_parser("move-probe", help="frame-data deep-probe cost for one character, per-finder reads vs region prefetch")
+    probe.add_argument("--moves", type=int, default=320)
+    probe.add_argument("--read-latency-us", type=float, default=50.0)
+
+    attack_index = sub.add_parser("attack-index", help="HUD attack-property lookup, validated definition cache vs per-character index")
+    attack_index.add_argument("--lookups", type=int, default=2000)
+    attack_index.add_argument("--read-latency-us", type=float, default=50.0)
+
+    move_families = sub.add_parser("families", help="move-family grouping on the largest bundled profiles, cold vs memoised")
+    move_families.add_argument("--profiles", type=int, default=4)
+    move_families.add_argument("--repeats", type=int, default=5)
+
+    edit_set = sub.add_parser("edit-set", help="family-wide frame-data edit, per-field writes vs one coalesced edit set")
+    edit_set.add_argument("--rows", type=int, default=40)
+    edit_set.add_argument("--latency-us", type=float, default=50.0)
+
+    patch_load = sub.add_parser("patch-load", help="patch autoload for one character, per-entry writers vs the compiled batch")
+    patch_load.add_argument("--rows", type=int, default=60)
+    patch_load.add_argument("--latency-us", type=float, default=50.0)
+
+    field_diff = sub.add_parser("field-diff", help="unknown-field diff of a captured block, per-frame walk vs column pass")
+    field_diff.add_argument("--frames", type=int, default=300)
+    field_diff.add_argument("--size", type=lambda text: int(text, 0), default=0x800)
+    field_diff.add_argument("--live", type=int, default=96)
+
+    dump = sub.add_parser("dump", help="character dump region pass, whole-buffer scan vs streamed compressed chunks")
+    dump.add_argument("--region-mib", type=float, default=7.0)
+    dump.add_argument("--repeats", type=int, default=3)
+
+    cancel_routes = sub.add_parser("cancel-routes", help="Cancel Mapper classification for every source, per open vs cached route graph")
+    cancel_routes.add_argument("--moves", type=int, default=400)
+    cancel_routes.add_argument("--repeats", type=int, default=3)
+
+    session = sub.add_parser("move-memory", help="one character's reads across the frame-data tools, private vs shared cache")
+    session.add_argument("--moves", type=int, default=320)
+    session.add_argument("--frames", type=int, default=600)
+    session.add_argument("--read-latency-us", type=float, default=50.0)
+
+    args = parser.parse_args(argv)
+    if args.command == "missions":
+        report = bench_mission_matching(Path(args.dir), repeats=max(1, args.repeats))
+        print(
+            f"{report['files']} files, {report['routes']} routes, "
+            f"{report['events']} events: {report['ns_per_event'] / 1000.0:.2f} us/event"
+        )
+    elif args.command == "sampler":
+        report = bench_sampler_handoff(max(0.1, args.seconds))
+        print(
+            f"publishes={report['publishes']} p50={report['publish_us_p50']:.1f}us "
+            f"p99={report['publish_us_p99']:.1f}us; "
+            f"4-slot reads={report['reads']} p50={report['read4_us_p50']:.1f}us "
+            f"p99={report['read4_us_p99']:.1f}us"
+        )
+        if "lock" in report:
+            lock = report["lock"]
+            print(f"publish lock hold avg={lock['hold_us_avg']:.1f}us max={lock['hold_us_max']:.1f}us")
+    elif args.command == "profiles":
+        report = bench_profile_lookup(max(1, args.repeats))
+        if not report.get("profiles"):
+            print("no bundled frame-data profiles found")
+            return 1
+        print(f"{report['profiles']} profiles, index migration {report['migrate_ms']:.0f} ms")
+        for backend in ("json", "index"):
+            print(
+                f"{backend:6}: header {report[f'{backend}_header_ms']:.2f} ms, peak {report[f'{backend}_header_mb']:.2f} MiB; "
+                f"full {report[f'{backend}_full_ms']:.2f} ms, peak {report[f'{backend}_full_mb']:.2f} MiB"
+            )
+    elif args.command == "attack-journal":
+        report = bench_attack_property_flush()
+        for mode, rows in report.items():
+            print(f"{mode:8}: " + "  ".join(f"{size} obs={ms:.2f} ms" for size, ms in rows.items()))
+    elif args.command == "export":
+        report = bench_export_rescan(max(4, args.characters), max(1, args.moves))
+        print(
+            f"{report['master_rows']} master rows: unchanged rescan={report['unchanged_ms']:.1f} ms "
+            f"one character changed={report['one_changed_ms']:.1f} ms "
+            f"full compile={report['full_compile_ms']:.1f} ms"
+        )
+    elif args.command == "prs":
+        report = bench_prs_decode(repeats=max(1, args.repeats))
+        for label in ("literal", "runs"):
+            print(
+                f"{label:8}: fast={report[f'{label}_fast_ms']:.1f} ms "
+                f"bitwise={report[f'{label}_bitwise_ms']:.1f} ms"
+            )
+    elif args.command == "move-names":
+        report = bench_move_name_lookup(max(1000, args.calls))
+        print(
+            f"cold load: csv={report['csv_load_ms']:.2f} ms index={report['index_load_ms']:.2f} ms "
+            f"({report['index_source']}); lookup: uncached={report['uncached_ns']:.0f} ns "
+            f"memo={report['memo_ns']:.0f} ns"
+        )
+    elif args.command == "animation":
+        report = bench_animation_lookup()
+        for label in ("json", "index", "runtime"):
+            print(
+                f"{label:7}: first lookup={report[f'{label}_first_ms']:.1f} ms "
+                f"retained={report[f'{label}_retained_kb']:.0f} KiB"
+            )
+    elif args.command == "filter":
+        report = bench_tree_filter(max(10, args.rows), max(1, args.repeats))
+        print(f"{report['rows']} rows (legacy timed without Tk, so a lower bound)")
+        for label in ("global", "column"):
+            print(
+                f"{label:6}: legacy={report[f'{label}_legacy_ms']:.2f} ms/keystroke, <= {report[f'{label}_legacy_tcl']} Tcl calls; "
+                f"index={report[f'{label}_index_ms']:.2f} ms/keystroke, <= {report[f'{label}_index_tcl']} set_children"
+            )
+    elif args.command == "move-probe":
+        report = bench_move_region_probe(max(1, args.moves), max(0.0, args.read_latency_us))
+        print(f"{report['moves']} moves, {report['read_latency_us']:.0f} us/read, identical={report['identical']}")
+        for label in ("per_finder", "prefetch", "memo"):
+            print(f"{label:10}: {report[f'{label}_ms']:.1f} ms, {report[f'{label}_reads']} reads")
+    elif args.command == "move-memory":
+        report = bench_move_memory_session(max(1, args.moves), max(0, args.frames), max(0.0, args.read_latency_us))
+        print(f"{report['moves']} moves, {report['frames']} cancel-lab frames, {report['read_latency_us']:.0f} us/read")
+        for label in ("private", "shared"):
+            print(f"{label:8}: {report[f'{label}_ms']:.1f} ms, {report[f'{label}_reads']} reads")
+        print(f"shared hit rate {report['hit_rate'] * 100:.1f}%")
+    elif args.command == "attack-index":
+        report = bench_attack_property_lookup(max(1, args.lookups), max(0.0, args.read_latency_us))
+        print(f"{report['lookups']} lookups, {report['read_latency_us']:.0f} us/read, index build {report['build_ms']:.1f} ms")
+        for label in ("cache", "index"):
+            print(f"{label:5}: {report[f'{label}_us']:.1f} us/lookup, {report[f'{label}_reads']} reads")
+    elif args.command == "cancel-routes":
+        report = bench_cancel_route_graph(max(20, args.moves), max(1, args.repeats))
+        print(f"{report['moves']} moves, {report['pairs']} source/target pairs")
+        print(
+            f"every source per pair: {report['legacy_ms']:.1f} ms; graph: build {report['build_ms']:.1f} ms, "
+            f"load {report['load_ms']:.1f} ms, cached {report['graph_ms']:.1f} ms"
+        )
+    elif args.command == "edit-set":
+        report = bench_edit_set(max(1, args.rows), max(0.0, args.latency_us))
+        print(f"{report['rows']} rows, {report['fields']} fields, {report['latency_us']:.0f} us per Dolphin call")
+        for label in ("per_field", "edit_set"):
+            print(
+                f"{label}: {report[f'{label}_ms']:.1f} ms, "
+                f"{report[f'{label}_reads']} reads, {report[f'{label}_writes']} writes"
+            )
+        print(f"identical memory: {report['identical']}")
+    elif args.command == "patch-load":
+        report = bench_patch_load(max(1, args.rows), max(0.0, args.latency_us))
+        print(f"{report['rows']} rows, {report['entries']} patch entries, {report['latency_us']:.0f} us per Dolphin call")
+        for label in ("per_entry", "compiled_cold", "compiled"):
+            print(
+                f"{label}: {report[f'{label}_ms']:.1f} ms, "
+                f"{report[f'{label}_reads']} reads, {report[f'{label}_writes']} writes"
+            )
+        print(f"identical memory: {report['identical']}")
+    elif args.command == "field-diff":
+        size = max(4, min(0x4000, args.size))
+        report = bench_field_diff(max(3, args.frames), size, max(1, min(size, args.live)))
+        print(f"{report['frames']} frames of {report['size']:#x} bytes, {report['live']} live offsets")
+        print(f"per-frame walk: {report['per_frame_ms']:.1f} ms ({report['per_frame_rows']} fields)")
+        print(f"column pass: {report['column_ms']:.1f} ms ({report['column_rows']} fields)")
+    elif args.command == "dump":
+        report = bench_character_dump(max(0.25, args.region_mib), max(1, args.repeats))
+        print(f"region {report['region_kb']:.0f} KiB -> {report['compressed_kb']:.0f} KiB compressed")
+        for label in ("legacy", "stream"):
+            print(
+                f"{label}: {report[f'{label}_ms']:.1f} ms, peak {report[f'{label}_peak_kb']:.0f} KiB, "
+                f"{report[f'{label}_reads']} reads"
+            )
+    elif args.command == "families":
+        report = bench_move_families(max(1, args.profiles), max(1, args.repeats))
+        if not report["profiles"]:
+            print("no bundled frame-data profiles found")
+            return 1
+        print(", ".join(f"{key} ({count} moves)" for key, count in report["profiles"]))
+        print(f"cold={report['cold_ms']:.1f} ms warm={report['warm_ms']:.1f} ms one-row edit={report['edit_ms']:.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,249 @@
+"""Fingerprinted on-disk cache of resolved normal-scan move lists.
+
+The profile fast path in :func:`normal_scanner.scan_once` loads a multi-MB
+profile shard, rebases every row onto the live ``chr_tbl`` and re-parses the
+move window before it can hand the workbench a snapshot.  Workbench scans
+run in a fresh child process, so none of that survives between openings.
+
+This cache keys each character on two fingerprints:
+
+* a *probe* over the scanner revisions, the profile shard stamp, the live
+  ``chr_tbl`` address and the chr_tbl pointer table bytes; and
+* a *window* fingerprint over the probe plus the live move-data window the
+  fast path reads.
+
+A probe match costs nothing beyond the chr_tbl read ``scan_once`` already
+does; the window read then confirms that no move data changed (for example
+through a workbench patch) before the stored rows are returned.  Rows are
+stored already rebased and refreshed, pickled exactly as the scan worker
+already ships them between processes.
+"""
+from __future__ import annotations
+
+import atexit
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+SCAN_CACHE_VERSION = 1
+SCAN_CACHE_ENABLED = str(os.environ.get("TVC_FD_SCAN_CACHE", "1")).strip().lower() not in {"0", "false", "no", "off"}
+SCAN_CACHE_MEMORY_ENTRIES = 8
+SCAN_CACHE_SUFFIX = ".scan"
+_STATS_FILE = "stats.json"
+
+
+def scan_fingerprint(*parts: Any) -> str:
+    """Hash bytes/str/int parts into a short stable fingerprint."""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        if isinstance(part, (bytes, bytearray, memoryview)):
+            data = bytes(part)
+        else:
+            data = repr(part).encode("utf-8", "replace")
+        digest.update(len(data).to_bytes(4, "big"))
+        digest.update(data)
+    return digest.hexdigest()
+
+
+class NormalScanCache:
+    """Per-character entries: a JSON header line followed by pickled rows."""
+
+    def __init__(self, directory: str) -> None:
+        self.directory = os.path.abspath(os.path.expanduser(str(directory)))
+        self._lock = threading.RLock()
+        self._memory: "OrderedDict[str, tuple[dict, bytes]]" = OrderedDict()
+        self._stats: Dict[str, Any] = {
+            "hits": 0,
+            "probe_misses": 0,
+            "window_misses": 0,
+            "stores": 0,
+            "invalidations": 0,
+            "last_hit_ms": 0.0,
+            "last_key": "",
+            "last_result": "",
+        }
+        # Counts not yet folded into the shared stats file.
+        self._unflushed: Dict[str, int] = {}
+        atexit.register(self.flush_stats)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}{SCAN_CACHE_SUFFIX}")
+
+    def _read_entry(self, key: str, probe: Optional[str] = None) -> Optional[tuple[dict, bytes]]:
+        cached = self._memory.get(key)
+        # Another process may have replaced the file; a memory entry that no
+        # longer matches falls through to disk.
+        if cached is not None and (probe is None or cached[0].get("probe") == probe):
+            self._memory.move_to_end(key)
+            return cached
+        try:
+            with open(self._path(key), "rb") as handle:
+                header = json.loads(handle.readline().decode("utf-8"))
+                payload = handle.read()
+        except Exception:
+            return None
+        if not isinstance(header, dict) or header.get("version") != SCAN_CACHE_VERSION:
+            return None
+        self._remember(key, header, payload)
+        return header, payload
+
+    def _remember(self, key: str, header: dict, payload: bytes) -> None:
+        self._memory[key] = (header, payload)
+        self._memory.move_to_end(key)
+        while len(self._memory) > SCAN_CACHE_MEMORY_ENTRIES:
+            self._memory.popitem(last=False)
+
+    def window_size(self, key: str, probe: str) -> Optional[int]:
+        """Return the stored window size when ``probe`` matches, else ``None``."""
+        with self._lock:
+            entry = self._read_entry(key, probe)
+            if entry is None or entry[0].get("probe") != probe:
+                self._count(key, "probe_misses")
+                return None
+            return int(entry[0].get("window") or 0) or None
+
+    def lookup(self, key: str, fingerprint: str, *, started: Optional[float] = None) -> Optional[List[Dict[str, Any]]]:
+        """Return a fresh copy of the stored rows for a full fingerprint match."""
+        with self._lock:
+            entry = self._read_entry(key)
+            if entry is None or entry[0].get("fingerprint") != fingerprint:
+                self._count(key, "window_misses")
+                return None
+            try:
+                moves = pickle.loads(entry[1])
+            except Exception:
+                self._memory.pop(key, None)
+                self._count(key, "window_misses")
+                return None
+            if started is not None:
+                self._stats["last_hit_ms"] = round((time.perf_counter() - started) * 1000.0, 3)
+            self._count(key, "hits")
+            return moves
+
+    def store(self, key: str, probe: str, fingerprint: str, window: int, moves: List[Dict[str, Any]]) -> bool:
+        header = {
+            "version": SCAN_CACHE_VERSION,
+            "key": key,
+            "probe": probe,
+            "fingerprint": fingerprint,
+            "window": int(window),
+            "moves": len(moves),
+            "stored_at": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime()),
+        }
+        try:
+            payload = pickle.dumps(moves, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            return False
+        with self._lock:
+            self._remember(key, header, payload)
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                fd, tmp_name = tempfile.mkstemp(prefix=f"{key}.", suffix=".tmp", dir=self.directory)
+                try:
+                    with os.fdopen(fd, "wb") as handle:
+                        handle.write(json.dumps(header, separators=(",", ":")).encode("utf-8") + b"\n")
+                        handle.write(payload)
+                    os.replace(tmp_name, self._path(key))
+                finally:
+                    if os.path.exists(tmp_name):
+                        os.unlink(tmp_name)
+            except Exception:
+                return False
+            self._count(key, "stores")
+            return True
+
+    def invalidate(self, key: Optional[str] = None) -> int:
+        """Drop one character's entry, or every entry when ``key`` is None."""
+        with self._lock:
+            keys = [key] if key else list(self._memory)
+            if not key:
+                try:
+                    keys.extend(
+                        name[: -len(SCAN_CACHE_SUFFIX)]
+                        for name in os.listdir(self.directory)
+                        if name.endswith(SCAN_CACHE_SUFFIX)
+                    )
+                except OSError:
+                    pass
+            removed = 0
+            for item in set(keys):
+                self._memory.pop(item, None)
+                try:
+                    os.unlink(self._path(item))
+                    removed += 1
+                except OSError:
+                    pass
+            self._stats["invalidations"] += removed
+            return removed
+
+    def _count(self, key: str, field: str) -> None:
+        self._stats[field] += 1
+        self._stats["last_key"] = key
+        self._stats["last_result"] = field
+        self._unflushed[field] = self._unflushed.get(field, 0) + 1
+
+    def _read_totals(self) -> Dict[str, Any]:
+        try:
+            with open(os.path.join(self.directory, _STATS_FILE), "r", encoding="utf-8") as handle:
+                totals = json.load(handle)
+        except Exception:
+            return {}
+        return totals if isinstance(totals, dict) else {}
+
+    def flush_stats(self) -> bool:
+        """Fold this process's counters into the shared stats file.
+
+        Workbench scans run in a child process, so the GUI process reads
+        their counters from a small file.  Call once per scan (and at exit),
+        not per lookup.
+        """
+        with self._lock:
+            if not self._unflushed:
+                return True
+            totals = self._read_totals()
+            for field, count in self._unflushed.items():
+                totals[field] = int(totals.get(field, 0) or 0) + count
+            totals["last_key"] = self._stats["last_key"]
+            totals["last_result"] = self._stats["last_result"]
+            totals["last_hit_ms"] = self._stats["last_hit_ms"]
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                fd, tmp_name = tempfile.mkstemp(prefix=f"{_STATS_FILE}.", suffix=".tmp", dir=self.directory)
+                try:
+                    with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                        json.dump(totals, handle, separators=(",", ":"))
+                    os.replace(tmp_name, os.path.join(self.directory, _STATS_FILE))
+                finally:
+                    if os.path.exists(tmp_name):
+                        os.unlink(tmp_name)
+            except Exception:
+                return False
+            self._unflushed.clear()
+            return True
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            out = dict(self._stats)
+            out["memory_entries"] = len(self._memory)
+            pending = dict(self._unflushed)
+        totals = self._read_totals()
+        if totals or pending:
+            for field, count in pending.items():
+                totals[field] = int(totals.get(field, 0) or 0) + count
+            out["all_processes"] = totals
+        out["enabled"] = SCAN_CACHE_ENABLED
+        return out
+
+
+__all__ = [
+    "SCAN_CACHE_ENABLED",
+    "SCAN_CACHE_VERSION",
+    "NormalScanCache",
+    "scan_fingerprint",
+]
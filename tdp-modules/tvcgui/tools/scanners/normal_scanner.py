@@ -12,15 +12,21 @@ from tvcgui.platform.dolphin import hook, rbytes, rd32
 from tvcgui.core.constants import MEM2_LO, MEM2_HI, SLOTS, CHAR_NAMES
 from tvcgui.features.combat.move_id_map import lookup_move_name
 from tvcgui.core.paths import data_path, user_data_path
+from tvcgui.features.frame_data.patterns import ACTIVE_HDR, DAMAGE_HDR, STUN_HDR
 from tvcgui.features.frame_data.profile_store import (
+    PROFILE_BACKEND_INDEX,
     load_frame_data_profile,
+    load_frame_data_profile_header,
+    profile_backend,
     save_frame_data_profile,
+    frame_data_profile_stamp,
     default_bundled_directory as _store_bundled_profile_dir,
     default_writable_directory as _store_writable_profile_dir,
     default_bundled_legacy_file as _store_bundled_legacy_file,
     default_writable_legacy_file as _store_writable_legacy_file,
 )
 from tvcgui.features.combat.move_filters import is_purged_move_label, filter_purged_moves_for_char
+from tvcgui.tools.scanners.normal_scan_cache import SCAN_CACHE_ENABLED, NormalScanCache, scan_fingerprint
 try:
     from tvcgui.features.training.stun_profiler import apply_runtime_stun_observations
 except Exception:
@@ -122,10 +128,6 @@ DEFAULT_METER = {
 }
 SPECIAL_DEFAULT_METER = 0xC8
 
-ACTIVE_HDR = [
-    0x20, 0x35, 0x01, 0x20,
-    0x3F, 0x00, 0x00, 0x00,
-]
 ACTIVE_TOTAL_LEN = 20
 
 INLINE_ACTIVE_HDR = [
@@ -139,7 +141,6 @@ INLINE_ACTIVE_HDR = [
 INLINE_ACTIVE_LEN = 17
 INLINE_ACTIVE_OFF = 0xB0
 
-DAMAGE_HDR     = [0x35, 0x10, 0x20, 0x3F, 0x00]
 DAMAGE_TOTAL_LEN = 16
 
 ATKPROP_HDR = [
@@ -200,14 +201,6 @@ GROUND_KB_MODE_OFF = 4
 GROUND_KB_VALUE_OFF = 8
 GROUND_KB_AUX_OFF = 12
 
-STUN_HDR = [
-    0x04, 0x01, 0x60, 0x00, 0x00, 0x00, 0x02, 0x54,
-    0x3F, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, None,
-    0x04, 0x01, 0x60, 0x00, 0x00, 0x00, 0x02, 0x58,
-    0x3F, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, None,
-    0x33, 0x32, 0x00, 0x20, 0x00, 0x00, 0x00, None,
-    0x04, 0x15, 0x60,
-]
 STUN_TOTAL_LEN = 43
 
 # ``+0x254/+0x258 == -2`` is the engine-default stun sentinel.  It is not
@@ -463,6 +456,9 @@ PROFILE_CACHE_LOCK_FILE = os.environ.get(
 PROFILE_CACHE_SAVE_TIMEOUT_SEC = float(os.environ.get("TVC_FD_PROFILE_SAVE_TIMEOUT", "2.0") or "2.0")
 PROFILE_CACHE_STALE_LOCK_SEC = float(os.environ.get("TVC_FD_PROFILE_STALE_LOCK_SEC", "30.0") or "30.0")
 
+SCAN_CACHE_DIR = os.environ.get("TVC_FD_SCAN_CACHE_DIR", os.path.join(_profile_exe_dir(), "scan_cache"))
+_SCAN_CACHE = NormalScanCache(SCAN_CACHE_DIR)
+
 _PROFILE_CACHE_LOCK = threading.RLock()
 _PROFILE_CACHE_MISSING = object()
 _PROFILE_CACHE_BY_KEY: Dict[str, Optional[Dict[str, Any]]] = {}
@@ -3444,6 +3440,32 @@ def _load_profile_entry(key: str) -> Optional[Dict[str, Any]]:
         return copy.deepcopy(profile) if isinstance(profile, dict) else None
 
 
+def _load_profile_header(key: str) -> Optional[Dict[str, Any]]:
+    """Load one profile's header fields without decoding its move rows.
+
+    The index backend answers from its header row.  The JSON backend has to
+    read the whole shard anyway, so it goes through the cached full load.
+    """
+    with _PROFILE_CACHE_LOCK:
+        cached = _PROFILE_CACHE_BY_KEY.get(key, _PROFILE_CACHE_MISSING)
+        if cached is _PROFILE_CACHE_MISSING and profile_backend() == PROFILE_BACKEND_INDEX:
+            header = load_frame_data_profile_header(
+                key,
+                expected_version=PROFILE_CACHE_VERSION,
+                bundled_directory=PROFILE_BUNDLED_CACHE_DIR,
+                writable_directory=PROFILE_CACHE_DIR,
+                bundled_legacy_file=PROFILE_BUNDLED_CACHE_FILE,
+                writable_legacy_file=PROFILE_CACHE_FILE,
+            )
+            return header if isinstance(header, dict) else None
+        if cached is _PROFILE_CACHE_MISSING:
+            _load_profile_entry(key)
+            cached = _PROFILE_CACHE_BY_KEY.get(key)
+        if not isinstance(cached, dict):
+            return None
+        return {name: copy.deepcopy(value) for name, value in cached.items() if name != "moves"}
+
+
 def _profile_warn_once(key: str, message: str) -> None:
     with _PROFILE_CACHE_LOCK:
         if key in _PROFILE_SAVE_WARNED:
@@ -3468,6 +3490,9 @@ def _save_profile_entry(key: str, profile: Dict[str, Any]) -> bool:
             expected_version=PROFILE_CACHE_VERSION,
         )
         _PROFILE_CACHE_BY_KEY[key] = copy.deepcopy(profile)
+        # The shard stamp covers saves that reach disk; a deferred save only
+        # changes the in-memory profile, so drop the resolved rows explicitly.
+        _SCAN_CACHE.invalidate(key)
         return bool(ok)
 
 
@@ -4271,12 +4296,15 @@ def _load_profile_moves(
     tbl_move_addrs: List[int],
     *,
     tbl_move_entries: Optional[List[Tuple[int, int]]] = None,
+    window_info: Optional[Dict[str, int]] = None,
 ) -> Optional[List[Dict[str, Any]]]:
     if not PROFILE_CACHE_ENABLED:
         return None
     key = _profile_key(char_id, char_name)
     sig = _profile_table_signature(tbl_move_addrs, chr_tbl_abs)
-    prof = _load_profile_entry(key)
+    # Every gate below reads header fields only, so a stale or mismatched
+    # profile is rejected before its move rows are decoded.
+    prof = _load_profile_header(key)
     if not isinstance(prof, dict):
         return None
     # Reject experimental Morrigan inherited-stun profiles from v28/v29.
@@ -4292,7 +4320,12 @@ def _load_profile_moves(
         return None
     if str(prof.get("table_signature") or "") != sig:
         return None
-    rows = prof.get("moves")
+    full = _load_profile_entry(key) or {}
+    # A save can land between the two loads; keep the rows only if they still
+    # belong to the table the header was checked against.
+    if str(full.get("table_signature") or "") != sig:
+        return None
+    rows = full.get("moves")
     if not isinstance(rows, list) or not rows:
         return None
     rows = filter_purged_moves_for_char({"char_id": char_id, "char_name": char_name, "profile_key": key}, rows)
@@ -4331,6 +4364,9 @@ def _load_profile_moves(
         buf, base_abs = _read_profile_window(chr_tbl_abs, moves)
         if not buf:
             return None
+        if window_info is not None:
+            window_info["size"] = len(buf)
+            window_info["digest"] = scan_fingerprint(buf)
         for mv in moves:
             try:
                 _owner_start, _owner_end = _invuln_owner_window(
@@ -4362,6 +4398,91 @@ def _load_profile_moves(
     return moves
 
 
+def _scan_cache_probe(key: str, char_id: Optional[int], chr_tbl_abs: int, tbl_buf: bytes) -> str:
+    stamp = frame_data_profile_stamp(
+        key,
+        expected_version=PROFILE_CACHE_VERSION,
+        bundled_directory=PROFILE_BUNDLED_CACHE_DIR,
+        writable_directory=PROFILE_CACHE_DIR,
+        bundled_legacy_file=PROFILE_BUNDLED_CACHE_FILE,
+        writable_legacy_file=PROFILE_CACHE_FILE,
+    )
+    return scan_fingerprint(
+        PROFILE_CACHE_VERSION,
+        PROFILE_SCANNER_BUILD,
+        STUN_RESOLVER_REVISION,
+        ACTIVE_RESOLVER_REVISION,
+        key,
+        char_id,
+        int(chr_tbl_abs),
+        stamp,
+        tbl_buf,
+    )
+
+
+def _load_profile_moves_cached(
+    char_id: Optional[int],
+    char_name: str,
+    chr_tbl_abs: int,
+    tbl_buf: bytes,
+    tbl_move_addrs: List[int],
+    *,
+    tbl_move_entries: Optional[List[Tuple[int, int]]] = None,
+) -> Tuple[Optional[List[Dict[str, Any]]], bool]:
+    """Profile fast path behind the fingerprinted scan cache.
+
+    Returns ``(moves, cache_hit)``.  A hit skips the profile shard load, the
+    rebase and the per-move refresh entirely.
+    """
+    if not SCAN_CACHE_ENABLED or not PROFILE_CACHE_ENABLED:
+        return _load_profile_moves(
+            char_id, char_name, chr_tbl_abs, tbl_move_addrs,
+            tbl_move_entries=tbl_move_entries,
+        ), False
+    started = time.perf_counter()
+    key = _profile_key(char_id, char_name)
+    try:
+        probe = _scan_cache_probe(key, char_id, chr_tbl_abs, tbl_buf)
+        window = _SCAN_CACHE.window_size(key, probe)
+        if window:
+            buf = safe_rbytes(int(chr_tbl_abs), window)
+            if len(buf) == window:
+                moves = _SCAN_CACHE.lookup(key, scan_fingerprint(probe, scan_fingerprint(buf)), started=started)
+                if moves is not None:
+                    return moves, True
+    except Exception as e:
+        _profile_warn_once(f"scan-cache:{key}", f"[fd scan cache] lookup skipped for {char_name}: {e!r}")
+        probe = ""
+
+    window_info: Dict[str, int] = {}
+    moves = _load_profile_moves(
+        char_id, char_name, chr_tbl_abs, tbl_move_addrs,
+        tbl_move_entries=tbl_move_entries,
+        window_info=window_info,
+    )
+    if moves is not None and probe and window_info.get("size"):
+        _SCAN_CACHE.store(
+            key,
+            probe,
+            scan_fingerprint(probe, window_info["digest"]),
+            window_info["size"],
+            moves,
+        )
+    return moves, False
+
+
+def get_normal_scan_cache_stats() -> Dict[str, Any]:
+    """Hit/miss counters for the fingerprinted normal-scan cache."""
+    return _SCAN_CACHE.stats()
+
+
+def clear_normal_scan_cache(char_id: Optional[int] = None, char_name: str = "") -> int:
+    """Drop resolved rows for one character, or for every character."""
+    if char_id is None and not char_name:
+        return _SCAN_CACHE.invalidate()
+    return _SCAN_CACHE.invalidate(_profile_key(char_id, char_name))
+
+
 def _save_profile_moves(
     char_id: Optional[int],
     char_name: str,
@@ -4376,7 +4497,7 @@ def _save_profile_moves(
     try:
         visible_moves = filter_purged_moves_for_char({"char_id": char_id, "char_name": char_name}, moves)
         rows = [_relativize_profile_obj(copy.deepcopy(mv), chr_tbl_abs) for mv in visible_moves]
-        previous = _load_profile_entry(key) or {}
+        previous = _load_profile_header(key) or {}
         # A normal-only rebuild must not throw away a projectile/special pass
         # that is already profiled for this exact character table.
         keep_extras = str(previous.get("table_signature") or "") == sig
@@ -4436,7 +4557,7 @@ def _profile_extra_bundle(
     if not PROFILE_CACHE_ENABLED:
         return empty
     key = _profile_key(char_id, char_name)
-    prof = _load_profile_entry(key)
+    prof = _load_profile_header(key)
     if not isinstance(prof, dict):
         return empty
     if int(prof.get("version") or 0) != PROFILE_CACHE_VERSION:
@@ -4700,8 +4821,8 @@ def scan_once(
             continue
 
         if _profile_cache_allowed(force_dynamic):
-            profiled_moves = _load_profile_moves(
-                cid, cname, chr_tbl_abs, tbl_move_addrs,
+            profiled_moves, scan_cache_hit = _load_profile_moves_cached(
+                cid, cname, chr_tbl_abs, tbl_buf, tbl_move_addrs,
                 tbl_move_entries=tbl_move_entries,
             )
             if profiled_moves is not None:
@@ -4729,6 +4850,7 @@ def scan_once(
                     "profile_projectiles_profiled": bool(extras.get("projectiles_profiled")),
                     "profile_specials_profiled": bool(extras.get("specials_profiled")),
                     "profile_fast_path": True,
+                    "profile_scan_cache_hit": scan_cache_hit,
                     "profile_key": _profile_key(cid, cname),
                 }
                 continue
@@ -4820,4 +4942,5 @@ def scan_once(
             "profile_key": _profile_key(cid, cname),
         }
 
+    _SCAN_CACHE.flush_stats()
     return result
\ No newline at end of file
@@ -18,6 +18,9 @@ DISPLAY_LABEL_OVERRIDES = {
     "Orientation":    "Orientation",
     "SuperBG":        "Super background",
     "CameraLock":     "Camera lock",
+    "MoveMemHits":    "Move cache hits",
+    "MoveMemGen":     "Move cache gen",
+    "MoveMemInval":   "Move cache resets",
 }
 
 # Helper / legend text for flags that are enums (not simple booleans).
@@ -44,6 +47,15 @@ FLAG_HELP = {
     "DamageOutput": (
         "00=1 star, 01=2 stars, 02=3 stars, 04=4 stars"
     ),
+    "MoveMemHits": (
+        "Shared move-memory reads served from cache / total"
+    ),
+    "MoveMemGen": (
+        "Memory generation; bumped on roster change, reload or patch write"
+    ),
+    "MoveMemInval": (
+        "Cache resets by reason (roster, reload, write)"
+    ),
 }
 
 TOOLTIP_TITLE_OVERRIDES = {
@@ -52,6 +64,24 @@ TOOLTIP_TITLE_OVERRIDES = {
 }
 
 
+def read_move_memory_rows():
+    """
+    Read-only status rows for the shared move-memory cache.
+
+    The address field is the string "move_memory", which marks them as
+    informational: they show no ON/OFF state and are not clickable.
+    """
+    try:
+        from tvcgui.platform.move_memory import move_memory_debug_rows
+        return move_memory_debug_rows()
+    except Exception:
+        return []
+
+
+def _is_info_row(addr):
+    return isinstance(addr, str)
+
+
 def read_debug_flags():
     '\n    Collect a list of (label, addr, value) entries for the debug overlay.\n\n    DEBUG_FLAG_ADDRS comes from config.py and is a list of (label, addr).\n    The module also append a few individually mapped flags discovered during\n    reverse-engineering.\n\n    Returns:\n        A list of tuples: (label, address, byte_value or None)\n    '
     out = []
@@ -315,7 +345,8 @@ def draw_debug_overlay(surface, rect, font_small, dbg_values, scroll_offset):
         disp_name = DISPLAY_LABEL_OVERRIDES.get(name, name)
         row_y = inner_top + (idx - start) * row_h
 
-        active = bool(val)
+        info_row = _is_info_row(addr)
+        active = bool(val) and not info_row
         if active:
             bg_col = (55, 65, 105)
         else:
@@ -342,7 +373,7 @@ def draw_debug_overlay(surface, rect, font_small, dbg_values, scroll_offset):
         label_surf = font_small.render(disp_name, True, COL_TEXT)
         surface.blit(label_surf, (row_x + 4, row_y + 2))
 
-        state_s = _state_label(name, val)
+        state_s = "" if info_row else _state_label(name, val)
         state_surf = font_small.render(state_s, True, COL_TEXT)
         sx = row_x + row_w - state_surf.get_width() - 4
         surface.blit(state_surf, (sx, row_y + 2))
@@ -352,7 +383,8 @@ def draw_debug_overlay(surface, rect, font_small, dbg_values, scroll_offset):
         vx = sx - val_surf.get_width() - 8
         surface.blit(val_surf, (vx, row_y + 2))
 
-        click_areas[name] = (row_rect, addr)
+        if not info_row:
+            click_areas[name] = (row_rect, addr)
 
     # Scrollbar
     if max_scroll > 0:
@@ -204,12 +204,61 @@ def _format_state_text(state: dict[str, Any]) -> str:
             f"ms={_format_value(rpm.get('last_write_ms', 0.0))} "
             f"age={_age(rpm.get('last_write_age_sec'))}"
         )
+        lines.append(
+            f"  transactions: {rpm.get('txn_count', 0)} "
+            f"edits={rpm.get('txn_edits', 0)} skipped={rpm.get('txn_edits_skipped', 0)} "
+            f"reads={rpm.get('txn_read_calls', 0)} writes={rpm.get('txn_write_calls', 0)} "
+            f"slow={rpm.get('slow_txns', 0)}"
+        )
+        lines.append(
+            f"  last txn: key={rpm.get('last_txn_key') or '-'} "
+            f"edits={rpm.get('last_txn_edits', 0)} dirty={rpm.get('last_txn_dirty', 0)} "
+            f"writes={rpm.get('last_txn_writes', 0)} ms={_format_value(rpm.get('last_txn_ms', 0.0))}"
+        )
         if rpm.get("last_error"):
             lines.append(f"  error: {rpm.get('last_error')}")
     else:
         lines.append("  no patch-manager state reported yet")
     lines.append("")
 
+    watch = state.get("memory_watch") or {}
+    lines.append("MEMORY WATCH")
+    if watch:
+        lines.append(
+            f"  watches: {watch.get('watches', 0)} spans={watch.get('spans', 0)} "
+            f"bytes={watch.get('polled_bytes', 0)}/{watch.get('max_polled_bytes', 0)} "
+            f"rejected={watch.get('rejected', 0)}"
+        )
+        lines.append(
+            f"  polls: {watch.get('polls', 0)} reads={watch.get('read_calls', 0)} "
+            f"changes={watch.get('changes', 0)} ms={_format_value(watch.get('last_poll_ms', 0.0))}"
+        )
+        for label, row in sorted((watch.get("per_watch") or {}).items()):
+            lines.append(f"    {label}: hits={row.get('hits', 0)}/{row.get('polls', 0)}")
+    else:
+        lines.append("  no watches registered")
+    lines.append("")
+
+    budget = state.get("tick_budget") or {}
+    lines.append("TICK BUDGET")
+    if budget.get("ticks"):
+        lines.append(
+            f"  frame budget: {_format_value(budget.get('frame_budget_ms', 0.0))} ms "
+            f"last={_format_value(budget.get('last_frame_ms', 0.0))} ms "
+            f"over={budget.get('frames_over_budget', 0)}/{budget.get('frames', 0)}"
+        )
+        for name, row in (budget.get("ticks") or {}).items():
+            hist = " ".join(f"{k}:{v}" for k, v in (row.get("overrun_histogram") or {}).items())
+            lines.append(
+                f"    {name}: p{row.get('priority', 0)}{' critical' if row.get('critical') else ''} "
+                f"est={_format_value(row.get('est_ms', 0.0))}/{_format_value(row.get('budget_ms', 0.0))} ms "
+                f"deferred={row.get('deferrals', 0)} forced={row.get('forced_runs', 0)} "
+                f"overruns={row.get('overruns', 0)}{(' [' + hist + ']') if hist else ''}"
+            )
+    else:
+        lines.append("  no ticks registered")
+    lines.append("")
+
     perf = state.get("perf") or {}
     lines.append("PERFORMANCE")
     if perf:
@@ -220,7 +269,7 @@ def _format_state_text(state: dict[str, Any]) -> str:
     lines.append("")
 
     other_keys = sorted(k for k in state.keys() if k not in {
-        "hooked", "megacrash", "hud_editor", "assist", "slots", "perf", "active_quick_assist_by_slot", "runtime_patch_manager",
+        "hooked", "megacrash", "hud_editor", "assist", "slots", "perf", "active_quick_assist_by_slot", "runtime_patch_manager", "memory_watch", "tick_budget",
     })
     if other_keys:
         lines.append("OTHER STATE")